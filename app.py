@@ -6,19 +6,13 @@ This is the main entry point for the Precision AgriAI system.
 """
 
 import streamlit as st
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 import asyncio
 import logging
 import time
 
-# Import services
-from services.map_service import MapService
-from services.db_service import DbService
-from services.brain_service import BrainService
-from services.voice_service import VoiceService
-from services.sms_service import SMSService
-from services.sentry_service import SentryService
-from services.integration import ServiceIntegration
+# Import services (service modules are imported on first use)
+from services.lazy import LazyService
 from ui.map_interface import MapInterface
 from config.settings import get_settings
 
@@ -29,32 +23,43 @@ logger = logging.getLogger(__name__)
 # Initialize services
 @st.cache_resource
 def init_services():
-    """Initialize application services with dependency injection"""
+    """
+    Initialize application services with dependency injection
+    
+    Each service is a LazyService proxy: its module is imported and the
+    service constructed the first time a page uses it, so startup does not
+    pay for geopandas/folium/earthengine imports or AWS calls up front.
+    """
     settings = get_settings()
     
-    # Initialize core services
-    map_service = MapService()
-    db_service = DbService()
-    brain_service = BrainService(use_mock_gee=False, region=settings.aws.region)
-    voice_service = VoiceService()
-    sms_service = SMSService(region=settings.aws.region)
+    # Core services
+    map_service = LazyService('map', 'services.map_service:MapService')
+    db_service = LazyService('db', 'services.db_service:DbService')
+    brain_service = LazyService(
+        'brain', 'services.brain_service:BrainService',
+        use_mock_gee=False, region=settings.aws.region
+    )
+    voice_service = LazyService('voice', 'services.voice_service:VoiceService')
+    sms_service = LazyService('sms', 'services.sms_service:SMSService', region=settings.aws.region)
     
-    # Initialize sentry service for proactive monitoring
-    sentry_service = SentryService(
+    # Sentry service for proactive monitoring
+    sentry_service = LazyService(
+        'sentry', 'services.sentry_service:SentryService',
         brain_service=brain_service,
         db_service=db_service,
         sms_service=sms_service
     )
     
-    # Initialize service integration
-    integration = ServiceIntegration(
+    # Service integration
+    integration = LazyService(
+        'integration', 'services.integration:ServiceIntegration',
         map_service=map_service,
         brain_service=brain_service,
         db_service=db_service,
         sms_service=sms_service
     )
     
-    logger.info("All services initialized successfully")
+    logger.info("Service proxies registered (services initialize on first use)")
     
     return {
         'map': map_service,
@@ -664,7 +669,8 @@ def render_officer_view():
             
             # Get plots and alerts for this jurisdiction from DbService
             try:
-                plots_data = db_service.get_hobli_plots(hobli_id)
+                # The heatmap renders every plot, so page through all of them
+                plots_data = fetch_all_pages(db_service.get_hobli_plots_page, hobli_id)
                 alerts_data = db_service.get_recent_alerts(hobli_id, limit=20)
                 
                 plots = plots_data if plots_data else get_mock_plots_for_hobli(hobli_id)
@@ -738,10 +744,10 @@ def render_officer_view():
             try:
                 stats = db_service.get_jurisdiction_stats(st.session_state.selected_hobli)
                 
-                st.metric("Total Plots", stats.get('total_plots', 0), help="Plots under monitoring")
-                st.metric("Active Alerts", stats.get('active_alerts', 0), 
-                         help="Current high-priority alerts")
-                st.metric("Critical Alerts", stats.get('critical_alerts', 0),
+                st.metric("Total Plots", stats.total_plots, help="Plots under monitoring")
+                st.metric("Active Alerts", stats.active_alerts, 
+                         help="Pending alerts in the last 24 hours")
+                st.metric("High Priority Alerts", stats.high_priority_alerts,
                          help="Alerts requiring immediate action")
                 
             except Exception as e:
@@ -760,7 +766,8 @@ def render_officer_view():
             # Alert breakdown by risk level
             st.subheader("Alert Breakdown")
             try:
-                alerts = db_service.get_recent_alerts(st.session_state.selected_hobli, limit=100)
+                # Count every alert in the window, not just the first page
+                alerts = fetch_all_pages(db_service.get_recent_alerts_page, st.session_state.selected_hobli)
                 if not alerts:
                     alerts = get_mock_alerts_for_hobli(st.session_state.selected_hobli)
             except:
@@ -833,6 +840,18 @@ def render_officer_view():
             st.info("Select a jurisdiction to view details")
 
 
+def fetch_all_pages(fetch_page: Callable[..., Any], *args, **kwargs) -> List[Any]:
+    """Collect every item from a cursor-paginated DbService method"""
+    items = []
+    cursor = None
+    while True:
+        page = fetch_page(*args, cursor=cursor, **kwargs)
+        items.extend(page.items)
+        cursor = page.next_cursor
+        if not cursor:
+            return items
+
+
 def get_mock_plots_for_hobli(hobli_id: str) -> List[Dict[str, Any]]:
     """Get mock plot data for a hobli (temporary until DbService integration)"""
     # Mock data based on hobli
@@ -1023,12 +1042,24 @@ def render_admin_view():
             if st.button("🚨 Trigger Daily Scan", type="primary", use_container_width=True):
                 with st.spinner("Running sentry scan... This may take a few minutes."):
                     try:
+                        from services.sentry_service import CallbackScanSink
+                        
+                        # Only alerted plots are kept for display; all other
+                        # results are folded into the scan summary
+                        alerted_results = []
+                        
+                        def keep_alerted(result):
+                            if result.alert_triggered:
+                                alerted_results.append(result.dict())
+                        
                         # Run async scan
                         scan_result = asyncio.run(
                             sentry_service.scan_all_registered_plots(
-                                max_plots=None  # Scan all plots
+                                max_plots=None,  # Scan all plots
+                                sink=CallbackScanSink(keep_alerted)
                             )
                         )
+                        scan_result['results'] = alerted_results
                         
                         # Display results
                         st.success(f"✅ Scan complete!")
@@ -1103,7 +1134,54 @@ def render_admin_view():
         
         uploaded_file = st.file_uploader("📥 Import Plots (CSV)", type=['csv'])
         if uploaded_file is not None:
-            st.info("Bulk import functionality will process CSV and register plots")
+            st.caption("Columns: user_id, plot_id, lat, lon, crop, farmer_name, phone_number (hobli_id optional)")
+            
+            if st.button("📥 Register Imported Plots", use_container_width=True):
+                import csv
+                import io
+                from datetime import datetime
+                from services.db_service import PlotData
+                
+                plots_to_register = []
+                rejected_rows = []
+                
+                reader = csv.DictReader(io.StringIO(uploaded_file.getvalue().decode('utf-8')))
+                for row_number, row in enumerate(reader, start=2):
+                    try:
+                        lat, lon = float(row['lat']), float(row['lon'])
+                        hobli_id = row.get('hobli_id')
+                        if not hobli_id:
+                            validation = map_service.validate_coordinates(lat, lon)
+                            if not validation.is_valid:
+                                raise ValueError(validation.error)
+                            hobli_id = validation.hobli_id
+                        
+                        plots_to_register.append(PlotData(
+                            user_id=row['user_id'],
+                            plot_id=row['plot_id'],
+                            lat=lat,
+                            lon=lon,
+                            crop=row.get('crop') or 'Other',
+                            hobli_id=hobli_id,
+                            farmer_name=row.get('farmer_name', ''),
+                            phone_number=row.get('phone_number', ''),
+                            registration_date=datetime.now()
+                        ))
+                    except Exception as e:
+                        rejected_rows.append(f"Row {row_number}: {e}")
+                
+                with st.spinner(f"Registering {len(plots_to_register)} plots..."):
+                    bulk_result = db_service.register_plots_bulk(plots_to_register)
+                
+                st.success(f"✅ Registered {len(bulk_result.succeeded)} plots "
+                           f"in {bulk_result.request_count} batch requests")
+                
+                if bulk_result.failed or rejected_rows:
+                    with st.expander(f"⚠️ {len(bulk_result.failed) + len(rejected_rows)} plots not registered"):
+                        for message in rejected_rows:
+                            st.text(message)
+                        for plot_key, error in bulk_result.failed.items():
+                            st.text(f"{plot_key}: {error}")
     
     with col2:
         st.subheader("System Monitoring")
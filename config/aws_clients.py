@@ -0,0 +1,255 @@
+"""
+AWS Client Registry
+
+Central, lazily populated pool of boto3 clients and resources shared by all
+services, so the process builds one client per (service, region) instead of
+one per service instance:
+- botocore Config from settings.aws_clients (connection pool size, retries,
+  timeouts, TCP keep-alive)
+- Thread-safe creation on a single boto3 Session
+- Build timings and connection pool statistics for cold start and socket
+  reuse measurements
+"""
+
+from typing import Any, Dict, Hashable, Optional, Tuple
+import logging
+import threading
+import time
+
+import boto3
+from botocore.config import Config
+
+from config.settings import AWSClientConfig, get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class AWSClientRegistry:
+    """Builds each boto3 client/resource once and hands out the shared instance"""
+    
+    def __init__(self, client_config: Optional[AWSClientConfig] = None, session: Optional[boto3.session.Session] = None):
+        """
+        Initialize AWSClientRegistry
+        
+        Args:
+            client_config: Client tuning (defaults to settings.aws_clients)
+            session: boto3 Session to build from (defaults to one built from settings)
+        """
+        settings = get_settings()
+        self.client_config = client_config or settings.aws_clients
+        self.default_region = settings.aws.region
+        
+        self._session = session
+        self._clients: Dict[Hashable, Any] = {}
+        self._resources: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        
+        self.build_seconds: Dict[str, float] = {}
+        self.reuses = 0
+    
+    @property
+    def session(self) -> boto3.session.Session:
+        """boto3 Session used for every client (created on first use)"""
+        if self._session is None:
+            aws = get_settings().aws
+            self._session = boto3.session.Session(
+                aws_access_key_id=aws.access_key_id,
+                aws_secret_access_key=aws.secret_access_key
+            )
+        return self._session
+    
+    def botocore_config(self) -> Config:
+        """
+        Build the botocore Config applied to every client
+        
+        Returns:
+            botocore Config with pool size, retries and timeouts from settings
+        """
+        return Config(
+            max_pool_connections=self.client_config.max_pool_connections,
+            retries={
+                'mode': self.client_config.retry_mode,
+                'total_max_attempts': self.client_config.max_attempts
+            },
+            connect_timeout=self.client_config.connect_timeout,
+            read_timeout=self.client_config.read_timeout,
+            tcp_keepalive=self.client_config.tcp_keepalive
+        )
+    
+    def _get_or_build(self, cache: Dict[Hashable, Any], kind: str, service_name: str,
+                      region_name: Optional[str], endpoint_url: Optional[str]) -> Any:
+        """Return the cached client/resource for a key, building it once under the lock"""
+        region = region_name or self.default_region
+        key: Tuple[str, str, Optional[str]] = (service_name, region, endpoint_url)
+        
+        existing = cache.get(key)
+        if existing is not None:
+            self.reuses += 1
+            return existing
+        
+        with self._lock:
+            existing = cache.get(key)
+            if existing is not None:
+                self.reuses += 1
+                return existing
+            
+            start = time.perf_counter()
+            factory = self.session.client if kind == 'client' else self.session.resource
+            built = factory(
+                service_name,
+                region_name=region,
+                endpoint_url=endpoint_url,
+                config=self.botocore_config()
+            )
+            elapsed = time.perf_counter() - start
+            
+            cache[key] = built
+            self.build_seconds[f"{kind}:{service_name}:{region}"] = elapsed
+            
+            logger.debug(f"Built boto3 {kind} {service_name} ({region}) in {elapsed * 1000:.1f} ms")
+            return built
+    
+    def client(self, service_name: str, region_name: Optional[str] = None, endpoint_url: Optional[str] = None) -> Any:
+        """
+        Get the shared boto3 client for a service and region
+        
+        Args:
+            service_name: AWS service name (e.g. 's3', 'sns', 'bedrock-runtime')
+            region_name: AWS region (defaults to settings)
+            endpoint_url: Optional endpoint override (e.g. LocalStack)
+            
+        Returns:
+            boto3 client (thread-safe, shared by all callers)
+        """
+        return self._get_or_build(self._clients, 'client', service_name, region_name, endpoint_url)
+    
+    def resource(self, service_name: str, region_name: Optional[str] = None, endpoint_url: Optional[str] = None) -> Any:
+        """
+        Get the shared boto3 resource for a service and region
+        
+        Args:
+            service_name: AWS service name (e.g. 'dynamodb')
+            region_name: AWS region (defaults to settings)
+            endpoint_url: Optional endpoint override (e.g. LocalStack)
+            
+        Returns:
+            boto3 ServiceResource
+        """
+        return self._get_or_build(self._resources, 'resource', service_name, region_name, endpoint_url)
+    
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Summarize HTTP connection pools of the built clients
+        
+        Reads urllib3 pool counters from botocore's HTTP session, so socket
+        reuse can be checked: requests growing while connections stay flat.
+        
+        Returns:
+            Dictionary keyed by "service:region" with pools, connections and requests
+        """
+        stats = {}
+        clients = [(key, c) for key, c in self._clients.items()]
+        clients += [(key, r.meta.client) for key, r in self._resources.items()]
+        
+        for (service_name, region, _), client in clients:
+            pools = connections = requests = 0
+            try:
+                manager = client._endpoint.http_session._manager
+                for pool_key in list(manager.pools.keys()):
+                    pool = manager.pools.get(pool_key)
+                    if pool is None:
+                        continue
+                    pools += 1
+                    connections += pool.num_connections
+                    requests += pool.num_requests
+            except AttributeError:
+                # botocore internals changed; report what we have
+                pass
+            
+            entry = stats.setdefault(f"{service_name}:{region}", {'pools': 0, 'connections': 0, 'requests': 0})
+            entry['pools'] += pools
+            entry['connections'] += connections
+            entry['requests'] += requests
+        
+        return stats
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics
+        
+        Returns:
+            Dictionary with client counts, reuse count and per-client build times
+        """
+        return {
+            'clients': len(self._clients),
+            'resources': len(self._resources),
+            'reuses': self.reuses,
+            'build_seconds': dict(self.build_seconds),
+            'total_build_seconds': sum(self.build_seconds.values())
+        }
+    
+    def clear(self) -> None:
+        """Drop every cached client and resource (they are rebuilt on next use)"""
+        with self._lock:
+            self._clients.clear()
+            self._resources.clear()
+            self.build_seconds.clear()
+
+
+_registry: Optional[AWSClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> AWSClientRegistry:
+    """
+    Get the process-wide client registry
+    
+    Returns:
+        AWSClientRegistry instance
+    """
+    global _registry
+    
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = AWSClientRegistry()
+    
+    return _registry
+
+
+def get_client(service_name: str, region_name: Optional[str] = None, endpoint_url: Optional[str] = None) -> Any:
+    """
+    Get a shared boto3 client from the process-wide registry
+    
+    Args:
+        service_name: AWS service name
+        region_name: AWS region (defaults to settings)
+        endpoint_url: Optional endpoint override
+        
+    Returns:
+        boto3 client
+    """
+    return get_client_registry().client(service_name, region_name, endpoint_url)
+
+
+def get_resource(service_name: str, region_name: Optional[str] = None, endpoint_url: Optional[str] = None) -> Any:
+    """
+    Get a shared boto3 resource from the process-wide registry
+    
+    Args:
+        service_name: AWS service name
+        region_name: AWS region (defaults to settings)
+        endpoint_url: Optional endpoint override
+        
+    Returns:
+        boto3 ServiceResource
+    """
+    return get_client_registry().resource(service_name, region_name, endpoint_url)
+
+
+def reset_client_registry() -> None:
+    """Discard the process-wide registry; a fresh one is built on next use"""
+    global _registry
+    
+    with _registry_lock:
+        _registry = None
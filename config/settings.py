@@ -50,6 +50,42 @@ class AWSConfig(BaseModel):
     )
 
 
+class AWSClientConfig(BaseModel):
+    """Shared boto3 client configuration"""
+    max_pool_connections: int = Field(
+        default=50,
+        description="HTTP connections kept per client (botocore default is 10)"
+    )
+    retry_mode: str = Field(
+        default="standard",
+        description="botocore retry mode (legacy/standard/adaptive)"
+    )
+    max_attempts: int = Field(
+        default=5,
+        description="Maximum attempts per request including the first"
+    )
+    connect_timeout: float = Field(
+        default=5.0,
+        description="Connection timeout in seconds"
+    )
+    read_timeout: float = Field(
+        default=60.0,
+        description="Socket read timeout in seconds"
+    )
+    tcp_keepalive: bool = Field(
+        default=True,
+        description="Enable TCP keep-alive on pooled connections"
+    )
+    
+    @field_validator('retry_mode')
+    @classmethod
+    def validate_retry_mode(cls, v):
+        """Validate retry mode is supported by botocore"""
+        if v not in ("legacy", "standard", "adaptive"):
+            raise ValueError(f"Retry mode must be legacy, standard or adaptive, got {v}")
+        return v
+
+
 class MapServiceConfig(BaseModel):
     """MapService configuration"""
     bhuvan_base_url: str = Field(
@@ -100,6 +136,58 @@ class GEEConfig(BaseModel):
         default=20.0,
         description="Maximum cloud cover percentage"
     )
+    batch_chunk_size: int = Field(
+        default=500,
+        description="Points per reduceRegions call in batched NDVI extraction"
+    )
+    ndvi_cache_backend: str = Field(
+        default="memory",
+        description="NDVI result cache backend: memory, sqlite, redis or none"
+    )
+    ndvi_cache_max_entries: int = Field(
+        default=50000,
+        description="Maximum NDVI results kept by the in-memory backend"
+    )
+    ndvi_cache_path: str = Field(
+        default=".cache/ndvi_cache.sqlite3",
+        description="SQLite file for the sqlite NDVI cache backend"
+    )
+    ndvi_cache_redis_url: str = Field(
+        default="redis://localhost:6379/0",
+        description="Redis URL for the redis NDVI cache backend"
+    )
+    ndvi_cache_release_lag_days: int = Field(
+        default=7,
+        description="Days after a MODIS 16-day period ends before its composite is published"
+    )
+    ndvi_cache_closed_year_ttl_seconds: int = Field(
+        default=30 * 86400,
+        description="TTL for NDVI results of past years (composites no longer change)"
+    )
+    timeseries_store_path: Optional[str] = Field(
+        default=".cache/ndvi_series",
+        description="Directory for per-pixel NDVI series (.npz); None keeps series in memory"
+    )
+    timeseries_climatology_years: int = Field(
+        default=5,
+        description="Preceding years used as the NDVI climatology for anomalies"
+    )
+    timeseries_min_years: int = Field(
+        default=3,
+        description="Minimum climatology years with data before a z-score is reported"
+    )
+    timeseries_anomaly_z: float = Field(
+        default=1.5,
+        description="Absolute z-score at which an NDVI value is anomalous"
+    )
+    
+    @field_validator('ndvi_cache_backend')
+    @classmethod
+    def validate_ndvi_cache_backend(cls, v):
+        """Validate NDVI cache backend is supported"""
+        if v not in ("memory", "sqlite", "redis", "none"):
+            raise ValueError(f"NDVI cache backend must be memory, sqlite, redis or none, got {v}")
+        return v
 
 
 class SentinelConfig(BaseModel):
@@ -116,6 +204,66 @@ class SentinelConfig(BaseModel):
         default=3600,
         description="Presigned URL expiry in seconds"
     )
+    tile_index_ttl_seconds: int = Field(
+        default=900,
+        description="TTL for the current month's tile acquisition index (new scenes still arrive)"
+    )
+    tile_index_closed_month_ttl_seconds: int = Field(
+        default=86400,
+        description="TTL for tile acquisition indexes of past months"
+    )
+    scene_metadata_ttl_seconds: int = Field(
+        default=7 * 86400,
+        description="TTL for a scene's cloud cover read from tileInfo.json (published scenes do not change)"
+    )
+    scene_metadata_missing_ttl_seconds: int = Field(
+        default=900,
+        description="TTL for remembering that a scene's metadata could not be read (it may still be uploading)"
+    )
+    chip_enabled: bool = Field(
+        default=False,
+        description="Send Bedrock a plot-sized image chip instead of the full-tile URL"
+    )
+    chip_size_px: int = Field(
+        default=256,
+        description="Chip width and height in pixels"
+    )
+    chip_resolution_m: float = Field(
+        default=10.0,
+        description="Chip ground resolution in metres per pixel"
+    )
+    chip_format: str = Field(
+        default="jpeg",
+        description="Chip encoding: jpeg or png"
+    )
+    chip_cache_enabled: bool = Field(
+        default=True,
+        description="Keep extracted chips in an on-disk LRU cache"
+    )
+    chip_cache_path: str = Field(
+        default=".cache/chips",
+        description="Chip cache directory (may be shared by worker processes)"
+    )
+    chip_cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        description="Chip cache byte budget; least recently used chips are evicted beyond it"
+    )
+    local_ndvi_window_m: float = Field(
+        default=100.0,
+        description="Side of the square plot window used for local 10 m NDVI"
+    )
+    local_ndvi_min_valid_fraction: float = Field(
+        default=0.3,
+        description="Minimum cloud-free share of the window for a local NDVI result"
+    )
+
+    @field_validator('chip_format')
+    @classmethod
+    def validate_chip_format(cls, v):
+        """Validate chip encoding is supported"""
+        if v not in ("jpeg", "png"):
+            raise ValueError(f"Chip format must be jpeg or png, got {v}")
+        return v
 
 
 class VoiceServiceConfig(BaseModel):
@@ -164,6 +312,26 @@ class DbServiceConfig(BaseModel):
         default=25,
         description="Maximum batch write size"
     )
+    batch_write_max_retries: int = Field(
+        default=5,
+        description="Retries for unprocessed BatchWriteItem items"
+    )
+    batch_write_base_delay_seconds: float = Field(
+        default=0.05,
+        description="Base delay for exponential backoff between batch write retries"
+    )
+    scan_page_size: int = Field(
+        default=1000,
+        description="Items requested per Scan page during full-table scans"
+    )
+    scan_total_segments: int = Field(
+        default=4,
+        description="Parallel scan segments (TotalSegments) for full-table scans"
+    )
+    fanout_max_concurrency: int = Field(
+        default=8,
+        description="Maximum concurrent per-Hobli queries in officer-level aggregations"
+    )
 
 
 class BrainServiceConfig(BaseModel):
@@ -185,17 +353,85 @@ class BrainServiceConfig(BaseModel):
         description="NDVI threshold for critical risk"
     )
     ndvi_threshold_high: float = Field(
-        default=0.3,
+        default=0.4,
         description="NDVI threshold for high risk"
     )
     ndvi_threshold_medium: float = Field(
-        default=0.5,
+        default=0.6,
         description="NDVI threshold for medium risk"
     )
     cluster_outbreak_min_plots: int = Field(
         default=3,
         description="Minimum plots for cluster outbreak detection"
     )
+    use_ndvi_anomaly: bool = Field(
+        default=False,
+        description="Add the seasonal NDVI anomaly (16-day series vs climatology) to plot analysis"
+    )
+    ndvi_source: str = Field(
+        default="gee",
+        description="Primary plot NDVI: gee (MODIS 250 m) or sentinel (local 10 m, GEE fallback)"
+    )
+    triage_enabled: bool = Field(
+        default=False,
+        description="Route clear-cut NDVI cases to rules or Haiku instead of multimodal Sonnet"
+    )
+    triage_sonnet_margin: float = Field(
+        default=0.05,
+        description="NDVI distance from a risk threshold within which plots go to Sonnet"
+    )
+    triage_haiku_margin: float = Field(
+        default=0.12,
+        description="NDVI distance from a risk threshold within which plots go to Haiku"
+    )
+    triage_sonnet_cost_usd: float = Field(
+        default=0.011,
+        description="Estimated cost of one multimodal Sonnet analysis (triage report)"
+    )
+    triage_haiku_cost_usd: float = Field(
+        default=0.0008,
+        description="Estimated cost of one text-only Haiku analysis (triage report)"
+    )
+    triage_sonnet_latency_seconds: float = Field(
+        default=4.0,
+        description="Sonnet latency assumed by the triage report until one is observed"
+    )
+    triage_batch_cost_usd: float = Field(
+        default=0.0015,
+        description="Estimated cost per plot of a text-only batch analysis prompt (triage report)"
+    )
+    batch_analysis_enabled: bool = Field(
+        default=False,
+        description="Analyze daily scan plots in batches (one text-only Bedrock call per batch)"
+    )
+    batch_analysis_size: int = Field(
+        default=20,
+        description="Plots packed into one batch analysis prompt"
+    )
+    batch_analysis_concurrency: int = Field(
+        default=4,
+        description="Batch analysis prompts in flight at once"
+    )
+    bedrock_cache_backend: str = Field(
+        default="none",
+        description="Bedrock response cache backend: memory, sqlite, redis or none (off)"
+    )
+    bedrock_cache_ttl_seconds: int = Field(
+        default=86400,
+        description="TTL for cached Bedrock responses"
+    )
+    bedrock_cache_max_entries: int = Field(
+        default=5000,
+        description="Maximum Bedrock responses kept by the in-memory backend"
+    )
+    bedrock_cache_path: str = Field(
+        default=".cache/bedrock_cache.sqlite3",
+        description="SQLite file for the sqlite Bedrock cache backend"
+    )
+    bedrock_cache_redis_url: str = Field(
+        default="redis://localhost:6379/0",
+        description="Redis URL for the redis Bedrock cache backend"
+    )
     
     @field_validator('temperature')
     @classmethod
@@ -212,6 +448,22 @@ class BrainServiceConfig(BaseModel):
         if not -1.0 <= v <= 1.0:
             raise ValueError(f"NDVI threshold must be between -1.0 and 1.0, got {v}")
         return v
+    
+    @field_validator('bedrock_cache_backend')
+    @classmethod
+    def validate_bedrock_cache_backend(cls, v):
+        """Validate Bedrock cache backend is supported"""
+        if v not in ("memory", "sqlite", "redis", "none"):
+            raise ValueError(f"Bedrock cache backend must be memory, sqlite, redis or none, got {v}")
+        return v
+    
+    @field_validator('ndvi_source')
+    @classmethod
+    def validate_ndvi_source(cls, v):
+        """Validate NDVI source is supported"""
+        if v not in ("gee", "sentinel"):
+            raise ValueError(f"NDVI source must be gee or sentinel, got {v}")
+        return v
 
 
 class PerformanceConfig(BaseModel):
@@ -228,10 +480,18 @@ class PerformanceConfig(BaseModel):
         default=3600,
         description="Cache TTL for repeated requests"
     )
+    cache_max_entries: int = Field(
+        default=2048,
+        description="Maximum entries held by each process-local cache"
+    )
     max_concurrent_requests: int = Field(
         default=10,
         description="Maximum concurrent requests"
     )
+    blocking_io_pool_size: int = Field(
+        default=32,
+        description="Worker threads shared by async services for blocking boto3 calls"
+    )
 
 
 class Settings(BaseSettings):
@@ -245,6 +505,7 @@ class Settings(BaseSettings):
     
     # Service configurations
     aws: AWSConfig = Field(default_factory=AWSConfig)
+    aws_clients: AWSClientConfig = Field(default_factory=AWSClientConfig)
     map_service: MapServiceConfig = Field(default_factory=MapServiceConfig)
     gee: GEEConfig = Field(default_factory=GEEConfig)
     sentinel: SentinelConfig = Field(default_factory=SentinelConfig)
@@ -1,9 +1,11 @@
 """
 DynamoDB Table Creation Script
 
-Creates the two DynamoDB tables required for Precision AgriAI:
+Creates the DynamoDB tables required for Precision AgriAI:
 1. PrecisionAgri_Plots - Plot registration and metadata
 2. PrecisionAgri_Alerts - Alert history and jurisdiction-based querying
+3. PrecisionAgri_HobliDirectory - Jurisdiction to Extension Officer mapping
+4. PrecisionAgri_JurisdictionStats - Materialized per-Hobli statistics
 """
 
 import boto3
@@ -278,6 +280,79 @@ def create_hobli_directory_table(dynamodb_client, table_name: str = "PrecisionAg
             raise
 
 
+def create_jurisdiction_stats_table(dynamodb_client, table_name: str = "PrecisionAgri_JurisdictionStats", enable_encryption: bool = True):
+    """
+    Create PrecisionAgri_JurisdictionStats table for materialized Hobli statistics
+    
+    Table Schema:
+    - PK: hobli_id (String)
+    - SK: stat_key (String) - "TOTAL" for lifetime totals, "H#YYYYMMDDHH" for hourly alert buckets
+    - TTL: expires_at (hourly buckets expire 48 hours after they start)
+    
+    Args:
+        dynamodb_client: Boto3 DynamoDB client
+        table_name: Name of the table to create
+        enable_encryption: Enable encryption at rest
+    """
+    try:
+        table_config = {
+            'TableName': table_name,
+            'KeySchema': [
+                {'AttributeName': 'hobli_id', 'KeyType': 'HASH'},  # Partition key
+                {'AttributeName': 'stat_key', 'KeyType': 'RANGE'}  # Sort key
+            ],
+            'AttributeDefinitions': [
+                {'AttributeName': 'hobli_id', 'AttributeType': 'S'},
+                {'AttributeName': 'stat_key', 'AttributeType': 'S'}
+            ],
+            'BillingMode': 'PROVISIONED',
+            'ProvisionedThroughput': {
+                'ReadCapacityUnits': 5,
+                'WriteCapacityUnits': 5
+            },
+            'Tags': [
+                {'Key': 'Project', 'Value': 'PrecisionAgriAI'},
+                {'Key': 'Environment', 'Value': 'Development'}
+            ]
+        }
+        
+        # Add encryption configuration if enabled
+        if enable_encryption:
+            table_config['SSESpecification'] = {
+                'Enabled': True,
+                'SSEType': 'KMS'
+            }
+        
+        response = dynamodb_client.create_table(**table_config)
+        
+        logger.info(f"Creating table {table_name}...")
+        
+        # Wait for table to be created
+        waiter = dynamodb_client.get_waiter('table_exists')
+        waiter.wait(TableName=table_name)
+        
+        logger.info(f"✓ Table {table_name} created successfully")
+        
+        # Let DynamoDB expire old hourly alert buckets
+        try:
+            dynamodb_client.update_time_to_live(
+                TableName=table_name,
+                TimeToLiveSpecification={'Enabled': True, 'AttributeName': 'expires_at'}
+            )
+            logger.info(f"✓ TTL on expires_at enabled for {table_name}")
+        except ClientError as e:
+            logger.warning(f"Could not enable TTL: {e}")
+        
+        return response
+        
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceInUseException':
+            logger.warning(f"Table {table_name} already exists")
+        else:
+            logger.error(f"Error creating table {table_name}: {e}")
+            raise
+
+
 def delete_table(dynamodb_client, table_name: str):
     """
     Delete a DynamoDB table (use with caution!)
@@ -304,7 +379,8 @@ def delete_table(dynamodb_client, table_name: str):
             raise
 
 
-def validate_tables(dynamodb_client, plots_table: str, alerts_table: str, hobli_directory_table: str):
+def validate_tables(dynamodb_client, plots_table: str, alerts_table: str, hobli_directory_table: str,
+                    jurisdiction_stats_table: str = "PrecisionAgri_JurisdictionStats"):
     """
     Validate that DynamoDB tables exist and are configured correctly
     
@@ -313,13 +389,14 @@ def validate_tables(dynamodb_client, plots_table: str, alerts_table: str, hobli_
         plots_table: Name of plots table
         alerts_table: Name of alerts table
         hobli_directory_table: Name of hobli directory table
+        jurisdiction_stats_table: Name of jurisdiction stats table
         
     Returns:
         Dictionary with validation results
     """
     results = {}
     
-    for table_name in [plots_table, alerts_table, hobli_directory_table]:
+    for table_name in [plots_table, alerts_table, hobli_directory_table, jurisdiction_stats_table]:
         try:
             response = dynamodb_client.describe_table(TableName=table_name)
             table_info = response['Table']
@@ -377,6 +454,11 @@ def main():
         default='PrecisionAgri_HobliDirectory',
         help='Hobli directory table name (default: PrecisionAgri_HobliDirectory)'
     )
+    parser.add_argument(
+        '--jurisdiction-stats-table',
+        default='PrecisionAgri_JurisdictionStats',
+        help='Jurisdiction stats table name (default: PrecisionAgri_JurisdictionStats)'
+    )
     parser.add_argument(
         '--enable-encryption',
         action='store_true',
@@ -401,11 +483,13 @@ def main():
             create_plots_table(dynamodb, args.plots_table, args.enable_encryption)
             create_alerts_table(dynamodb, args.alerts_table, args.enable_encryption)
             create_hobli_directory_table(dynamodb, args.hobli_directory_table, args.enable_encryption)
+            create_jurisdiction_stats_table(dynamodb, args.jurisdiction_stats_table, args.enable_encryption)
             logger.info("✓ All tables created successfully")
             
         elif args.action == 'validate':
             logger.info("Validating DynamoDB tables...")
-            results = validate_tables(dynamodb, args.plots_table, args.alerts_table, args.hobli_directory_table)
+            results = validate_tables(dynamodb, args.plots_table, args.alerts_table, args.hobli_directory_table,
+                                      args.jurisdiction_stats_table)
             
             print("\n" + "="*60)
             print("DynamoDB Table Validation Results")
@@ -423,6 +507,7 @@ def main():
                 delete_table(dynamodb, args.plots_table)
                 delete_table(dynamodb, args.alerts_table)
                 delete_table(dynamodb, args.hobli_directory_table)
+                delete_table(dynamodb, args.jurisdiction_stats_table)
                 logger.info("✓ All tables deleted successfully")
             else:
                 logger.info("Deletion cancelled")
@@ -434,9 +519,11 @@ def main():
                 delete_table(dynamodb, args.plots_table)
                 delete_table(dynamodb, args.alerts_table)
                 delete_table(dynamodb, args.hobli_directory_table)
+                delete_table(dynamodb, args.jurisdiction_stats_table)
                 create_plots_table(dynamodb, args.plots_table, args.enable_encryption)
                 create_alerts_table(dynamodb, args.alerts_table, args.enable_encryption)
                 create_hobli_directory_table(dynamodb, args.hobli_directory_table, args.enable_encryption)
+                create_jurisdiction_stats_table(dynamodb, args.jurisdiction_stats_table, args.enable_encryption)
                 logger.info("✓ All tables recreated successfully")
             else:
                 logger.info("Recreation cancelled")
@@ -0,0 +1,112 @@
+"""
+Jurisdiction Statistics Rebuild Script
+
+Verifies and repairs the materialized per-Hobli statistics kept in
+PrecisionAgri_JurisdictionStats:
+- verify: compare materialized aggregates with the plots and alerts tables
+- rebuild: recompute aggregates from the source tables and overwrite them
+"""
+
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.db_service import DbService
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def verify_hoblis(db_service: DbService, hobli_ids: list) -> list:
+    """
+    Verify materialized statistics for a list of Hoblis
+
+    Args:
+        db_service: DbService instance
+        hobli_ids: Hobli identifiers to verify
+
+    Returns:
+        List of Hobli identifiers whose statistics have drifted
+    """
+    drifted = []
+
+    for hobli_id in hobli_ids:
+        report = db_service.verify_jurisdiction_stats(hobli_id)
+
+        if report['in_sync']:
+            logger.info(f"✓ {hobli_id} in sync")
+        else:
+            drifted.append(hobli_id)
+            for field, values in report['drift'].items():
+                logger.warning(f"✗ {hobli_id} {field}: materialized={values['materialized']} "
+                              f"computed={values['computed']}")
+
+    return drifted
+
+
+def rebuild_hoblis(db_service: DbService, hobli_ids: list) -> None:
+    """
+    Rebuild materialized statistics for a list of Hoblis
+
+    Args:
+        db_service: DbService instance
+        hobli_ids: Hobli identifiers to rebuild
+    """
+    for hobli_id in hobli_ids:
+        stats = db_service.rebuild_jurisdiction_stats(hobli_id)
+        logger.info(f"✓ Rebuilt {hobli_id}: {stats.total_plots} plots, "
+                   f"{stats.active_alerts} active alerts")
+
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Verify or rebuild materialized jurisdiction statistics')
+    parser.add_argument(
+        '--action',
+        choices=['verify', 'rebuild', 'repair'],
+        default='verify',
+        help='verify only, rebuild all selected Hoblis, or repair only drifted ones (default: verify)'
+    )
+    parser.add_argument(
+        '--hobli',
+        action='append',
+        dest='hobli_ids',
+        help='Hobli to process (repeatable; default: every known Hobli)'
+    )
+    parser.add_argument(
+        '--region',
+        default=None,
+        help='AWS region (default: from settings)'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        db_service = DbService(region=args.region)
+        hobli_ids = args.hobli_ids or db_service.get_known_hobli_ids()
+        logger.info(f"Processing {len(hobli_ids)} Hoblis ({args.action})")
+
+        if args.action == 'rebuild':
+            rebuild_hoblis(db_service, hobli_ids)
+
+        else:
+            drifted = verify_hoblis(db_service, hobli_ids)
+
+            if drifted and args.action == 'repair':
+                rebuild_hoblis(db_service, drifted)
+            elif drifted:
+                logger.warning(f"{len(drifted)} Hoblis have drifted; run with --action repair")
+                sys.exit(2)
+
+    except Exception as e:
+        logger.error(f"Operation failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Batch Bedrock analysis for daily scans
+
+Nightly scans care about throughput and cost, not per-plot latency. Many
+plots' NDVI summaries are packed into one text prompt, and the model
+answers with one JSON result per plot:
+- build_batch_prompt: numbered plot table plus the shared instructions
+- parse_batch_results: tolerant parser that keeps every complete result
+  from truncated or partly malformed output
+- batch_max_tokens: output budget scaled to the number of plots
+
+Plots without a usable result are left for the caller to classify with
+the rule-based fallback.
+"""
+
+from typing import Any, Dict, Optional, Sequence
+import json
+import re
+
+RISK_LEVELS = ("low", "medium", "high", "critical")
+
+# Output tokens budgeted per plot result, plus the JSON wrapper
+TOKENS_PER_RESULT = 160
+TOKENS_OVERHEAD = 100
+MAX_OUTPUT_TOKENS = 4096
+
+# Start of the next result object, used to resynchronize after a malformed one
+_RESULT_START = re.compile(r'\{\s*"id"\s*:')
+
+
+def batch_max_tokens(plot_count: int) -> int:
+    """
+    Output token budget for a batch
+
+    Args:
+        plot_count: Plots in the prompt
+
+    Returns:
+        max_tokens for the request
+    """
+    return min(MAX_OUTPUT_TOKENS, TOKENS_OVERHEAD + TOKENS_PER_RESULT * plot_count)
+
+
+def build_batch_prompt(plots: Sequence[Dict[str, Any]], thresholds: Sequence[float]) -> str:
+    """
+    Build one prompt covering many plots
+
+    Args:
+        plots: Plot summaries with id, ndvi, lat, lon and optional tile_id,
+            cloud_cover and anomaly (NDVIAnomaly dictionary)
+        thresholds: NDVI risk thresholds (critical, high, medium)
+
+    Returns:
+        Prompt text
+    """
+    critical, high, medium = thresholds
+    rows = []
+    for plot in plots:
+        row = (f"{plot['id']} | {plot['ndvi']:.3f} | ({plot['lat']:.4f}, {plot['lon']:.4f}) | "
+               f"{plot.get('tile_id') or 'N/A'} | {plot.get('cloud_cover', 'N/A')}")
+        anomaly = plot.get('anomaly') or {}
+        if anomaly.get('z_score') is not None:
+            row += f" | z {anomaly['z_score']:+.2f} ({anomaly['classification']})"
+        else:
+            row += " | N/A"
+        rows.append(row)
+
+    return f"""You are an expert AI agronomist triaging agricultural plots from satellite NDVI.
+
+PLOTS (id | NDVI | coordinates | Sentinel-2 tile | cloud cover % | seasonal anomaly):
+{chr(10).join(rows)}
+
+RISK BANDS:
+- "critical": NDVI < {critical}
+- "high": NDVI {critical}-{high}
+- "medium": NDVI {high}-{medium}
+- "low": NDVI > {medium}
+
+For every plot, consider whether low NDVI may be seasonal (harvest, fallow,
+senescence; a normal seasonal anomaly z-score suggests so) before classifying,
+and give short, sustainable recommendations.
+
+Respond with JSON only, one result per plot id, in the same order:
+{{"results": [
+    {{"id": 1, "risk_classification": "low|medium|high|critical", "confidence_score": 0.0-1.0,
+      "explanation": "One or two sentences", "recommendations": ["Action 1", "Action 2"]}}
+]}}"""
+
+
+def _normalize_result(result: Any, expected_ids: Sequence[int]) -> Optional[Dict[str, Any]]:
+    """Validate one result object, returning None if unusable"""
+    if not isinstance(result, dict):
+        return None
+    try:
+        plot_id = int(result.get('id'))
+    except (TypeError, ValueError):
+        return None
+    risk = str(result.get('risk_classification', '')).strip().lower()
+    if plot_id not in expected_ids or risk not in RISK_LEVELS:
+        return None
+
+    try:
+        confidence = min(max(float(result.get('confidence_score', 0.7)), 0.0), 1.0)
+    except (TypeError, ValueError):
+        confidence = 0.7
+    recommendations = result.get('recommendations')
+    if not isinstance(recommendations, list) or not recommendations:
+        recommendations = ['Monitor plot regularly']
+
+    return {
+        'id': plot_id,
+        'risk_classification': risk,
+        'confidence_score': confidence,
+        'explanation': str(result.get('explanation') or 'Batch analysis completed'),
+        'recommendations': [str(item) for item in recommendations]
+    }
+
+
+def parse_batch_results(content: str, expected_ids: Sequence[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Extract per-plot results from a batch response
+
+    Result objects are decoded one at a time from the results array, so a
+    response cut off by max_tokens still yields every complete result, and
+    a malformed object is skipped rather than discarding the batch.
+    Unknown ids, invalid risk levels and duplicates are ignored.
+
+    Args:
+        content: Model text output
+        expected_ids: Plot ids sent in the prompt
+
+    Returns:
+        Dictionary of plot id -> normalized result
+    """
+    expected = set(expected_ids)
+    results: Dict[int, Dict[str, Any]] = {}
+    decoder = json.JSONDecoder()
+
+    start = content.find('[')
+    if start < 0:
+        return results
+
+    position = start + 1
+    while position < len(content):
+        while position < len(content) and content[position] in ' \t\r\n,':
+            position += 1
+        if position >= len(content) or content[position] != '{':
+            break
+        try:
+            result, position = decoder.raw_decode(content, position)
+        except json.JSONDecodeError:
+            # Skip to the next result object (none left if the output was truncated)
+            match = _RESULT_START.search(content, position + 1)
+            if match is None:
+                break
+            position = match.start()
+            continue
+
+        normalized = _normalize_result(result, expected)
+        if normalized is not None and normalized['id'] not in results:
+            results[normalized['id']] = normalized
+
+    return results
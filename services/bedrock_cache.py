@@ -0,0 +1,179 @@
+"""
+Content-addressed cache for Bedrock model responses
+
+Plot analyses and farmer guidance are deterministic functions of their
+prompt: identical NDVI (3 dp), tile, image and metadata produce an
+identical request body. Responses are cached under a hash of that body:
+- Key: SHA-256 of model id plus the canonical JSON request body, with
+  presigned image URLs reduced to the object they point at
+- TTL and entry-count bounds, with memory, SQLite or Redis storage (the
+  NDVI cache backends)
+- Hit/miss counters for service metrics
+
+Backend failures never fail an analysis; they are logged and treated as
+misses.
+"""
+
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit, urlunsplit
+import hashlib
+import json
+import logging
+
+from config.settings import get_settings
+from services.ndvi_cache import (
+    MemoryNDVICacheBackend,
+    NDVICacheBackend,
+    RedisNDVICacheBackend,
+    SQLiteNDVICacheBackend
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_request(value: Any) -> Any:
+    """Drop presigned URL query strings (signature, expiry) from image sources"""
+    if isinstance(value, dict):
+        if value.get('type') == 'url' and isinstance(value.get('url'), str):
+            parts = urlsplit(value['url'])
+            return {**value, 'url': urlunsplit((parts.scheme, parts.netloc, parts.path, '', ''))}
+        return {key: _normalize_request(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_normalize_request(item) for item in value]
+    return value
+
+
+class BedrockResponseCache:
+    """Bedrock response cache keyed by a hash of model id and request body"""
+
+    def __init__(self, backend: NDVICacheBackend, ttl_seconds: float = 86400):
+        """
+        Initialize BedrockResponseCache
+
+        Args:
+            backend: Storage backend
+            ttl_seconds: Seconds a response stays valid
+        """
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.errors = 0
+
+    @property
+    def blocking(self) -> bool:
+        """Whether lookups block on I/O"""
+        return self.backend.blocking
+
+    @staticmethod
+    def key_for(model_id: str, request_body: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a request
+
+        Args:
+            model_id: Bedrock model identifier
+            request_body: Request payload sent to invoke_model
+
+        Returns:
+            Hex SHA-256 of the model id and normalized request body
+        """
+        canonical = json.dumps(
+            {'model_id': model_id, 'body': _normalize_request(request_body)},
+            sort_keys=True,
+            separators=(',', ':'),
+            ensure_ascii=False
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached response body
+
+        Args:
+            key: Key from key_for
+
+        Returns:
+            Parsed response body, or None on a miss
+        """
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            self.errors += 1
+            self.misses += 1
+            logger.warning(f"Bedrock cache lookup failed for {key}: {e}")
+            return None
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, response_body: Dict[str, Any]) -> None:
+        """
+        Store a response body
+
+        Args:
+            key: Key from key_for
+            response_body: Parsed invoke_model response body
+        """
+        try:
+            self.backend.set(key, json.dumps(response_body), self.ttl_seconds)
+            self.stores += 1
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Bedrock cache store failed for {key}: {e}")
+
+    def clear(self) -> None:
+        """Remove every cached response (counters are kept)"""
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with backend name, TTL, hit/miss/store/error counters and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'backend': type(self.backend).__name__,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'errors': self.errors,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+def create_bedrock_cache(backend: Optional[str] = None) -> Optional[BedrockResponseCache]:
+    """
+    Build the Bedrock response cache configured in settings.brain_service
+
+    Args:
+        backend: Backend name overriding settings.brain_service.bedrock_cache_backend
+
+    Returns:
+        BedrockResponseCache, or None when the backend is "none"
+    """
+    config = get_settings().brain_service
+    backend = backend or config.bedrock_cache_backend
+
+    if backend == "none":
+        return None
+    if backend == "memory":
+        store: NDVICacheBackend = MemoryNDVICacheBackend(max_entries=config.bedrock_cache_max_entries)
+    elif backend == "sqlite":
+        store = SQLiteNDVICacheBackend(
+            config.bedrock_cache_path, table="bedrock_cache", max_entries=config.bedrock_cache_max_entries
+        )
+    elif backend == "redis":
+        store = RedisNDVICacheBackend(url=config.bedrock_cache_redis_url, key_prefix="bedrock:")
+    else:
+        raise ValueError(f"Unknown Bedrock cache backend: {backend}")
+
+    return BedrockResponseCache(store, ttl_seconds=config.bedrock_cache_ttl_seconds)
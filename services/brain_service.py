@@ -3,8 +3,10 @@ BrainService - Multimodal AI Orchestration
 
 Orchestrates multimodal AI analysis by combining:
 - GEEService: Google Earth Engine NDVI data
-- SentinelService: AWS Open Data Sentinel-2 imagery
+- SentinelService: AWS Open Data Sentinel-2 imagery (and local 10 m NDVI)
 - AWS Bedrock: Multimodal reasoning (NDVI + Image → Analysis)
+- ReasoningTriage: clear-cut NDVI cases skip Sonnet (rules or Haiku)
+- Batch analysis: many plots per text prompt for daily scans
 """
 
 from typing import Tuple, Optional, Dict, Any, List
@@ -13,12 +15,20 @@ from datetime import datetime
 import logging
 import json
 import asyncio
-import boto3
+import time
 from botocore.exceptions import ClientError
 
+from services.batch_analysis import batch_max_tokens, build_batch_prompt, parse_batch_results
+from services.bedrock_cache import BedrockResponseCache, create_bedrock_cache
+from services.cache import SingleFlight
 from services.gee_service import GEEService, GEEData
+from services.image_chips import ImageChip
+from services.ndvi_timeseries import NDVIAnomaly, NDVITimeSeriesEngine
+from services.reasoning_triage import ReasoningTriage
 from services.sentinel_service import SentinelService, SentinelData
+from services.executor import run_blocking
 from config.settings import get_settings
+from config.aws_clients import get_client
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +50,7 @@ class AnalysisResult(BaseModel):
     risk_level: str
     confidence: float
     analysis_timestamp: datetime
+    reasoning_tier: Optional[str] = None  # 'rules', 'haiku', 'sonnet' or 'batch' (batch analysis)
     
     class Config:
         json_encoders = {
@@ -67,37 +78,82 @@ class Alert(BaseModel):
 class BrainService:
     """Service for multimodal AI orchestration with GEE, Sentinel, and Bedrock"""
     
-    def __init__(self, use_mock_gee: bool = False, region: Optional[str] = None):
+    def __init__(
+        self,
+        use_mock_gee: bool = False,
+        region: Optional[str] = None,
+        sentinel_service: Optional[SentinelService] = None,
+        bedrock_cache: Optional[BedrockResponseCache] = None
+    ):
         """
         Initialize BrainService with sub-services
         
         Args:
             use_mock_gee: If True, use mock GEE data
             region: AWS region for Bedrock (defaults to settings)
+            sentinel_service: Existing SentinelService to share (one is created if omitted)
+            bedrock_cache: Bedrock response cache; if omitted one is built from
+                settings.brain_service.bedrock_cache_backend (off by default)
         """
         settings = get_settings()
         
         # Initialize sub-services
         self.gee_service = GEEService(use_mock=use_mock_gee)
-        self.sentinel_service = SentinelService(region=region)
+        self.sentinel_service = sentinel_service or SentinelService(region=region)
         
-        # Initialize Bedrock client
+        # 16-day NDVI series and seasonal anomalies (separates senescence from stress)
+        self.ndvi_timeseries = NDVITimeSeriesEngine(self.gee_service)
+        self.use_ndvi_anomaly = settings.brain_service.use_ndvi_anomaly
+        
+        # Primary NDVI source: GEE (MODIS 250 m) or local Sentinel-2 10 m with GEE fallback
+        self.ndvi_source = settings.brain_service.ndvi_source
+        self.ndvi_source_stats = {'sentinel': 0, 'gee_fallback': 0}
+        
+        # Shared Bedrock client from the registry
         self.region = region or settings.aws.region
-        self.bedrock_client = boto3.client('bedrock-runtime', region_name=self.region)
+        self.bedrock_client = get_client('bedrock-runtime', self.region)
+        
+        # Responses keyed by a hash of model id and request; None (the default) disables caching
+        self.bedrock_cache = bedrock_cache if bedrock_cache is not None else create_bedrock_cache()
+        self._bedrock_flight = SingleFlight()
         
         # Bedrock model configuration
         self.bedrock_model_id = 'anthropic.claude-3-sonnet-20240229-v1:0'
         self.bedrock_haiku_model_id = 'anthropic.claude-3-haiku-20240307-v1:0'
         
         # Risk classification thresholds
-        self.ndvi_critical_threshold = 0.2  # < 0.2 is critical
-        self.ndvi_high_threshold = 0.4      # < 0.4 is high risk
-        self.ndvi_medium_threshold = 0.6    # < 0.6 is medium risk
+        config = settings.brain_service
+        self.ndvi_critical_threshold = config.ndvi_threshold_critical  # < 0.2 is critical
+        self.ndvi_high_threshold = config.ndvi_threshold_high          # < 0.4 is high risk
+        self.ndvi_medium_threshold = config.ndvi_threshold_medium      # < 0.6 is medium risk
+        self.max_tokens = config.max_tokens
+        self.cluster_outbreak_min_plots = config.cluster_outbreak_min_plots
+        
+        # Daily scans: plots per batch prompt and batch prompts in flight
+        self.batch_analysis_enabled = config.batch_analysis_enabled
+        self.batch_analysis_size = config.batch_analysis_size
+        self.batch_analysis_concurrency = config.batch_analysis_concurrency
+        self.batch_stats = {'batches': 0, 'plots': 0, 'parsed': 0, 'fallbacks': 0, 'failed_batches': 0}
+        
+        # Plots whose only scene was too cloudy for multimodal analysis
+        self.unusable_scenes_skipped = 0
+        
+        # Which plots need Sonnet, Haiku or only the rule-based classification
+        self.triage = ReasoningTriage(
+            thresholds=(self.ndvi_critical_threshold, self.ndvi_high_threshold, self.ndvi_medium_threshold),
+            enabled=config.triage_enabled,
+            sonnet_margin=config.triage_sonnet_margin,
+            haiku_margin=config.triage_haiku_margin,
+            sonnet_cost_usd=config.triage_sonnet_cost_usd,
+            haiku_cost_usd=config.triage_haiku_cost_usd,
+            sonnet_latency_seconds=config.triage_sonnet_latency_seconds,
+            batch_cost_usd=config.triage_batch_cost_usd
+        )
         
         logger.info(f"BrainService initialized with region={self.region}, "
                    f"model={self.bedrock_model_id}")
     
-    async def analyze_plot(self, lat: float, lon: float) -> AnalysisResult:
+    async def analyze_plot(self, lat: float, lon: float, gee_data: Optional[GEEData] = None) -> AnalysisResult:
         """
         Multimodal analysis combining GEE data and Sentinel imagery
         
@@ -105,11 +161,14 @@ class BrainService:
         then sends both numerical NDVI data and visual imagery to Bedrock
         for comprehensive multimodal reasoning.
         
-        FALLBACK: If Sentinel imagery is unavailable, falls back to NDVI-only analysis.
+        FALLBACK: If Sentinel imagery is unavailable, or the scene is too
+        cloudy to be usable, falls back to NDVI-only analysis without Bedrock.
         
         Args:
             lat: Latitude coordinate
             lon: Longitude coordinate
+            gee_data: NDVI already fetched for this point (e.g. by
+                GEEService.get_ndvi_batch); fetched here when omitted
             
         Returns:
             AnalysisResult with complete or fallback analysis
@@ -123,16 +182,24 @@ class BrainService:
             
             # Step 1 & 2: Concurrent data fetching (GEE + Sentinel)
             # This meets the 6-second concurrent processing requirement
-            gee_task = self.gee_service.get_ndvi_analysis(lat, lon)
+            if gee_data is None:
+                gee_task = self.get_ndvi(lat, lon)
+            else:
+                gee_task = self._prefetched(gee_data)
             sentinel_task = self.sentinel_service.get_latest_image(lat, lon)
+            if self.use_ndvi_anomaly:
+                anomaly_task = self.get_ndvi_anomalies([(lat, lon)])
+            else:
+                anomaly_task = self._prefetched(None)
             
-            # Wait for both to complete concurrently, but handle failures
+            # Wait for all to complete concurrently, but handle failures
             gee_data = None
             sentinel_data = None
             sentinel_error = None
+            ndvi_anomaly = None
             
             try:
-                results = await asyncio.gather(gee_task, sentinel_task, return_exceptions=True)
+                results = await asyncio.gather(gee_task, sentinel_task, anomaly_task, return_exceptions=True)
                 
                 # Check GEE result (critical - must succeed)
                 if isinstance(results[0], Exception):
@@ -146,6 +213,13 @@ class BrainService:
                     logger.info("Falling back to NDVI-only analysis")
                 else:
                     sentinel_data = results[1]
+                
+                # Check anomaly result (optional - analysis proceeds without it)
+                if isinstance(results[2], Exception):
+                    logger.warning(f"NDVI anomaly unavailable: {results[2]}")
+                elif results[2]:
+                    ndvi_anomaly = results[2][0]
+                    gee_data.metadata['ndvi_anomaly'] = ndvi_anomaly.dict()
                     
             except Exception as e:
                 logger.error(f"Data fetching error: {e}")
@@ -158,22 +232,55 @@ class BrainService:
             else:
                 logger.info(f"Data fetched - NDVI: {gee_data.ndvi_float:.3f} (Sentinel unavailable)")
             
-            # Step 3: Send to Bedrock for reasoning (multimodal or NDVI-only)
-            if sentinel_data:
-                # Full multimodal analysis
-                bedrock_response = await self._bedrock_multimodal_analysis(
-                    ndvi_value=gee_data.ndvi_float,
-                    image_url=sentinel_data.image_url,
-                    coordinates=(lat, lon),
-                    additional_context={
-                        'gee_metadata': gee_data.metadata,
-                        'sentinel_metadata': {
-                            'tile_id': sentinel_data.tile_id,
-                            'cloud_cover': sentinel_data.cloud_cover_percentage,
-                            'quality': sentinel_data.quality_assessment
-                        }
-                    }
+            # Step 3: Triage, then reason with Sonnet, Haiku or rules (NDVI-only without imagery)
+            reasoning_tier = None
+            if sentinel_data and sentinel_data.quality_assessment == "unusable":
+                # Cloud hides the canopy: skip Bedrock and the image transfer
+                logger.info(f"Scene {sentinel_data.tile_id} is unusable "
+                           f"({sentinel_data.cloud_cover_percentage:.1f}% cloud), using NDVI-only analysis")
+                self.unusable_scenes_skipped += 1
+                bedrock_response = self._fallback_risk_classification(gee_data.ndvi_float)
+                bedrock_response.explanation += (
+                    f"\n\nNote: The latest satellite scene is "
+                    f"{sentinel_data.cloud_cover_percentage:.0f}% cloud covered. "
+                    f"Analysis based on NDVI data only."
                 )
+            elif sentinel_data:
+                analysis_context = {
+                    'gee_metadata': gee_data.metadata,
+                    'ndvi_anomaly': ndvi_anomaly.dict() if ndvi_anomaly else None,
+                    'sentinel_metadata': {
+                        'tile_id': sentinel_data.tile_id,
+                        'cloud_cover': sentinel_data.cloud_cover_percentage,
+                        'quality': sentinel_data.quality_assessment
+                    }
+                }
+                decision = self.triage.decide(gee_data.ndvi_float, analysis_context['ndvi_anomaly'])
+                reasoning_tier = decision.tier
+                logger.debug(f"Triage: {decision.tier} ({decision.reason})")
+                
+                reasoning_start = time.perf_counter()
+                if decision.tier == "sonnet":
+                    # Full multimodal analysis (plot chip when enabled, else the tile URL)
+                    bedrock_response = await self._bedrock_multimodal_analysis(
+                        ndvi_value=gee_data.ndvi_float,
+                        image_url=sentinel_data.image_url,
+                        coordinates=(lat, lon),
+                        additional_context=analysis_context,
+                        image_chip=await self._get_image_chip(sentinel_data, lat, lon)
+                    )
+                elif decision.tier == "haiku":
+                    bedrock_response = await self._bedrock_text_analysis(
+                        ndvi_value=gee_data.ndvi_float,
+                        coordinates=(lat, lon),
+                        additional_context=analysis_context
+                    )
+                else:
+                    bedrock_response = self._fallback_risk_classification(gee_data.ndvi_float)
+                    bedrock_response.visual_observations = (
+                        f"Not required: NDVI {gee_data.ndvi_float:.3f} is clear of every risk threshold"
+                    )
+                self.triage.record(decision.tier, time.perf_counter() - reasoning_start)
             else:
                 # Fallback to NDVI-only analysis
                 logger.info("Using fallback NDVI-only analysis")
@@ -187,19 +294,7 @@ class BrainService:
             
             # Create mock Sentinel data if unavailable
             if not sentinel_data:
-                from services.sentinel_service import SentinelData
-                sentinel_data = SentinelData(
-                    image_url="",
-                    tile_id="unavailable",
-                    acquisition_date=datetime.now(),
-                    cloud_cover_percentage=0.0,
-                    resolution="N/A",
-                    quality_assessment="unavailable",
-                    metadata={
-                        'error': str(sentinel_error),
-                        'fallback_mode': True
-                    }
-                )
+                sentinel_data = self._unavailable_sentinel_data(sentinel_error)
             
             # Create complete analysis result
             analysis_result = AnalysisResult(
@@ -208,7 +303,8 @@ class BrainService:
                 bedrock_reasoning=bedrock_response,
                 risk_level=bedrock_response.risk_classification,
                 confidence=bedrock_response.confidence_score,
-                analysis_timestamp=datetime.now()
+                analysis_timestamp=datetime.now(),
+                reasoning_tier=reasoning_tier
             )
             
             logger.info(f"Analysis complete - Risk: {bedrock_response.risk_classification}, "
@@ -226,12 +322,364 @@ class BrainService:
             logger.error(f"Unexpected error during plot analysis: {e}")
             raise
     
+    @staticmethod
+    def _unavailable_sentinel_data(error: Any) -> SentinelData:
+        """Placeholder SentinelData for plots without imagery"""
+        return SentinelData(
+            image_url="",
+            tile_id="unavailable",
+            acquisition_date=datetime.now(),
+            cloud_cover_percentage=0.0,
+            resolution="N/A",
+            quality_assessment="unavailable",
+            metadata={
+                'error': str(error),
+                'fallback_mode': True
+            }
+        )
+    
+    async def analyze_plots_batch(
+        self,
+        points: List[Tuple[float, float]],
+        gee_data: Optional[List[Optional[GEEData]]] = None
+    ) -> List[AnalysisResult]:
+        """
+        Analyze many plots with one Bedrock call per batch_analysis_size plots
+        
+        Throughput mode for daily scans: NDVI summaries (with tile, cloud
+        cover and seasonal anomaly when available) are packed into text-only
+        Sonnet prompts that return one JSON result per plot. Plots the triage
+        routes to rules skip the prompt. Plots missing from a truncated or
+        malformed response, or from a failed call, get the rule-based
+        classification. Prompted plots get reasoning_tier 'batch' and are
+        recorded in the triage report with their share of the prompt latency.
+        
+        Args:
+            points: (lat, lon) pairs
+            gee_data: NDVI already fetched for the points (None entries are fetched)
+            
+        Returns:
+            AnalysisResult per point, in input order
+            
+        Raises:
+            ValueError: If coordinates are invalid
+        """
+        if not points:
+            return []
+        
+        # NDVI: reuse prefetched values, fetch the rest in one batched lookup
+        ndvi = list(gee_data) if gee_data is not None else [None] * len(points)
+        missing = [index for index, data in enumerate(ndvi) if data is None]
+        if missing:
+            fetched = await self.get_ndvi_batch([points[index] for index in missing])
+            for index, data in zip(missing, fetched):
+                ndvi[index] = data
+        
+        # Imagery metadata (tile lookups coalesce) and optional anomalies, concurrently
+        sentinel_task = asyncio.gather(
+            *(self.sentinel_service.get_latest_image(lat, lon) for lat, lon in points),
+            return_exceptions=True
+        )
+        anomaly_task = self.get_ndvi_anomalies(points) if self.use_ndvi_anomaly else self._prefetched(None)
+        sentinel_results, anomalies = await asyncio.gather(sentinel_task, anomaly_task, return_exceptions=True)
+        if isinstance(anomalies, Exception):
+            logger.warning(f"NDVI anomalies unavailable for batch: {anomalies}")
+            anomalies = None
+        
+        sentinel = [
+            self._unavailable_sentinel_data(result) if isinstance(result, Exception) else result
+            for result in sentinel_results
+        ]
+        anomaly_dicts = [anomaly.dict() for anomaly in anomalies] if anomalies else [None] * len(points)
+        for data, anomaly in zip(ndvi, anomaly_dicts):
+            if anomaly is not None:
+                data.metadata['ndvi_anomaly'] = anomaly
+        
+        responses: List[Optional[BedrockResponse]] = [None] * len(points)
+        tiers: List[Optional[str]] = [None] * len(points)
+        pending = []
+        for index, data in enumerate(ndvi):
+            decision = self.triage.decide(data.ndvi_float, anomaly_dicts[index]) if self.triage.enabled else None
+            if decision is not None and decision.tier == "rules":
+                responses[index] = self._fallback_risk_classification(data.ndvi_float)
+                responses[index].visual_observations = (
+                    f"Not required: NDVI {data.ndvi_float:.3f} is clear of every risk threshold"
+                )
+                tiers[index] = "rules"
+                self.triage.record("rules", 0.0)
+            else:
+                pending.append(index)
+        
+        semaphore = asyncio.Semaphore(self.batch_analysis_concurrency)
+        
+        async def run_batch(indexes: List[int]) -> None:
+            async with semaphore:
+                batch_start = time.perf_counter()
+                batch = await self._bedrock_batch_analysis([
+                    {
+                        'id': position + 1,
+                        'ndvi': ndvi[index].ndvi_float,
+                        'lat': points[index][0],
+                        'lon': points[index][1],
+                        'tile_id': None if sentinel[index].tile_id == "unavailable" else sentinel[index].tile_id,
+                        'cloud_cover': sentinel[index].cloud_cover_percentage,
+                        'anomaly': anomaly_dicts[index]
+                    }
+                    for position, index in enumerate(indexes)
+                ])
+                per_plot_seconds = (time.perf_counter() - batch_start) / len(indexes)
+            for position, index in enumerate(indexes):
+                responses[index] = batch[position]
+                tiers[index] = "batch"
+                self.triage.record("batch", per_plot_seconds)
+        
+        await asyncio.gather(*(
+            run_batch(pending[start:start + self.batch_analysis_size])
+            for start in range(0, len(pending), self.batch_analysis_size)
+        ))
+        
+        timestamp = datetime.now()
+        return [
+            AnalysisResult(
+                gee_data=ndvi[index],
+                sentinel_data=sentinel[index],
+                bedrock_reasoning=responses[index],
+                risk_level=responses[index].risk_classification,
+                confidence=responses[index].confidence_score,
+                analysis_timestamp=timestamp,
+                reasoning_tier=tiers[index]
+            )
+            for index in range(len(points))
+        ]
+    
+    async def _bedrock_batch_analysis(self, plots: List[Dict[str, Any]]) -> List[BedrockResponse]:
+        """
+        One text-only Bedrock call for a batch of plot summaries
+        
+        Args:
+            plots: Plot summaries for build_batch_prompt (ids 1..n)
+            
+        Returns:
+            BedrockResponse per plot, in order; rule-based for plots without a result
+        """
+        self.batch_stats['batches'] += 1
+        self.batch_stats['plots'] += len(plots)
+        
+        thresholds = (self.ndvi_critical_threshold, self.ndvi_high_threshold, self.ndvi_medium_threshold)
+        request_body = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": batch_max_tokens(len(plots)),
+            "temperature": 0.3,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": build_batch_prompt(plots, thresholds)
+                }
+            ]
+        }
+        
+        results: Dict[int, Dict[str, Any]] = {}
+        try:
+            response_body = await self._invoke_bedrock_cached(self.bedrock_model_id, request_body)
+            results = parse_batch_results(response_body['content'][0]['text'], [plot['id'] for plot in plots])
+        except Exception as e:
+            self.batch_stats['failed_batches'] += 1
+            logger.error(f"Batch analysis of {len(plots)} plots failed: {e}")
+        
+        responses = []
+        for plot in plots:
+            result = results.get(plot['id'])
+            if result is None:
+                responses.append(self._fallback_risk_classification(plot['ndvi']))
+                continue
+            responses.append(BedrockResponse(
+                risk_classification=result['risk_classification'],
+                confidence_score=result['confidence_score'],
+                explanation=result['explanation'],
+                visual_observations="Not assessed: batch analysis uses NDVI summaries only",
+                recommendations=result['recommendations']
+            ))
+        
+        self.batch_stats['parsed'] += len(results)
+        self.batch_stats['fallbacks'] += len(plots) - len(results)
+        if len(results) < len(plots):
+            logger.warning(f"Batch analysis returned {len(results)}/{len(plots)} results; "
+                          f"rule-based classification used for the rest")
+        return responses
+    
+    async def get_ndvi(self, lat: float, lon: float) -> GEEData:
+        """
+        Plot NDVI from the configured primary source
+        
+        With ndvi_source "sentinel", NDVI is computed locally from the latest
+        Sentinel-2 scene's 10 m bands; Earth Engine is the fallback when no
+        recent scene covers the plot or it is too cloudy.
+        
+        Args:
+            lat: Latitude coordinate
+            lon: Longitude coordinate
+            
+        Returns:
+            GEEData (metadata['data_source'] is 'sentinel_local' for local results)
+            
+        Raises:
+            ValueError: If coordinates are invalid or no source has data
+        """
+        if self.ndvi_source == "sentinel":
+            try:
+                result = await self.sentinel_service.get_local_ndvi(lat, lon)
+                self.ndvi_source_stats['sentinel'] += 1
+                return result
+            except Exception as e:
+                self.ndvi_source_stats['gee_fallback'] += 1
+                logger.warning(f"Local Sentinel-2 NDVI unavailable for ({lat}, {lon}), using GEE: {e}")
+        return await self.gee_service.get_ndvi_analysis(lat, lon)
+    
+    async def get_ndvi_batch(self, points: List[Tuple[float, float]]) -> List[GEEData]:
+        """
+        NDVI for many plots from the configured primary source
+        
+        Local Sentinel-2 results are computed concurrently; plots without one
+        share a single batched Earth Engine lookup.
+        
+        Args:
+            points: (lat, lon) pairs
+            
+        Returns:
+            GEEData per point, in input order
+        """
+        if self.ndvi_source != "sentinel":
+            return await self.gee_service.get_ndvi_batch(points)
+        
+        local = await asyncio.gather(
+            *(self.sentinel_service.get_local_ndvi(lat, lon) for lat, lon in points),
+            return_exceptions=True
+        )
+        results: List[Optional[GEEData]] = [None if isinstance(item, Exception) else item for item in local]
+        missing = [index for index, result in enumerate(results) if result is None]
+        self.ndvi_source_stats['sentinel'] += len(points) - len(missing)
+        self.ndvi_source_stats['gee_fallback'] += len(missing)
+        
+        if missing:
+            logger.info(f"Local Sentinel-2 NDVI unavailable for {len(missing)}/{len(points)} plots, using GEE")
+            fetched = await self.gee_service.get_ndvi_batch([points[index] for index in missing])
+            for index, result in zip(missing, fetched):
+                results[index] = result
+        return results
+    
+    async def get_ndvi_anomalies(self, points: List[Tuple[float, float]]) -> List[NDVIAnomaly]:
+        """
+        Seasonal NDVI anomalies for a batch of plots
+        
+        Compares each plot's latest 16-day composite with the same period in
+        previous years, so low NDVI during senescence or harvest is not
+        mistaken for stress.
+        
+        Args:
+            points: (lat, lon) pairs
+            
+        Returns:
+            NDVIAnomaly per point, in input order
+        """
+        return await self.ndvi_timeseries.get_anomalies(points)
+    
+    @staticmethod
+    def _format_anomaly_context(anomaly: Optional[Dict[str, Any]]) -> str:
+        """Prompt line describing the seasonal NDVI anomaly (empty when unknown)"""
+        if not anomaly or anomaly.get('z_score') is None:
+            return ""
+        return (f"- Seasonal Anomaly: z-score {anomaly['z_score']:+.2f} vs "
+                f"{anomaly['climatology_years']}-year mean {anomaly['climatology_mean']:.3f} "
+                f"for this time of year ({anomaly['classification']})\n")
+    
+    @staticmethod
+    async def _prefetched(value: Any) -> Any:
+        """Wrap an already available value as an awaitable for asyncio.gather"""
+        return value
+    
+    def _invoke_bedrock(self, model_id: str, request_body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Invoke a Bedrock model and read its JSON response body (blocking)
+        
+        Both the request and the response stream read block on the network,
+        so callers run this on the shared executor.
+        
+        Args:
+            model_id: Bedrock model identifier
+            request_body: Request payload
+            
+        Returns:
+            Parsed response body
+            
+        Raises:
+            ClientError: If Bedrock API call fails
+        """
+        response = self.bedrock_client.invoke_model(
+            modelId=model_id,
+            body=json.dumps(request_body)
+        )
+        return json.loads(response['body'].read())
+    
+    async def _invoke_bedrock_cached(self, model_id: str, request_body: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Invoke a Bedrock model through the response cache
+        
+        Identical requests (same model, prompt and image object) are served
+        from the cache, and concurrent identical requests share one call.
+        Failed calls are not cached.
+        
+        Args:
+            model_id: Bedrock model identifier
+            request_body: Request payload
+            
+        Returns:
+            Parsed response body
+            
+        Raises:
+            ClientError: If Bedrock API call fails
+        """
+        cache = self.bedrock_cache
+        if cache is None:
+            return await run_blocking(self._invoke_bedrock, model_id, request_body)
+        
+        key = cache.key_for(model_id, request_body)
+        cached = await run_blocking(cache.get, key) if cache.blocking else cache.get(key)
+        if cached is not None:
+            logger.debug(f"Bedrock cache hit for {model_id}")
+            return cached
+        
+        async def invoke() -> Dict[str, Any]:
+            response_body = await run_blocking(self._invoke_bedrock, model_id, request_body)
+            if cache.blocking:
+                await run_blocking(cache.set, key, response_body)
+            else:
+                cache.set(key, response_body)
+            return response_body
+        
+        return await self._bedrock_flight.do(key, invoke)
+    
+    async def _get_image_chip(self, sentinel_data: SentinelData, lat: float, lon: float) -> Optional[ImageChip]:
+        """
+        Plot-sized chip for the multimodal prompt, if enabled
+        
+        Returns None (the prompt falls back to the full-tile URL) when chips
+        are disabled or extraction fails.
+        """
+        if getattr(self.sentinel_service, 'chip_enabled', False) is not True:
+            return None
+        try:
+            return await self.sentinel_service.get_image_chip(sentinel_data, lat, lon)
+        except Exception as e:
+            logger.warning(f"Image chip unavailable for ({lat}, {lon}), sending tile URL: {e}")
+            return None
+    
     async def _bedrock_multimodal_analysis(
         self, 
         ndvi_value: float, 
         image_url: str, 
         coordinates: Tuple[float, float],
-        additional_context: Dict[str, Any]
+        additional_context: Dict[str, Any],
+        image_chip: Optional[ImageChip] = None
     ) -> BedrockResponse:
         """
         Send both numerical data and imagery to Bedrock for analysis
@@ -245,6 +693,7 @@ class BrainService:
             image_url: Sentinel-2 image URL
             coordinates: Plot coordinates (lat, lon)
             additional_context: Additional GEE and Sentinel metadata
+            image_chip: Plot-sized chip embedded as base64 instead of image_url
             
         Returns:
             BedrockResponse with multimodal analysis
@@ -254,6 +703,13 @@ class BrainService:
         """
         try:
             lat, lon = coordinates
+            if image_chip:
+                image_description = (f"- Image below is a {image_chip.width}x{image_chip.height} px true-color RGB chip "
+                                     f"({image_chip.resolution_m:g} m/pixel) centred on the plot")
+                image_source = image_chip.to_bedrock_source()
+            else:
+                image_description = "- Image URL provided below shows true-color RGB satellite view"
+                image_source = {"type": "url", "url": image_url}
             
             # Construct Chain-of-Thought prompt for agricultural analysis
             prompt = f"""You are an expert AI agronomist analyzing agricultural plot health using multimodal data.
@@ -263,9 +719,9 @@ NUMERICAL DATA (Google Earth Engine):
 - Coordinates: ({lat:.4f}, {lon:.4f})
 - Data Source: {additional_context.get('gee_metadata', {}).get('sensor', 'MODIS')}
 - Cloud Cover: {additional_context.get('gee_metadata', {}).get('cloud_cover', 'N/A')}%
-
+{self._format_anomaly_context(additional_context.get('ndvi_anomaly'))}
 VISUAL DATA (Sentinel-2 Satellite Imagery):
-- Image URL provided below shows true-color RGB satellite view
+{image_description}
 - Tile ID: {additional_context.get('sentinel_metadata', {}).get('tile_id', 'N/A')}
 - Image Quality: {additional_context.get('sentinel_metadata', {}).get('quality', 'N/A')}
 
@@ -306,7 +762,7 @@ Respond in JSON format:
             # Prepare Bedrock API request with multimodal content
             request_body = {
                 "anthropic_version": "bedrock-2023-05-31",
-                "max_tokens": 1000,
+                "max_tokens": self.max_tokens,
                 "temperature": 0.3,  # Lower temperature for more consistent analysis
                 "messages": [
                     {
@@ -318,10 +774,7 @@ Respond in JSON format:
                             },
                             {
                                 "type": "image",
-                                "source": {
-                                    "type": "url",
-                                    "url": image_url
-                                }
+                                "source": image_source
                             }
                         ]
                     }
@@ -330,31 +783,10 @@ Respond in JSON format:
             
             logger.debug(f"Sending multimodal request to Bedrock: NDVI={ndvi_value:.3f}")
             
-            # Call Bedrock API
-            response = self.bedrock_client.invoke_model(
-                modelId=self.bedrock_model_id,
-                body=json.dumps(request_body)
-            )
-            
-            # Parse response
-            response_body = json.loads(response['body'].read())
-            content = response_body['content'][0]['text']
-            
-            # Parse JSON response from Claude
-            try:
-                analysis = json.loads(content)
-            except json.JSONDecodeError:
-                # Fallback if response is not valid JSON
-                logger.warning("Bedrock response not valid JSON, using fallback parsing")
-                analysis = self._fallback_risk_classification(ndvi_value)
-            
-            # Create BedrockResponse
-            bedrock_response = BedrockResponse(
-                risk_classification=analysis.get('risk_classification', 'medium'),
-                confidence_score=float(analysis.get('confidence_score', 0.7)),
-                explanation=analysis.get('explanation', 'Analysis completed'),
-                visual_observations=analysis.get('visual_observations', 'Visual analysis performed'),
-                recommendations=analysis.get('recommendations', ['Monitor plot regularly'])
+            # Call Bedrock API off the event loop (identical requests come from the cache)
+            response_body = await self._invoke_bedrock_cached(self.bedrock_model_id, request_body)
+            bedrock_response = self._parse_analysis(
+                response_body['content'][0]['text'], ndvi_value, 'Visual analysis performed'
             )
             
             logger.info(f"Bedrock analysis complete: {bedrock_response.risk_classification}")
@@ -370,6 +802,106 @@ Respond in JSON format:
             logger.error(f"Unexpected error in Bedrock analysis: {e}")
             return self._fallback_risk_classification(ndvi_value)
     
+    async def _bedrock_text_analysis(
+        self,
+        ndvi_value: float,
+        coordinates: Tuple[float, float],
+        additional_context: Dict[str, Any]
+    ) -> BedrockResponse:
+        """
+        Text-only Haiku analysis for plots the triage marks as mid-confidence
+        
+        The NDVI is close enough to a risk band that the rule-based label may
+        be wrong, but not close enough to need the multimodal Sonnet call.
+        
+        Args:
+            ndvi_value: NDVI float value from GEE
+            coordinates: Plot coordinates (lat, lon)
+            additional_context: Additional GEE, anomaly and Sentinel metadata
+            
+        Returns:
+            BedrockResponse from Haiku, or the rule-based classification on failure
+        """
+        try:
+            lat, lon = coordinates
+            
+            prompt = f"""You are an expert AI agronomist classifying agricultural plot health from satellite NDVI.
+
+DATA:
+- NDVI Value: {ndvi_value:.3f} (Range: -1 to 1, where higher = healthier vegetation)
+- Coordinates: ({lat:.4f}, {lon:.4f})
+- Data Source: {additional_context.get('gee_metadata', {}).get('sensor', 'MODIS')}
+- Sentinel-2 Cloud Cover: {additional_context.get('sentinel_metadata', {}).get('cloud_cover', 'N/A')}%
+{self._format_anomaly_context(additional_context.get('ndvi_anomaly'))}
+RISK BANDS:
+- "critical": NDVI < {self.ndvi_critical_threshold}
+- "high": NDVI {self.ndvi_critical_threshold}-{self.ndvi_high_threshold}
+- "medium": NDVI {self.ndvi_high_threshold}-{self.ndvi_medium_threshold}
+- "low": NDVI > {self.ndvi_medium_threshold}
+
+The value is near a band boundary. Consider whether it may be seasonal (harvest,
+fallow, senescence) before classifying, and give sustainable recommendations.
+
+Respond in JSON format:
+{{
+    "risk_classification": "low|medium|high|critical",
+    "confidence_score": 0.0-1.0,
+    "explanation": "Short reasoning",
+    "recommendations": ["Action 1", "Action 2", "Action 3"]
+}}"""
+            
+            request_body = {
+                "anthropic_version": "bedrock-2023-05-31",
+                "max_tokens": min(self.max_tokens, 500),
+                "temperature": 0.3,
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ]
+            }
+            
+            response_body = await self._invoke_bedrock_cached(self.bedrock_haiku_model_id, request_body)
+            bedrock_response = self._parse_analysis(
+                response_body['content'][0]['text'], ndvi_value, 'Not required: NDVI-only Haiku analysis'
+            )
+            
+            logger.info(f"Haiku analysis complete: {bedrock_response.risk_classification}")
+            
+            return bedrock_response
+            
+        except Exception as e:
+            logger.error(f"Haiku analysis error: {e}")
+            return self._fallback_risk_classification(ndvi_value)
+    
+    def _parse_analysis(self, content: str, ndvi_value: float, default_observations: str) -> BedrockResponse:
+        """
+        Build a BedrockResponse from the model's JSON answer
+        
+        Args:
+            content: Model text output
+            ndvi_value: NDVI used for the rule-based fallback
+            default_observations: visual_observations when the model gives none
+            
+        Returns:
+            Parsed BedrockResponse, or the rule-based classification if not JSON
+        """
+        try:
+            analysis = json.loads(content)
+        except json.JSONDecodeError:
+            # Fallback if response is not valid JSON
+            logger.warning("Bedrock response not valid JSON, using fallback parsing")
+            return self._fallback_risk_classification(ndvi_value)
+        
+        return BedrockResponse(
+            risk_classification=analysis.get('risk_classification', 'medium'),
+            confidence_score=float(analysis.get('confidence_score', 0.7)),
+            explanation=analysis.get('explanation', 'Analysis completed'),
+            visual_observations=analysis.get('visual_observations', default_observations),
+            recommendations=analysis.get('recommendations', ['Monitor plot regularly'])
+        )
+    
     def _fallback_risk_classification(self, ndvi_value: float) -> BedrockResponse:
         """
         Fallback risk classification when Bedrock is unavailable
@@ -501,12 +1033,7 @@ Respond in plain text (not JSON)."""
             logger.debug(f"Generating farmer guidance in {language}")
             
             # Use Haiku for faster, cost-effective guidance generation
-            response = self.bedrock_client.invoke_model(
-                modelId=self.bedrock_haiku_model_id,
-                body=json.dumps(request_body)
-            )
-            
-            response_body = json.loads(response['body'].read())
+            response_body = await self._invoke_bedrock_cached(self.bedrock_haiku_model_id, request_body)
             guidance = response_body['content'][0]['text']
             
             logger.info(f"Generated farmer guidance ({len(guidance)} chars)")
@@ -595,9 +1122,9 @@ Respond in plain text (not JSON)."""
         avg_ndvi = sum(ndvi_values) / len(ndvi_values) if ndvi_values else 0.0
         
         # Determine if this represents a coordinated outbreak
-        # Criteria: 3+ plots AND (avg NDVI < 0.3 OR 50%+ high risk)
+        # Criteria: cluster_outbreak_min_plots+ plots AND (avg NDVI < 0.3 OR 50%+ high risk)
         outbreak_detected = (
-            len(hobli_alerts) >= 3 and 
+            len(hobli_alerts) >= self.cluster_outbreak_min_plots and 
             (avg_ndvi < 0.3 or high_risk_count >= len(hobli_alerts) * 0.5)
         )
         
@@ -627,6 +1154,18 @@ Respond in plain text (not JSON)."""
             recommended_action=recommended_action
         )
     
+    def get_triage_report(self, since: Optional[Dict[str, Dict[str, float]]] = None) -> Dict[str, Any]:
+        """
+        Reasoning tier counts with the Bedrock cost and latency saved by triage
+        
+        Args:
+            since: Optional snapshot from self.triage.snapshot() to report a single scan
+            
+        Returns:
+            Dictionary from ReasoningTriage.report
+        """
+        return self.triage.report(since)
+    
     def get_service_info(self) -> Dict[str, Any]:
         """
         Get service information and status
@@ -640,6 +1179,12 @@ Respond in plain text (not JSON)."""
             'bedrock_model': self.bedrock_model_id,
             'bedrock_haiku_model': self.bedrock_haiku_model_id,
             'region': self.region,
+            'bedrock_cache': self.bedrock_cache.stats() if self.bedrock_cache else None,
+            'triage': self.triage.report(),
+            'batch_analysis': dict(self.batch_stats, enabled=self.batch_analysis_enabled,
+                                   batch_size=self.batch_analysis_size),
+            'ndvi_source': dict(self.ndvi_source_stats, primary=self.ndvi_source),
+            'unusable_scenes_skipped': self.unusable_scenes_skipped,
             'risk_thresholds': {
                 'critical': f'< {self.ndvi_critical_threshold}',
                 'high': f'< {self.ndvi_high_threshold}',
@@ -0,0 +1,224 @@
+"""
+TTLCache - Process-local LRU cache with time-based expiry
+
+Small, thread-safe cache used by services to avoid repeating identical
+remote lookups (DynamoDB reads, S3 listings, model calls):
+- Least-recently-used eviction once max_entries is reached
+- Per-entry expiry after ttl_seconds
+- Hit/miss/eviction counters for service metrics
+
+SingleFlight complements it for concurrent misses: callers asking for the
+same key while a lookup is running await that lookup instead of starting
+their own.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+from collections import OrderedDict
+import asyncio
+import threading
+import time
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed TTL"""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize TTLCache
+
+        Args:
+            max_entries: Maximum number of entries kept before LRU eviction
+            ttl_seconds: Seconds an entry stays valid after being stored
+            clock: Monotonic time source (overridable for tests)
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up a key
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (found, value); value is None when not found
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry if full
+
+        Args:
+            key: Cache key
+            value: Value to store (None is a valid, cacheable value)
+            ttl_seconds: Optional TTL overriding the cache default for this entry
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Read-through lookup: return the cached value or load and store it
+
+        Args:
+            key: Cache key
+            loader: Zero-argument callable producing the value on a miss
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        found, value = self.get(key)
+        if found:
+            return value
+
+        value = loader()
+        self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single key if present"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Remove every key matching a predicate
+
+        Args:
+            predicate: Function returning True for keys to drop
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            doomed = [key for key in self._entries if predicate(key)]
+            for key in doomed:
+                del self._entries[key]
+            return len(doomed)
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with size, hit/miss counters and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'ttl_seconds': self.ttl_seconds,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+class SingleFlight:
+    """Coalesce concurrent async calls sharing a key into one in-flight call"""
+
+    def __init__(self):
+        """Initialize SingleFlight with no calls in flight"""
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn for key, or join the call already running for key
+
+        The shared call is shielded, so a cancelled caller does not cancel
+        it for the others. Results are not retained once the call finishes.
+
+        Args:
+            key: Coalescing key
+            fn: Zero-argument coroutine function performing the lookup
+
+        Returns:
+            Result of the shared call
+
+        Raises:
+            Exception: Whatever the shared call raised, re-raised to every caller
+        """
+        loop = asyncio.get_running_loop()
+        task = self._inflight.get(key)
+
+        if task is None or task.get_loop() is not loop:
+            task = loop.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        """Drop a finished call unless a newer one replaced it"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        task = self._inflight.get(key)
+        return task is not None and not task.done()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics
+
+        Returns:
+            Dictionary with executed and coalesced call counts
+        """
+        return {
+            'in_flight': len(self._inflight),
+            'calls': self.calls,
+            'coalesced': self.coalesced
+        }
@@ -0,0 +1,208 @@
+"""
+On-disk cache for plot image chips
+
+Sentinel-2 revisits a plot every ~5 days, so a daily rescan mostly asks
+for chips that were already cut from the same scene. Chips are stored as
+files under a content key:
+- Key: SHA-256 of tile, acquisition date and plot window (centre, size,
+  resolution, format), so a new acquisition never serves an old chip
+- Byte budget enforced with LRU eviction (file mtime is the recency,
+  refreshed on every hit)
+- Atomic writes (temporary file + os.replace), so worker processes sharing
+  the directory never read a partial chip
+- Hit/miss and bytes-served counters for scan summaries
+
+Filesystem errors never fail an analysis; they are logged and treated as
+misses.
+"""
+
+from typing import Any, Dict, Optional
+from datetime import datetime
+from pathlib import Path
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+
+from services.image_chips import ImageChip
+
+logger = logging.getLogger(__name__)
+
+
+class ChipCache:
+    """Size-bounded LRU store of ImageChip files"""
+
+    def __init__(self, root: str, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize chip cache (the directory is created and scanned on first use)
+
+        Args:
+            root: Cache directory, may be shared by several processes
+            max_bytes: Total size of stored chip files kept after eviction
+        """
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._bytes_stored: Optional[int] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.errors = 0
+        self.bytes_served = 0
+
+    @staticmethod
+    def key_for(
+        tile_id: str,
+        acquisition_date: datetime,
+        lat: float,
+        lon: float,
+        size_px: int,
+        resolution_m: float,
+        image_format: str
+    ) -> str:
+        """
+        Build the cache key for a chip
+
+        Centres are rounded to 5 decimal places (~1 m), well inside one chip pixel.
+
+        Returns:
+            Hex SHA-256 of the scene and plot window
+        """
+        identity = (f"{tile_id}|{acquisition_date.isoformat()}|{round(lat, 5):.5f}|{round(lon, 5):.5f}|"
+                    f"{size_px}|{resolution_m:g}|{image_format}")
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def _files(self):
+        """Yield (path, size, mtime) of every stored chip"""
+        for entry in self.root.glob('*/*.json'):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            yield entry, stat.st_size, stat.st_mtime
+
+    def get(self, key: str) -> Optional[ImageChip]:
+        """
+        Look up a chip and mark it recently used
+
+        Args:
+            key: Key from key_for
+
+        Returns:
+            ImageChip, or None on a miss
+        """
+        path = self._path(key)
+        try:
+            chip = ImageChip.model_validate_json(path.read_bytes())
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except Exception as e:
+            with self._lock:
+                self.errors += 1
+                self.misses += 1
+            logger.warning(f"Chip cache entry {key} unreadable, discarding: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # Evicted meanwhile; the chip is still valid
+
+        with self._lock:
+            self.hits += 1
+            self.bytes_served += chip.size_bytes
+        return chip
+
+    def set(self, key: str, chip: ImageChip) -> None:
+        """
+        Store a chip, evicting least recently used chips beyond max_bytes
+
+        Args:
+            key: Key from key_for
+            chip: Chip to store
+        """
+        path = self._path(key)
+        payload = chip.model_dump_json().encode('utf-8')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            descriptor, temp_path = tempfile.mkstemp(dir=path.parent, prefix='.', suffix='.tmp')
+            try:
+                with os.fdopen(descriptor, 'wb') as temp_file:
+                    temp_file.write(payload)
+                os.replace(temp_path, path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError as e:
+            with self._lock:
+                self.errors += 1
+            logger.warning(f"Chip cache store failed for {key}: {e}")
+            return
+
+        with self._lock:
+            self.stores += 1
+            if self._bytes_stored is None:
+                self._bytes_stored = sum(size for _, size, _ in self._files())
+            else:
+                self._bytes_stored += len(payload)
+            over_budget = self._bytes_stored > self.max_bytes
+        if over_budget:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used chips until the directory fits max_bytes"""
+        files = sorted(self._files(), key=lambda item: item[2])
+        total = sum(size for _, size, _ in files)
+        evicted = 0
+        for path, size, _ in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                evicted += 1
+            except FileNotFoundError:
+                pass  # Evicted by another process
+            total -= size
+
+        with self._lock:
+            self._bytes_stored = total
+            self.evictions += evicted
+        logger.debug(f"Chip cache evicted {evicted} chips, {total} bytes stored")
+
+    def clear(self) -> None:
+        """Remove every stored chip (counters are kept)"""
+        for path, _, _ in list(self._files()):
+            path.unlink(missing_ok=True)
+        with self._lock:
+            self._bytes_stored = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with hit/miss/store/eviction/error counters, hit rate,
+            bytes served from the cache and bytes stored by this process's view
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'errors': self.errors,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'bytes_served': self.bytes_served,
+                'bytes_stored': self._bytes_stored or 0,
+                'max_bytes': self.max_bytes
+            }
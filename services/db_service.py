@@ -6,16 +6,24 @@ Handles all database operations and data persistence including:
 - Alert creation and tracking
 - Jurisdiction-based data querying
 - Officer dashboard data aggregation
+- Materialized per-Hobli statistics (PrecisionAgri_JurisdictionStats)
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator, Iterable, Tuple
+from collections import Counter, defaultdict
 from pydantic import BaseModel, Field
 from datetime import datetime, timedelta
 from decimal import Decimal
+import asyncio
 import logging
-import boto3
+import random
+import time
 from botocore.exceptions import ClientError
 from config.settings import get_settings
+from config.aws_clients import get_resource
+from services.cache import TTLCache
+from services.executor import run_blocking
+from services import serialization
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +78,31 @@ class JurisdictionStats(BaseModel):
     last_updated: datetime
 
 
+class BulkWriteResult(BaseModel):
+    """Per-item outcome of a bulk BatchWriteItem operation"""
+    succeeded: List[str] = Field(default_factory=list)
+    failed: Dict[str, str] = Field(default_factory=dict)
+    duplicates: int = 0  # items superseded by a later item with the same key
+    request_count: int = 0
+    
+    @property
+    def all_succeeded(self) -> bool:
+        """True if every item in the bulk operation was written"""
+        return not self.failed
+
+
+class PlotPage(BaseModel):
+    """One page of plots with an opaque continuation cursor"""
+    items: List[PlotData]
+    next_cursor: Optional[str] = None
+
+
+class AlertPage(BaseModel):
+    """One page of alerts with an opaque continuation cursor"""
+    items: List[AlertData]
+    next_cursor: Optional[str] = None
+
+
 class HobliDirectory(BaseModel):
     """Hobli directory entry mapping jurisdiction to Extension Officer"""
     hobli_id: str
@@ -130,6 +163,22 @@ class OfficerAssignment(BaseModel):
 class DbService:
     """Service for DynamoDB operations and data persistence"""
     
+    # Sort key of the per-Hobli lifetime totals item in the stats table. Hourly
+    # alert buckets use "H#YYYYMMDDHH", which sorts before "TOTAL", so a single
+    # Query on stat_key >= <window start bucket> returns the window and totals.
+    _STATS_TOTAL_KEY = 'TOTAL'
+    _STATS_BUCKET_PREFIX = 'H#'
+    _STATS_WINDOW_HOURS = 24
+    _STATS_BUCKET_RETENTION_HOURS = 48
+    
+    # Error codes for which a failed BatchWriteItem request is retried
+    _RETRYABLE_ERROR_CODES = {
+        'ProvisionedThroughputExceededException',
+        'ThrottlingException',
+        'RequestLimitExceeded',
+        'InternalServerError'
+    }
+    
     def __init__(self, region: Optional[str] = None):
         """
         Initialize DbService with DynamoDB client
@@ -139,22 +188,37 @@ class DbService:
         """
         settings = get_settings()
         
-        # Initialize boto3 DynamoDB resource
+        # Shared boto3 DynamoDB resource from the registry
         self.region = region or settings.aws.region
-        self.dynamodb = boto3.resource('dynamodb', region_name=self.region)
+        self.dynamodb = get_resource('dynamodb', self.region)
         
         # Get table names from settings
         self.plots_table_name = settings.aws.dynamodb_plots_table
         self.alerts_table_name = settings.aws.dynamodb_alerts_table
         self.hobli_directory_table_name = "PrecisionAgri_HobliDirectory"
+        self.jurisdiction_stats_table_name = "PrecisionAgri_JurisdictionStats"
         
         # Initialize table references
         self.plots_table = self.dynamodb.Table(self.plots_table_name)
         self.alerts_table = self.dynamodb.Table(self.alerts_table_name)
         self.hobli_directory_table = self.dynamodb.Table(self.hobli_directory_table_name)
+        self.jurisdiction_stats_table = self.dynamodb.Table(self.jurisdiction_stats_table_name)
         
         # Configuration
         self.query_limit = settings.db_service.query_limit
+        self.scan_page_size = settings.db_service.scan_page_size
+        self.scan_total_segments = settings.db_service.scan_total_segments
+        self.fanout_max_concurrency = settings.db_service.fanout_max_concurrency
+        self.batch_write_size = settings.db_service.batch_write_size
+        self.batch_write_max_retries = settings.db_service.batch_write_max_retries
+        self.batch_write_base_delay = settings.db_service.batch_write_base_delay_seconds
+        
+        # Read-through cache for Hobli directory lookups, keyed by
+        # ('hobli', hobli_id) and ('officer', officer_id)
+        self.hobli_cache = TTLCache(
+            max_entries=settings.performance.cache_max_entries,
+            ttl_seconds=settings.performance.cache_ttl_seconds
+        )
         
         logger.info(f"DbService initialized with region={self.region}, "
                    f"plots_table={self.plots_table_name}, "
@@ -171,13 +235,7 @@ class DbService:
         Returns:
             Object with floats converted to Decimal
         """
-        if isinstance(obj, float):
-            return Decimal(str(obj))
-        elif isinstance(obj, dict):
-            return {k: self._convert_floats_to_decimal(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_floats_to_decimal(item) for item in obj]
-        return obj
+        return serialization.floats_to_decimal(obj)
     
     def _convert_decimal_to_float(self, obj: Any) -> Any:
         """
@@ -189,13 +247,39 @@ class DbService:
         Returns:
             Object with Decimals converted to float
         """
-        if isinstance(obj, Decimal):
-            return float(obj)
-        elif isinstance(obj, dict):
-            return {k: self._convert_decimal_to_float(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [self._convert_decimal_to_float(item) for item in obj]
-        return obj
+        return serialization.decimals_to_float(obj)
+    
+    def _plot_to_item(self, plot_data: PlotData) -> Dict[str, Any]:
+        """
+        Build the DynamoDB item for a plot
+        
+        Args:
+            plot_data: Plot registration data
+            
+        Returns:
+            Item dictionary ready for put_item/BatchWriteItem
+        """
+        return serialization.plot_to_item(plot_data)
+    
+    def _alert_to_item(self, alert_data: AlertData) -> Dict[str, Any]:
+        """
+        Build the DynamoDB item for an alert
+        
+        Args:
+            alert_data: Alert data to store
+            
+        Returns:
+            Item dictionary ready for put_item/BatchWriteItem
+        """
+        return serialization.alert_to_item(alert_data)
+    
+    def _plot_from_item(self, item: Dict[str, Any]) -> PlotData:
+        """Build a PlotData directly from a raw plots-table item"""
+        return serialization.plot_from_item(item, PlotData)
+    
+    def _alert_from_item(self, item: Dict[str, Any]) -> AlertData:
+        """Build an AlertData directly from a raw alerts-table item"""
+        return serialization.alert_from_item(item, AlertData)
     
     def register_plot(self, plot_data: PlotData) -> str:
         """
@@ -211,26 +295,16 @@ class DbService:
             ClientError: If DynamoDB operation fails
         """
         try:
-            # Prepare item for DynamoDB
-            item = {
-                'user_id': plot_data.user_id,
-                'plot_id': plot_data.plot_id,
-                'lat': self._convert_floats_to_decimal(plot_data.lat),
-                'lon': self._convert_floats_to_decimal(plot_data.lon),
-                'crop': plot_data.crop,
-                'hobli_id': plot_data.hobli_id,
-                'farmer_name': plot_data.farmer_name,
-                'phone_number': plot_data.phone_number,
-                'registration_date': plot_data.registration_date.isoformat(),
-                'status': plot_data.status
-            }
-            
-            # Add optional fields
-            if plot_data.last_analysis:
-                item['last_analysis'] = plot_data.last_analysis.isoformat()
+            # Write to DynamoDB; the previous item tells us whether this is a new plot
+            response = self.plots_table.put_item(
+                Item=self._plot_to_item(plot_data),
+                ReturnValues='ALL_OLD'
+            )
             
-            # Write to DynamoDB
-            self.plots_table.put_item(Item=item)
+            previous_hobli = response.get('Attributes', {}).get('hobli_id')
+            self._apply_plot_count_deltas(
+                self._plot_count_deltas([(plot_data.hobli_id, previous_hobli)])
+            )
             
             logger.info(f"Successfully registered plot: {plot_data.plot_id} for user: {plot_data.user_id}")
             
@@ -251,26 +325,25 @@ class DbService:
             ClientError: If DynamoDB operation fails
         """
         try:
-            # Prepare item for DynamoDB
-            item = {
-                'hobli_id': alert_data.hobli_id,
-                'timestamp': alert_data.timestamp.isoformat(),
-                'plot_id': alert_data.plot_id,
-                'user_id': alert_data.user_id,
-                'risk_level': alert_data.risk_level,
-                'message': alert_data.message,
-                'gee_proof': self._convert_floats_to_decimal(alert_data.gee_proof),
-                'bedrock_reasoning': alert_data.bedrock_reasoning,
-                'resolution_status': alert_data.resolution_status,
-                'sms_sent': alert_data.sms_sent
-            }
-            
-            # Add optional fields
-            if alert_data.officer_response:
-                item['officer_response'] = alert_data.officer_response
+            # Write to DynamoDB; an overwritten alert's contribution is replaced
+            response = self.alerts_table.put_item(
+                Item=self._alert_to_item(alert_data),
+                ReturnValues='ALL_OLD'
+            )
             
-            # Write to DynamoDB
-            self.alerts_table.put_item(Item=item)
+            deltas = self._alert_stats_contribution(
+                alert_data.risk_level, alert_data.resolution_status, alert_data.gee_proof
+            )
+            previous = response.get('Attributes')
+            if previous:
+                previous = self._convert_decimal_to_float(previous)
+                old = self._alert_stats_contribution(
+                    previous.get('risk_level'),
+                    previous.get('resolution_status'),
+                    previous.get('gee_proof') or {}
+                )
+                deltas = {name: value - old[name] for name, value in deltas.items()}
+            self._apply_alert_stats_deltas(alert_data.hobli_id, alert_data.timestamp, deltas)
             
             logger.info(f"Successfully created alert for hobli: {alert_data.hobli_id}, "
                        f"plot: {alert_data.plot_id}, risk_level: {alert_data.risk_level}")
@@ -279,20 +352,284 @@ class DbService:
             logger.error(f"Failed to create alert for hobli {alert_data.hobli_id}: {e}")
             raise
     
-    def get_hobli_plots(self, hobli_id: str, limit: Optional[int] = None) -> List[PlotData]:
+    def _batch_write(
+        self,
+        table_name: str,
+        items: List[Tuple[str, Dict[str, Any]]],
+        key_attributes: Tuple[str, str]
+    ) -> BulkWriteResult:
         """
-        Get all plots for a specific jurisdiction using GSI
+        Write items with BatchWriteItem, retrying unprocessed items
+        
+        Items are chunked to batch_write_size (the DynamoDB maximum of 25).
+        UnprocessedItems and throttling errors are retried with exponential
+        backoff and jitter up to batch_write_max_retries times; anything still
+        unwritten after that is reported as failed rather than raised.
+        
+        Items sharing a primary key are deduplicated before writing (the last
+        one wins, matching sequential PutItem calls); superseded items are
+        counted in duplicates, not reported as failed.
+        
+        Args:
+            table_name: Target table name
+            items: List of (item_id, item) pairs; item_id is used for reporting
+            key_attributes: Primary key attribute names used to match
+                unprocessed items back to their item_id
+            
+        Returns:
+            BulkWriteResult with per-item outcomes
+        """
+        result = BulkWriteResult()
+        
+        def item_key(item: Dict[str, Any]) -> Tuple[Any, ...]:
+            return tuple(item[attr] for attr in key_attributes)
+        
+        # BatchWriteItem rejects a request that writes the same key twice
+        unique: Dict[Tuple[Any, ...], Tuple[str, Dict[str, Any]]] = {}
+        for item_id, item in items:
+            key = item_key(item)
+            if key in unique:
+                result.duplicates += 1
+                del unique[key]  # keep the position of the last write
+            unique[key] = (item_id, item)
+        unique_items = list(unique.items())
+        
+        for start in range(0, len(unique_items), self.batch_write_size):
+            chunk = dict(unique_items[start:start + self.batch_write_size])
+            
+            pending = [{'PutRequest': {'Item': item}} for _, item in chunk.values()]
+            attempt = 0
+            
+            while pending:
+                try:
+                    response = self.dynamodb.batch_write_item(RequestItems={table_name: pending})
+                    result.request_count += 1
+                    unprocessed = response.get('UnprocessedItems', {}).get(table_name, [])
+                except ClientError as e:
+                    result.request_count += 1
+                    error_code = e.response.get('Error', {}).get('Code', '')
+                    if error_code not in self._RETRYABLE_ERROR_CODES:
+                        logger.error(f"Batch write to {table_name} failed: {e}")
+                        for request in pending:
+                            item_id = chunk[item_key(request['PutRequest']['Item'])][0]
+                            result.failed[item_id] = str(e)
+                        break
+                    unprocessed = pending
+                
+                unprocessed_keys = {item_key(r['PutRequest']['Item']) for r in unprocessed}
+                for request in pending:
+                    key = item_key(request['PutRequest']['Item'])
+                    if key not in unprocessed_keys:
+                        result.succeeded.append(chunk[key][0])
+                
+                if not unprocessed:
+                    break
+                
+                attempt += 1
+                if attempt > self.batch_write_max_retries:
+                    for key in unprocessed_keys:
+                        result.failed[chunk[key][0]] = (
+                            f"Unprocessed after {self.batch_write_max_retries} retries"
+                        )
+                    break
+                
+                delay = self.batch_write_base_delay * (2 ** (attempt - 1))
+                logger.warning(f"Retrying {len(unprocessed)} unprocessed items for {table_name} "
+                              f"(attempt {attempt}) in {delay:.2f}s")
+                time.sleep(delay + random.uniform(0, delay))
+                pending = unprocessed
+        
+        return result
+    
+    def _get_existing_plot_hoblis(
+        self,
+        keys: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], str]:
+        """
+        Look up the current hobli_id of plots that already exist
+        
+        Args:
+            keys: (user_id, plot_id) pairs
+            
+        Returns:
+            Mapping of (user_id, plot_id) to hobli_id for keys that exist
+        """
+        existing = {}
+        unique_keys = list(dict.fromkeys(keys))
+        
+        for start in range(0, len(unique_keys), 100):
+            request = {
+                self.plots_table_name: {
+                    'Keys': [
+                        {'user_id': user_id, 'plot_id': plot_id}
+                        for user_id, plot_id in unique_keys[start:start + 100]
+                    ],
+                    'ProjectionExpression': 'user_id, plot_id, hobli_id'
+                }
+            }
+            attempt = 0
+            while request:
+                response = self.dynamodb.batch_get_item(RequestItems=request)
+                for item in response.get('Responses', {}).get(self.plots_table_name, []):
+                    existing[(item['user_id'], item['plot_id'])] = item['hobli_id']
+                
+                request = response.get('UnprocessedKeys') or None
+                attempt += 1
+                if request and attempt > self.batch_write_max_retries:
+                    logger.warning("Giving up on unprocessed plot existence checks; "
+                                  "materialized plot counts may drift")
+                    break
+                if request:
+                    time.sleep(self.batch_write_base_delay * (2 ** (attempt - 1)))
+        
+        return existing
+    
+    def register_plots_bulk(self, plots: List[PlotData]) -> BulkWriteResult:
+        """
+        Register many plots using BatchWriteItem
+        
+        Args:
+            plots: Plot registration data
+            
+        Returns:
+            BulkWriteResult keyed by "user_id/plot_id"
+        """
+        items = [
+            (f"{plot.user_id}/{plot.plot_id}", self._plot_to_item(plot))
+            for plot in plots
+        ]
+        # BatchWriteItem cannot return old items, so look up which plots already
+        # exist to keep the materialized plot counts exact on re-imports
+        previous_hoblis = self._get_existing_plot_hoblis(
+            [(plot.user_id, plot.plot_id) for plot in plots]
+        )
+        result = self._batch_write(self.plots_table_name, items, ('user_id', 'plot_id'))
+        
+        plots_by_id = {f"{plot.user_id}/{plot.plot_id}": plot for plot in plots}
+        moves = []
+        for item_id in result.succeeded:
+            plot = plots_by_id[item_id]
+            key = (plot.user_id, plot.plot_id)
+            moves.append((plot.hobli_id, previous_hoblis.get(key)))
+            previous_hoblis[key] = plot.hobli_id
+        self._apply_plot_count_deltas(self._plot_count_deltas(moves))
+        
+        logger.info(f"Bulk registered {len(result.succeeded)}/{len(plots)} plots "
+                   f"in {result.request_count} requests ({len(result.failed)} failed, "
+                   f"{result.duplicates} duplicates)")
+        
+        return result
+    
+    def create_alerts_bulk(self, alerts: List[AlertData]) -> BulkWriteResult:
+        """
+        Create many alerts using BatchWriteItem
+        
+        Args:
+            alerts: Alert data to store
+            
+        Returns:
+            BulkWriteResult keyed by "hobli_id@timestamp"
+        """
+        items = [
+            (f"{alert.hobli_id}@{alert.timestamp.isoformat()}", self._alert_to_item(alert))
+            for alert in alerts
+        ]
+        result = self._batch_write(self.alerts_table_name, items, ('hobli_id', 'timestamp'))
+        
+        # Merge contributions so each hourly bucket gets a single UpdateItem
+        alerts_by_id = {item_id: alert for (item_id, _), alert in zip(items, alerts)}
+        bucket_deltas: Dict[Tuple[str, str], Counter] = defaultdict(Counter)
+        bucket_times: Dict[Tuple[str, str], datetime] = {}
+        for item_id in result.succeeded:
+            alert = alerts_by_id[item_id]
+            bucket = (alert.hobli_id, self._stats_bucket_key(alert.timestamp))
+            bucket_deltas[bucket].update(self._alert_stats_contribution(
+                alert.risk_level, alert.resolution_status, alert.gee_proof
+            ))
+            bucket_times.setdefault(bucket, alert.timestamp)
+        for bucket, deltas in bucket_deltas.items():
+            self._apply_alert_stats_deltas(bucket[0], bucket_times[bucket], dict(deltas))
+        
+        logger.info(f"Bulk created {len(result.succeeded)}/{len(alerts)} alerts "
+                   f"in {result.request_count} requests ({len(result.failed)} failed, "
+                   f"{result.duplicates} duplicates)")
+        
+        return result
+    
+    def _start_key_for_hobli(self, cursor: Optional[str], hobli_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Decode a pagination cursor and check it was issued for hobli_id
+        
+        Raises:
+            ValueError: If the cursor is malformed or belongs to another Hobli
+        """
+        start_key = serialization.decode_cursor(cursor)
+        if start_key is not None and start_key.get('hobli_id') != hobli_id:
+            raise ValueError(f"Pagination cursor was not issued for hobli {hobli_id}")
+        return start_key
+    
+    def _query_pages(
+        self,
+        table: Any,
+        query_params: Dict[str, Any],
+        limit: int,
+        start_key: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Run a Query, following LastEvaluatedKey until limit items are read
+        
+        Args:
+            table: DynamoDB Table resource
+            query_params: Query parameters (Limit and ExclusiveStartKey are managed here)
+            limit: Maximum number of items to return
+            start_key: Optional ExclusiveStartKey to resume from
+            
+        Returns:
+            Tuple of (raw items, cursor for the next page or None)
+        """
+        items: List[Dict[str, Any]] = []
+        last_key = start_key
+        
+        while True:
+            if last_key:
+                query_params['ExclusiveStartKey'] = last_key
+            query_params['Limit'] = limit - len(items)
+            
+            response = table.query(**query_params)
+            items.extend(response.get('Items', []))
+            
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key or len(items) >= limit:
+                break
+        
+        return items, serialization.encode_cursor(last_key)
+    
+    def get_hobli_plots_page(
+        self,
+        hobli_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> PlotPage:
+        """
+        Get one page of plots for a jurisdiction using GSI
+        
+        Follows DynamoDB pagination internally, so a page only holds fewer
+        than limit plots when the jurisdiction has no more.
         
         Args:
             hobli_id: Hobli identifier
             limit: Maximum number of results (defaults to query_limit from settings)
+            cursor: next_cursor from the previous page, or None for the first page
             
         Returns:
-            List of PlotData for the jurisdiction
+            PlotPage with plots in registration order and the next cursor
             
         Raises:
             ClientError: If DynamoDB operation fails
+            ValueError: If the cursor is invalid for this Hobli
         """
+        start_key = self._start_key_for_hobli(cursor, hobli_id)
+        
         try:
             # Query using GSI on hobli_id
             query_params = {
@@ -300,62 +637,66 @@ class DbService:
                 'KeyConditionExpression': 'hobli_id = :hobli_id',
                 'ExpressionAttributeValues': {
                     ':hobli_id': hobli_id
-                },
-                'Limit': limit or self.query_limit
+                }
             }
             
-            response = self.plots_table.query(**query_params)
-            items = response.get('Items', [])
+            items, next_cursor = self._query_pages(
+                self.plots_table, query_params, limit or self.query_limit, start_key
+            )
             
             # Convert to PlotData objects
-            plots = []
-            for item in items:
-                # Convert Decimal to float
-                item = self._convert_decimal_to_float(item)
-                
-                plot = PlotData(
-                    user_id=item['user_id'],
-                    plot_id=item['plot_id'],
-                    lat=item['lat'],
-                    lon=item['lon'],
-                    crop=item['crop'],
-                    hobli_id=item['hobli_id'],
-                    farmer_name=item['farmer_name'],
-                    phone_number=item['phone_number'],
-                    registration_date=datetime.fromisoformat(item['registration_date']),
-                    last_analysis=datetime.fromisoformat(item['last_analysis']) if item.get('last_analysis') else None,
-                    status=item.get('status', 'active')
-                )
-                plots.append(plot)
+            plots = [self._plot_from_item(item) for item in items]
             
-            logger.info(f"Retrieved {len(plots)} plots for hobli: {hobli_id}")
+            logger.info(f"Retrieved {len(plots)} plots for hobli: {hobli_id} "
+                       f"(more: {next_cursor is not None})")
             
-            return plots
+            return PlotPage(items=plots, next_cursor=next_cursor)
             
         except ClientError as e:
             logger.error(f"Failed to retrieve plots for hobli {hobli_id}: {e}")
             raise
     
-    def get_recent_alerts(
-        self, 
-        hobli_id: str, 
+    def get_hobli_plots(self, hobli_id: str, limit: Optional[int] = None) -> List[PlotData]:
+        """
+        Get all plots for a specific jurisdiction using GSI
+        
+        Args:
+            hobli_id: Hobli identifier
+            limit: Maximum number of results (defaults to query_limit from settings)
+            
+        Returns:
+            List of PlotData for the jurisdiction
+            
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        return self.get_hobli_plots_page(hobli_id, limit=limit).items
+    
+    def get_recent_alerts_page(
+        self,
+        hobli_id: str,
         hours: int = 24,
-        limit: Optional[int] = None
-    ) -> List[AlertData]:
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> AlertPage:
         """
-        Get recent alerts for a jurisdiction within a time range
+        Get one page of recent alerts for a jurisdiction, newest first
         
         Args:
             hobli_id: Hobli identifier
             hours: Number of hours to look back
             limit: Maximum number of results (defaults to query_limit from settings)
+            cursor: next_cursor from the previous page, or None for the first page
             
         Returns:
-            List of AlertData within the time range
+            AlertPage with alerts and the next cursor
             
         Raises:
             ClientError: If DynamoDB operation fails
+            ValueError: If the cursor is invalid for this Hobli
         """
+        start_key = self._start_key_for_hobli(cursor, hobli_id)
+        
         try:
             # Calculate time threshold
             time_threshold = datetime.now() - timedelta(hours=hours)
@@ -371,46 +712,57 @@ class DbService:
                     ':hobli_id': hobli_id,
                     ':time_threshold': time_threshold_str
                 },
-                'Limit': limit or self.query_limit,
                 'ScanIndexForward': False  # Sort by timestamp descending (newest first)
             }
             
-            response = self.alerts_table.query(**query_params)
-            items = response.get('Items', [])
+            items, next_cursor = self._query_pages(
+                self.alerts_table, query_params, limit or self.query_limit, start_key
+            )
             
             # Convert to AlertData objects
-            alerts = []
-            for item in items:
-                # Convert Decimal to float
-                item = self._convert_decimal_to_float(item)
-                
-                alert = AlertData(
-                    hobli_id=item['hobli_id'],
-                    timestamp=datetime.fromisoformat(item['timestamp']),
-                    plot_id=item['plot_id'],
-                    user_id=item['user_id'],
-                    risk_level=item['risk_level'],
-                    message=item['message'],
-                    gee_proof=item['gee_proof'],
-                    bedrock_reasoning=item['bedrock_reasoning'],
-                    officer_response=item.get('officer_response'),
-                    resolution_status=item.get('resolution_status', 'pending'),
-                    sms_sent=item.get('sms_sent', False)
-                )
-                alerts.append(alert)
+            alerts = [self._alert_from_item(item) for item in items]
             
-            logger.info(f"Retrieved {len(alerts)} alerts for hobli: {hobli_id} (last {hours} hours)")
+            logger.info(f"Retrieved {len(alerts)} alerts for hobli: {hobli_id} (last {hours} hours, "
+                       f"more: {next_cursor is not None})")
             
-            return alerts
+            return AlertPage(items=alerts, next_cursor=next_cursor)
             
         except ClientError as e:
             logger.error(f"Failed to retrieve alerts for hobli {hobli_id}: {e}")
             raise
     
+    def get_recent_alerts(
+        self, 
+        hobli_id: str, 
+        hours: int = 24,
+        limit: Optional[int] = None
+    ) -> List[AlertData]:
+        """
+        Get recent alerts for a jurisdiction within a time range
+        
+        Args:
+            hobli_id: Hobli identifier
+            hours: Number of hours to look back
+            limit: Maximum number of results (defaults to query_limit from settings)
+            
+        Returns:
+            List of AlertData within the time range
+            
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        return self.get_recent_alerts_page(hobli_id, hours=hours, limit=limit).items
+    
     def get_jurisdiction_stats(self, hobli_id: str) -> JurisdictionStats:
         """
         Get aggregated statistics for a jurisdiction
         
+        Reads the materialized aggregates kept up to date by register_plot,
+        create_alert and update_alert_status: one Query returning at most
+        one totals item and 25 hourly alert buckets, independent of how many
+        plots or alerts the jurisdiction has. Alert figures cover the last
+        24 hours at hourly granularity.
+        
         Args:
             hobli_id: Hobli identifier
             
@@ -421,43 +773,349 @@ class DbService:
             ClientError: If DynamoDB operation fails
         """
         try:
-            # Get all plots for the jurisdiction
-            plots = self.get_hobli_plots(hobli_id, limit=1000)
-            
-            # Get recent alerts (last 24 hours)
-            recent_alerts = self.get_recent_alerts(hobli_id, hours=24, limit=1000)
-            
-            # Calculate statistics
-            total_plots = len(plots)
-            active_alerts = len([a for a in recent_alerts if a.resolution_status == 'pending'])
-            high_priority_alerts = len([a for a in recent_alerts if a.risk_level in ['high', 'critical']])
-            
-            # Calculate average NDVI from recent alerts
-            ndvi_values = []
-            for alert in recent_alerts:
-                if 'ndvi_value' in alert.gee_proof:
-                    ndvi_values.append(float(alert.gee_proof['ndvi_value']))
-            
-            avg_ndvi = sum(ndvi_values) / len(ndvi_values) if ndvi_values else 0.0
-            
-            stats = JurisdictionStats(
-                hobli_id=hobli_id,
-                total_plots=total_plots,
-                active_alerts=active_alerts,
-                high_priority_alerts=high_priority_alerts,
-                avg_ndvi=avg_ndvi,
-                last_updated=datetime.now()
-            )
+            total_plots, buckets = self._read_materialized_stats(hobli_id, self._stats_window_start())
+            
+            stats = self._stats_from_aggregates(hobli_id, total_plots, buckets.values())
             
-            logger.info(f"Calculated statistics for hobli: {hobli_id} - "
-                       f"{total_plots} plots, {active_alerts} active alerts")
+            logger.info(f"Read statistics for hobli: {hobli_id} - "
+                       f"{stats.total_plots} plots, {stats.active_alerts} active alerts")
             
             return stats
             
         except ClientError as e:
-            logger.error(f"Failed to calculate statistics for hobli {hobli_id}: {e}")
+            logger.error(f"Failed to read statistics for hobli {hobli_id}: {e}")
             raise
     
+    def rebuild_jurisdiction_stats(self, hobli_id: str) -> JurisdictionStats:
+        """
+        Recompute a jurisdiction's materialized statistics from source tables
+        
+        Overwrites the totals item and the hourly buckets in the current
+        window, and deletes window buckets that no longer have alerts. Run it
+        while writes to the Hobli are quiet; increments racing the rebuild
+        can be lost.
+        
+        Args:
+            hobli_id: Hobli identifier
+            
+        Returns:
+            JurisdictionStats computed from the source tables
+            
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        try:
+            window_start = self._stats_window_start()
+            total_plots, buckets = self._compute_stats_aggregates(hobli_id, window_start)
+            _, stored_buckets = self._read_materialized_stats(hobli_id, window_start)
+            now = datetime.now().isoformat()
+            
+            with self.jurisdiction_stats_table.batch_writer() as batch:
+                batch.put_item(Item={
+                    'hobli_id': hobli_id,
+                    'stat_key': self._STATS_TOTAL_KEY,
+                    'total_plots': total_plots,
+                    'last_updated': now
+                })
+                for stat_key, counters in buckets.items():
+                    batch.put_item(Item=self._convert_floats_to_decimal({
+                        'hobli_id': hobli_id,
+                        'stat_key': stat_key,
+                        **counters,
+                        'expires_at': self._stats_bucket_expiry(stat_key),
+                        'last_updated': now
+                    }))
+                for stat_key in set(stored_buckets) - set(buckets):
+                    batch.delete_item(Key={'hobli_id': hobli_id, 'stat_key': stat_key})
+            
+            logger.info(f"Rebuilt statistics for hobli: {hobli_id} - "
+                       f"{total_plots} plots, {len(buckets)} alert buckets")
+            
+            return self._stats_from_aggregates(hobli_id, total_plots, buckets.values())
+            
+        except ClientError as e:
+            logger.error(f"Failed to rebuild statistics for hobli {hobli_id}: {e}")
+            raise
+    
+    def verify_jurisdiction_stats(self, hobli_id: str) -> Dict[str, Any]:
+        """
+        Compare a jurisdiction's materialized statistics with the source tables
+        
+        Args:
+            hobli_id: Hobli identifier
+            
+        Returns:
+            Dictionary with hobli_id, in_sync flag and per-field drift
+            ({field: {'materialized': ..., 'computed': ...}})
+            
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        try:
+            window_start = self._stats_window_start()
+            stored_total, stored_buckets = self._read_materialized_stats(hobli_id, window_start)
+            total_plots, buckets = self._compute_stats_aggregates(hobli_id, window_start)
+            
+            materialized = self._stats_from_aggregates(hobli_id, stored_total, stored_buckets.values())
+            computed = self._stats_from_aggregates(hobli_id, total_plots, buckets.values())
+            
+            drift = {}
+            for field in ('total_plots', 'active_alerts', 'high_priority_alerts', 'avg_ndvi'):
+                stored_value = getattr(materialized, field)
+                computed_value = getattr(computed, field)
+                if abs(stored_value - computed_value) > 1e-6:
+                    drift[field] = {'materialized': stored_value, 'computed': computed_value}
+            
+            if drift:
+                logger.warning(f"Statistics drift for hobli {hobli_id}: {drift}")
+            
+            return {'hobli_id': hobli_id, 'in_sync': not drift, 'drift': drift}
+            
+        except ClientError as e:
+            logger.error(f"Failed to verify statistics for hobli {hobli_id}: {e}")
+            raise
+    
+    def get_known_hobli_ids(self) -> List[str]:
+        """
+        List every Hobli that has a directory entry or registered plots
+        
+        Scans the directory and plots tables (hobli_id only), so it is meant
+        for maintenance jobs such as stats rebuilds rather than request paths.
+        
+        Returns:
+            Sorted list of Hobli identifiers
+            
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        hobli_ids = set()
+        for table in (self.hobli_directory_table, self.plots_table):
+            scan_params: Dict[str, Any] = {'ProjectionExpression': 'hobli_id'}
+            while True:
+                response = table.scan(**scan_params)
+                hobli_ids.update(item['hobli_id'] for item in response.get('Items', []) if 'hobli_id' in item)
+                
+                last_key = response.get('LastEvaluatedKey')
+                if not last_key:
+                    break
+                scan_params['ExclusiveStartKey'] = last_key
+        
+        return sorted(hobli_ids)
+    
+    def _stats_bucket_key(self, timestamp: datetime) -> str:
+        """Sort key of the hourly alert bucket containing timestamp"""
+        return f"{self._STATS_BUCKET_PREFIX}{timestamp.strftime('%Y%m%d%H')}"
+    
+    def _stats_bucket_expiry(self, stat_key: str) -> int:
+        """Epoch seconds after which DynamoDB TTL may delete an hourly bucket"""
+        bucket_start = datetime.strptime(stat_key[len(self._STATS_BUCKET_PREFIX):], '%Y%m%d%H')
+        return int((bucket_start + timedelta(hours=self._STATS_BUCKET_RETENTION_HOURS)).timestamp())
+    
+    def _stats_window_start(self) -> datetime:
+        """Start of the hour containing now - 24h (first bucket in the stats window)"""
+        return (datetime.now() - timedelta(hours=self._STATS_WINDOW_HOURS)).replace(
+            minute=0, second=0, microsecond=0
+        )
+    
+    def _alert_stats_contribution(
+        self,
+        risk_level: Optional[str],
+        resolution_status: Optional[str],
+        gee_proof: Dict[str, Any]
+    ) -> Dict[str, float]:
+        """Counter values a single alert adds to its hourly bucket"""
+        has_ndvi = 'ndvi_value' in gee_proof
+        return {
+            'pending_alerts': 1 if resolution_status == 'pending' else 0,
+            'high_priority_alerts': 1 if risk_level in ['high', 'critical'] else 0,
+            'ndvi_sum': float(gee_proof['ndvi_value']) if has_ndvi else 0.0,
+            'ndvi_count': 1 if has_ndvi else 0
+        }
+    
+    def _plot_count_deltas(self, moves: Iterable[Tuple[str, Optional[str]]]) -> Counter:
+        """
+        Net total_plots change per Hobli for a set of plot writes
+        
+        Args:
+            moves: (new_hobli_id, previous_hobli_id or None) per written plot
+        """
+        deltas: Counter = Counter()
+        for hobli_id, previous_hobli in moves:
+            if previous_hobli == hobli_id:
+                continue
+            deltas[hobli_id] += 1
+            if previous_hobli:
+                deltas[previous_hobli] -= 1
+        return deltas
+    
+    def _apply_plot_count_deltas(self, deltas: Counter) -> None:
+        """ADD total_plots deltas to each Hobli's totals item"""
+        for hobli_id, delta in deltas.items():
+            self._apply_stats_deltas(hobli_id, self._STATS_TOTAL_KEY, {'total_plots': delta})
+    
+    def _apply_alert_stats_deltas(
+        self,
+        hobli_id: str,
+        timestamp: datetime,
+        deltas: Dict[str, float]
+    ) -> None:
+        """ADD alert counter deltas to the hourly bucket containing timestamp"""
+        stat_key = self._stats_bucket_key(timestamp)
+        self._apply_stats_deltas(hobli_id, stat_key, deltas, expires_at=self._stats_bucket_expiry(stat_key))
+    
+    def _apply_stats_deltas(
+        self,
+        hobli_id: str,
+        stat_key: str,
+        deltas: Dict[str, float],
+        expires_at: Optional[int] = None
+    ) -> None:
+        """
+        Atomically apply counter deltas to one stats item with UpdateItem ADD
+        
+        Failures are logged rather than raised: the source write has already
+        succeeded, and rebuild_jurisdiction_stats repairs any resulting drift.
+        """
+        deltas = {name: value for name, value in deltas.items() if value}
+        if not deltas:
+            return
+        
+        expr_values: Dict[str, Any] = {':now': datetime.now().isoformat()}
+        add_clauses = []
+        for i, (name, value) in enumerate(deltas.items()):
+            add_clauses.append(f"{name} :d{i}")
+            expr_values[f':d{i}'] = self._convert_floats_to_decimal(value)
+        
+        update_expr = "ADD " + ", ".join(add_clauses) + " SET last_updated = :now"
+        if expires_at is not None:
+            update_expr += ", expires_at = if_not_exists(expires_at, :expires_at)"
+            expr_values[':expires_at'] = expires_at
+        
+        try:
+            self.jurisdiction_stats_table.update_item(
+                Key={'hobli_id': hobli_id, 'stat_key': stat_key},
+                UpdateExpression=update_expr,
+                ExpressionAttributeValues=expr_values
+            )
+        except ClientError as e:
+            logger.warning(f"Failed to update materialized stats for hobli {hobli_id} "
+                          f"({stat_key}): {e}")
+    
+    def _read_materialized_stats(
+        self,
+        hobli_id: str,
+        window_start: datetime
+    ) -> Tuple[int, Dict[str, Dict[str, float]]]:
+        """
+        Read the totals item and window buckets for a Hobli in one Query
+        
+        Returns:
+            Tuple of (total_plots, {bucket stat_key: counters})
+        """
+        query_params: Dict[str, Any] = {
+            'KeyConditionExpression': 'hobli_id = :hobli_id AND stat_key >= :window_start',
+            'ExpressionAttributeValues': {
+                ':hobli_id': hobli_id,
+                ':window_start': self._stats_bucket_key(window_start)
+            }
+        }
+        
+        total_plots = 0
+        buckets = {}
+        while True:
+            response = self.jurisdiction_stats_table.query(**query_params)
+            for item in response.get('Items', []):
+                item = self._convert_decimal_to_float(item)
+                if item['stat_key'] == self._STATS_TOTAL_KEY:
+                    total_plots = int(item.get('total_plots', 0))
+                else:
+                    buckets[item['stat_key']] = {
+                        name: item.get(name, 0)
+                        for name in ('pending_alerts', 'high_priority_alerts', 'ndvi_sum', 'ndvi_count')
+                    }
+            
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                break
+            query_params['ExclusiveStartKey'] = last_key
+        
+        return total_plots, buckets
+    
+    def _compute_stats_aggregates(
+        self,
+        hobli_id: str,
+        window_start: datetime
+    ) -> Tuple[int, Dict[str, Dict[str, float]]]:
+        """
+        Compute a Hobli's aggregates from the plots and alerts tables
+        
+        Returns:
+            Tuple of (total_plots, {bucket stat_key: counters}) in the same
+            shape as _read_materialized_stats
+        """
+        total_plots = 0
+        query_params: Dict[str, Any] = {
+            'IndexName': 'hobli_id-registration_date-index',
+            'KeyConditionExpression': 'hobli_id = :hobli_id',
+            'ExpressionAttributeValues': {':hobli_id': hobli_id},
+            'Select': 'COUNT'
+        }
+        while True:
+            response = self.plots_table.query(**query_params)
+            total_plots += response.get('Count', 0)
+            
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                break
+            query_params['ExclusiveStartKey'] = last_key
+        
+        buckets: Dict[str, Counter] = defaultdict(Counter)
+        query_params = {
+            'KeyConditionExpression': 'hobli_id = :hobli_id AND #ts >= :window_start',
+            'ExpressionAttributeNames': {'#ts': 'timestamp'},
+            'ExpressionAttributeValues': {
+                ':hobli_id': hobli_id,
+                ':window_start': window_start.isoformat()
+            }
+        }
+        while True:
+            response = self.alerts_table.query(**query_params)
+            for item in response.get('Items', []):
+                item = self._convert_decimal_to_float(item)
+                stat_key = self._stats_bucket_key(datetime.fromisoformat(item['timestamp']))
+                buckets[stat_key].update(self._alert_stats_contribution(
+                    item.get('risk_level'), item.get('resolution_status'), item.get('gee_proof') or {}
+                ))
+            
+            last_key = response.get('LastEvaluatedKey')
+            if not last_key:
+                break
+            query_params['ExclusiveStartKey'] = last_key
+        
+        return total_plots, {stat_key: dict(counters) for stat_key, counters in buckets.items()}
+    
+    def _stats_from_aggregates(
+        self,
+        hobli_id: str,
+        total_plots: int,
+        buckets: Iterable[Dict[str, float]]
+    ) -> JurisdictionStats:
+        """Fold hourly bucket counters into JurisdictionStats"""
+        totals: Counter = Counter()
+        for counters in buckets:
+            totals.update(counters)
+        
+        ndvi_count = totals['ndvi_count']
+        
+        return JurisdictionStats(
+            hobli_id=hobli_id,
+            total_plots=total_plots,
+            active_alerts=int(totals['pending_alerts']),
+            high_priority_alerts=int(totals['high_priority_alerts']),
+            avg_ndvi=totals['ndvi_sum'] / ndvi_count if ndvi_count else 0.0,
+            last_updated=datetime.now()
+        )
+    
     def update_alert_status(
         self, 
         hobli_id: str, 
@@ -487,15 +1145,26 @@ class DbService:
                 expr_values[':response'] = officer_response
             
             # Update item in DynamoDB
-            self.alerts_table.update_item(
+            response = self.alerts_table.update_item(
                 Key={
                     'hobli_id': hobli_id,
                     'timestamp': timestamp.isoformat()
                 },
                 UpdateExpression=update_expr,
-                ExpressionAttributeValues=expr_values
+                ExpressionAttributeValues=expr_values,
+                ReturnValues='ALL_OLD'
             )
             
+            # Move the alert in or out of its bucket's pending count
+            previous = response.get('Attributes')
+            if previous:
+                was_pending = previous.get('resolution_status') == 'pending'
+                is_pending = status == 'pending'
+                if was_pending != is_pending:
+                    self._apply_alert_stats_deltas(
+                        hobli_id, timestamp, {'pending_alerts': 1 if is_pending else -1}
+                    )
+            
             logger.info(f"Updated alert status: {hobli_id} @ {timestamp} -> {status}")
             
         except ClientError as e:
@@ -531,23 +1200,8 @@ class DbService:
                 logger.info(f"Plot not found: {user_id}/{plot_id}")
                 return None
             
-            # Convert Decimal to float
-            item = self._convert_decimal_to_float(item)
-            
             # Convert to PlotData
-            plot = PlotData(
-                user_id=item['user_id'],
-                plot_id=item['plot_id'],
-                lat=item['lat'],
-                lon=item['lon'],
-                crop=item['crop'],
-                hobli_id=item['hobli_id'],
-                farmer_name=item['farmer_name'],
-                phone_number=item['phone_number'],
-                registration_date=datetime.fromisoformat(item['registration_date']),
-                last_analysis=datetime.fromisoformat(item['last_analysis']) if item.get('last_analysis') else None,
-                status=item.get('status', 'active')
-            )
+            plot = self._plot_from_item(item)
             
             logger.info(f"Retrieved plot: {user_id}/{plot_id}")
             
@@ -616,25 +1270,7 @@ class DbService:
             items = response.get('Items', [])
             
             # Convert to AlertData objects
-            alerts = []
-            for item in items:
-                # Convert Decimal to float
-                item = self._convert_decimal_to_float(item)
-                
-                alert = AlertData(
-                    hobli_id=item['hobli_id'],
-                    timestamp=datetime.fromisoformat(item['timestamp']),
-                    plot_id=item['plot_id'],
-                    user_id=item['user_id'],
-                    risk_level=item['risk_level'],
-                    message=item['message'],
-                    gee_proof=item['gee_proof'],
-                    bedrock_reasoning=item['bedrock_reasoning'],
-                    officer_response=item.get('officer_response'),
-                    resolution_status=item.get('resolution_status', 'pending'),
-                    sms_sent=item.get('sms_sent', False)
-                )
-                alerts.append(alert)
+            alerts = [self._alert_from_item(item) for item in items]
             
             logger.info(f"Retrieved {len(alerts)} high priority alerts")
             
@@ -676,6 +1312,7 @@ class DbService:
             
             # Write to DynamoDB
             self.hobli_directory_table.put_item(Item=item)
+            self._invalidate_hobli_cache(hobli_data.hobli_id)
             
             logger.info(f"Successfully registered Hobli: {hobli_data.hobli_id} "
                        f"with officer: {hobli_data.officer_id}")
@@ -686,10 +1323,41 @@ class DbService:
             logger.error(f"Failed to register Hobli {hobli_data.hobli_id}: {e}")
             raise
     
+    def _hobli_item_to_model(self, item: Dict[str, Any]) -> HobliDirectory:
+        """Convert a raw Hobli directory item to a HobliDirectory"""
+        return HobliDirectory(
+            hobli_id=item['hobli_id'],
+            hobli_name=item['hobli_name'],
+            district=item['district'],
+            state=item['state'],
+            officer_id=item['officer_id'],
+            officer_name=item['officer_name'],
+            officer_phone=item['officer_phone'],
+            officer_email=item['officer_email'],
+            created_date=datetime.fromisoformat(item['created_date']),
+            last_updated=datetime.fromisoformat(item['last_updated'])
+        )
+    
+    def _invalidate_hobli_cache(self, hobli_id: str) -> None:
+        """
+        Drop cached directory data affected by a write to a Hobli
+        
+        Officer lists are all dropped because a reassignment removes the
+        Hobli from the previous officer's list as well as adding it to the new one.
+        
+        Args:
+            hobli_id: Hobli identifier that was written
+        """
+        self.hobli_cache.invalidate(('hobli', hobli_id))
+        self.hobli_cache.invalidate_where(lambda key: key[0] == 'officer')
+    
     def get_hobli_directory(self, hobli_id: str) -> Optional[HobliDirectory]:
         """
         Get Hobli directory entry including Extension Officer assignment
         
+        Served from the process-local Hobli cache when possible; misses
+        (including "not found") are cached for cache_ttl_seconds.
+        
         Args:
             hobli_id: Hobli identifier
             
@@ -699,6 +1367,10 @@ class DbService:
         Raises:
             ClientError: If DynamoDB operation fails
         """
+        found, hobli = self.hobli_cache.get(('hobli', hobli_id))
+        if found:
+            return hobli.copy() if hobli else None
+        
         try:
             # Get item from DynamoDB
             response = self.hobli_directory_table.get_item(
@@ -709,25 +1381,16 @@ class DbService:
             
             if not item:
                 logger.info(f"Hobli directory entry not found: {hobli_id}")
+                self.hobli_cache.set(('hobli', hobli_id), None)
                 return None
             
             # Convert to HobliDirectory
-            hobli = HobliDirectory(
-                hobli_id=item['hobli_id'],
-                hobli_name=item['hobli_name'],
-                district=item['district'],
-                state=item['state'],
-                officer_id=item['officer_id'],
-                officer_name=item['officer_name'],
-                officer_phone=item['officer_phone'],
-                officer_email=item['officer_email'],
-                created_date=datetime.fromisoformat(item['created_date']),
-                last_updated=datetime.fromisoformat(item['last_updated'])
-            )
+            hobli = self._hobli_item_to_model(item)
+            self.hobli_cache.set(('hobli', hobli_id), hobli)
             
             logger.info(f"Retrieved Hobli directory entry: {hobli_id}")
             
-            return hobli
+            return hobli.copy()
             
         except ClientError as e:
             logger.error(f"Failed to retrieve Hobli directory entry {hobli_id}: {e}")
@@ -771,6 +1434,7 @@ class DbService:
                     ':last_updated': datetime.now().isoformat()
                 }
             )
+            self._invalidate_hobli_cache(hobli_id)
             
             logger.info(f"Updated officer assignment for Hobli: {hobli_id} -> {officer_id}")
             
@@ -782,6 +1446,8 @@ class DbService:
         """
         Get all Hoblis assigned to an Extension Officer
         
+        Served from the process-local Hobli cache when possible.
+        
         Args:
             officer_id: Extension Officer identifier
             
@@ -791,38 +1457,38 @@ class DbService:
         Raises:
             ClientError: If DynamoDB operation fails
         """
+        found, hoblis = self.hobli_cache.get(('officer', officer_id))
+        if found:
+            return [hobli.copy() for hobli in hoblis]
+        
         try:
-            # Scan for all hoblis with this officer_id
-            # Note: In production, this should use a GSI on officer_id
-            response = self.hobli_directory_table.scan(
-                FilterExpression='officer_id = :officer_id',
-                ExpressionAttributeValues={
+            # Query the officer GSI, following pagination so officers with
+            # large jurisdictions are not truncated at 1 MB per page
+            query_params = {
+                'IndexName': 'officer_id-last_updated-index',
+                'KeyConditionExpression': 'officer_id = :officer_id',
+                'ExpressionAttributeValues': {
                     ':officer_id': officer_id
                 }
-            )
+            }
             
-            items = response.get('Items', [])
+            items = []
+            while True:
+                response = self.hobli_directory_table.query(**query_params)
+                items.extend(response.get('Items', []))
+                
+                last_key = response.get('LastEvaluatedKey')
+                if not last_key:
+                    break
+                query_params['ExclusiveStartKey'] = last_key
             
             # Convert to HobliDirectory objects
-            hoblis = []
-            for item in items:
-                hobli = HobliDirectory(
-                    hobli_id=item['hobli_id'],
-                    hobli_name=item['hobli_name'],
-                    district=item['district'],
-                    state=item['state'],
-                    officer_id=item['officer_id'],
-                    officer_name=item['officer_name'],
-                    officer_phone=item['officer_phone'],
-                    officer_email=item['officer_email'],
-                    created_date=datetime.fromisoformat(item['created_date']),
-                    last_updated=datetime.fromisoformat(item['last_updated'])
-                )
-                hoblis.append(hobli)
+            hoblis = [self._hobli_item_to_model(item) for item in items]
+            self.hobli_cache.set(('officer', officer_id), hoblis)
             
             logger.info(f"Retrieved {len(hoblis)} Hoblis for officer: {officer_id}")
             
-            return hoblis
+            return [hobli.copy() for hobli in hoblis]
             
         except ClientError as e:
             logger.error(f"Failed to retrieve Hoblis for officer {officer_id}: {e}")
@@ -884,47 +1550,52 @@ class DbService:
             # Get all Hoblis for this officer
             hoblis = self.get_officer_hoblis(officer_id)
             
-            if not hoblis:
-                # Return empty assignment if no Hoblis found
-                return OfficerAssignment(
-                    officer_id=officer_id,
-                    officer_name="Unknown",
-                    hobli_ids=[],
-                    total_plots=0,
-                    active_alerts=0,
-                    last_updated=datetime.now()
-                )
-            
-            # Aggregate statistics across all Hoblis
-            hobli_ids = [h.hobli_id for h in hoblis]
-            officer_name = hoblis[0].officer_name  # All should have same officer name
-            
-            total_plots = 0
-            active_alerts = 0
-            
-            for hobli in hoblis:
-                stats = self.get_jurisdiction_stats(hobli.hobli_id)
-                total_plots += stats.total_plots
-                active_alerts += stats.active_alerts
-            
-            assignment = OfficerAssignment(
-                officer_id=officer_id,
-                officer_name=officer_name,
-                hobli_ids=hobli_ids,
-                total_plots=total_plots,
-                active_alerts=active_alerts,
-                last_updated=datetime.now()
-            )
-            
-            logger.info(f"Retrieved assignment for officer: {officer_id} - "
-                       f"{len(hobli_ids)} Hoblis, {total_plots} plots, {active_alerts} active alerts")
+            stats = [self.get_jurisdiction_stats(hobli.hobli_id) for hobli in hoblis]
             
-            return assignment
+            return self._build_officer_assignment(officer_id, hoblis, stats)
             
         except ClientError as e:
             logger.error(f"Failed to retrieve assignment for officer {officer_id}: {e}")
             raise
     
+    def _build_officer_assignment(
+        self,
+        officer_id: str,
+        hoblis: List[HobliDirectory],
+        stats: List[JurisdictionStats]
+    ) -> OfficerAssignment:
+        """Aggregate per-Hobli statistics into an OfficerAssignment"""
+        if not hoblis:
+            # Return empty assignment if no Hoblis found
+            return OfficerAssignment(
+                officer_id=officer_id,
+                officer_name="Unknown",
+                hobli_ids=[],
+                total_plots=0,
+                active_alerts=0,
+                last_updated=datetime.now()
+            )
+        
+        # Aggregate statistics across all Hoblis
+        hobli_ids = [h.hobli_id for h in hoblis]
+        officer_name = hoblis[0].officer_name  # All should have same officer name
+        total_plots = sum(s.total_plots for s in stats)
+        active_alerts = sum(s.active_alerts for s in stats)
+        
+        assignment = OfficerAssignment(
+            officer_id=officer_id,
+            officer_name=officer_name,
+            hobli_ids=hobli_ids,
+            total_plots=total_plots,
+            active_alerts=active_alerts,
+            last_updated=datetime.now()
+        )
+        
+        logger.info(f"Retrieved assignment for officer: {officer_id} - "
+                   f"{len(hobli_ids)} Hoblis, {total_plots} plots, {active_alerts} active alerts")
+        
+        return assignment
+    
     def get_officer_for_plot(self, user_id: str, plot_id: str) -> Optional[HobliDirectory]:
         """
         Get the Extension Officer assigned to a specific plot
@@ -961,10 +1632,120 @@ class DbService:
             logger.error(f"Failed to get officer for plot {user_id}/{plot_id}: {e}")
             raise
 
+    def _plot_item_to_scan_dict(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a raw plots-table item to the dictionary shape used by sentry scans
+        
+        Args:
+            item: DynamoDB item as returned by the Table resource
+            
+        Returns:
+            Plot dictionary with all information needed for scanning
+        """
+        area = item.get('area_hectares')
+        return {
+            'plot_id': item.get('plot_id', ''),
+            'user_id': item.get('user_id', ''),
+            'latitude': float(item.get('lat', item.get('latitude', 0))),
+            'longitude': float(item.get('lon', item.get('longitude', 0))),
+            'hobli_id': item.get('hobli_id', 'unknown'),
+            'farmer_name': item.get('farmer_name', ''),
+            'phone': item.get('phone_number', item.get('phone', '')),
+            'crop_type': item.get('crop', item.get('crop_type', '')),
+            'area_hectares': float(area) if area is not None else None
+        }
+    
+    async def iter_all_plots(
+        self,
+        limit: Optional[int] = None,
+        total_segments: Optional[int] = None,
+        page_size: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream all registered plots using a paginated, parallel table scan
+        
+        Each scan segment (Segment/TotalSegments) follows LastEvaluatedKey
+        until exhausted in its own task on the shared blocking I/O executor,
+        so at most total_segments Scan calls are in flight; pages are yielded as
+        soon as any segment returns them, so callers can start processing
+        the first page while later pages are still loading.
+        
+        Args:
+            limit: Optional limit on number of plots to yield
+            total_segments: Number of parallel scan segments (defaults to settings)
+            page_size: Items requested per Scan page (defaults to settings)
+            
+        Yields:
+            Plot dictionaries with all necessary information
+            
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        total_segments = max(1, total_segments or self.scan_total_segments)
+        page_size = page_size or self.scan_page_size
+        if limit:
+            page_size = min(page_size, limit)
+        
+        # Bounded so that fast segments cannot race arbitrarily far ahead of the consumer
+        pages: asyncio.Queue = asyncio.Queue(maxsize=total_segments * 2)
+        done_marker = object()
+        
+        async def scan_segment(segment: int) -> None:
+            scan_params: Dict[str, Any] = {'Limit': page_size}
+            if total_segments > 1:
+                scan_params['Segment'] = segment
+                scan_params['TotalSegments'] = total_segments
+            
+            try:
+                while True:
+                    response = await run_blocking(self.plots_table.scan, **scan_params)
+                    await pages.put(response.get('Items', []))
+                    
+                    last_key = response.get('LastEvaluatedKey')
+                    if not last_key:
+                        break
+                    scan_params['ExclusiveStartKey'] = last_key
+            except Exception as e:
+                await pages.put(e)
+            finally:
+                await pages.put(done_marker)
+        
+        logger.info(f"Streaming all registered plots (limit={limit}, "
+                   f"segments={total_segments}, page_size={page_size})")
+        
+        workers = [asyncio.create_task(scan_segment(i)) for i in range(total_segments)]
+        yielded = 0
+        finished = 0
+        
+        try:
+            while finished < total_segments:
+                page = await pages.get()
+                
+                if page is done_marker:
+                    finished += 1
+                    continue
+                if isinstance(page, Exception):
+                    logger.error(f"Failed to scan plots table: {page}")
+                    raise page
+                
+                for item in page:
+                    yield self._plot_item_to_scan_dict(item)
+                    yielded += 1
+                    if limit and yielded >= limit:
+                        return
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            logger.info(f"Streamed {yielded} registered plots")
+    
     async def get_all_plots(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get all registered plots for sentry scanning
         
+        Collects the output of iter_all_plots, so every page of the table is
+        returned rather than only the first 1 MB scan page.
+        
         Args:
             limit: Optional limit on number of plots to return
             
@@ -974,42 +1755,12 @@ class DbService:
         Raises:
             ClientError: If DynamoDB operation fails
         """
-        try:
-            logger.info(f"Retrieving all registered plots (limit={limit})")
-            
-            # Scan the plots table
-            scan_params = {
-                'TableName': self.plots_table
-            }
-            
-            if limit:
-                scan_params['Limit'] = limit
-            
-            response = self.dynamodb.scan(**scan_params)
-            items = response.get('Items', [])
-            
-            # Convert to list of dictionaries
-            plots = []
-            for item in items:
-                plot_dict = {
-                    'plot_id': item.get('plot_id', {}).get('S', ''),
-                    'user_id': item.get('user_id', {}).get('S', ''),
-                    'latitude': float(item.get('latitude', {}).get('N', 0)),
-                    'longitude': float(item.get('longitude', {}).get('N', 0)),
-                    'hobli_id': item.get('hobli_id', {}).get('S', 'unknown'),
-                    'farmer_name': item.get('farmer_name', {}).get('S', ''),
-                    'phone': item.get('phone', {}).get('S', ''),
-                    'crop_type': item.get('crop_type', {}).get('S', ''),
-                    'area_hectares': float(item.get('area_hectares', {}).get('N', 0)) if item.get('area_hectares') else None
-                }
-                plots.append(plot_dict)
-            
-            logger.info(f"Retrieved {len(plots)} registered plots")
-            return plots
-            
-        except ClientError as e:
-            logger.error(f"Failed to retrieve all plots: {e}")
-            raise
+        logger.info(f"Retrieving all registered plots (limit={limit})")
+        
+        plots = [plot async for plot in self.iter_all_plots(limit=limit)]
+        
+        logger.info(f"Retrieved {len(plots)} registered plots")
+        return plots
     
     async def get_officer_by_hobli(self, hobli_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -1052,3 +1803,197 @@ class DbService:
         except ClientError as e:
             logger.error(f"Failed to get officer for Hobli {hobli_id}: {e}")
             raise
+    
+    async def get_jurisdiction_stats_async(self, hobli_id: str) -> JurisdictionStats:
+        """
+        Get aggregated statistics for a jurisdiction without blocking the event loop
+        
+        Args:
+            hobli_id: Hobli identifier
+            
+        Returns:
+            JurisdictionStats with aggregated data
+            
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        try:
+            return await run_blocking(self.get_jurisdiction_stats, hobli_id)
+        except ClientError as e:
+            logger.error(f"Failed to calculate statistics for hobli {hobli_id}: {e}")
+            raise
+    
+    async def get_officer_assignment_async(
+        self,
+        officer_id: str,
+        max_concurrency: Optional[int] = None
+    ) -> OfficerAssignment:
+        """
+        Get Extension Officer assignment summary with per-Hobli queries fanned out
+        
+        The per-Hobli statistics reads run on the shared blocking I/O
+        executor, at most max_concurrency at a time, instead of one after
+        another.
+        
+        Args:
+            officer_id: Extension Officer identifier
+            max_concurrency: Maximum in-flight DynamoDB queries (defaults to settings)
+            
+        Returns:
+            OfficerAssignment with aggregated data
+            
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.fanout_max_concurrency))
+        
+        async def hobli_stats(hobli_id: str) -> JurisdictionStats:
+            async with semaphore:
+                return await run_blocking(self.get_jurisdiction_stats, hobli_id)
+        
+        try:
+            hoblis = await run_blocking(self.get_officer_hoblis, officer_id)
+            
+            stats = await asyncio.gather(*(hobli_stats(hobli.hobli_id) for hobli in hoblis))
+            
+            return self._build_officer_assignment(officer_id, hoblis, list(stats))
+            
+        except ClientError as e:
+            logger.error(f"Failed to retrieve assignment for officer {officer_id}: {e}")
+            raise
+    
+    async def get_officer_plots_async(
+        self,
+        officer_id: str,
+        limit: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ) -> List[PlotData]:
+        """
+        Get plots across an officer's jurisdictions with concurrent per-Hobli queries
+        
+        Up to max_concurrency Hobli queries are in flight at once and results
+        are merged in arrival order. The plots still needed are split across
+        the queries in flight, so together they never fetch more than limit;
+        a Hobli that fills its share is re-queued with its page cursor, and
+        no further queries are made once the limit is reached.
+        
+        Args:
+            officer_id: Extension Officer identifier
+            limit: Maximum number of results (defaults to query_limit from settings)
+            max_concurrency: Maximum in-flight DynamoDB queries (defaults to settings)
+            
+        Returns:
+            List of PlotData for plots in the officer's jurisdictions
+            
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        limit = limit or self.query_limit
+        max_concurrency = max(1, max_concurrency or self.fanout_max_concurrency)
+        in_flight: Dict[asyncio.Future, Tuple[str, int]] = {}  # future -> (hobli_id, reserved plots)
+        all_plots: List[PlotData] = []
+        
+        try:
+            hoblis = await run_blocking(self.get_officer_hoblis, officer_id)
+            pending: List[Tuple[str, Optional[str]]] = [(hobli.hobli_id, None) for hobli in hoblis]
+            
+            while (pending or in_flight) and len(all_plots) < limit:
+                available = limit - len(all_plots) - sum(reserved for _, reserved in in_flight.values())
+                while pending and len(in_flight) < max_concurrency and available > 0:
+                    slots = min(max_concurrency - len(in_flight), len(pending))
+                    share = -(-available // slots)
+                    hobli_id, cursor = pending.pop(0)
+                    future = asyncio.ensure_future(
+                        run_blocking(self.get_hobli_plots_page, hobli_id, limit=share, cursor=cursor)
+                    )
+                    in_flight[future] = (hobli_id, share)
+                    available -= share
+                
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    hobli_id, _ = in_flight.pop(future)
+                    page = future.result()
+                    all_plots.extend(page.items)
+                    if page.next_cursor:
+                        pending.insert(0, (hobli_id, page.next_cursor))
+            
+            logger.info(f"Retrieved {min(len(all_plots), limit)} plots for officer: {officer_id}")
+            
+            return all_plots[:limit]
+            
+        except ClientError as e:
+            logger.error(f"Failed to retrieve plots for officer {officer_id}: {e}")
+            raise
+        finally:
+            for future in in_flight:
+                future.cancel()
+    
+    async def iter_hobli_plots(
+        self,
+        hobli_id: str,
+        page_size: Optional[int] = None
+    ) -> AsyncIterator[PlotData]:
+        """
+        Stream every plot in a jurisdiction, fetching pages lazily
+        
+        The next page is only requested once the caller has consumed the
+        current one, so breaking out early skips the remaining queries.
+        
+        Args:
+            hobli_id: Hobli identifier
+            page_size: Plots per page (defaults to query_limit from settings)
+            
+        Yields:
+            PlotData in registration order
+            
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        cursor = None
+        while True:
+            page = await run_blocking(self.get_hobli_plots_page, hobli_id, page_size, cursor)
+            for plot in page.items:
+                yield plot
+            
+            cursor = page.next_cursor
+            if not cursor:
+                return
+    
+    async def iter_recent_alerts(
+        self,
+        hobli_id: str,
+        hours: int = 24,
+        page_size: Optional[int] = None
+    ) -> AsyncIterator[AlertData]:
+        """
+        Stream every recent alert in a jurisdiction, newest first, fetching pages lazily
+        
+        Args:
+            hobli_id: Hobli identifier
+            hours: Number of hours to look back
+            page_size: Alerts per page (defaults to query_limit from settings)
+            
+        Yields:
+            AlertData, newest first
+            
+        Raises:
+            ClientError: If DynamoDB operation fails
+        """
+        cursor = None
+        while True:
+            page = await run_blocking(self.get_recent_alerts_page, hobli_id, hours, page_size, cursor)
+            for alert in page.items:
+                yield alert
+            
+            cursor = page.next_cursor
+            if not cursor:
+                return
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get Hobli directory cache statistics
+        
+        Returns:
+            Dictionary with cache size, hit/miss counters and hit rate
+        """
+        return self.hobli_cache.stats()
@@ -0,0 +1,111 @@
+"""
+Shared executor for blocking I/O
+
+boto3 clients are synchronous, so async service methods that call them
+directly block the event loop and run one at a time. Services hand those
+calls to one process-wide thread pool instead:
+- Pool size from performance.blocking_io_pool_size
+- run_blocking() as a drop-in for asyncio.to_thread on the shared pool
+- Lazy creation, so importing services never starts threads
+"""
+
+from typing import Any, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_blocking_executor() -> ThreadPoolExecutor:
+    """
+    Get the process-wide executor for blocking calls, creating it on first use
+
+    Returns:
+        Shared ThreadPoolExecutor
+    """
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                pool_size = get_settings().performance.blocking_io_pool_size
+                _executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="blocking-io")
+                logger.info(f"Blocking I/O executor started with {pool_size} workers")
+
+    return _executor
+
+
+def configure_blocking_executor(pool_size: int) -> ThreadPoolExecutor:
+    """
+    Replace the shared executor with one of the given size
+
+    Calls already submitted to the previous executor finish on it.
+
+    Args:
+        pool_size: Number of worker threads
+
+    Returns:
+        The new shared ThreadPoolExecutor
+    """
+    global _executor
+
+    if pool_size <= 0:
+        raise ValueError(f"pool_size must be positive, got {pool_size}")
+
+    with _executor_lock:
+        previous = _executor
+        _executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="blocking-io")
+
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+    logger.info(f"Blocking I/O executor resized to {pool_size} workers")
+    return _executor
+
+
+def shutdown_blocking_executor(wait: bool = True) -> None:
+    """
+    Shut down the shared executor; the next call creates a fresh one
+
+    Args:
+        wait: Wait for running calls to finish
+    """
+    global _executor
+
+    with _executor_lock:
+        executor, _executor = _executor, None
+
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+async def run_blocking(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking callable on the shared executor and await its result
+
+    Context variables are propagated like asyncio.to_thread.
+
+    Args:
+        fn: Blocking callable (typically a boto3 client method)
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        Whatever fn returns
+
+    Raises:
+        Exception: Whatever fn raised
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, fn, *args, **kwargs)
+    return await loop.run_in_executor(get_blocking_executor(), call)
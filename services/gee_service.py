@@ -1,10 +1,20 @@
-﻿from typing import Optional, Dict, Any
+﻿from typing import Optional, Dict, Any, List, Sequence, Tuple
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import date, datetime
 import logging
+import re
+
+import numpy as np
+
+from services.executor import run_blocking
+from services.ndvi_cache import NDVICache, composite_start, create_ndvi_cache, next_composite_start
+from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Band names produced by ImageCollection.toBands() on MOD13Q1, e.g. "2024_01_17_NDVI"
+_SERIES_BAND = re.compile(r"^(\d{4})_(\d{2})_(\d{2})_NDVI$")
+
 _ee = None
 _ee_initialized = False
 
@@ -24,12 +34,18 @@ class QualityAssessment(BaseModel):
     confidence: float
 
 class GEEService:
-    def __init__(self, use_mock: bool = False):
+    def __init__(self, use_mock: bool = False, ndvi_cache: Optional[NDVICache] = None):
         self.use_mock = use_mock
         self._ee_available = False
         self.ndvi_min_threshold = -1.0
         self.ndvi_max_threshold = 1.0
         self.cloud_cover_threshold = 30.0
+        # Results keyed by MODIS pixel and composite period; None disables caching
+        self.ndvi_cache = ndvi_cache if ndvi_cache is not None else create_ndvi_cache()
+        # Points per reduceRegions call in get_ndvi_batch
+        self.batch_chunk_size = get_settings().gee.batch_chunk_size
+        # Earth Engine getInfo round trips issued by this service
+        self.ee_requests = 0
 
     def _init_earth_engine(self) -> bool:
         global _ee, _ee_initialized
@@ -66,19 +82,213 @@ class GEEService:
         )
 
     async def get_ndvi_analysis(self, lat: float, lon: float, year: Optional[int] = None) -> GEEData:
-        if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
-            raise ValueError(f"Invalid coordinates: ({lat}, {lon})")
+        self._validate_coordinates(lat, lon)
         if self.use_mock or not self._init_earth_engine():
             return self._get_mock_ndvi_data(lat, lon)
         if year is None:
             year = datetime.now().year
-        point = _ee.Geometry.Point([lon, lat])
+        if self.ndvi_cache is None:
+            return await self._compute_ndvi_analysis(lat, lon, year)
+        key, ttl_seconds = self.ndvi_cache.entry_for(lat, lon, year)
+        cached = (await self._cache_lookup([key]))[0]
+        if cached is not None:
+            return cached
+        result = await self._compute_ndvi_analysis(lat, lon, year)
+        await self._cache_store([(key, result, ttl_seconds)])
+        return result
+
+    async def get_ndvi_batch(self, points: Sequence[Tuple[float, float]], year: Optional[int] = None) -> List[GEEData]:
+        """
+        NDVI for many (lat, lon) points with one reduceRegions call per chunk
+
+        Points in the same cached MODIS pixel are computed once. Results are
+        returned in input order.
+        """
+        for lat, lon in points:
+            self._validate_coordinates(lat, lon)
+        if self.use_mock or not self._init_earth_engine():
+            return [self._get_mock_ndvi_data(lat, lon) for lat, lon in points]
+        if year is None:
+            year = datetime.now().year
+
+        # Unique work items: cache key (or point index when uncached) -> point indexes
+        members: Dict[str, List[int]] = {}
+        entries: Dict[str, Tuple[float, float, float]] = {}
+        for index, (lat, lon) in enumerate(points):
+            if self.ndvi_cache is None:
+                key, ttl_seconds = str(index), 0.0
+            else:
+                key, ttl_seconds = self.ndvi_cache.entry_for(lat, lon, year)
+            if key not in members:
+                members[key] = []
+                entries[key] = (lat, lon, ttl_seconds)
+            members[key].append(index)
+
+        keys = list(members)
+        resolved: Dict[str, GEEData] = {}
+        if self.ndvi_cache is not None:
+            for key, cached in zip(keys, await self._cache_lookup(keys)):
+                if cached is not None:
+                    resolved[key] = cached
+
+        missing = [key for key in keys if key not in resolved]
+        for start in range(0, len(missing), self.batch_chunk_size):
+            chunk = missing[start:start + self.batch_chunk_size]
+            computed = await self._compute_ndvi_chunk([entries[key][:2] for key in chunk], year)
+            resolved.update(zip(chunk, computed))
+            if self.ndvi_cache is not None:
+                await self._cache_store([(key, data, entries[key][2]) for key, data in zip(chunk, computed)])
+
+        results: List[GEEData] = [None] * len(points)
+        for key, indexes in members.items():
+            for index in indexes:
+                results[index] = resolved[key]
+        logger.info(f"NDVI batch: {len(points)} points, {len(keys) - len(missing)} cached, "
+                    f"{len(missing)} computed in {-(-len(missing) // self.batch_chunk_size)} requests")
+        return results
+
+    async def get_ndvi_series_batch(
+        self,
+        points: Sequence[Tuple[float, float]],
+        start: date,
+        end: date
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Full 16-day NDVI series for many (lat, lon) points
+
+        Composites starting in [start, end) are sampled with one
+        toBands/reduceRegions call per chunk of points.
+
+        Returns:
+            Tuple of (composite start dates as datetime64[D], float32 NDVI of
+            shape (points, dates) with NaN where a composite has no value)
+        """
+        for lat, lon in points:
+            self._validate_coordinates(lat, lon)
+        if self.use_mock or not self._init_earth_engine():
+            return self._get_mock_ndvi_series(points, start, end)
+        if not points or start >= end:
+            return np.empty(0, dtype='datetime64[D]'), np.empty((len(points), 0), dtype=np.float32)
+
+        per_point: List[Dict[date, float]] = []
+        for offset in range(0, len(points), self.batch_chunk_size):
+            per_point += await self._compute_ndvi_series_chunk(
+                list(points[offset:offset + self.batch_chunk_size]), start, end
+            )
+
+        dates = sorted({day for series in per_point for day in series})
+        values = np.full((len(points), len(dates)), np.nan, dtype=np.float32)
+        column = {day: index for index, day in enumerate(dates)}
+        for row, series in enumerate(per_point):
+            for day, value in series.items():
+                values[row, column[day]] = value
+        return np.array(dates, dtype='datetime64[D]'), values
+
+    async def _compute_ndvi_series_chunk(
+        self,
+        coords: List[Tuple[float, float]],
+        start: date,
+        end: date
+    ) -> List[Dict[date, float]]:
+        features = [
+            _ee.Feature(_ee.Geometry.Point([lon, lat]), {'point_index': index})
+            for index, (lat, lon) in enumerate(coords)
+        ]
+        collection = _ee.FeatureCollection(features)
+        stack = _ee.ImageCollection("MODIS/061/MOD13Q1") \
+            .filterBounds(collection.geometry()) \
+            .filterDate(start.isoformat(), end.isoformat()) \
+            .select('NDVI') \
+            .toBands()
+        reduced = stack.reduceRegions(collection=collection, reducer=_ee.Reducer.first(), scale=250)
+        self.ee_requests += 1
+        info = await run_blocking(reduced.getInfo)
+
+        per_point: List[Dict[date, float]] = [{} for _ in coords]
+        for feature in info.get('features', []):
+            properties = feature['properties']
+            series = per_point[properties['point_index']]
+            for name, raw in properties.items():
+                match = _SERIES_BAND.match(name)
+                if match and raw is not None:
+                    series[date(*map(int, match.groups()))] = raw * 0.0001
+        return per_point
+
+    def _get_mock_ndvi_series(
+        self,
+        points: Sequence[Tuple[float, float]],
+        start: date,
+        end: date
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        dates = []
+        day = composite_start(start)
+        if day < start:
+            day = next_composite_start(day)
+        while day < min(end, date.today()):
+            dates.append(day)
+            day = next_composite_start(day)
+        days = np.array(dates, dtype='datetime64[D]')
+        day_of_year = (days - days.astype('datetime64[Y]')).astype(np.int64)
+        season = 0.15 * np.sin(2 * np.pi * (day_of_year - 120) / 365.0)
+        base = np.array([self._get_mock_ndvi_data(lat, lon).ndvi_float for lat, lon in points], dtype=np.float64)
+        noise = np.array([
+            np.random.default_rng(abs(hash((round(lat, 4), round(lon, 4)))) % (2 ** 32)).normal(0, 0.02, len(dates))
+            for lat, lon in points
+        ]).reshape(len(points), len(dates))
+        values = np.clip(base[:, None] - 0.1 + season[None, :] + noise, -1.0, 1.0)
+        return days, values.astype(np.float32)
+
+    def _validate_coordinates(self, lat: float, lon: float) -> None:
+        if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
+            raise ValueError(f"Invalid coordinates: ({lat}, {lon})")
+
+    async def _cache_lookup(self, keys: List[str]) -> List[Optional[GEEData]]:
+        def lookup():
+            return [self.ndvi_cache.get(key) for key in keys]
+        values = await run_blocking(lookup) if self.ndvi_cache.blocking else lookup()
+        return [GEEData(**value) if value is not None else None for value in values]
+
+    async def _cache_store(self, items: List[Tuple[str, GEEData, float]]) -> None:
+        def store():
+            for key, data, ttl_seconds in items:
+                self.ndvi_cache.set(key, data.dict(), ttl_seconds)
+        if self.ndvi_cache.blocking:
+            await run_blocking(store)
+        else:
+            store()
+
+    def _composite_image(self, geometry: Any, year: int) -> Any:
         modis = _ee.ImageCollection("MODIS/061/MOD13Q1")
-        image = modis.filterBounds(point).filterDate(f"{year}-01-01", f"{year}-12-31").median()
-        stats = image.reduceRegion(reducer=_ee.Reducer.mean(), geometry=point, scale=250, bestEffort=True).getInfo()
+        return modis.filterBounds(geometry).filterDate(f"{year}-01-01", f"{year}-12-31").median()
+
+    async def _compute_ndvi_analysis(self, lat: float, lon: float, year: int) -> GEEData:
+        point = _ee.Geometry.Point([lon, lat])
+        image = self._composite_image(point, year)
+        region_stats = image.reduceRegion(reducer=_ee.Reducer.mean(), geometry=point, scale=250, bestEffort=True)
+        self.ee_requests += 1
+        stats = await run_blocking(region_stats.getInfo)
+        return self._stats_to_gee_data(stats, year)
+
+    async def _compute_ndvi_chunk(self, coords: List[Tuple[float, float]], year: int) -> List[GEEData]:
+        features = [
+            _ee.Feature(_ee.Geometry.Point([lon, lat]), {'point_index': index})
+            for index, (lat, lon) in enumerate(coords)
+        ]
+        collection = _ee.FeatureCollection(features)
+        image = self._composite_image(collection.geometry(), year)
+        reduced = image.reduceRegions(collection=collection, reducer=_ee.Reducer.mean(), scale=250)
+        self.ee_requests += 1
+        info = await run_blocking(reduced.getInfo)
+        stats_by_index = {
+            feature['properties']['point_index']: feature['properties']
+            for feature in info.get('features', [])
+        }
+        return [self._stats_to_gee_data(stats_by_index.get(index, {}), year) for index in range(len(coords))]
+
+    def _stats_to_gee_data(self, stats: Dict[str, Any], year: int) -> GEEData:
         ndvi_raw = stats.get('NDVI', 0)
         ndvi = ndvi_raw * 0.0001 if ndvi_raw else 0.0
-        cloud_cover = stats.get('SummaryQA', 0)
+        cloud_cover = stats.get('SummaryQA', 0) or 0
         quality_result = self._assess_data_quality(ndvi, cloud_cover)
         return GEEData(
             ndvi_float=round(ndvi, 3),
@@ -136,6 +346,8 @@ class GEEService:
             'data_source': 'MODIS/061/MOD13Q1',
             'resolution': '250m',
             'ndvi_range': [self.ndvi_min_threshold, self.ndvi_max_threshold],
-            'cloud_cover_threshold': self.cloud_cover_threshold
+            'cloud_cover_threshold': self.cloud_cover_threshold,
+            'ndvi_cache': self.ndvi_cache.stats() if self.ndvi_cache is not None else None,
+            'ee_requests': self.ee_requests
         }
 
@@ -0,0 +1,190 @@
+"""
+Plot-sized image chips from Sentinel-2 rasters
+
+A Sentinel-2 tile covers ~110x110 km, while a plot analysis only needs the
+few kilometres around the plot. read_window opens the raster (local path,
+presigned HTTPS URL or any GDAL-readable source) and reads a single window
+around the coordinate; read_chip turns it into an image:
+- Cloud-optimized GeoTIFFs and JPEG2000 tiles are read with HTTP range
+  requests, so only the blocks overlapping the window are transferred
+- The window is resampled to size_px x size_px at resolution_m per pixel
+- The result is encoded as JPEG or PNG and base64-encoded for Bedrock
+
+rasterio and Pillow are imported on first use.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import BaseModel
+import base64
+import io
+import math
+
+import numpy as np
+
+MEDIA_TYPES = {'jpeg': 'image/jpeg', 'png': 'image/png'}
+
+# Reflectance mapped to white when a source is not already 8-bit (L2A scale is 10000)
+REFLECTANCE_MAX = 3000
+
+# Remote reads: skip the directory listing GDAL would otherwise request
+GDAL_REMOTE_OPTIONS = {
+    'GDAL_DISABLE_READDIR_ON_OPEN': 'EMPTY_DIR',
+    'GDAL_HTTP_MULTIRANGE': 'YES',
+    'GDAL_HTTP_MERGE_CONSECUTIVE_RANGES': 'YES'
+}
+
+
+class ImageChip(BaseModel):
+    """Encoded image chip centred on a plot"""
+    data_base64: str
+    media_type: str
+    width: int
+    height: int
+    resolution_m: float
+    center: Tuple[float, float]  # (lat, lon)
+    size_bytes: int
+
+    def to_bedrock_source(self) -> Dict[str, Any]:
+        """Image source block for an Anthropic messages request"""
+        return {
+            "type": "base64",
+            "media_type": self.media_type,
+            "data": self.data_base64
+        }
+
+
+def _to_uint8(data: np.ndarray) -> np.ndarray:
+    """Scale reflectance bands to 8-bit (8-bit sources such as TCI pass through)"""
+    if data.dtype == np.uint8:
+        return data
+    scaled = data.astype(np.float32) * (255.0 / REFLECTANCE_MAX)
+    return np.clip(scaled, 0, 255).astype(np.uint8)
+
+
+def read_window(
+    source: str,
+    lat: float,
+    lon: float,
+    size_px: int,
+    resolution_m: float,
+    indexes: Optional[List[int]] = None,
+    resampling: str = 'bilinear'
+) -> np.ndarray:
+    """
+    Read a square window around a coordinate, resampled to resolution_m
+
+    Only the part of the window inside the raster is read; the rest is
+    filled with 0 (nodata for Sentinel-2 products).
+
+    Args:
+        source: Raster path or URL (presigned HTTPS URLs are read with range requests)
+        lat: Latitude of the window centre
+        lon: Longitude of the window centre
+        size_px: Window width and height in output pixels
+        resolution_m: Ground resolution of an output pixel in metres
+        indexes: Bands to read (default: RGB when available, else band 1)
+        resampling: rasterio resampling name ('nearest' for class bands such as SCL)
+
+    Returns:
+        Array of shape (bands, size_px, size_px) in the source dtype
+
+    Raises:
+        ValueError: If the coordinate is outside the raster
+        rasterio.errors.RasterioIOError: If the source cannot be opened
+    """
+    import rasterio
+    from rasterio.enums import Resampling
+    from rasterio.warp import transform as transform_coords
+    from rasterio.windows import Window
+
+    with rasterio.Env(**GDAL_REMOTE_OPTIONS):
+        with rasterio.open(source) as src:
+            xs, ys = transform_coords('EPSG:4326', src.crs, [lon], [lat])
+            geo = src.transform
+
+            # Window extent in source pixels (Sentinel-2 tiles are north-up)
+            half_x = half_y = size_px * resolution_m / 2
+            if src.crs.is_geographic:
+                half_x /= 111320.0 * math.cos(math.radians(lat))
+                half_y /= 110540.0
+            col = (xs[0] - geo.c) / geo.a
+            row = (ys[0] - geo.f) / geo.e
+            if not (0 <= col <= src.width and 0 <= row <= src.height):
+                raise ValueError(f"Coordinates ({lat}, {lon}) are outside raster {source.split('?')[0]}")
+            col_off, row_off = col - half_x / abs(geo.a), row - half_y / abs(geo.e)
+            scale_x = size_px / (2 * half_x / abs(geo.a))
+            scale_y = size_px / (2 * half_y / abs(geo.e))
+
+            # Read only the part inside the raster and pad the rest, instead of a boundless (warped) read
+            left, top = max(col_off, 0.0), max(row_off, 0.0)
+            right = min(col_off + size_px / scale_x, src.width)
+            bottom = min(row_off + size_px / scale_y, src.height)
+            dest_left, dest_top = round((left - col_off) * scale_x), round((top - row_off) * scale_y)
+            dest_right = max(round((right - col_off) * scale_x), dest_left + 1)
+            dest_bottom = max(round((bottom - row_off) * scale_y), dest_top + 1)
+
+            if indexes is None:
+                indexes = [1, 2, 3] if src.count >= 3 else [1]
+            data = np.zeros((len(indexes), size_px, size_px), dtype=src.dtypes[0])
+            data[:, dest_top:dest_bottom, dest_left:dest_right] = src.read(
+                indexes,
+                window=Window(left, top, right - left, bottom - top),
+                out_shape=(len(indexes), dest_bottom - dest_top, dest_right - dest_left),
+                resampling=Resampling[resampling]
+            )
+            return data
+
+
+def read_chip(
+    source: str,
+    lat: float,
+    lon: float,
+    size_px: int = 256,
+    resolution_m: float = 10.0,
+    image_format: str = 'jpeg',
+    quality: int = 85
+) -> ImageChip:
+    """
+    Read a square chip around a coordinate with one windowed read
+
+    Args:
+        source: Raster path or URL (presigned HTTPS URLs are read with range requests)
+        lat: Latitude of the chip centre
+        lon: Longitude of the chip centre
+        size_px: Chip width and height in pixels
+        resolution_m: Ground resolution of a chip pixel in metres
+        image_format: 'jpeg' or 'png'
+        quality: JPEG quality
+
+    Returns:
+        ImageChip with the encoded image
+
+    Raises:
+        ValueError: If the format is unsupported or the coordinate is outside the raster
+        rasterio.errors.RasterioIOError: If the source cannot be opened
+    """
+    if image_format not in MEDIA_TYPES:
+        raise ValueError(f"Unsupported chip format: {image_format}")
+
+    from PIL import Image
+
+    data = read_window(source, lat, lon, size_px, resolution_m)
+    pixels = _to_uint8(data)
+    image = Image.fromarray(pixels[0] if len(pixels) == 1 else np.moveaxis(pixels, 0, -1))
+
+    buffer = io.BytesIO()
+    if image_format == 'jpeg':
+        image.save(buffer, format='JPEG', quality=quality)
+    else:
+        image.save(buffer, format='PNG', optimize=True)
+    encoded = buffer.getvalue()
+
+    return ImageChip(
+        data_base64=base64.b64encode(encoded).decode('ascii'),
+        media_type=MEDIA_TYPES[image_format],
+        width=size_px,
+        height=size_px,
+        resolution_m=resolution_m,
+        center=(lat, lon),
+        size_bytes=len(encoded)
+    )
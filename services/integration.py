@@ -13,6 +13,7 @@ from datetime import datetime
 
 from services.map_service import MapService
 from services.brain_service import BrainService, AnalysisResult
+from services.gee_service import GEEData
 from services.db_service import DbService
 from services.sms_service import SMSService
 from config.settings import get_settings
@@ -64,7 +65,8 @@ class ServiceIntegration:
         user_id: str,
         plot_id: str,
         farmer_name: Optional[str] = None,
-        phone: Optional[str] = None
+        phone: Optional[str] = None,
+        gee_data: Optional[GEEData] = None
     ) -> Dict[str, Any]:
         """
         Complete end-to-end plot analysis workflow
@@ -81,6 +83,7 @@ class ServiceIntegration:
             plot_id: Unique plot ID
             farmer_name: Optional farmer name
             phone: Optional phone number
+            gee_data: NDVI already fetched for the plot (skips the GEE lookup)
             
         Returns:
             Dictionary with analysis results and storage status
@@ -106,7 +109,8 @@ class ServiceIntegration:
             # Step 2: Run multimodal AI analysis
             analysis_result = await self.brain_service.analyze_plot(
                 lat=latitude,
-                lon=longitude
+                lon=longitude,
+                gee_data=gee_data
             )
             
             logger.info(f"Analysis complete: Risk={analysis_result.risk_level}, "
@@ -240,6 +244,10 @@ class ServiceIntegration:
         """
         Analyze multiple plots concurrently
         
+        NDVI for all plots is fetched up front with batched Earth Engine
+        requests (GEEService.get_ndvi_batch); plots fall back to individual
+        lookups if the batch fails.
+        
         Args:
             plots: List of plot dictionaries with coordinates and metadata
             max_concurrent: Maximum concurrent analyses
@@ -249,10 +257,19 @@ class ServiceIntegration:
         """
         logger.info(f"Starting batch analysis of {len(plots)} plots")
         
+        # Batch NDVI extraction for every plot
+        try:
+            ndvi = await self.brain_service.gee_service.get_ndvi_batch(
+                [(plot['latitude'], plot['longitude']) for plot in plots]
+            )
+        except Exception as e:
+            logger.warning(f"Batched NDVI lookup failed, falling back to per-plot lookups: {e}")
+            ndvi = [None] * len(plots)
+        
         # Create semaphore to limit concurrency
         semaphore = asyncio.Semaphore(max_concurrent)
         
-        async def analyze_with_semaphore(plot):
+        async def analyze_with_semaphore(plot, gee_data):
             async with semaphore:
                 try:
                     return await self.analyze_and_store_plot(
@@ -261,7 +278,8 @@ class ServiceIntegration:
                         user_id=plot['user_id'],
                         plot_id=plot['plot_id'],
                         farmer_name=plot.get('farmer_name'),
-                        phone=plot.get('phone')
+                        phone=plot.get('phone'),
+                        gee_data=gee_data
                     )
                 except Exception as e:
                     logger.error(f"Batch analysis failed for plot {plot['plot_id']}: {e}")
@@ -273,7 +291,7 @@ class ServiceIntegration:
         
         # Run analyses concurrently
         results = await asyncio.gather(
-            *[analyze_with_semaphore(plot) for plot in plots],
+            *[analyze_with_semaphore(plot, gee_data) for plot, gee_data in zip(plots, ndvi)],
             return_exceptions=True
         )
         
@@ -0,0 +1,138 @@
+"""
+Lazy service proxies
+
+Building every service up front makes the first Streamlit load pay for
+imports (geopandas, folium, earthengine) and network calls (S3 bucket
+checks) that most pages never need. LazyService stands in for a service
+and builds it on first attribute access:
+- Target given as a factory callable or a "module:attribute" path
+- Thread-safe, build-once construction
+- Other proxies passed as constructor arguments stay lazy until used
+- Import and construction timings per service for startup reporting
+"""
+
+from typing import Any, Callable, Dict, Iterable, Union
+import importlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class LazyService:
+    """Proxy that constructs the wrapped service on first use"""
+
+    def __init__(self, name: str, target: Union[str, Callable[..., Any]], **kwargs: Any):
+        """
+        Initialize LazyService
+
+        Args:
+            name: Service name used in logs and timings
+            target: Factory callable, or "module:attribute" path imported on first use
+            **kwargs: Keyword arguments passed to the factory
+        """
+        object.__setattr__(self, '_lazy_name', name)
+        object.__setattr__(self, '_lazy_target', target)
+        object.__setattr__(self, '_lazy_kwargs', kwargs)
+        object.__setattr__(self, '_lazy_instance', None)
+        object.__setattr__(self, '_lazy_lock', threading.Lock())
+        object.__setattr__(self, '_lazy_timings', {'import_seconds': 0.0, 'construct_seconds': 0.0})
+
+    def _lazy_resolve(self) -> Any:
+        """Return the wrapped service, building it on the first call"""
+        instance = self._lazy_instance
+        if instance is not None:
+            return instance
+
+        with self._lazy_lock:
+            if self._lazy_instance is None:
+                factory = self._lazy_target
+                if isinstance(factory, str):
+                    start = time.perf_counter()
+                    module_name, _, attribute = factory.partition(':')
+                    factory = getattr(importlib.import_module(module_name), attribute)
+                    self._lazy_timings['import_seconds'] = time.perf_counter() - start
+
+                start = time.perf_counter()
+                instance = factory(**self._lazy_kwargs)
+                self._lazy_timings['construct_seconds'] = time.perf_counter() - start
+                object.__setattr__(self, '_lazy_instance', instance)
+
+                logger.info(f"Initialized {self._lazy_name} service on first use "
+                            f"(import {self._lazy_timings['import_seconds'] * 1000:.0f} ms, "
+                            f"construct {self._lazy_timings['construct_seconds'] * 1000:.0f} ms)")
+
+        return self._lazy_instance
+
+    def __getattr__(self, attribute: str) -> Any:
+        if attribute.startswith('_lazy_'):
+            # Proxy state missing (e.g. during copy/unpickling): do not recurse
+            raise AttributeError(attribute)
+        return getattr(self._lazy_resolve(), attribute)
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        setattr(self._lazy_resolve(), attribute, value)
+
+    def __delattr__(self, attribute: str) -> None:
+        delattr(self._lazy_resolve(), attribute)
+
+    def __repr__(self) -> str:
+        state = "initialized" if self._lazy_instance is not None else "pending"
+        return f"<LazyService {self._lazy_name} ({state})>"
+
+
+def is_initialized(service: Any) -> bool:
+    """
+    Check whether a service has been built
+
+    Args:
+        service: LazyService proxy or plain service instance
+
+    Returns:
+        False only for proxies that have not been used yet
+    """
+    if isinstance(service, LazyService):
+        return object.__getattribute__(service, '_lazy_instance') is not None
+    return True
+
+
+def resolve(service: Any) -> Any:
+    """
+    Get the real service behind a proxy, building it if needed
+
+    Args:
+        service: LazyService proxy or plain service instance
+
+    Returns:
+        The wrapped service (plain instances are returned unchanged)
+    """
+    if isinstance(service, LazyService):
+        return service._lazy_resolve()
+    return service
+
+
+def startup_timings(services: Union[Dict[str, Any], Iterable[Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Collect per-service import/construct timings
+
+    Args:
+        services: Mapping or iterable of services; non-proxies are skipped
+
+    Returns:
+        Dictionary keyed by service name with initialized, import_seconds
+        and construct_seconds
+    """
+    values = services.values() if isinstance(services, dict) else services
+    timings: Dict[str, Dict[str, Any]] = {}
+
+    for service in values:
+        if not isinstance(service, LazyService):
+            continue
+        name = object.__getattribute__(service, '_lazy_name')
+        timings[name] = {
+            'initialized': is_initialized(service),
+            **object.__getattribute__(service, '_lazy_timings')
+        }
+
+    return timings
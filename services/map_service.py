@@ -6,19 +6,23 @@ Handles all mapping and geospatial operations including:
 - Coordinate validation and normalization
 - Hobli boundary detection from coordinates
 - GPS location services integration
+
+folium and geopandas are imported by the methods that need them, and the
+HTTP client is created on first request, so constructing MapService stays
+cheap for pages that never render a map.
 """
 
-from typing import Tuple, Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Tuple, Optional, Dict, Any, List
 from pydantic import BaseModel, Field
 import logging
 import httpx
 from urllib.parse import urlencode
-import folium
-from shapely.geometry import Point
-from shapely.ops import nearest_points
-import geopandas as gpd
 from config.settings import get_settings
 
+if TYPE_CHECKING:
+    import folium
+    import geopandas as gpd
+
 logger = logging.getLogger(__name__)
 
 # Get configuration
@@ -74,14 +78,21 @@ class MapService:
         self.india_lon_bounds = settings.map_service.india_lon_bounds
         self.coordinate_precision = settings.map_service.coordinate_precision
         
-        # HTTP client for WMS requests
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        # HTTP client for WMS requests (created on first request)
+        self._http_client: Optional[httpx.AsyncClient] = None
         
         # Cache for Hobli boundary data (in production, this would be loaded from a database)
-        self._hobli_cache: Optional[gpd.GeoDataFrame] = None
+        self._hobli_cache: Optional["gpd.GeoDataFrame"] = None
         
         logger.info(f"MapService initialized with Bhuvan URL: {self.bhuvan_base_url}")
     
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """HTTP client for WMS requests, created on first use"""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(timeout=30.0)
+        return self._http_client
+    
     def validate_coordinates(self, lat: float, lon: float) -> CoordinateValidationResult:
         """
         Validate coordinates for Indian geographic regions
@@ -383,7 +394,7 @@ class MapService:
         center_lon: float, 
         zoom: int = 10,
         add_bhuvan_layer: bool = True
-    ) -> folium.Map:
+    ) -> "folium.Map":
         """
         Create Folium map with ISRO Bhuvan base layer
         
@@ -396,6 +407,8 @@ class MapService:
         Returns:
             Folium Map object
         """
+        import folium
+        
         # Create base map
         m = folium.Map(
             location=[center_lat, center_lon],
@@ -428,14 +441,14 @@ class MapService:
     
     def add_plot_marker(
         self,
-        map_obj: folium.Map,
+        map_obj: "folium.Map",
         lat: float,
         lon: float,
         plot_id: str,
         popup_text: Optional[str] = None,
         color: str = "blue",
         draggable: bool = False
-    ) -> folium.Marker:
+    ) -> "folium.Marker":
         """
         Add a plot marker to the map
         
@@ -451,6 +464,8 @@ class MapService:
         Returns:
             Folium Marker object
         """
+        import folium
+        
         if popup_text is None:
             popup_text = f"Plot ID: {plot_id}<br>Coordinates: {lat:.6f}, {lon:.6f}"
         
@@ -467,12 +482,12 @@ class MapService:
     
     def add_jurisdiction_boundary(
         self,
-        map_obj: folium.Map,
+        map_obj: "folium.Map",
         hobli_id: str,
         boundary_coords: List[Tuple[float, float]],
         color: str = "blue",
         fill_opacity: float = 0.2
-    ) -> folium.Polygon:
+    ) -> "folium.Polygon":
         """
         Add Hobli jurisdiction boundary to the map
         
@@ -486,6 +501,8 @@ class MapService:
         Returns:
             Folium Polygon object
         """
+        import folium
+        
         polygon = folium.Polygon(
             locations=boundary_coords,
             popup=f"Hobli: {hobli_id}",
@@ -508,7 +525,7 @@ class MapService:
         add_bhuvan_layer: bool = True,
         enable_draw: bool = False,
         enable_locate: bool = True
-    ) -> folium.Map:
+    ) -> "folium.Map":
         """
         Create interactive Folium map for Streamlit integration
         
@@ -523,6 +540,8 @@ class MapService:
         Returns:
             Folium Map object with interactive features
         """
+        import folium
+        
         # Create base map with click events enabled
         m = folium.Map(
             location=[center_lat, center_lon],
@@ -585,7 +604,7 @@ class MapService:
     
     def add_clustered_markers(
         self,
-        map_obj: folium.Map,
+        map_obj: "folium.Map",
         plots: List[Dict[str, Any]],
         cluster_radius: int = 80
     ) -> None:
@@ -597,6 +616,8 @@ class MapService:
             plots: List of plot dictionaries with lat, lon, plot_id, status
             cluster_radius: Clustering radius in pixels
         """
+        import folium
+        
         from folium.plugins import MarkerCluster
         
         # Create marker cluster
@@ -658,7 +679,7 @@ class MapService:
     
     def add_heatmap_layer(
         self,
-        map_obj: folium.Map,
+        map_obj: "folium.Map",
         alerts: List[Dict[str, Any]],
         radius: int = 15,
         blur: int = 25
@@ -712,5 +733,7 @@ class MapService:
     
     async def close(self):
         """Close HTTP client connections"""
-        await self.http_client.aclose()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
         logger.info("MapService HTTP client closed")
\ No newline at end of file
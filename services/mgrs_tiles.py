@@ -0,0 +1,229 @@
+"""
+Sentinel-2 tile (MGRS 100 km square) assignment for plot coordinates
+
+Sentinel-2 granules are named after the MGRS square they start in, e.g.
+43PGQ: UTM zone 43, latitude band P, 100 km column G and row Q. Tiles are
+resolved for whole plot batches at once:
+- UTM projection with pyproj, one vectorized transform per zone and hemisphere
+- Latitude band and 100 km square letters computed with NumPy
+- Norway (32V) and Svalbard (31X-37X) zone exceptions
+- Results memoized per quantized coordinate (1e-5 degrees, ~1 m)
+
+Tile IDs use a two-digit zone (05QKB) so zone, band and square can be
+sliced by position; S3 prefixes drop the padding.
+"""
+
+from typing import Dict, List, Sequence
+from functools import lru_cache
+import threading
+
+import numpy as np
+from pyproj import Transformer
+
+# Latitude bands C-X (8 degrees each, X is 12), excluding I and O
+LATITUDE_BANDS = "CDEFGHJKLMNPQRSTUVWX"
+
+# 100 km column letters repeat every three zones, row letters every two
+COLUMN_LETTERS = ("STUVWXYZ", "ABCDEFGH", "JKLMNPQR")  # indexed by zone % 3
+ROW_LETTERS = "ABCDEFGHJKLMNPQRSTUV"
+EVEN_ZONE_ROW_OFFSET = 5
+
+# UTM grid limits; Sentinel-2 acquires between 56S and 84N
+MIN_LATITUDE = -80.0
+MAX_LATITUDE = 84.0
+
+COORDINATE_SCALE = 100000  # quantization: 1e-5 degrees
+KEY_LAT_OFFSET = 90 * COORDINATE_SCALE
+KEY_LON_SPAN = 10 ** 9  # packs quantized (lat, lon) into one int64
+
+
+@lru_cache(maxsize=None)
+def _utm_transformer(epsg: int) -> Transformer:
+    return Transformer.from_crs(4326, epsg, always_xy=True)
+
+
+def utm_zones(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """
+    UTM zone numbers including the Norway and Svalbard exceptions
+
+    Args:
+        lat: Latitudes in degrees
+        lon: Longitudes in degrees
+
+    Returns:
+        Zone numbers 1-60
+    """
+    lon = (np.asarray(lon, dtype=np.float64) + 180.0) % 360.0 - 180.0
+    lat = np.asarray(lat, dtype=np.float64)
+    zones = (np.floor((lon + 180.0) / 6.0).astype(np.int64) % 60) + 1
+
+    zones = np.where((lat >= 56.0) & (lat < 64.0) & (lon >= 3.0) & (lon < 12.0), 32, zones)
+
+    svalbard = (lat >= 72.0) & (lon >= 0.0) & (lon < 42.0)
+    svalbard_zones = np.select(
+        [lon < 9.0, lon < 21.0, lon < 33.0],
+        [31, 33, 35],
+        default=37
+    )
+    return np.where(svalbard, svalbard_zones, zones)
+
+
+def latitude_bands(lat: np.ndarray) -> np.ndarray:
+    """
+    MGRS latitude band letters
+
+    Args:
+        lat: Latitudes in degrees, within [MIN_LATITUDE, MAX_LATITUDE]
+
+    Returns:
+        Band letters as a string array
+    """
+    index = np.clip(np.floor((np.asarray(lat, dtype=np.float64) + 80.0) / 8.0).astype(np.int64), 0, 19)
+    return np.array(list(LATITUDE_BANDS))[index]
+
+
+def tile_ids(lat: Sequence[float], lon: Sequence[float]) -> np.ndarray:
+    """
+    Sentinel-2 tile IDs for arrays of coordinates
+
+    Args:
+        lat: Latitudes in degrees
+        lon: Longitudes in degrees (same length)
+
+    Returns:
+        Tile IDs (e.g. '43PGQ') as a string array
+
+    Raises:
+        ValueError: If a latitude is outside the UTM grid or a coordinate is not finite
+    """
+    lat = np.atleast_1d(np.asarray(lat, dtype=np.float64))
+    lon = np.atleast_1d(np.asarray(lon, dtype=np.float64))
+    if lat.shape != lon.shape:
+        raise ValueError(f"lat and lon lengths differ: {lat.shape} vs {lon.shape}")
+    if not (np.isfinite(lat).all() and np.isfinite(lon).all()):
+        raise ValueError("Coordinates must be finite")
+    if ((lat < MIN_LATITUDE) | (lat > MAX_LATITUDE)).any():
+        raise ValueError(f"Latitude outside the UTM grid ({MIN_LATITUDE} to {MAX_LATITUDE})")
+
+    zones = utm_zones(lat, lon)
+    south = lat < 0
+    easting = np.empty_like(lat)
+    northing = np.empty_like(lat)
+
+    # One transform per (zone, hemisphere); a country-wide batch touches a handful
+    epsg = np.where(south, 32700, 32600) + zones
+    for code in np.unique(epsg):
+        mask = epsg == code
+        easting[mask], northing[mask] = _utm_transformer(int(code)).transform(lon[mask], lat[mask])
+
+    set_index = zones % 3
+    column = np.clip(np.floor(easting / 100000.0).astype(np.int64), 1, 8) - 1
+    column_letters = np.array([list(letters) for letters in COLUMN_LETTERS])[set_index, column]
+
+    row = np.floor(northing / 100000.0).astype(np.int64)
+    row = (row + np.where(zones % 2 == 0, EVEN_ZONE_ROW_OFFSET, 0)) % len(ROW_LETTERS)
+    row_letters = np.array(list(ROW_LETTERS))[row]
+
+    zone_text = np.char.zfill(zones.astype(str), 2)
+    return np.char.add(np.char.add(np.char.add(zone_text, latitude_bands(lat)), column_letters), row_letters)
+
+
+class TileResolver:
+    """Memoizing tile assignment for single plots and plot batches"""
+
+    def __init__(self, max_entries: int = 1_000_000):
+        """
+        Initialize TileResolver
+
+        Args:
+            max_entries: Quantized coordinates kept before the oldest are dropped
+        """
+        self.max_entries = max_entries
+        self._memo: Dict[int, str] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, lat: float, lon: float) -> str:
+        """
+        Tile ID for one coordinate
+
+        Args:
+            lat: Latitude in degrees
+            lon: Longitude in degrees
+
+        Returns:
+            Tile ID (e.g. '43PGQ')
+
+        Raises:
+            ValueError: If the coordinate is outside the UTM grid
+        """
+        return self.resolve_many([lat], [lon])[0]
+
+    def resolve_many(self, lat: Sequence[float], lon: Sequence[float]) -> List[str]:
+        """
+        Tile IDs for a batch of coordinates in one vectorized pass
+
+        Coordinates are quantized to 1e-5 degrees; only quantized coordinates
+        not seen before are projected.
+
+        Args:
+            lat: Latitudes in degrees
+            lon: Longitudes in degrees (same length)
+
+        Returns:
+            Tile IDs aligned with the input
+
+        Raises:
+            ValueError: If a coordinate is outside the UTM grid
+        """
+        lat = np.atleast_1d(np.asarray(lat, dtype=np.float64))
+        lon = np.atleast_1d(np.asarray(lon, dtype=np.float64))
+        if lat.shape != lon.shape:
+            raise ValueError(f"lat and lon lengths differ: {lat.shape} vs {lon.shape}")
+        if not (np.isfinite(lat).all() and np.isfinite(lon).all()):
+            raise ValueError("Coordinates must be finite")
+
+        lat_q = np.round(lat * COORDINATE_SCALE).astype(np.int64)
+        lon_q = np.round(lon * COORDINATE_SCALE).astype(np.int64)
+        unique, inverse = np.unique((lat_q + KEY_LAT_OFFSET) * KEY_LON_SPAN + lon_q, return_inverse=True)
+        keys = unique.tolist()
+
+        with self._lock:
+            found = [self._memo.get(key) for key in keys]
+        missing = [index for index, tile_id in enumerate(found) if tile_id is None]
+
+        if missing:
+            missing_lat_q, missing_lon_q = np.divmod(unique[missing] + KEY_LON_SPAN // 2, KEY_LON_SPAN)
+            resolved = tile_ids(
+                (missing_lat_q - KEY_LAT_OFFSET) / COORDINATE_SCALE,
+                (missing_lon_q - KEY_LON_SPAN // 2) / COORDINATE_SCALE
+            )
+            with self._lock:
+                for index, tile_id in zip(missing, resolved.tolist()):
+                    found[index] = tile_id
+                    self._memo[keys[index]] = tile_id
+                while len(self._memo) > self.max_entries:
+                    del self._memo[next(iter(self._memo))]
+
+        with self._lock:
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+
+        return [found[index] for index in inverse.reshape(-1).tolist()]
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get memo statistics
+
+        Returns:
+            Dictionary with hits and misses (per distinct quantized coordinate)
+            and memoized entries
+        """
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._memo)}
+
+
+# Shared by every service in the process
+tile_resolver = TileResolver()
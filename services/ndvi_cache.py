@@ -0,0 +1,458 @@
+"""
+NDVI result cache for MODIS MOD13Q1 analyses
+
+MOD13Q1 is a 250 m product published as 16-day composites, so every point
+inside one MODIS pixel gets the same yearly median until the next composite
+is released. Results are cached under that identity:
+- Key: global MODIS sinusoidal pixel (row, col), year and latest released composite
+- TTL: until the next composite is expected to be published
+- Pluggable backends: in-memory LRU, on-disk SQLite, or Redis
+- Hit/miss counters for service metrics
+
+Backend failures never fail an analysis; they are logged and treated as
+misses.
+"""
+
+from typing import Any, Callable, Dict, Optional, Tuple
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timedelta
+from pathlib import Path
+import json
+import logging
+import math
+import sqlite3
+import threading
+import time
+
+from config.settings import get_settings
+from services.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# MODIS sinusoidal grid (MOD13Q1 nominal 250 m = 231.656358 m pixels)
+MODIS_EARTH_RADIUS_M = 6371007.181
+MODIS_GRID_ORIGIN_X = -20015109.354
+MODIS_GRID_ORIGIN_Y = 10007554.677
+MODIS_PIXEL_SIZE_M = -2 * MODIS_GRID_ORIGIN_X / (36 * 4800)  # 36 tiles of 4800 pixels across
+
+# MOD13Q1 composites start on day-of-year 1, 17, 33, ... 353 every year
+COMPOSITE_PERIOD_DAYS = 16
+
+
+def modis_pixel_index(lat: float, lon: float) -> Tuple[int, int]:
+    """
+    Get the global MOD13Q1 pixel containing a point
+
+    Args:
+        lat: Latitude in degrees
+        lon: Longitude in degrees
+
+    Returns:
+        Tuple of (row, col) on the global 250 m sinusoidal grid
+    """
+    lat_rad = math.radians(lat)
+    x = MODIS_EARTH_RADIUS_M * math.radians(lon) * math.cos(lat_rad)
+    y = MODIS_EARTH_RADIUS_M * lat_rad
+
+    row = int((MODIS_GRID_ORIGIN_Y - y) // MODIS_PIXEL_SIZE_M)
+    col = int((x - MODIS_GRID_ORIGIN_X) // MODIS_PIXEL_SIZE_M)
+    return row, col
+
+
+def composite_start(day: date) -> date:
+    """
+    Get the first day of the 16-day composite period containing a date
+
+    Args:
+        day: Calendar date
+
+    Returns:
+        Start date of the MOD13Q1 composite period
+    """
+    period = (day.timetuple().tm_yday - 1) // COMPOSITE_PERIOD_DAYS
+    return date(day.year, 1, 1) + timedelta(days=period * COMPOSITE_PERIOD_DAYS)
+
+
+def next_composite_start(start: date) -> date:
+    """
+    Get the start of the composite period following the given one
+
+    Args:
+        start: Composite start date
+
+    Returns:
+        Next composite start (the last period of a year runs into January 1)
+    """
+    return min(start + timedelta(days=COMPOSITE_PERIOD_DAYS), date(start.year + 1, 1, 1))
+
+
+def latest_released_composite(now: datetime, release_lag_days: int) -> Tuple[date, datetime]:
+    """
+    Get the newest composite published by a point in time
+
+    A period's composite becomes available release_lag_days after the
+    period ends.
+
+    Args:
+        now: Current time
+        release_lag_days: Days between period end and publication
+
+    Returns:
+        Tuple of (start of the newest released composite, time the next one is released)
+    """
+    lag = timedelta(days=release_lag_days)
+    start = composite_start((now - lag).date())
+    # The period containing now - lag has not ended yet, so its predecessor is the newest released
+    previous = composite_start(start - timedelta(days=1))
+
+    next_release = datetime.combine(next_composite_start(start), datetime.min.time()) + lag
+    return previous, next_release
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize datetimes in cached results as ISO strings"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class NDVICacheBackend(ABC):
+    """Storage interface for serialized NDVI results"""
+
+    # Whether calls block on I/O and should run off the event loop
+    blocking = True
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """Return the stored value, or None if missing or expired"""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        """Store a value for ttl_seconds"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every stored value"""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of stored values"""
+
+
+class MemoryNDVICacheBackend(NDVICacheBackend):
+    """Process-local LRU backend"""
+
+    blocking = False
+
+    def __init__(self, max_entries: int = 50000):
+        """
+        Initialize in-memory backend
+
+        Args:
+            max_entries: Maximum entries before LRU eviction
+        """
+        self._cache = TTLCache(max_entries=max_entries, ttl_seconds=86400)
+
+    def get(self, key: str) -> Optional[str]:
+        _, value = self._cache.get(key)
+        return value
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        self._cache.set(key, value, ttl_seconds=ttl_seconds)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class SQLiteNDVICacheBackend(NDVICacheBackend):
+    """On-disk backend shared by processes on the same host"""
+
+    def __init__(
+        self,
+        path: str,
+        clock: Callable[[], float] = time.time,
+        table: str = "ndvi_cache",
+        max_entries: Optional[int] = None
+    ):
+        """
+        Initialize SQLite backend (the database is opened on first use)
+
+        Args:
+            path: Database file path (parent directories are created)
+            clock: Wall-clock time source (overridable for tests)
+            table: Table holding this cache's rows
+            max_entries: Row limit; rows closest to expiry are dropped beyond it
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+        self.path = Path(path)
+        self.table = table
+        self.max_entries = max_entries
+        self._clock = clock
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connect().execute(
+                f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] <= self._clock():
+                self._connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+                self._connection.commit()
+                return None
+            return row[0]
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, self._clock() + ttl_seconds)
+            )
+            if self.max_entries is not None:
+                connection.execute(
+                    f"DELETE FROM {self.table} WHERE key IN (SELECT key FROM {self.table} "
+                    f"ORDER BY expires_at LIMIT max(0, (SELECT COUNT(*) FROM {self.table}) - ?))",
+                    (self.max_entries,)
+                )
+            connection.commit()
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired rows
+
+        Returns:
+            Number of rows removed
+        """
+        with self._lock:
+            cursor = self._connect().execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (self._clock(),))
+            self._connection.commit()
+            return cursor.rowcount
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connect().execute(f"DELETE FROM {self.table}")
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute(f"SELECT COUNT(*) FROM {self.table}").fetchone()[0]
+
+
+class RedisNDVICacheBackend(NDVICacheBackend):
+    """Redis backend shared by every app instance"""
+
+    def __init__(self, url: Optional[str] = None, client: Any = None, key_prefix: str = "ndvi:"):
+        """
+        Initialize Redis backend (the client is created on first use)
+
+        Args:
+            url: Redis URL, used when no client is given
+            client: Existing redis client
+            key_prefix: Prefix for every key written by this backend
+        """
+        self.url = url
+        self.key_prefix = key_prefix
+        self._client = client
+
+    @property
+    def client(self) -> Any:
+        """Redis client, created from url on first use"""
+        if self._client is None:
+            import redis
+            self._client = redis.Redis.from_url(self.url, decode_responses=True)
+        return self._client
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(self.key_prefix + key)
+        if isinstance(value, bytes):
+            value = value.decode('utf-8')
+        return value
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        self.client.set(self.key_prefix + key, value, ex=max(1, int(math.ceil(ttl_seconds))))
+
+    def clear(self) -> None:
+        keys = list(self.client.scan_iter(match=self.key_prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.client.scan_iter(match=self.key_prefix + "*"))
+
+
+class NDVICache:
+    """NDVI result cache keyed by MODIS pixel and composite period"""
+
+    def __init__(
+        self,
+        backend: NDVICacheBackend,
+        release_lag_days: int = 7,
+        closed_year_ttl_seconds: float = 30 * 86400,
+        clock: Callable[[], datetime] = datetime.now
+    ):
+        """
+        Initialize NDVICache
+
+        Args:
+            backend: Storage backend
+            release_lag_days: Days after a period ends before its composite is published
+            closed_year_ttl_seconds: TTL for results of past years
+            clock: Current time source (overridable for tests)
+        """
+        self.backend = backend
+        self.release_lag_days = release_lag_days
+        self.closed_year_ttl_seconds = closed_year_ttl_seconds
+        self._clock = clock
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.errors = 0
+
+    @property
+    def blocking(self) -> bool:
+        """Whether lookups block on I/O"""
+        return self.backend.blocking
+
+    def entry_for(self, lat: float, lon: float, year: int) -> Tuple[str, float]:
+        """
+        Build the cache key and TTL for an analysis
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+            year: Year of the median composite
+
+        Returns:
+            Tuple of (key, ttl_seconds)
+        """
+        row, col = modis_pixel_index(lat, lon)
+        now = self._clock()
+        released, next_release = latest_released_composite(now, self.release_lag_days)
+
+        if released >= composite_start(date(year, 12, 31)):
+            # The year's last composite is published; its median is final
+            return f"mod13q1:{row}:{col}:{year}:final", self.closed_year_ttl_seconds
+
+        ttl = max((next_release - now).total_seconds(), 1.0)
+        return f"mod13q1:{row}:{col}:{year}:{released.isoformat()}", ttl
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached result
+
+        Args:
+            key: Key from entry_for
+
+        Returns:
+            Cached result dictionary, or None on a miss
+        """
+        try:
+            value = self.backend.get(key)
+        except Exception as e:
+            self.errors += 1
+            self.misses += 1
+            logger.warning(f"NDVI cache lookup failed for {key}: {e}")
+            return None
+
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, result: Dict[str, Any], ttl_seconds: float) -> None:
+        """
+        Store a result
+
+        Args:
+            key: Key from entry_for
+            result: JSON-serializable result dictionary
+            ttl_seconds: TTL from entry_for
+        """
+        try:
+            self.backend.set(key, json.dumps(result, default=_json_default), ttl_seconds)
+            self.stores += 1
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"NDVI cache store failed for {key}: {e}")
+
+    def clear(self) -> None:
+        """Remove every cached result (counters are kept)"""
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with backend name, hit/miss/store/error counters and hit rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            'backend': type(self.backend).__name__,
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'errors': self.errors,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+def create_ndvi_cache(backend: Optional[str] = None) -> Optional[NDVICache]:
+    """
+    Build the NDVI cache configured in settings.gee
+
+    Args:
+        backend: Backend name overriding settings.gee.ndvi_cache_backend
+
+    Returns:
+        NDVICache, or None when the backend is "none"
+    """
+    config = get_settings().gee
+    backend = backend or config.ndvi_cache_backend
+
+    if backend == "none":
+        return None
+    if backend == "memory":
+        store: NDVICacheBackend = MemoryNDVICacheBackend(max_entries=config.ndvi_cache_max_entries)
+    elif backend == "sqlite":
+        store = SQLiteNDVICacheBackend(config.ndvi_cache_path)
+    elif backend == "redis":
+        store = RedisNDVICacheBackend(url=config.ndvi_cache_redis_url)
+    else:
+        raise ValueError(f"Unknown NDVI cache backend: {backend}")
+
+    return NDVICache(
+        store,
+        release_lag_days=config.ndvi_cache_release_lag_days,
+        closed_year_ttl_seconds=config.ndvi_cache_closed_year_ttl_seconds
+    )
@@ -0,0 +1,376 @@
+"""
+NDVI time series and seasonal anomaly engine
+
+A single yearly-median NDVI cannot separate seasonal senescence from real
+stress. This engine works on the full MOD13Q1 16-day series instead:
+- Series for a batch of plots held as one float32 matrix (plots x composites)
+- Per-pixel columnar store (dates + float32 NDVI) in memory and on disk, so
+  repeated scans only fetch composites released since the last fetch
+- Z-score anomalies against the preceding years' values for the same
+  composite period, vectorized over plots, periods and years
+- Per-plot classification: stress, seasonal_low, normal, above_normal
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from datetime import date, datetime, timedelta
+from pathlib import Path
+import logging
+import threading
+
+import numpy as np
+from pydantic import BaseModel
+
+from config.settings import get_settings
+from services.ndvi_cache import latest_released_composite, modis_pixel_index
+
+logger = logging.getLogger(__name__)
+
+PERIODS_PER_YEAR = 23
+PERIOD_DAYS = 16
+
+
+class NDVISeries(BaseModel):
+    """NDVI series for a batch of points"""
+    dates: np.ndarray   # composite start dates, datetime64[D], shape (T,)
+    values: np.ndarray  # float32 NDVI, shape (points, T), NaN where missing
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
+class NDVIAnomaly(BaseModel):
+    """Latest-composite anomaly for one plot"""
+    lat: float
+    lon: float
+    composite_date: Optional[date] = None
+    ndvi: Optional[float] = None
+    climatology_mean: Optional[float] = None
+    climatology_std: Optional[float] = None
+    z_score: Optional[float] = None
+    climatology_years: int = 0
+    classification: str = "insufficient_history"
+
+
+def composite_periods(dates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split composite dates into calendar year and 16-day period index
+
+    Args:
+        dates: datetime64 array of composite start dates
+
+    Returns:
+        Tuple of (years, period indexes 0-22) as int64 arrays
+    """
+    days = dates.astype('datetime64[D]')
+    year_start = days.astype('datetime64[Y]')
+    years = year_start.astype(np.int64) + 1970
+    periods = (days - year_start.astype('datetime64[D]')).astype(np.int64) // PERIOD_DAYS
+    return years, np.minimum(periods, PERIODS_PER_YEAR - 1)
+
+
+def ndvi_anomalies(
+    dates: np.ndarray,
+    values: np.ndarray,
+    climatology_years: int = 5,
+    min_years: int = 3,
+    std_floor: float = 0.02
+) -> Dict[str, np.ndarray]:
+    """
+    Z-score every composite against the same period in preceding years
+
+    For a composite in year Y and period P the climatology is the values of
+    period P in years Y-climatology_years .. Y-1. Rolling sums over a
+    (plots, years, periods) grid make this a handful of array operations
+    regardless of the number of plots.
+
+    Args:
+        dates: Composite start dates, shape (T,)
+        values: NDVI, shape (plots, T), NaN where missing
+        climatology_years: Number of preceding years in the climatology
+        min_years: Minimum years with data for a z-score
+        std_floor: Lower bound on the climatology standard deviation
+
+    Returns:
+        Dictionary of (plots, T) float arrays: z_score, climatology_mean,
+        climatology_std, and climatology_years (count)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n_plots, n_dates = values.shape
+    if n_dates == 0:
+        empty = np.empty((n_plots, 0))
+        return {'z_score': empty, 'climatology_mean': empty, 'climatology_std': empty, 'climatology_years': empty}
+
+    years, periods = composite_periods(dates)
+    year_index = years - years.min()
+    n_years = int(year_index.max()) + 1
+
+    grid = np.full((n_plots, n_years, PERIODS_PER_YEAR), np.nan)
+    grid[:, year_index, periods] = values
+    valid = ~np.isnan(grid)
+    filled = np.where(valid, grid, 0.0)
+
+    def rolling(array: np.ndarray) -> np.ndarray:
+        # Sum over years [y - climatology_years, y) for every y
+        cumulative = np.concatenate([np.zeros((n_plots, 1, PERIODS_PER_YEAR)), np.cumsum(array, axis=1)], axis=1)
+        upper = np.arange(n_years)
+        lower = np.maximum(upper - climatology_years, 0)
+        return cumulative[:, upper, :] - cumulative[:, lower, :]
+
+    count = rolling(valid.astype(np.float64))
+    total = rolling(filled)
+    squares = rolling(filled ** 2)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / count
+        variance = (squares - count * mean ** 2) / (count - 1)
+        std = np.maximum(np.sqrt(np.maximum(variance, 0.0)), std_floor)
+        enough = count >= max(min_years, 2)
+        z_grid = np.where(enough, (grid - mean) / std, np.nan)
+
+    return {
+        'z_score': z_grid[:, year_index, periods],
+        'climatology_mean': np.where(enough, mean, np.nan)[:, year_index, periods],
+        'climatology_std': np.where(enough, std, np.nan)[:, year_index, periods],
+        'climatology_years': count[:, year_index, periods]
+    }
+
+
+def classify_anomalies(
+    z_scores: np.ndarray,
+    ndvi: np.ndarray,
+    anomaly_z: float = 1.5,
+    low_ndvi: float = 0.4
+) -> np.ndarray:
+    """
+    Classify plots from their latest z-score and NDVI
+
+    Low NDVI with a normal z-score is seasonal (senescence, harvest,
+    fallow); only values well below the period's climatology are stress.
+
+    Args:
+        z_scores: Latest z-score per plot (NaN without enough history)
+        ndvi: Latest NDVI per plot
+        anomaly_z: |z| at or beyond which a value is anomalous
+        low_ndvi: NDVI below which a normal value is reported as seasonal_low
+
+    Returns:
+        Array of classification strings
+    """
+    return np.select(
+        [np.isnan(z_scores), z_scores <= -anomaly_z, z_scores >= anomaly_z, ndvi < low_ndvi],
+        ["insufficient_history", "stress", "above_normal", "seasonal_low"],
+        default="normal"
+    )
+
+
+class NDVISeriesStore:
+    """Per-pixel NDVI series (dates + float32 values), in memory and optionally on disk"""
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize series store
+
+        Args:
+            root: Directory for .npz files; None keeps series in memory only
+        """
+        self.root = Path(root) if root else None
+        self._series: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.npz"
+
+    def load(self, key: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get the stored series for a pixel
+
+        Args:
+            key: Pixel key
+
+        Returns:
+            Tuple of (dates datetime64[D], float32 values), or None
+        """
+        with self._lock:
+            series = self._series.get(key)
+        if series is not None or self.root is None:
+            return series
+
+        path = self._path(key)
+        if not path.exists():
+            return None
+        with np.load(path) as data:
+            series = (data['dates'].astype('datetime64[D]'), data['ndvi'].astype(np.float32))
+        with self._lock:
+            self._series[key] = series
+        return series
+
+    def save(self, key: str, dates: np.ndarray, values: np.ndarray) -> None:
+        """
+        Replace the stored series for a pixel
+
+        Args:
+            key: Pixel key
+            dates: Composite start dates
+            values: float32 NDVI aligned with dates
+        """
+        series = (dates.astype('datetime64[D]'), values.astype(np.float32))
+        with self._lock:
+            self._series[key] = series
+        if self.root is not None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            np.savez(self._path(key), dates=series[0].astype(np.int32), ndvi=series[1])
+
+    def __len__(self) -> int:
+        return len(self._series)
+
+
+class NDVITimeSeriesEngine:
+    """Incremental NDVI series fetching and seasonal anomaly scoring"""
+
+    def __init__(
+        self,
+        gee_service: Any,
+        store: Optional[NDVISeriesStore] = None,
+        clock: Callable[[], datetime] = datetime.now
+    ):
+        """
+        Initialize NDVITimeSeriesEngine
+
+        Args:
+            gee_service: GEEService used for get_ndvi_series_batch
+            store: Series store (defaults to settings.gee.timeseries_store_path)
+            clock: Current time source (overridable for tests)
+        """
+        config = get_settings().gee
+        self.gee_service = gee_service
+        self.store = store if store is not None else NDVISeriesStore(config.timeseries_store_path)
+        self.climatology_years = config.timeseries_climatology_years
+        self.min_years = config.timeseries_min_years
+        self.anomaly_z = config.timeseries_anomaly_z
+        self.release_lag_days = config.ndvi_cache_release_lag_days
+        self._clock = clock
+
+        self.fetches = 0
+        self.composites_fetched = 0
+
+    def series_start(self) -> date:
+        """First composite date kept: January 1 of the oldest climatology year"""
+        return date(self._clock().year - self.climatology_years, 1, 1)
+
+    async def get_series(self, points: Sequence[Tuple[float, float]]) -> NDVISeries:
+        """
+        Get NDVI series for a batch of points, fetching only new composites
+
+        Args:
+            points: (lat, lon) pairs
+
+        Returns:
+            NDVISeries with one row per point
+        """
+        start = self.series_start()
+        released, _ = latest_released_composite(self._clock(), self.release_lag_days)
+        keys = ["{}_{}".format(*modis_pixel_index(lat, lon)) for lat, lon in points]
+
+        # Group pixels by the first composite they are missing
+        first_point: Dict[str, Tuple[float, float]] = {}
+        for key, point in zip(keys, points):
+            first_point.setdefault(key, point)
+
+        stored: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        pending: Dict[date, List[str]] = {}
+        for key in first_point:
+            series = self.store.load(key)
+            if series is not None:
+                series = self._trim(series, start)
+                stored[key] = series
+            last = series[0][-1].astype(date) if series is not None and len(series[0]) else None
+            if last is not None and last >= released:
+                continue
+            fetch_from = last + timedelta(days=1) if last is not None else start
+            pending.setdefault(fetch_from, []).append(key)
+
+        end = self._clock().date() + timedelta(days=1)
+        for fetch_from, group in pending.items():
+            dates, values = await self.gee_service.get_ndvi_series_batch(
+                [first_point[key] for key in group], fetch_from, end
+            )
+            self.fetches += 1
+            self.composites_fetched += values.size
+            for key, row in zip(group, values):
+                old_dates, old_values = stored.get(key, (np.empty(0, 'datetime64[D]'), np.empty(0, np.float32)))
+                merged = (np.concatenate([old_dates, dates]), np.concatenate([old_values, row.astype(np.float32)]))
+                stored[key] = merged
+                self.store.save(key, *merged)
+
+        return self._assemble([stored[key] for key in keys])
+
+    def _trim(self, series: Tuple[np.ndarray, np.ndarray], start: date) -> Tuple[np.ndarray, np.ndarray]:
+        keep = series[0] >= np.datetime64(start, 'D')
+        return series[0][keep], series[1][keep]
+
+    def _assemble(self, rows: List[Tuple[np.ndarray, np.ndarray]]) -> NDVISeries:
+        if not rows:
+            return NDVISeries(dates=np.empty(0, 'datetime64[D]'), values=np.empty((0, 0), np.float32))
+
+        dates = np.unique(np.concatenate([row_dates for row_dates, _ in rows]))
+        values = np.full((len(rows), len(dates)), np.nan, dtype=np.float32)
+        for index, (row_dates, row_values) in enumerate(rows):
+            values[index, np.searchsorted(dates, row_dates)] = row_values
+        return NDVISeries(dates=dates, values=values)
+
+    async def get_anomalies(self, points: Sequence[Tuple[float, float]]) -> List[NDVIAnomaly]:
+        """
+        Score each point's latest composite against its seasonal climatology
+
+        Args:
+            points: (lat, lon) pairs
+
+        Returns:
+            NDVIAnomaly per point, in input order
+        """
+        series = await self.get_series(points)
+        n_points = len(points)
+        if series.values.shape[1] == 0:
+            return [NDVIAnomaly(lat=lat, lon=lon) for lat, lon in points]
+
+        scores = ndvi_anomalies(series.dates, series.values, self.climatology_years, self.min_years)
+
+        # Latest composite with a value, per plot
+        has_value = ~np.isnan(series.values)
+        latest = np.where(has_value, np.arange(series.values.shape[1]), -1).max(axis=1)
+        rows = np.arange(n_points)
+        column = np.maximum(latest, 0)
+        ndvi = np.where(latest >= 0, series.values[rows, column], np.nan)
+        z = np.where(latest >= 0, scores['z_score'][rows, column], np.nan)
+        labels = classify_anomalies(z, ndvi, self.anomaly_z)
+
+        def scalar(value: float) -> Optional[float]:
+            return None if np.isnan(value) else round(float(value), 4)
+
+        return [
+            NDVIAnomaly(
+                lat=lat,
+                lon=lon,
+                composite_date=series.dates[column[i]].astype(date) if latest[i] >= 0 else None,
+                ndvi=scalar(ndvi[i]),
+                climatology_mean=scalar(scores['climatology_mean'][i, column[i]]) if latest[i] >= 0 else None,
+                climatology_std=scalar(scores['climatology_std'][i, column[i]]) if latest[i] >= 0 else None,
+                z_score=scalar(z[i]),
+                climatology_years=int(scores['climatology_years'][i, column[i]]) if latest[i] >= 0 else 0,
+                classification=str(labels[i])
+            )
+            for i, (lat, lon) in enumerate(points)
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get engine statistics
+
+        Returns:
+            Dictionary with stored pixel count, fetch requests and composites fetched
+        """
+        return {
+            'stored_pixels': len(self.store),
+            'fetches': self.fetches,
+            'composites_fetched': self.composites_fetched
+        }
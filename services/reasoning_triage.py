@@ -0,0 +1,160 @@
+"""
+Tiered reasoning triage for plot analysis
+
+Most plots have an NDVI far from every risk threshold, and for those the
+rule-based classification gives the same label as the multimodal model.
+ReasoningTriage sends each plot to the cheapest tier that can decide it:
+- rules: NDVI clear of every threshold band and no anomaly signal
+- haiku: NDVI moderately close to a threshold, or a seasonal-low anomaly
+  (text-only Haiku call)
+- sonnet: NDVI inside the escalation band of a threshold, or a stress /
+  above-normal anomaly (multimodal Sonnet call)
+
+It also counts plots and reasoning latency per tier, and reports the
+Bedrock cost and latency saved compared with sending every plot to Sonnet.
+Plots analyzed in a shared batch prompt are accounted under a fourth tier,
+batch, at their per-plot share of the prompt's cost and latency.
+"""
+
+from typing import Any, Dict, Optional, Sequence
+
+from pydantic import BaseModel
+
+TIERS = ("rules", "haiku", "sonnet", "batch")
+
+# Anomaly classifications that always need the multimodal model
+ESCALATING_ANOMALIES = ("stress", "above_normal")
+
+
+class TriageDecision(BaseModel):
+    """Reasoning tier chosen for one plot"""
+    tier: str  # 'rules', 'haiku' or 'sonnet'
+    reason: str
+    threshold_distance: float
+
+
+class ReasoningTriage:
+    """Route plot analyses to rules, Haiku or Sonnet and account for the savings"""
+
+    def __init__(
+        self,
+        thresholds: Sequence[float],
+        enabled: bool = True,
+        sonnet_margin: float = 0.05,
+        haiku_margin: float = 0.12,
+        sonnet_cost_usd: float = 0.011,
+        haiku_cost_usd: float = 0.0008,
+        sonnet_latency_seconds: float = 4.0,
+        batch_cost_usd: float = 0.0015
+    ):
+        """
+        Initialize ReasoningTriage
+
+        Args:
+            thresholds: NDVI risk thresholds (critical, high, medium)
+            enabled: If False every plot goes to Sonnet
+            sonnet_margin: NDVI distance from a threshold escalated to Sonnet
+            haiku_margin: NDVI distance from a threshold sent to Haiku
+            sonnet_cost_usd: Estimated cost of one multimodal Sonnet call
+            haiku_cost_usd: Estimated cost of one text-only Haiku call
+            sonnet_latency_seconds: Sonnet latency assumed until one is observed
+            batch_cost_usd: Estimated cost per plot of a text-only batch prompt
+        """
+        if not 0 <= sonnet_margin <= haiku_margin:
+            raise ValueError(f"Expected 0 <= sonnet_margin <= haiku_margin, got {sonnet_margin}, {haiku_margin}")
+
+        self.thresholds = sorted(thresholds)
+        self.enabled = enabled
+        self.sonnet_margin = sonnet_margin
+        self.haiku_margin = haiku_margin
+        self.costs_usd = {
+            'rules': 0.0, 'haiku': haiku_cost_usd, 'sonnet': sonnet_cost_usd, 'batch': batch_cost_usd
+        }
+        self.sonnet_latency_seconds = sonnet_latency_seconds
+
+        self._counts = {tier: 0 for tier in TIERS}
+        self._seconds = {tier: 0.0 for tier in TIERS}
+
+    def decide(self, ndvi_value: float, anomaly: Optional[Dict[str, Any]] = None) -> TriageDecision:
+        """
+        Choose the reasoning tier for a plot
+
+        Args:
+            ndvi_value: Plot NDVI
+            anomaly: Optional NDVIAnomaly dictionary for the plot
+
+        Returns:
+            TriageDecision with tier and reason
+        """
+        distance = min(abs(ndvi_value - threshold) for threshold in self.thresholds)
+        classification = (anomaly or {}).get('classification')
+
+        if not self.enabled:
+            return TriageDecision(tier="sonnet", reason="triage disabled", threshold_distance=distance)
+        if classification in ESCALATING_ANOMALIES:
+            return TriageDecision(tier="sonnet", reason=f"{classification} anomaly", threshold_distance=distance)
+        if distance <= self.sonnet_margin:
+            return TriageDecision(tier="sonnet", reason="near risk threshold", threshold_distance=distance)
+        if classification == "seasonal_low":
+            return TriageDecision(tier="haiku", reason="seasonal_low anomaly", threshold_distance=distance)
+        if distance <= self.haiku_margin:
+            return TriageDecision(tier="haiku", reason="moderately close to risk threshold", threshold_distance=distance)
+        return TriageDecision(tier="rules", reason="clear of every risk threshold", threshold_distance=distance)
+
+    def record(self, tier: str, latency_seconds: float) -> None:
+        """
+        Record one completed analysis
+
+        Args:
+            tier: Tier that produced the classification
+            latency_seconds: Time spent in the reasoning step (for batch, the
+                plot's share of the prompt latency)
+        """
+        self._counts[tier] += 1
+        self._seconds[tier] += latency_seconds
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Current per-tier counters, for reporting on a later interval"""
+        return {tier: {'count': self._counts[tier], 'seconds': self._seconds[tier]} for tier in TIERS}
+
+    def report(self, since: Optional[Dict[str, Dict[str, float]]] = None) -> Dict[str, Any]:
+        """
+        Summarize routing, cost and latency
+
+        Savings compare each cheaper-tier plot with the average observed
+        Sonnet latency (or sonnet_latency_seconds before any Sonnet call)
+        and the estimated Sonnet cost.
+
+        Args:
+            since: Optional snapshot; only analyses recorded after it are counted
+
+        Returns:
+            Dictionary with per-tier counts and latency, Sonnet calls avoided,
+            estimated cost vs the all-Sonnet baseline and latency saved
+        """
+        counts = {tier: self._counts[tier] - (since or {}).get(tier, {}).get('count', 0) for tier in TIERS}
+        seconds = {tier: self._seconds[tier] - (since or {}).get(tier, {}).get('seconds', 0.0) for tier in TIERS}
+        plots = sum(counts.values())
+
+        if self._counts['sonnet']:
+            sonnet_latency = self._seconds['sonnet'] / self._counts['sonnet']
+        else:
+            sonnet_latency = self.sonnet_latency_seconds
+
+        cost = sum(counts[tier] * self.costs_usd[tier] for tier in TIERS)
+        baseline_cost = plots * self.costs_usd['sonnet']
+        latency_saved = sum(counts[tier] * sonnet_latency - seconds[tier] for tier in ("rules", "haiku", "batch"))
+
+        return {
+            'enabled': self.enabled,
+            'plots': plots,
+            'tier_counts': counts,
+            'avg_latency_ms': {
+                tier: seconds[tier] / counts[tier] * 1000 if counts[tier] else 0.0 for tier in TIERS
+            },
+            'sonnet_calls_avoided': plots - counts['sonnet'],
+            'estimated_cost_usd': round(cost, 6),
+            'baseline_cost_usd': round(baseline_cost, 6),
+            'cost_saved_usd': round(baseline_cost - cost, 6),
+            'latency_saved_seconds': round(max(latency_saved, 0.0), 3)
+        }
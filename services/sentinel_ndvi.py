@@ -0,0 +1,102 @@
+"""
+Plot NDVI from Sentinel-2 L2A bands
+
+MOD13Q1 NDVI is a 250 m yearly median, coarser than most smallholder
+plots. Sentinel-2 L2A gives 10 m red (B04) and near-infrared (B08) bands
+plus a 20 m scene classification (SCL) every ~5 days, so NDVI can be
+computed locally over a window the size of the plot:
+- Surface reflectance from digital numbers, with the BOA_ADD_OFFSET of
+  processing baseline 04.00 (scenes from 2022-01-25)
+- Cloud, shadow, snow, saturated and nodata pixels masked with SCL
+- Window statistics computed with vectorized NumPy
+
+Band windows are read with services.image_chips.read_window.
+"""
+
+from typing import Any, Dict
+from datetime import datetime
+
+import numpy as np
+
+# Scene classification (SCL) values
+SCL_NO_DATA = 0
+SCL_SATURATED = 1
+SCL_DARK_AREA = 2
+SCL_CLOUD_SHADOW = 3
+SCL_VEGETATION = 4
+SCL_NOT_VEGETATED = 5
+SCL_WATER = 6
+SCL_UNCLASSIFIED = 7
+SCL_CLOUD_MEDIUM = 8
+SCL_CLOUD_HIGH = 9
+SCL_CIRRUS = 10
+SCL_SNOW = 11
+
+# Pixels usable for NDVI, and pixels counted as cloud cover
+VALID_SCL_CLASSES = (SCL_VEGETATION, SCL_NOT_VEGETATED, SCL_WATER, SCL_UNCLASSIFIED)
+CLOUD_SCL_CLASSES = (SCL_CLOUD_SHADOW, SCL_CLOUD_MEDIUM, SCL_CLOUD_HIGH, SCL_CIRRUS)
+
+# Processing baseline 04.00 added an offset of -1000 to L2A digital numbers
+BOA_OFFSET_SINCE = datetime(2022, 1, 25)
+BOA_ADD_OFFSET = 1000
+
+
+def boa_offset(acquisition_date: datetime) -> int:
+    """
+    Digital-number offset to remove before computing reflectance ratios
+
+    Args:
+        acquisition_date: Scene acquisition date
+
+    Returns:
+        1000 for processing baseline 04.00 scenes, else 0
+    """
+    return BOA_ADD_OFFSET if acquisition_date >= BOA_OFFSET_SINCE else 0
+
+
+def window_ndvi(b04: np.ndarray, b08: np.ndarray, scl: np.ndarray, offset: int = 0) -> Dict[str, Any]:
+    """
+    NDVI statistics over a band window
+
+    Args:
+        b04: Red digital numbers (0 = nodata)
+        b08: Near-infrared digital numbers on the same grid
+        scl: Scene classification on the same grid
+        offset: Digital-number offset (see boa_offset)
+
+    Returns:
+        Dictionary with mean, median, std, min and max NDVI over valid
+        pixels (None when there are none), valid_pixels, total_pixels,
+        valid_fraction and cloud_fraction
+    """
+    red = b04.astype(np.float32) - offset
+    nir = b08.astype(np.float32) - offset
+    total = nir + red
+
+    valid = np.isin(scl, VALID_SCL_CLASSES) & (b04 > 0) & (b08 > 0) & (total > 0)
+    ndvi = np.divide(nir - red, total, out=np.full(red.shape, np.nan, dtype=np.float32), where=valid)
+    ndvi = np.clip(ndvi, -1.0, 1.0)
+
+    total_pixels = int(scl.size)
+    valid_pixels = int(valid.sum())
+    values = ndvi[valid]
+    stats = {
+        'valid_pixels': valid_pixels,
+        'total_pixels': total_pixels,
+        'valid_fraction': valid_pixels / total_pixels if total_pixels else 0.0,
+        'cloud_fraction': float(np.isin(scl, CLOUD_SCL_CLASSES).mean()) if total_pixels else 0.0,
+        'mean': None,
+        'median': None,
+        'std': None,
+        'min': None,
+        'max': None
+    }
+    if valid_pixels:
+        stats.update({
+            'mean': float(values.mean()),
+            'median': float(np.median(values)),
+            'std': float(values.std()),
+            'min': float(values.min()),
+            'max': float(values.max())
+        })
+    return stats
@@ -3,22 +3,54 @@ SentinelService - AWS Open Data Sentinel-2 Integration
 
 Handles satellite imagery retrieval from AWS Open Data Sentinel-2:
 - Fetches latest cloud-free RGB imagery from S3
+- Caches a per-tile acquisition index shared by every plot on the tile
+- Coalesces concurrent lookups for the same tile into one S3 round trip
+- Reads each scene's cloud cover from tileInfo.json once and picks the
+  newest scene under the usable threshold
 - Generates presigned URLs for secure image access
+- Extracts plot-sized image chips with windowed (range) reads
+- Serves repeated chips from an on-disk LRU chip cache
+- Computes 10 m plot NDVI locally from B04/B08 with SCL cloud masking
 - Assesses image quality (cloud cover, data availability)
 - Supports multimodal Bedrock analysis
 """
 
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple
 from pydantic import BaseModel
 from datetime import datetime, timedelta
+import asyncio
+import json
 import logging
-import boto3
+import re
+import threading
 from botocore.exceptions import ClientError
 from config.settings import get_settings
+from config.aws_clients import get_client
+from services.cache import SingleFlight, TTLCache
+from services.chip_cache import ChipCache
+from services.executor import run_blocking
+from services.gee_service import GEEData
+from services.image_chips import ImageChip, read_chip, read_window
+from services.mgrs_tiles import tile_resolver
+from services.sentinel_ndvi import boa_offset, window_ndvi
 import math
 
 logger = logging.getLogger(__name__)
 
+# Scene metadata objects carrying the cloud percentage, relative to the scene prefix
+SCENE_METADATA_FILES = ('tileInfo.json', 'metadata.xml')
+METADATA_XML_CLOUD = re.compile(r'<CLOUDY_PIXEL_PERCENTAGE>\s*([0-9.]+)\s*<')
+
+# L2A band objects used for local NDVI, relative to the scene prefix
+LOCAL_NDVI_BANDS = {
+    'B04': 'R10m/B04.jp2',
+    'B08': 'R10m/B08.jp2',
+    'SCL': 'R20m/SCL.jp2'
+}
+
+# Full-resolution true-colour object chips are cut from, relative to the scene prefix
+CHIP_SOURCE = 'R10m/TCI.jp2'
+
 
 class SentinelData(BaseModel):
     """Sentinel-2 imagery data result"""
@@ -46,6 +78,31 @@ class ImageQualityResult(BaseModel):
     confidence: float
 
 
+def lat_lon_to_tile_id(lat: float, lon: float) -> str:
+    """
+    Convert latitude/longitude to Sentinel-2 tile ID (MGRS)
+    
+    Sentinel-2 uses Military Grid Reference System (MGRS) for tile naming.
+    Format: [UTM Zone][Latitude Band][Grid Square]
+    Example: 43PGQ
+    
+    Args:
+        lat: Latitude coordinate
+        lon: Longitude coordinate
+    
+    Returns:
+        Sentinel-2 tile ID (MGRS format)
+        
+    Raises:
+        ValueError: If the coordinates are outside the UTM grid
+    """
+    tile_id = tile_resolver.resolve(lat, lon)
+    
+    logger.debug(f"Converted coordinates ({lat}, {lon}) to tile ID: {tile_id}")
+    
+    return tile_id
+
+
 class SentinelService:
     """Service for AWS Open Data Sentinel-2 integration"""
     
@@ -58,15 +115,55 @@ class SentinelService:
         """
         settings = get_settings()
         
-        # Initialize boto3 S3 client
+        # Shared S3 client from the registry
         self.region = region or settings.aws.region
-        self.s3_client = boto3.client('s3', region_name=self.region)
+        self.s3_client = get_client('s3', self.region)
         
         # Get configuration from settings
         self.sentinel_bucket = settings.sentinel.s3_bucket
         self.default_resolution = settings.sentinel.default_resolution
         self.presigned_url_expiry = settings.sentinel.presigned_url_expiry
         
+        # Tile acquisition index keyed by (tile_id, year, month)
+        self.tile_index_ttl_seconds = settings.sentinel.tile_index_ttl_seconds
+        self.tile_index_closed_month_ttl_seconds = settings.sentinel.tile_index_closed_month_ttl_seconds
+        self.tile_index = TTLCache(
+            max_entries=settings.performance.cache_max_entries,
+            ttl_seconds=self.tile_index_ttl_seconds
+        )
+        
+        # Concurrent lookups for the same (tile, date window) share one call
+        self.tile_lookups = SingleFlight()
+        self._lookup_counters = {
+            's3_list_calls': 0,
+            'scene_metadata_requests': 0,
+            'coalesced_s3_calls_saved': 0
+        }
+        self._counters_lock = threading.Lock()
+        self._lookup_local = threading.local()
+        
+        # Cloud cover per scene prefix, read once from the scene's tileInfo.json;
+        # scenes without readable metadata are cached as None for a shorter TTL
+        self.scene_cloud_cover = TTLCache(
+            max_entries=settings.performance.cache_max_entries,
+            ttl_seconds=settings.sentinel.scene_metadata_ttl_seconds
+        )
+        self.scene_metadata_missing_ttl = settings.sentinel.scene_metadata_missing_ttl_seconds
+        
+        # Plot-sized chips sent to Bedrock instead of the full-tile URL
+        self.chip_enabled = settings.sentinel.chip_enabled
+        self.chip_size_px = settings.sentinel.chip_size_px
+        self.chip_resolution_m = settings.sentinel.chip_resolution_m
+        self.chip_format = settings.sentinel.chip_format
+        self.chip_cache = ChipCache(
+            settings.sentinel.chip_cache_path,
+            max_bytes=settings.sentinel.chip_cache_max_bytes
+        ) if self.chip_enabled and settings.sentinel.chip_cache_enabled else None
+        
+        # Local 10 m NDVI window around the plot
+        self.local_ndvi_window_m = settings.sentinel.local_ndvi_window_m
+        self.local_ndvi_min_valid_fraction = settings.sentinel.local_ndvi_min_valid_fraction
+        
         # Quality thresholds
         self.cloud_cover_threshold_usable = 20.0  # < 20% is usable
         self.cloud_cover_threshold_marginal = 50.0  # 20-50% is marginal
@@ -79,10 +176,6 @@ class SentinelService:
         """
         Convert latitude/longitude to Sentinel-2 tile ID (MGRS)
         
-        Sentinel-2 uses Military Grid Reference System (MGRS) for tile naming.
-        Format: [UTM Zone][Latitude Band][Grid Square]
-        Example: 43PGP
-        
         Args:
             lat: Latitude coordinate
             lon: Longitude coordinate
@@ -90,40 +183,209 @@ class SentinelService:
         Returns:
             Sentinel-2 tile ID (MGRS format)
         """
-        # Calculate UTM zone from longitude
-        utm_zone = int((lon + 180) / 6) + 1
-        
-        # Determine latitude band (C-X, excluding I and O)
-        # Simplified mapping for demonstration
-        lat_bands = "CDEFGHJKLMNPQRSTUVWX"
-        lat_band_idx = int((lat + 80) / 8)
-        lat_band_idx = max(0, min(lat_band_idx, len(lat_bands) - 1))
-        lat_band = lat_bands[lat_band_idx]
-        
-        # For grid square, we'll use a simplified approach
-        # In production, use a proper MGRS library like mgrs-python
-        # For now, we'll use common tiles for Indian region
-        
-        # Common Sentinel-2 tiles for India (Karnataka region)
-        # This is a simplified mapping - in production use proper MGRS conversion
-        if 12.0 <= lat <= 18.0 and 74.0 <= lon <= 78.0:
-            # Karnataka region
-            grid_square = "PGP"  # Bangalore area
-        elif 8.0 <= lat <= 13.0 and 76.0 <= lon <= 80.0:
-            # Tamil Nadu region
-            grid_square = "PNR"  # Chennai area
-        elif 15.0 <= lat <= 20.0 and 78.0 <= lon <= 82.0:
-            # Telangana region
-            grid_square = "PET"  # Hyderabad area
+        return lat_lon_to_tile_id(lat, lon)
+    
+    def _tile_prefix(self, tile_id: str) -> str:
+        """
+        Build the S3 prefix for a Sentinel-2 tile
+        
+        Sentinel-2 L2A path structure:
+        tiles/[UTM]/[LAT]/[GRID]/[YEAR]/[MONTH]/[DAY]/[SEQUENCE]/
+        """
+        utm_zone = int(tile_id[:2])  # tile IDs pad the zone, S3 keys do not
+        lat_band = tile_id[2]
+        grid_square = tile_id[3:]
+        
+        return f"tiles/{utm_zone}/{lat_band}/{grid_square}/"
+    
+    @staticmethod
+    def _parse_acquisition_date(key: str) -> Optional[datetime]:
+        """Extract the acquisition date from a tiles/.../[YEAR]/[MONTH]/[DAY]/ key or prefix"""
+        parts = key.split('/')
+        try:
+            return datetime(int(parts[4]), int(parts[5]), int(parts[6]))
+        except (IndexError, ValueError):
+            return None
+    
+    def _list_tile_month(self, tile_id: str, year: int, month: int) -> List[Dict[str, Any]]:
+        """
+        List the acquisitions of a tile in one month with a delimiter listing
+        
+        A single ListObjectsV2 call on the month prefix with Delimiter='/'
+        returns one CommonPrefix per acquisition day instead of every object.
+        
+        Args:
+            tile_id: Sentinel-2 tile ID (MGRS format)
+            year: Acquisition year
+            month: Acquisition month
+            
+        Returns:
+            Acquisitions sorted by date, each with s3_key, acquisition_date and tile_id
+            
+        Raises:
+            ClientError: If the S3 listing fails
+        """
+        prefix = f"{self._tile_prefix(tile_id)}{year:04d}/{month:02d}/"
+        tci_suffix = f"R{self.default_resolution}/TCI.jp2"
+        acquisitions: Dict[datetime, Dict[str, Any]] = {}
+        
+        params = {
+            'Bucket': self.sentinel_bucket,
+            'Prefix': prefix,
+            'Delimiter': '/'
+        }
+        
+        while True:
+            response = self.s3_client.list_objects_v2(**params)
+            self._count_s3_list_call()
+            
+            # One common prefix per acquisition day; TCI lives in the first sequence
+            for common_prefix in response.get('CommonPrefixes', []):
+                day_prefix = common_prefix['Prefix']
+                acquisition_date = self._parse_acquisition_date(day_prefix)
+                if acquisition_date:
+                    acquisitions.setdefault(acquisition_date, {
+                        's3_key': f"{day_prefix}0/{tci_suffix}",
+                        'acquisition_date': acquisition_date,
+                        'tile_id': tile_id
+                    })
+            
+            # Objects listed directly carry the exact key and size
+            for obj in response.get('Contents', []):
+                key = obj['Key']
+                acquisition_date = self._parse_acquisition_date(key)
+                if 'TCI.jp2' not in key or acquisition_date is None:
+                    continue
+                
+                existing = acquisitions.get(acquisition_date)
+                if existing is None or 'size' not in existing or key.endswith(tci_suffix):
+                    acquisitions[acquisition_date] = {
+                        's3_key': key,
+                        'acquisition_date': acquisition_date,
+                        'tile_id': tile_id,
+                        'size': obj.get('Size', 0)
+                    }
+            
+            if not response.get('IsTruncated'):
+                break
+            params['ContinuationToken'] = response['NextContinuationToken']
+        
+        return [
+            acquisitions[acquisition_date]
+            for acquisition_date in sorted(acquisitions)
+            if (acquisition_date.year, acquisition_date.month) == (year, month)
+        ]
+    
+    def _count_s3_list_call(self) -> None:
+        """Count a ListObjectsV2 call globally and for the lookup running on this thread"""
+        self._count_s3_call('s3_list_calls')
+    
+    def _count_s3_call(self, counter: str) -> None:
+        """Count an S3 request globally and for the lookup running on this thread"""
+        with self._counters_lock:
+            self._lookup_counters[counter] += 1
+        self._lookup_local.s3_calls = getattr(self._lookup_local, 's3_calls', 0) + 1
+    
+    @staticmethod
+    def _scene_prefix(s3_key: str) -> str:
+        """tiles/.../[DAY]/[SEQUENCE]/R60m/TCI.jp2 -> tiles/.../[DAY]/[SEQUENCE]"""
+        return s3_key.rsplit('/', 2)[0]
+    
+    def _read_scene_cloud_cover(self, scene_prefix: str) -> Optional[float]:
+        """
+        Read a scene's cloudy pixel percentage from its metadata objects
+        
+        tileInfo.json (cloudyPixelPercentage) is a few KB; metadata.xml
+        (CLOUDY_PIXEL_PERCENTAGE) is only read when it is missing.
+        
+        Args:
+            scene_prefix: tiles/[UTM]/[LAT]/[GRID]/[YEAR]/[MONTH]/[DAY]/[SEQUENCE]
+            
+        Returns:
+            Cloud cover percentage, or None if neither object could be read
+        """
+        for filename in SCENE_METADATA_FILES:
+            key = f"{scene_prefix}/{filename}"
+            self._count_s3_call('scene_metadata_requests')
+            try:
+                response = self.s3_client.get_object(Bucket=self.sentinel_bucket, Key=key)
+                body = response['Body'].read()
+                
+                if filename.endswith('.json'):
+                    return float(json.loads(body)['cloudyPixelPercentage'])
+                match = METADATA_XML_CLOUD.search(body.decode('utf-8'))
+                if match:
+                    return float(match.group(1))
+            except (ClientError, KeyError, TypeError, ValueError, AttributeError) as e:
+                logger.debug(f"No cloud cover in {key}: {e}")
+        
+        return None
+    
+    def get_scene_cloud_cover(self, acquisition: Dict[str, Any]) -> Optional[float]:
+        """
+        Get the cached cloud cover of a scene from the tile index
+        
+        Published scenes never change, so each scene's metadata is read once
+        and shared by every plot on the tile. A scene whose metadata could not
+        be read is remembered for scene_metadata_missing_ttl_seconds, so
+        lookups in the meantime make no further requests for it.
+        
+        Args:
+            acquisition: Tile index entry (see get_tile_acquisitions)
+            
+        Returns:
+            Cloud cover percentage, or None if the scene metadata is unavailable
+        """
+        scene_prefix = self._scene_prefix(acquisition['s3_key'])
+        found, cloud_cover = self.scene_cloud_cover.get(scene_prefix)
+        if found:
+            return cloud_cover
+        
+        cloud_cover = self._read_scene_cloud_cover(scene_prefix)
+        if cloud_cover is not None:
+            self.scene_cloud_cover.set(scene_prefix, cloud_cover)
         else:
-            # Default grid square
-            grid_square = "PGP"
+            self.scene_cloud_cover.set(scene_prefix, None, ttl_seconds=self.scene_metadata_missing_ttl)
         
-        tile_id = f"{utm_zone}{lat_band}{grid_square}"
+        return cloud_cover
+    
+    def get_tile_acquisitions(self, tile_id: str, year: int, month: int) -> List[Dict[str, Any]]:
+        """
+        Get the cached acquisition index of a tile for one month
+        
+        The index is shared by every plot on the tile. Past months are cached
+        for longer since no new scenes are published for them.
+        
+        Args:
+            tile_id: Sentinel-2 tile ID (MGRS format)
+            year: Acquisition year
+            month: Acquisition month
+            
+        Returns:
+            Acquisitions sorted by date
+            
+        Raises:
+            ClientError: If the S3 listing fails
+        """
+        cache_key = (tile_id, year, month)
+        found, acquisitions = self.tile_index.get(cache_key)
+        if found:
+            return acquisitions
+        
+        acquisitions = self._list_tile_month(tile_id, year, month)
         
-        logger.debug(f"Converted coordinates ({lat}, {lon}) to tile ID: {tile_id}")
+        today = datetime.now()
+        is_closed_month = (year, month) < (today.year, today.month)
+        self.tile_index.set(
+            cache_key,
+            acquisitions,
+            ttl_seconds=self.tile_index_closed_month_ttl_seconds if is_closed_month else None
+        )
+        
+        logger.debug(f"Indexed {len(acquisitions)} acquisitions for tile {tile_id} "
+                    f"in {year:04d}-{month:02d}")
         
-        return tile_id
+        return acquisitions
     
     def _find_latest_sentinel_image(
         self, 
@@ -131,62 +393,58 @@ class SentinelService:
         max_days_back: int = 30
     ) -> Optional[Dict[str, Any]]:
         """
-        Find the latest available Sentinel-2 image for a tile
+        Find the latest usable Sentinel-2 image for a tile
+        
+        Reads the tile's monthly acquisition index, newest month first, so a
+        warm lookup costs no S3 calls and a cold one costs one listing per month.
+        Scenes are checked newest first against their cached cloud cover; the
+        first under the usable threshold (or without metadata) is returned.
+        When every scene in the window is cloudier, the clearest one is.
         
         Args:
             tile_id: Sentinel-2 tile ID (MGRS format)
             max_days_back: Maximum days to search backwards
             
         Returns:
-            Dictionary with image metadata or None if not found
+            Dictionary with image metadata (including cloud_cover, None if
+            unknown) or None if not found
         """
         try:
-            # Sentinel-2 L2A path structure:
-            # tiles/[UTM]/[LAT]/[GRID]/[YEAR]/[MONTH]/[DAY]/[SEQUENCE]/
-            
-            # Extract tile components
-            utm_zone = tile_id[:2]
-            lat_band = tile_id[2]
-            grid_square = tile_id[3:]
-            
-            # Search backwards from today
-            current_date = datetime.now()
+            today = datetime.now()
+            earliest = (today - timedelta(days=max_days_back - 1)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
             
-            for days_back in range(max_days_back):
-                search_date = current_date - timedelta(days=days_back)
-                year = search_date.strftime('%Y')
-                month = search_date.strftime('%m')
-                day = search_date.strftime('%d')
-                
-                # Construct S3 prefix
-                prefix = f"tiles/{utm_zone}/{lat_band}/{grid_square}/{year}/{month}/{day}/"
-                
+            cloudy_scenes = []
+            year, month = today.year, today.month
+            while (year, month) >= (earliest.year, earliest.month):
                 try:
-                    # List objects with this prefix
-                    response = self.s3_client.list_objects_v2(
-                        Bucket=self.sentinel_bucket,
-                        Prefix=prefix,
-                        MaxKeys=10
-                    )
+                    acquisitions = self.get_tile_acquisitions(tile_id, year, month)
+                except ClientError as e:
+                    # Continue searching if this month can't be listed
+                    logger.debug(f"No data found for tile {tile_id} in {year:04d}-{month:02d}: {e}")
+                    acquisitions = []
+                
+                # Indexes are sorted, so walk back from the newest in-window scene
+                for acquisition in reversed(acquisitions):
+                    if acquisition['acquisition_date'] < earliest:
+                        break
                     
-                    if 'Contents' in response and len(response['Contents']) > 0:
-                        # Found imagery for this date
-                        # Look for TCI (True Color Image) file
-                        for obj in response['Contents']:
-                            if 'TCI.jp2' in obj['Key'] or 'R60m/TCI.jp2' in obj['Key']:
-                                logger.info(f"Found Sentinel-2 image: {obj['Key']}")
-                                
-                                return {
-                                    's3_key': obj['Key'],
-                                    'acquisition_date': search_date,
-                                    'tile_id': tile_id,
-                                    'size': obj['Size']
-                                }
+                    scene = dict(acquisition, cloud_cover=self.get_scene_cloud_cover(acquisition))
+                    if scene['cloud_cover'] is None or scene['cloud_cover'] < self.cloud_cover_threshold_usable:
+                        logger.info(f"Found Sentinel-2 image: {scene['s3_key']} "
+                                   f"(cloud cover {scene['cloud_cover']}%)")
+                        return scene
+                    cloudy_scenes.append(scene)
                 
-                except ClientError as e:
-                    # Continue searching if this date doesn't exist
-                    logger.debug(f"No data found for {prefix}: {e}")
-                    continue
+                year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+            
+            if cloudy_scenes:
+                clearest = min(cloudy_scenes, key=lambda scene: scene['cloud_cover'])
+                logger.info(f"No scene of tile {tile_id} under {self.cloud_cover_threshold_usable}% cloud "
+                           f"within {max_days_back} days, using the clearest: {clearest['s3_key']} "
+                           f"({clearest['cloud_cover']}%)")
+                return clearest
             
             logger.warning(f"No Sentinel-2 imagery found for tile {tile_id} "
                           f"within {max_days_back} days")
@@ -291,6 +549,84 @@ class SentinelService:
             confidence=confidence
         )
     
+    def _resolve_tile_image(self, tile_id: str, max_days_back: int) -> Dict[str, Any]:
+        """
+        Find the latest image for a tile and presign it (blocking)
+        
+        Args:
+            tile_id: Sentinel-2 tile ID (MGRS format)
+            max_days_back: Maximum days to search backwards
+            
+        Returns:
+            Dictionary with image_metadata (None if not found), image_url and
+            the number of S3 calls the lookup issued
+            
+        Raises:
+            ClientError: If URL generation fails
+        """
+        self._lookup_local.s3_calls = 0
+        
+        image_metadata = self._find_latest_sentinel_image(tile_id, max_days_back)
+        image_url = self._generate_presigned_url(image_metadata['s3_key']) if image_metadata else None
+        
+        return {
+            'image_metadata': image_metadata,
+            'image_url': image_url,
+            's3_calls': self._lookup_local.s3_calls
+        }
+    
+    async def _lookup_tile_image(self, tile_id: str, max_days_back: int) -> Dict[str, Any]:
+        """
+        Resolve the latest image for a tile, joining an identical lookup in flight
+        
+        Lookups are keyed by (tile_id, date window), so every plot on a tile
+        scanned concurrently shares one index read and one presigned URL.
+        
+        Args:
+            tile_id: Sentinel-2 tile ID (MGRS format)
+            max_days_back: Maximum days to search backwards
+            
+        Returns:
+            Shared lookup result (see _resolve_tile_image)
+        """
+        key = (tile_id, datetime.now().date(), max_days_back)
+        joined = key in self.tile_lookups
+        
+        result = await self.tile_lookups.do(
+            key, lambda: run_blocking(self._resolve_tile_image, tile_id, max_days_back)
+        )
+        
+        if joined:
+            with self._counters_lock:
+                self._lookup_counters['coalesced_s3_calls_saved'] += result['s3_calls']
+        
+        return result
+    
+    def get_lookup_stats(self) -> Dict[str, int]:
+        """
+        Get tile lookup statistics
+        
+        S3 calls saved counts month listings served from the tile index plus,
+        for every lookup that joined one in flight, the listings it would
+        have repeated.
+        
+        Returns:
+            Dictionary with lookup, coalescing and S3 call counters
+        """
+        with self._counters_lock:
+            counters = dict(self._lookup_counters)
+        
+        return {
+            'tile_lookups': self.tile_lookups.calls,
+            'coalesced_lookups': self.tile_lookups.coalesced,
+            'tile_index_hits': self.tile_index.hits,
+            'scene_metadata_hits': self.scene_cloud_cover.hits,
+            's3_list_calls': counters['s3_list_calls'],
+            'scene_metadata_requests': counters['scene_metadata_requests'],
+            's3_calls_saved': (self.tile_index.hits + self.scene_cloud_cover.hits
+                               + counters['coalesced_s3_calls_saved'])
+        }
+    
     async def get_latest_image(
         self, 
         lat: float, 
@@ -318,8 +654,10 @@ class SentinelService:
             # Step 1: Convert coordinates to Sentinel-2 tile ID
             tile_id = self._lat_lon_to_sentinel_tile(lat, lon)
             
-            # Step 2: Find latest available image
-            image_metadata = self._find_latest_sentinel_image(tile_id, max_days_back)
+            # Step 2 & 3: Find latest available image and presign it (shared per tile)
+            lookup = await self._lookup_tile_image(tile_id, max_days_back)
+            image_metadata = lookup['image_metadata']
+            image_url = lookup['image_url']
             
             if not image_metadata:
                 raise ValueError(
@@ -327,11 +665,11 @@ class SentinelService:
                     f"within {max_days_back} days"
                 )
             
-            # Step 3: Generate presigned URL
-            image_url = self._generate_presigned_url(image_metadata['s3_key'])
-            
-            # Step 4: Assess image quality
-            quality_result = self._assess_image_quality(image_metadata)
+            # Step 4: Assess image quality from the scene's cloud cover
+            quality_result = self._assess_image_quality(
+                image_metadata,
+                cloud_cover=image_metadata.get('cloud_cover')
+            )
             
             # Step 5: Create SentinelData result
             sentinel_data = SentinelData(
@@ -368,6 +706,148 @@ class SentinelService:
             logger.error(f"Unexpected error retrieving Sentinel-2 imagery: {e}")
             raise
     
+    async def get_image_chip(self, sentinel_data: SentinelData, lat: float, lon: float) -> ImageChip:
+        """
+        Extract a plot-sized chip from the scene in sentinel_data
+        
+        Chips are cut from the scene's 10 m true-colour image (CHIP_SOURCE)
+        rather than the default_resolution preview in image_url; only the
+        raster blocks around the plot are read (HTTP range requests on a
+        presigned URL), instead of transferring the whole tile. Scenes without
+        an s3_key in their metadata are read from image_url. Chips already
+        cut from the same acquisition come from the chip cache.
+        
+        Args:
+            sentinel_data: Scene from get_latest_image
+            lat: Plot latitude (chip centre)
+            lon: Plot longitude (chip centre)
+            
+        Returns:
+            ImageChip encoded for Bedrock
+            
+        Raises:
+            ValueError: If the scene has no image or does not cover the plot
+        """
+        if not sentinel_data.image_url:
+            raise ValueError(f"No image available for tile {sentinel_data.tile_id}")
+        
+        cache_key = None
+        if self.chip_cache is not None:
+            cache_key = ChipCache.key_for(
+                sentinel_data.tile_id, sentinel_data.acquisition_date, lat, lon,
+                self.chip_size_px, self.chip_resolution_m, self.chip_format
+            )
+            chip = await run_blocking(self.chip_cache.get, cache_key)
+            if chip is not None:
+                return chip
+        
+        s3_key = sentinel_data.metadata.get('s3_key')
+        if s3_key:
+            source = self._generate_presigned_url(f"{self._scene_prefix(s3_key)}/{CHIP_SOURCE}")
+        else:
+            source = sentinel_data.image_url
+        
+        chip = await run_blocking(
+            read_chip,
+            source,
+            lat,
+            lon,
+            size_px=self.chip_size_px,
+            resolution_m=self.chip_resolution_m,
+            image_format=self.chip_format
+        )
+        
+        logger.debug(f"Extracted {chip.width}x{chip.height} chip for ({lat}, {lon}) from tile "
+                    f"{sentinel_data.tile_id} ({CHIP_SOURCE if s3_key else 'image_url'}): "
+                    f"{chip.size_bytes} bytes")
+        
+        if cache_key is not None:
+            await run_blocking(self.chip_cache.set, cache_key, chip)
+        
+        return chip
+    
+    async def get_local_ndvi(self, lat: float, lon: float, max_days_back: int = 30) -> GEEData:
+        """
+        Compute plot NDVI from the latest L2A scene's 10 m bands
+        
+        Reads B04, B08 and SCL windows of local_ndvi_window_m around the plot
+        concurrently (range reads on presigned URLs; SCL is resampled from
+        20 m with nearest neighbour), masks cloud, shadow, snow and nodata
+        pixels with SCL and averages NDVI over the rest.
+        
+        Args:
+            lat: Plot latitude
+            lon: Plot longitude
+            max_days_back: Maximum scene age in days
+            
+        Returns:
+            GEEData with the window NDVI (drop-in for GEEService results)
+            
+        Raises:
+            ValueError: If no scene covers the plot or too little of the window is cloud-free
+            ClientError: If S3 operations fail
+        """
+        tile_id = self._lat_lon_to_sentinel_tile(lat, lon)
+        lookup = await self._lookup_tile_image(tile_id, max_days_back)
+        image_metadata = lookup['image_metadata']
+        if not image_metadata:
+            raise ValueError(f"No Sentinel-2 scene for ({lat}, {lon}) within {max_days_back} days")
+        
+        scene_prefix = self._scene_prefix(image_metadata['s3_key'])
+        sources = {
+            band: self._generate_presigned_url(f"{scene_prefix}/{path}")
+            for band, path in LOCAL_NDVI_BANDS.items()
+        }
+        size_px = max(1, round(self.local_ndvi_window_m / 10.0))
+        b04, b08, scl = await asyncio.gather(
+            run_blocking(read_window, sources['B04'], lat, lon, size_px, 10.0, [1]),
+            run_blocking(read_window, sources['B08'], lat, lon, size_px, 10.0, [1]),
+            run_blocking(read_window, sources['SCL'], lat, lon, size_px, 10.0, [1], 'nearest')
+        )
+        
+        acquisition_date = image_metadata['acquisition_date']
+        stats = window_ndvi(b04[0], b08[0], scl[0], offset=boa_offset(acquisition_date))
+        if stats['valid_fraction'] < self.local_ndvi_min_valid_fraction:
+            raise ValueError(
+                f"Only {stats['valid_fraction']:.0%} of the plot window is cloud-free "
+                f"in scene {scene_prefix}"
+            )
+        
+        cloud_cover = round(stats['cloud_fraction'] * 100, 1)
+        logger.info(f"Local NDVI for ({lat}, {lon}): {stats['mean']:.3f} from "
+                   f"{stats['valid_pixels']}/{stats['total_pixels']} pixels of {scene_prefix}")
+        
+        return GEEData(
+            ndvi_float=round(stats['mean'], 3),
+            acquisition_date=acquisition_date,
+            cloud_cover=cloud_cover,
+            metadata={
+                'sensor': 'Sentinel-2 L2A',
+                'resolution': '10m',
+                'data_source': 'sentinel_local',
+                'tile_id': tile_id,
+                'scene': scene_prefix,
+                'window_m': self.local_ndvi_window_m,
+                'cloud_cover': cloud_cover,
+                'valid_pixels': stats['valid_pixels'],
+                'total_pixels': stats['total_pixels'],
+                'ndvi_median': round(stats['median'], 3),
+                'ndvi_std': round(stats['std'], 3),
+                'ndvi_min': round(stats['min'], 3),
+                'ndvi_max': round(stats['max'], 3)
+            },
+            quality_score=round(stats['valid_fraction'], 3)
+        )
+    
+    def get_chip_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Get chip cache statistics
+        
+        Returns:
+            ChipCache.stats() dictionary, or None when the cache is disabled
+        """
+        return self.chip_cache.stats() if self.chip_cache is not None else None
+    
     def assess_image_quality(
         self, 
         sentinel_data: SentinelData
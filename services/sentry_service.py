@@ -8,15 +8,21 @@ Handles automated background scanning of registered plots:
 - SMS notification triggering for farmers and officers
 """
 
+from abc import ABC, abstractmethod
 import asyncio
+import inspect
 import logging
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Callable, Union
 from datetime import datetime, timedelta
 from pydantic import BaseModel
 
-from services.brain_service import BrainService
-from services.db_service import DbService
+from services.brain_service import AnalysisResult, BrainService
+from services.gee_service import GEEData
+from services.db_service import DbService, AlertData
 from services.sms_service import SMSService
+from services.mgrs_tiles import tile_resolver
+from services.executor import run_blocking
 from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
@@ -39,6 +45,149 @@ class ScanResult(BaseModel):
     processing_time_ms: int
 
 
+class ScanProgress(BaseModel):
+    """Running aggregates for a scan, updated as each plot completes"""
+    total_plots: int = 0
+    scanned: int = 0
+    scan_failures: int = 0
+    alerts_triggered: int = 0
+    sms_sent: int = 0
+    high_urgency_plots: int = 0
+    total_processing_time_ms: int = 0
+    risk_level_counts: Dict[str, int] = {}
+    
+    @property
+    def completed(self) -> int:
+        """Number of plots whose scan has finished (successfully or not)"""
+        return self.scanned + self.scan_failures
+    
+    @property
+    def avg_scan_time_ms(self) -> float:
+        """Average processing time of completed scans"""
+        return self.total_processing_time_ms / self.completed if self.completed else 0
+    
+    def record(self, result: ScanResult) -> None:
+        """
+        Fold a single scan result into the running aggregates
+        
+        Args:
+            result: Completed ScanResult
+        """
+        if result.urgency == 'unknown':
+            self.scan_failures += 1
+        else:
+            self.scanned += 1
+        
+        if result.alert_triggered:
+            self.alerts_triggered += 1
+        if result.sms_sent:
+            self.sms_sent += 1
+        if result.urgency == 'high':
+            self.high_urgency_plots += 1
+        
+        self.total_processing_time_ms += result.processing_time_ms
+        self.risk_level_counts[result.risk_level] = self.risk_level_counts.get(result.risk_level, 0) + 1
+
+
+class AlertWriteBuffer:
+    """Alerts of one scan waiting for a bulk write"""
+    
+    def __init__(self, db_service: DbService, batch_size: int):
+        """
+        Initialize alert buffer
+        
+        Args:
+            db_service: DbService used for create_alerts_bulk
+            batch_size: Alerts accumulated before a bulk write
+        """
+        self.db_service = db_service
+        self.batch_size = batch_size
+        self.pending: List[AlertData] = []
+        self.written = 0
+        self.failures: Dict[str, Dict[str, str]] = {}  # alert_id -> plot_id and error
+    
+    @staticmethod
+    def alert_id(alert: AlertData) -> str:
+        """Alert primary key ("hobli_id@timestamp")"""
+        return f"{alert.hobli_id}@{alert.timestamp.isoformat()}"
+    
+    async def add(self, alert: AlertData) -> None:
+        """Buffer an alert, writing the batch once batch_size have accumulated"""
+        self.pending.append(alert)
+        if len(self.pending) >= self.batch_size:
+            await self.flush()
+    
+    async def flush(self) -> None:
+        """Write all buffered alerts with a single bulk call, recording failures"""
+        if not self.pending:
+            return
+        
+        batch, self.pending = self.pending, []
+        plot_ids = {self.alert_id(alert): alert.plot_id for alert in batch}
+        
+        try:
+            result = await run_blocking(self.db_service.create_alerts_bulk, batch)
+            self.written += len(result.succeeded)
+            failed = result.failed
+        except Exception as e:
+            failed = {alert_id: str(e) for alert_id in plot_ids}
+        
+        for alert_id, error in failed.items():
+            logger.error(f"Failed to write alert {alert_id}: {error}")
+            self.failures[alert_id] = {'plot_id': plot_ids.get(alert_id, 'unknown'), 'error': error}
+
+
+class ScanResultSink(ABC):
+    """Destination for scan results streamed out of a sentry scan"""
+    
+    @abstractmethod
+    async def write(self, result: ScanResult) -> None:
+        """Consume a single scan result"""
+    
+    async def close(self) -> None:
+        """Flush and release any resources held by the sink"""
+
+
+class JsonlScanSink(ScanResultSink):
+    """Sink that appends each scan result as one JSON line to a file"""
+    
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize JSONL sink
+        
+        Args:
+            path: Output file path (parent directories are created)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open('w', encoding='utf-8')
+    
+    async def write(self, result: ScanResult) -> None:
+        self._file.write(result.json() + "\n")
+    
+    async def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+
+class CallbackScanSink(ScanResultSink):
+    """Sink that hands each scan result to a sync or async callback"""
+    
+    def __init__(self, callback: Callable[[ScanResult], Any]):
+        """
+        Initialize callback sink
+        
+        Args:
+            callback: Function (or coroutine function) called with each ScanResult
+        """
+        self.callback = callback
+    
+    async def write(self, result: ScanResult) -> None:
+        outcome = self.callback(result)
+        if inspect.isawaitable(outcome):
+            await outcome
+
+
 class SentryService:
     """Service for proactive plot monitoring and alerting"""
     
@@ -64,6 +213,12 @@ class SentryService:
         # Sentry configuration
         self.urgency_threshold = 'high'  # Only alert on high urgency
         self.max_concurrent_scans = 5  # Limit concurrent processing
+        self.scan_queue_per_worker = 4  # Plots buffered ahead of each worker
+        self.progress_log_interval = 1000  # Log progress every N completed plots
+        self.tile_group_window = 500  # Plots regrouped by Sentinel-2 tile before dispatch
+        
+        # Live counters for the scan currently in progress (or the last one)
+        self.scan_progress = ScanProgress()
         
         # Metrics
         self.metrics = {
@@ -71,20 +226,31 @@ class SentryService:
             'alerts_triggered': 0,
             'sms_sent': 0,
             'high_urgency_plots': 0,
-            'scan_failures': 0
+            'scan_failures': 0,
+            'alert_write_failures': 0
         }
         
+        # Alerts per bulk write; each full scan buffers its own alerts
+        self.alert_batch_size = self.settings.db_service.batch_write_size
+        
         logger.info("SentryService initialized for proactive monitoring")
     
     async def scan_single_plot(
         self,
-        plot_data: Dict[str, Any]
+        plot_data: Dict[str, Any],
+        gee_data: Optional[GEEData] = None,
+        analysis: Optional[AnalysisResult] = None,
+        alert_buffer: Optional[AlertWriteBuffer] = None
     ) -> ScanResult:
         """
         Scan a single plot and determine if alert is needed
         
         Args:
             plot_data: Plot information from DbService
+            gee_data: NDVI prefetched for the plot by a batched lookup, if any
+            analysis: Analysis already made by batch analysis, if any
+            alert_buffer: Buffer of the running full scan; the alert is
+                written immediately when omitted
             
         Returns:
             ScanResult with analysis and alert status
@@ -100,11 +266,20 @@ class SentryService:
         try:
             logger.info(f"Scanning plot {plot_id} at ({latitude}, {longitude})")
             
-            # Run full AI analysis
-            analysis = await self.brain_service.analyze_plot(
-                latitude=latitude,
-                longitude=longitude
-            )
+            # Run full AI analysis (reusing batched NDVI or analysis when available)
+            if analysis is not None:
+                logger.debug(f"Using batch analysis for plot {plot_id}")
+            elif gee_data is None:
+                analysis = await self.brain_service.analyze_plot(
+                    lat=latitude,
+                    lon=longitude
+                )
+            else:
+                analysis = await self.brain_service.analyze_plot(
+                    lat=latitude,
+                    lon=longitude,
+                    gee_data=gee_data
+                )
             
             # Classify urgency based on AI reasoning
             urgency = self._classify_urgency(analysis)
@@ -121,7 +296,8 @@ class SentryService:
                 alert_id = await self._create_alert(
                     plot_data=plot_data,
                     analysis=analysis,
-                    urgency=urgency
+                    urgency=urgency,
+                    alert_buffer=alert_buffer
                 )
                 
                 # Send SMS notifications
@@ -219,41 +395,55 @@ class SentryService:
         self,
         plot_data: Dict[str, Any],
         analysis,
-        urgency: str
+        urgency: str,
+        alert_buffer: Optional[AlertWriteBuffer] = None
     ) -> str:
         """
-        Create alert in database
+        Queue an alert for a bulk write to the database
+        
+        During a full scan alerts go to the scan's buffer and are written with
+        DbService.create_alerts_bulk once batch_write_size have accumulated
+        (and at the end of the scan), so the returned ID may not be persisted
+        yet; write failures are reported in the scan summary. Outside a scan
+        the alert is written before returning.
         
         Args:
             plot_data: Plot information
             analysis: AnalysisResult from BrainService
             urgency: Urgency classification
+            alert_buffer: Buffer of the running full scan, if any
             
         Returns:
-            Alert ID
+            Alert ID ("hobli_id@timestamp", the alert's primary key)
         """
-        try:
-            alert_id = await self.db_service.create_alert(
-                plot_id=plot_data['plot_id'],
-                user_id=plot_data['user_id'],
-                hobli_id=plot_data.get('hobli_id', 'unknown'),
-                risk_level=analysis.risk_level,
-                ndvi=analysis.gee_data.ndvi_float,
-                confidence=analysis.confidence,
-                recommendations=analysis.bedrock_reasoning.recommendations,
-                metadata={
-                    'urgency': urgency,
-                    'sentry_scan': True,
-                    'scan_timestamp': datetime.now().isoformat()
-                }
-            )
-            
-            logger.info(f"Created alert {alert_id} for plot {plot_data['plot_id']}")
-            return alert_id
-            
-        except Exception as e:
-            logger.error(f"Failed to create alert: {e}")
-            return f"alert-{plot_data['plot_id']}-{int(datetime.now().timestamp())}"
+        recommendations = analysis.bedrock_reasoning.recommendations
+        alert = AlertData(
+            hobli_id=plot_data.get('hobli_id', 'unknown'),
+            timestamp=datetime.now(),
+            plot_id=plot_data['plot_id'],
+            user_id=plot_data['user_id'],
+            risk_level=analysis.risk_level,
+            message=recommendations[0] if recommendations else f"{urgency} urgency crop stress detected",
+            gee_proof={
+                'ndvi_value': analysis.gee_data.ndvi_float,
+                'confidence': analysis.confidence,
+                'urgency': urgency,
+                'sentry_scan': True,
+                'scan_timestamp': datetime.now().isoformat()
+            },
+            bedrock_reasoning=analysis.bedrock_reasoning.explanation
+        )
+        alert_id = AlertWriteBuffer.alert_id(alert)
+        
+        if alert_buffer is not None:
+            await alert_buffer.add(alert)
+        else:
+            buffer = AlertWriteBuffer(self.db_service, batch_size=1)
+            await buffer.add(alert)
+            self.metrics['alert_write_failures'] += len(buffer.failures)
+        
+        logger.info(f"Queued alert {alert_id} for plot {plot_data['plot_id']}")
+        return alert_id
     
     async def _send_notifications(
         self,
@@ -334,28 +524,255 @@ class SentryService:
         base_url = self.settings.app_url if hasattr(self.settings, 'app_url') else 'http://localhost:8501'
         return f"{base_url}?plot_id={plot_id}&alert_id={alert_id}"
     
+    def _group_by_tile(self, plots: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Reorder plots so plots on the same Sentinel-2 tile are adjacent
+        
+        Tiles keep the order in which they were first seen. Adjacent plots
+        reach the workers together, so their tile lookups coalesce. Tiles are
+        assigned for the whole scan in one vectorized pass; if a plot has
+        coordinates outside the UTM grid, plots are assigned one by one and
+        invalid plots are kept together at the end.
+        
+        Args:
+            plots: Plot dictionaries from DbService
+            
+        Returns:
+            The same plots grouped by tile
+        """
+        try:
+            tile_ids = tile_resolver.resolve_many(
+                [plot['latitude'] for plot in plots],
+                [plot['longitude'] for plot in plots]
+            )
+        except ValueError:
+            tile_ids = []
+            for plot in plots:
+                try:
+                    tile_ids.append(tile_resolver.resolve(plot['latitude'], plot['longitude']))
+                except ValueError:
+                    tile_ids.append(None)
+        
+        groups: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        for plot, tile_id in zip(plots, tile_ids):
+            groups.setdefault(tile_id, []).append(plot)
+        if None in groups:
+            groups[None] = groups.pop(None)
+        
+        return [plot for group in groups.values() for plot in group]
+    
+    async def _prefetch_ndvi(self, plots: List[Dict[str, Any]]) -> List[Optional[GEEData]]:
+        """
+        Fetch NDVI for a window of plots with batched requests
+        
+        Falls back to per-plot lookups (all None) when the brain service has
+        no batch API or the batch fails.
+        
+        Args:
+            plots: Plot dictionaries from DbService
+            
+        Returns:
+            GEEData (or None) aligned with plots
+        """
+        # BrainService picks the primary NDVI source; other brain services expose GEE directly
+        get_batch = getattr(self.brain_service, 'get_ndvi_batch', None)
+        if not inspect.iscoroutinefunction(get_batch):
+            gee_service = getattr(self.brain_service, 'gee_service', None)
+            get_batch = getattr(gee_service, 'get_ndvi_batch', None)
+        if not plots or not inspect.iscoroutinefunction(get_batch):
+            return [None] * len(plots)
+        
+        try:
+            return await get_batch([(plot['latitude'], plot['longitude']) for plot in plots])
+        except Exception as e:
+            logger.warning(f"Batched NDVI lookup failed for {len(plots)} plots, "
+                          f"falling back to per-plot lookups: {e}")
+            return [None] * len(plots)
+    
+    async def _batch_analyze(
+        self,
+        plots: List[Dict[str, Any]],
+        ndvi: List[Optional[GEEData]]
+    ) -> List[Optional[AnalysisResult]]:
+        """
+        Analyze a window of plots with BrainService batch analysis
+        
+        Returns all None (per-plot analysis) when batch analysis is disabled,
+        unavailable or fails.
+        
+        Args:
+            plots: Plot dictionaries from DbService
+            ndvi: Prefetched GEEData (or None) aligned with plots
+            
+        Returns:
+            AnalysisResult (or None) aligned with plots
+        """
+        analyze_batch = getattr(self.brain_service, 'analyze_plots_batch', None)
+        if (not plots or getattr(self.brain_service, 'batch_analysis_enabled', False) is not True
+                or not inspect.iscoroutinefunction(analyze_batch)):
+            return [None] * len(plots)
+        
+        try:
+            return await analyze_batch([(plot['latitude'], plot['longitude']) for plot in plots], gee_data=ndvi)
+        except Exception as e:
+            logger.warning(f"Batch analysis failed for {len(plots)} plots, "
+                          f"falling back to per-plot analysis: {e}")
+            return [None] * len(plots)
+    
+    def _sentinel_lookup_stats(self) -> Dict[str, int]:
+        """Snapshot SentinelService tile lookup counters (empty if unavailable)"""
+        sentinel_service = getattr(self.brain_service, 'sentinel_service', None)
+        get_stats = getattr(sentinel_service, 'get_lookup_stats', None)
+        stats = get_stats() if callable(get_stats) else None
+        return stats if isinstance(stats, dict) else {}
+    
+    def _chip_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Snapshot SentinelService chip cache counters (None if unavailable)"""
+        sentinel_service = getattr(self.brain_service, 'sentinel_service', None)
+        get_stats = getattr(sentinel_service, 'get_chip_cache_stats', None)
+        stats = get_stats() if callable(get_stats) else None
+        return stats if isinstance(stats, dict) else None
+    
+    def _chip_cache_report(self, before: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Chip cache hits, misses and bytes served since a snapshot"""
+        after = self._chip_cache_stats()
+        if before is None or after is None:
+            return None
+        delta = {
+            name: after[name] - before[name]
+            for name in ('hits', 'misses', 'evictions', 'bytes_served')
+        }
+        lookups = delta['hits'] + delta['misses']
+        delta['hit_rate'] = delta['hits'] / lookups if lookups else 0.0
+        delta['bytes_stored'] = after['bytes_stored']
+        return delta
+    
+    def _triage_snapshot(self) -> Optional[Dict[str, Dict[str, float]]]:
+        """Snapshot BrainService reasoning triage counters (None if unavailable)"""
+        triage = getattr(self.brain_service, 'triage', None)
+        snapshot = getattr(triage, 'snapshot', None)
+        counters = snapshot() if callable(snapshot) else None
+        return counters if isinstance(counters, dict) else None
+    
+    def _triage_report(self, since: Optional[Dict[str, Dict[str, float]]]) -> Optional[Dict[str, Any]]:
+        """Reasoning triage report for the analyses made since a snapshot"""
+        if since is None:
+            return None
+        report = self.brain_service.get_triage_report(since)
+        return report if isinstance(report, dict) else None
+    
     async def scan_all_registered_plots(
         self,
-        max_plots: Optional[int] = None
+        max_plots: Optional[int] = None,
+        sink: Optional[ScanResultSink] = None,
+        progress_callback: Optional[Callable[[ScanProgress], Any]] = None
     ) -> Dict[str, Any]:
         """
         Scan all registered plots (Daily Scan Simulation)
         
+        Runs a producer/consumer pipeline: plots streamed from DbService feed a
+        bounded queue drained by max_concurrent_scans workers. Plots are
+        regrouped by Sentinel-2 tile in windows of tile_group_window so that
+        concurrent lookups for a tile coalesce, and each window's NDVI is
+        fetched with batched Earth Engine requests. Results are streamed to the
+        optional sink and folded into running aggregates, so memory stays
+        flat regardless of the number of plots.
+        
         Args:
             max_plots: Optional limit on number of plots to scan
+            sink: Optional ScanResultSink receiving every ScanResult
+            progress_callback: Optional callable invoked with the live
+                ScanProgress after each plot completes
             
         Returns:
-            Dictionary with scan summary and results
+            Dictionary with scan summary
         """
         start_time = datetime.now()
+        progress = ScanProgress()
+        self.scan_progress = progress
+        lookup_stats_before = self._sentinel_lookup_stats()
+        triage_before = self._triage_snapshot()
+        chip_cache_before = self._chip_cache_stats()
         
         try:
             logger.info("Starting daily scan simulation for all registered plots")
             
-            # Get all registered plots
-            plots = await self.db_service.get_all_plots(limit=max_plots)
+            num_workers = self.max_concurrent_scans
+            queue: asyncio.Queue = asyncio.Queue(maxsize=num_workers * self.scan_queue_per_worker)
+            alert_buffer = AlertWriteBuffer(self.db_service, self.alert_batch_size)
+            ndvi_prefetched = [0]
+            batch_analyzed = [0]
+            
+            async def dispatch(window: List[Dict[str, Any]]) -> None:
+                grouped = self._group_by_tile(window)
+                ndvi = await self._prefetch_ndvi(grouped)
+                ndvi_prefetched[0] += sum(1 for gee_data in ndvi if gee_data is not None)
+                analyses = await self._batch_analyze(grouped, ndvi)
+                batch_analyzed[0] += sum(1 for analysis in analyses if analysis is not None)
+                for grouped_plot, gee_data, analysis in zip(grouped, ndvi, analyses):
+                    await queue.put((grouped_plot, gee_data, analysis))
+            
+            async def produce():
+                window: List[Dict[str, Any]] = []
+                async for plot in self.db_service.iter_all_plots(limit=max_plots):
+                    progress.total_plots += 1
+                    window.append(plot)
+                    
+                    if len(window) >= self.tile_group_window:
+                        await dispatch(window)
+                        window = []
+                
+                await dispatch(window)
+                
+                # One stop marker per worker once the source is exhausted
+                for _ in range(num_workers):
+                    await queue.put(None)
             
-            if not plots:
+            async def consume():
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        break
+                    
+                    plot, gee_data, analysis = item
+                    result = await self.scan_single_plot(
+                        plot, gee_data=gee_data, analysis=analysis, alert_buffer=alert_buffer
+                    )
+                    progress.record(result)
+                    
+                    if sink:
+                        await sink.write(result)
+                    if progress_callback:
+                        progress_callback(progress)
+                    if progress.completed % self.progress_log_interval == 0:
+                        logger.info(f"Scan progress: {progress.completed} plots completed, "
+                                   f"{progress.alerts_triggered} alerts triggered")
+            
+            tasks = [asyncio.create_task(produce())]
+            tasks += [asyncio.create_task(consume()) for _ in range(num_workers)]
+            
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            finally:
+                await alert_buffer.flush()
+                self.metrics['alert_write_failures'] += len(alert_buffer.failures)
+                if sink:
+                    await sink.close()
+            
+            duration = (datetime.now() - start_time).total_seconds()
+            
+            lookup_stats_after = self._sentinel_lookup_stats()
+            lookup_delta = {
+                name: lookup_stats_after[name] - lookup_stats_before.get(name, 0)
+                for name in lookup_stats_after
+            }
+            
+            if progress.total_plots == 0:
                 logger.warning("No registered plots found for scanning")
                 return {
                     'status': 'completed',
@@ -366,44 +783,42 @@ class SentryService:
                     'duration_seconds': 0
                 }
             
-            logger.info(f"Found {len(plots)} plots to scan")
-            
-            # Scan plots with concurrency limit
-            semaphore = asyncio.Semaphore(self.max_concurrent_scans)
-            
-            async def scan_with_limit(plot):
-                async with semaphore:
-                    return await self.scan_single_plot(plot)
-            
-            # Execute scans concurrently
-            scan_results = await asyncio.gather(
-                *[scan_with_limit(plot) for plot in plots],
-                return_exceptions=True
-            )
-            
-            # Process results
-            successful_scans = [r for r in scan_results if isinstance(r, ScanResult)]
-            alerts_triggered = sum(1 for r in successful_scans if r.alert_triggered)
-            sms_sent = sum(1 for r in successful_scans if r.sms_sent)
-            high_urgency = sum(1 for r in successful_scans if r.urgency == 'high')
-            
-            duration = (datetime.now() - start_time).total_seconds()
-            
             summary = {
                 'status': 'completed',
-                'total_plots': len(plots),
-                'scanned': len(successful_scans),
-                'alerts_triggered': alerts_triggered,
-                'sms_sent': sms_sent,
-                'high_urgency_plots': high_urgency,
-                'scan_failures': len(plots) - len(successful_scans),
+                'total_plots': progress.total_plots,
+                'scanned': progress.scanned,
+                'alerts_triggered': progress.alerts_triggered,
+                'sms_sent': progress.sms_sent,
+                'alerts_written': alert_buffer.written,
+                'alert_write_failures': [
+                    {'alert_id': alert_id, **failure}
+                    for alert_id, failure in alert_buffer.failures.items()
+                ],
+                'high_urgency_plots': progress.high_urgency_plots,
+                'scan_failures': progress.scan_failures,
+                'risk_level_counts': dict(progress.risk_level_counts),
                 'duration_seconds': duration,
-                'avg_scan_time_ms': sum(r.processing_time_ms for r in successful_scans) / len(successful_scans) if successful_scans else 0,
-                'scan_timestamp': datetime.now().isoformat(),
-                'results': [r.dict() for r in successful_scans]
+                'avg_scan_time_ms': progress.avg_scan_time_ms,
+                'coalesced_tile_lookups': lookup_delta.get('coalesced_lookups', 0),
+                's3_calls_saved': lookup_delta.get('s3_calls_saved', 0),
+                'ndvi_prefetched': ndvi_prefetched[0],
+                'batch_analyzed': batch_analyzed[0],
+                'reasoning_triage': self._triage_report(triage_before),
+                'chip_cache': self._chip_cache_report(chip_cache_before),
+                'scan_timestamp': datetime.now().isoformat()
             }
             
-            logger.info(f"Daily scan completed: {len(successful_scans)}/{len(plots)} plots scanned, {alerts_triggered} alerts triggered")
+            logger.info(f"Daily scan completed: {progress.scanned}/{progress.total_plots} plots scanned, "
+                       f"{progress.alerts_triggered} alerts triggered, "
+                       f"{summary['s3_calls_saved']} S3 calls saved")
+            if summary['reasoning_triage']:
+                triage = summary['reasoning_triage']
+                logger.info(f"Reasoning triage: {triage['sonnet_calls_avoided']}/{triage['plots']} Sonnet calls avoided, "
+                           f"~${triage['cost_saved_usd']:.4f} and {triage['latency_saved_seconds']:.1f}s saved")
+            if summary['chip_cache']:
+                chip_cache = summary['chip_cache']
+                logger.info(f"Chip cache: {chip_cache['hit_rate']:.0%} hit rate, "
+                           f"{chip_cache['bytes_served']} bytes served from disk")
             
             return summary
             
@@ -426,6 +841,7 @@ class SentryService:
         return {
             'service': 'SentryService',
             'metrics': self.metrics.copy(),
+            'scan_progress': self.scan_progress.dict(),
             'configuration': {
                 'urgency_threshold': self.urgency_threshold,
                 'max_concurrent_scans': self.max_concurrent_scans
@@ -0,0 +1,235 @@
+"""
+DynamoDB item serialization
+
+Fast conversion between Pydantic models and DynamoDB items:
+- Iterative (stack-based) float <-> Decimal conversion for free-form values
+- Schema-aware PlotData/AlertData converters that touch only known fields
+- Deserialization straight from a raw item to a model in one validation pass
+- Opaque pagination cursors wrapping DynamoDB LastEvaluatedKey
+
+Deserialization hands the raw item to model_validate: pydantic-core parses
+ISO timestamps and coerces Decimal to float for typed fields itself, so only
+free-form values (gee_proof) need a Decimal walk. In Pydantic v2 this is
+faster than pre-converting in Python and faster than model_construct.
+"""
+
+from typing import Any, Dict, Mapping, Optional, Type, TypeVar
+from decimal import Decimal
+import base64
+import binascii
+import json
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def floats_to_decimal(value: Any) -> Any:
+    """
+    Convert floats to Decimal for DynamoDB, walking containers iteratively
+
+    Dicts and lists are copied, never mutated in place. Floats are converted
+    through their shortest repr, matching Decimal(str(value)).
+
+    Args:
+        value: Scalar, dict or list (arbitrarily nested)
+
+    Returns:
+        Value with every float replaced by a Decimal
+    """
+    if isinstance(value, float):
+        return Decimal(repr(value))
+    if isinstance(value, dict):
+        root: Any = dict(value)
+    elif isinstance(value, list):
+        root = list(value)
+    else:
+        return value
+
+    stack = [root]
+    while stack:
+        container = stack.pop()
+        entries = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, item in entries:
+            if isinstance(item, float):
+                container[key] = Decimal(repr(item))
+            elif isinstance(item, dict):
+                container[key] = copy = dict(item)
+                stack.append(copy)
+            elif isinstance(item, list):
+                container[key] = copy = list(item)
+                stack.append(copy)
+
+    return root
+
+
+def decimals_to_float(value: Any) -> Any:
+    """
+    Convert Decimals from DynamoDB to float, walking containers iteratively
+
+    Args:
+        value: Scalar, dict or list (arbitrarily nested)
+
+    Returns:
+        Value with every Decimal replaced by a float
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, dict):
+        root: Any = dict(value)
+    elif isinstance(value, list):
+        root = list(value)
+    else:
+        return value
+
+    stack = [root]
+    while stack:
+        container = stack.pop()
+        entries = container.items() if isinstance(container, dict) else enumerate(container)
+        for key, item in entries:
+            if isinstance(item, Decimal):
+                container[key] = float(item)
+            elif isinstance(item, dict):
+                container[key] = copy = dict(item)
+                stack.append(copy)
+            elif isinstance(item, list):
+                container[key] = copy = list(item)
+                stack.append(copy)
+
+    return root
+
+
+def plot_to_item(plot: Any) -> Dict[str, Any]:
+    """
+    Build the DynamoDB item for a PlotData
+
+    Args:
+        plot: PlotData instance
+
+    Returns:
+        Item dictionary ready for put_item/BatchWriteItem
+    """
+    item = {
+        'user_id': plot.user_id,
+        'plot_id': plot.plot_id,
+        'lat': Decimal(repr(plot.lat)),
+        'lon': Decimal(repr(plot.lon)),
+        'crop': plot.crop,
+        'hobli_id': plot.hobli_id,
+        'farmer_name': plot.farmer_name,
+        'phone_number': plot.phone_number,
+        'registration_date': plot.registration_date.isoformat(),
+        'status': plot.status
+    }
+
+    # Add optional fields
+    if plot.last_analysis:
+        item['last_analysis'] = plot.last_analysis.isoformat()
+
+    return item
+
+
+def alert_to_item(alert: Any) -> Dict[str, Any]:
+    """
+    Build the DynamoDB item for an AlertData
+
+    Args:
+        alert: AlertData instance
+
+    Returns:
+        Item dictionary ready for put_item/BatchWriteItem
+    """
+    item = {
+        'hobli_id': alert.hobli_id,
+        'timestamp': alert.timestamp.isoformat(),
+        'plot_id': alert.plot_id,
+        'user_id': alert.user_id,
+        'risk_level': alert.risk_level,
+        'message': alert.message,
+        'gee_proof': floats_to_decimal(alert.gee_proof),
+        'bedrock_reasoning': alert.bedrock_reasoning,
+        'resolution_status': alert.resolution_status,
+        'sms_sent': alert.sms_sent
+    }
+
+    # Add optional fields
+    if alert.officer_response:
+        item['officer_response'] = alert.officer_response
+
+    return item
+
+
+def plot_from_item(item: Mapping[str, Any], model: Type[ModelT]) -> ModelT:
+    """
+    Build a PlotData directly from a raw DynamoDB item
+
+    Args:
+        item: Item as returned by boto3 (Decimals, ISO timestamps)
+        model: PlotData class
+
+    Returns:
+        Validated model instance
+    """
+    return model.model_validate(item)
+
+
+def alert_from_item(item: Mapping[str, Any], model: Type[ModelT]) -> ModelT:
+    """
+    Build an AlertData directly from a raw DynamoDB item
+
+    Args:
+        item: Item as returned by boto3 (Decimals, ISO timestamps)
+        model: AlertData class
+
+    Returns:
+        Validated model instance
+    """
+    gee_proof = item.get('gee_proof')
+    if gee_proof:
+        item = {**item, 'gee_proof': decimals_to_float(gee_proof)}
+
+    return model.model_validate(item)
+
+
+def encode_cursor(last_evaluated_key: Optional[Mapping[str, Any]]) -> Optional[str]:
+    """
+    Wrap a DynamoDB LastEvaluatedKey in an opaque, URL-safe cursor
+
+    Args:
+        last_evaluated_key: Key returned by Query/Scan, or None on the last page
+
+    Returns:
+        Cursor string, or None when there are no more pages
+    """
+    if not last_evaluated_key:
+        return None
+
+    payload = json.dumps(decimals_to_float(dict(last_evaluated_key)), sort_keys=True, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Unwrap a cursor produced by encode_cursor into an ExclusiveStartKey
+
+    Args:
+        cursor: Cursor string or None
+
+    Returns:
+        ExclusiveStartKey dictionary, or None when cursor is empty
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid pagination cursor: {e}") from e
+
+    if not isinstance(key, dict):
+        raise ValueError("Invalid pagination cursor: not a key object")
+
+    return floats_to_decimal(key)
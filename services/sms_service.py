@@ -11,11 +11,12 @@ from typing import Optional, Dict, Any, List
 from pydantic import BaseModel
 from datetime import datetime
 import logging
-import boto3
 from botocore.exceptions import ClientError
 import urllib.parse
 
 from config.settings import get_settings
+from config.aws_clients import get_client
+from services.executor import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -55,8 +56,8 @@ class SMSService:
         self.region = region or settings.aws.region
         self.app_base_url = app_base_url or "https://precision-agriai.example.com"
         
-        # Initialize AWS SNS client
-        self.sns = boto3.client('sns', region_name=self.region)
+        # Shared AWS SNS client from the registry
+        self.sns = get_client('sns', self.region)
         
         # SMS attributes for India
         self.sms_attributes = {
@@ -126,7 +127,8 @@ class SMSService:
             message += f"View details: {deep_link}"
             
             # Send SMS via SNS
-            response = self.sns.publish(
+            response = await run_blocking(
+                self.sns.publish,
                 PhoneNumber=farmer_phone,
                 Message=message,
                 MessageAttributes={
@@ -204,7 +206,8 @@ class SMSService:
             message += f"View dashboard: {deep_link}"
             
             # Send SMS
-            response = self.sns.publish(
+            response = await run_blocking(
+                self.sns.publish,
                 PhoneNumber=officer_phone,
                 Message=message,
                 MessageAttributes={
@@ -278,7 +281,8 @@ class SMSService:
             message += f"Immediate action required!\n"
             message += f"View analysis: {deep_link}"
             
-            response = self.sns.publish(
+            response = await run_blocking(
+                self.sns.publish,
                 PhoneNumber=officer_phone,
                 Message=message,
                 MessageAttributes={
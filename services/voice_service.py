@@ -12,7 +12,6 @@ from typing import Optional, Dict, Any, List
 from pydantic import BaseModel
 from datetime import datetime
 import logging
-import boto3
 from botocore.exceptions import ClientError
 import json
 import time
@@ -20,6 +19,8 @@ import uuid
 import asyncio
 
 from config.settings import get_settings
+from config.aws_clients import get_client
+from services.executor import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -78,17 +79,17 @@ class VoiceService:
         # Fallback mode flag (set to True if AWS services unavailable)
         self.fallback_mode = False
         
-        # Initialize AWS clients
+        # Shared AWS clients from the registry
         try:
-            self.transcribe = boto3.client('transcribe', region_name=self.region)
-            self.polly = boto3.client('polly', region_name=self.region)
+            self.transcribe = get_client('transcribe', self.region)
+            self.polly = get_client('polly', self.region)
         except Exception as e:
             logger.warning(f"Failed to initialize AWS voice clients: {e}")
             self.transcribe = None
             self.polly = None
             self.fallback_mode = True
-        self.bedrock = boto3.client('bedrock-runtime', region_name=self.region)
-        self.s3 = boto3.client('s3', region_name=self.region)
+        self.bedrock = get_client('bedrock-runtime', self.region)
+        self.s3 = get_client('s3', self.region)
         
         # Bedrock model for intent detection
         self.bedrock_model_id = 'anthropic.claude-3-haiku-20240307-v1:0'  # Fast model for intent
@@ -96,9 +97,9 @@ class VoiceService:
         # Audio cache for common phrases
         self.audio_cache: Dict[str, AudioResponse] = {}
         
-        # Ensure S3 bucket exists (in production, this should be pre-created)
-        if not self.fallback_mode:
-            self._ensure_audio_bucket()
+        # S3 bucket existence is checked on first upload, not at construction
+        # (in production, this should be pre-created)
+        self._audio_bucket_checked = False
         
         if self.fallback_mode:
             logger.warning(f"VoiceService initialized in FALLBACK MODE (AWS Transcribe/Polly unavailable)")
@@ -107,6 +108,7 @@ class VoiceService:
     
     def _ensure_audio_bucket(self):
         """Ensure S3 bucket exists for audio storage"""
+        self._audio_bucket_checked = True
         try:
             self.s3.head_bucket(Bucket=self.audio_bucket)
             logger.info(f"Audio bucket {self.audio_bucket} exists")
@@ -128,6 +130,26 @@ class VoiceService:
             else:
                 logger.warning(f"Error checking audio bucket: {e}")
     
+    async def _upload_audio(self, audio_key: str, audio_data: bytes, content_type: str) -> None:
+        """
+        Upload audio to the audio bucket, checking the bucket on first use
+        
+        Args:
+            audio_key: S3 object key
+            audio_data: Audio bytes
+            content_type: MIME type of the audio
+        """
+        if not self._audio_bucket_checked:
+            await run_blocking(self._ensure_audio_bucket)
+        
+        await run_blocking(
+            self.s3.put_object,
+            Bucket=self.audio_bucket,
+            Key=audio_key,
+            Body=audio_data,
+            ContentType=content_type
+        )
+    
     async def process_audio_input(
         self, 
         audio_data: bytes, 
@@ -166,12 +188,7 @@ class VoiceService:
         try:
             # Step 1: Upload audio to S3
             audio_key = f"input/{uuid.uuid4()}.wav"
-            self.s3.put_object(
-                Bucket=self.audio_bucket,
-                Key=audio_key,
-                Body=audio_data,
-                ContentType='audio/wav'
-            )
+            await self._upload_audio(audio_key, audio_data, 'audio/wav')
             audio_uri = f"s3://{self.audio_bucket}/{audio_key}"
             
             logger.info(f"Uploaded audio to {audio_uri}")
@@ -182,7 +199,8 @@ class VoiceService:
             # Determine language code for Transcribe
             transcribe_language = self._get_transcribe_language_code(language)
             
-            self.transcribe.start_transcription_job(
+            await run_blocking(
+                self.transcribe.start_transcription_job,
                 TranscriptionJobName=job_name,
                 Media={'MediaFileUri': audio_uri},
                 MediaFormat='wav',
@@ -197,7 +215,8 @@ class VoiceService:
             elapsed = 0
             
             while elapsed < max_wait_time:
-                response = self.transcribe.get_transcription_job(
+                response = await run_blocking(
+                    self.transcribe.get_transcription_job,
                     TranscriptionJobName=job_name
                 )
                 status = response['TranscriptionJob']['TranscriptionJobStatus']
@@ -207,7 +226,7 @@ class VoiceService:
                     
                     # Fetch transcript
                     import requests
-                    transcript_response = requests.get(transcript_uri)
+                    transcript_response = await run_blocking(requests.get, transcript_uri)
                     transcript_data = transcript_response.json()
                     
                     transcribed_text = transcript_data['results']['transcripts'][0]['transcript']
@@ -219,8 +238,8 @@ class VoiceService:
                     intent = await self.detect_intent(transcribed_text)
                     
                     # Cleanup
-                    self.transcribe.delete_transcription_job(TranscriptionJobName=job_name)
-                    self.s3.delete_object(Bucket=self.audio_bucket, Key=audio_key)
+                    await run_blocking(self.transcribe.delete_transcription_job, TranscriptionJobName=job_name)
+                    await run_blocking(self.s3.delete_object, Bucket=self.audio_bucket, Key=audio_key)
                     
                     processing_time = int((time.time() - start_time) * 1000)
                     
@@ -324,12 +343,13 @@ Respond with ONLY the JSON, no other text."""
             
             logger.debug(f"Detecting intent for: {transcribed_text}")
             
-            response = self.bedrock.invoke_model(
+            response = await run_blocking(
+                self.bedrock.invoke_model,
                 modelId=self.bedrock_model_id,
                 body=json.dumps(request_body)
             )
             
-            response_body = json.loads(response['body'].read())
+            response_body = json.loads(await run_blocking(response['body'].read))
             content = response_body['content'][0]['text']
             
             # Parse JSON response
@@ -427,7 +447,8 @@ Respond with ONLY the JSON, no other text."""
             logger.info(f"Generating audio in {language} with voice {voice_id}")
             
             # Generate speech using Polly
-            response = self.polly.synthesize_speech(
+            response = await run_blocking(
+                self.polly.synthesize_speech,
                 Text=text,
                 OutputFormat='mp3',
                 VoiceId=voice_id,
@@ -436,16 +457,11 @@ Respond with ONLY the JSON, no other text."""
             )
             
             # Get audio stream
-            audio_data = response['AudioStream'].read()
+            audio_data = await run_blocking(response['AudioStream'].read)
             
             # Upload to S3 for persistent storage
             audio_key = f"output/{uuid.uuid4()}.mp3"
-            self.s3.put_object(
-                Bucket=self.audio_bucket,
-                Key=audio_key,
-                Body=audio_data,
-                ContentType='audio/mpeg'
-            )
+            await self._upload_audio(audio_key, audio_data, 'audio/mpeg')
             
             # Generate presigned URL (valid for 1 hour)
             audio_url = self.s3.generate_presigned_url(
@@ -9,12 +9,18 @@ Provides common fixtures for testing all services including:
 
 import pytest
 from typing import Generator, Dict, Any
+from datetime import datetime
+import json
 import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
 import boto3
 from moto import mock_aws
 from hypothesis import strategies as st
 from hypothesis import settings, HealthCheck
 
+from config.aws_clients import reset_client_registry
+
 
 # Configure Hypothesis settings for all tests
 settings.register_profile("default", max_examples=50, deadline=5000, database=None)
@@ -32,6 +38,14 @@ def aws_credentials():
     os.environ["AWS_DEFAULT_REGION"] = "ap-south-1"
 
 
+@pytest.fixture(autouse=True)
+def fresh_client_registry():
+    """Reset the shared AWS client registry so clients never outlive a test's mocks"""
+    reset_client_registry()
+    yield
+    reset_client_registry()
+
+
 @pytest.fixture
 def sample_coordinates():
     """Sample valid coordinates for testing"""
@@ -113,6 +127,79 @@ def sample_hobli_directory():
     }
 
 
+@pytest.fixture
+def make_gee_data():
+    """Factory for GEEData with the given NDVI; keyword arguments override fields"""
+    from services.gee_service import GEEData
+    
+    def _make(ndvi: float = 0.65, **overrides) -> GEEData:
+        return GEEData(**{
+            "ndvi_float": ndvi,
+            "acquisition_date": datetime(2024, 1, 1),
+            "cloud_cover": 10.0,
+            "metadata": {"sensor": "MODIS"},
+            "quality_score": 0.85,
+            **overrides,
+        })
+    
+    return _make
+
+
+@pytest.fixture
+def make_sentinel_data():
+    """Factory for a usable Sentinel-2 scene; keyword arguments override fields"""
+    from services.sentinel_service import SentinelData
+    
+    def _make(**overrides) -> SentinelData:
+        return SentinelData(**{
+            "image_url": "https://example.com/tci.jpg",
+            "tile_id": "43PGP",
+            "acquisition_date": datetime(2024, 1, 1),
+            "cloud_cover_percentage": 10.0,
+            "resolution": "60m",
+            "quality_assessment": "usable",
+            "metadata": {},
+            **overrides,
+        })
+    
+    return _make
+
+
+@pytest.fixture
+def bedrock_reply():
+    """Factory for invoke_model return values with a fresh, readable body holding text"""
+    def _make(text: str) -> Dict[str, Any]:
+        return {"body": MagicMock(read=lambda: json.dumps({"content": [{"text": text}]}).encode())}
+    
+    return _make
+
+
+@pytest.fixture
+def bedrock_analysis_reply(bedrock_reply):
+    """Factory for invoke_model replies carrying a medium-risk analysis; keyword arguments override fields"""
+    def _make(**overrides) -> Dict[str, Any]:
+        return bedrock_reply(json.dumps({
+            "risk_classification": "medium",
+            "confidence_score": 0.8,
+            "explanation": "Moderate vegetation",
+            "visual_observations": "Patchy green",
+            "recommendations": ["Monitor"],
+            **overrides,
+        }))
+    
+    return _make
+
+
+@pytest.fixture
+def brain(make_sentinel_data):
+    """BrainService on mock GEE with a usable Sentinel-2 scene and no Bedrock cache"""
+    from services.brain_service import BrainService
+    
+    service = BrainService(use_mock_gee=True)
+    service.sentinel_service.get_latest_image = AsyncMock(return_value=make_sentinel_data())
+    return service
+
+
 # ============================================================================
 # AWS Service Mocking Fixtures (moto)
 # ============================================================================
@@ -219,10 +306,26 @@ def mock_dynamodb_tables(mock_dynamodb_service):
         ProvisionedThroughput={"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
     )
     
+    # Create PrecisionAgri_JurisdictionStats table
+    jurisdiction_stats_table = dynamodb.create_table(
+        TableName="PrecisionAgri_JurisdictionStats",
+        KeySchema=[
+            {"AttributeName": "hobli_id", "KeyType": "HASH"},
+            {"AttributeName": "stat_key", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "hobli_id", "AttributeType": "S"},
+            {"AttributeName": "stat_key", "AttributeType": "S"},
+        ],
+        BillingMode="PROVISIONED",
+        ProvisionedThroughput={"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
+    )
+    
     tables = {
         "plots": plots_table, 
         "alerts": alerts_table,
-        "hobli_directory": hobli_directory_table
+        "hobli_directory": hobli_directory_table,
+        "jurisdiction_stats": jurisdiction_stats_table
     }
     
     yield tables
@@ -260,6 +363,18 @@ def mock_transcribe_service(aws_credentials):
         yield boto3.client("transcribe", region_name="ap-south-1")
 
 
+@pytest.fixture
+def fake_ee():
+    """Offline Earth Engine: GEEService imports and initializes tests.fake_ee"""
+    from tests.fake_ee import FakeEarthEngine
+    
+    fake = FakeEarthEngine()
+    with patch.dict(sys.modules, {'ee': fake}), \
+         patch('services.gee_service._ee', None), \
+         patch('services.gee_service._ee_initialized', False):
+        yield fake
+
+
 # ============================================================================
 # Hypothesis Strategies for Property-Based Testing
 # ============================================================================
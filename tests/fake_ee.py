@@ -0,0 +1,167 @@
+"""
+Fake Earth Engine module for offline tests
+
+Implements the small part of the `ee` API used by GEEService:
+- Initialize, Geometry.Point, Feature, FeatureCollection, Reducer.mean
+- ImageCollection(...).filterBounds().filterDate().median() / .select().toBands()
+- Image.reduceRegion / Image.reduceRegions returning objects with getInfo()
+
+NDVI is derived from the MODIS pixel of each point, so neighbours in one
+pixel get identical values. Every getInfo() call is recorded in `requests`
+as (method, number_of_points).
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import date
+import math
+
+from services.ndvi_cache import composite_start, modis_pixel_index, next_composite_start
+
+
+def fake_ndvi_stats(lat: float, lon: float) -> Dict[str, Any]:
+    """Deterministic MOD13Q1-style band means for a point"""
+    row, col = modis_pixel_index(lat, lon)
+    return {'NDVI': 1500 + (row * 7 + col * 13) % 7000, 'SummaryQA': (row + col) % 3}
+
+
+def fake_ndvi_series_raw(lat: float, lon: float, day: date) -> int:
+    """Deterministic seasonal MOD13Q1 NDVI (scaled by 10000) for a composite"""
+    row, col = modis_pixel_index(lat, lon)
+    season = 1500 * math.sin(2 * math.pi * (day.timetuple().tm_yday - 120) / 365.0)
+    return int(5000 + (row * 7 + col * 13) % 1000 + season + (day.year % 3) * 50)
+
+
+class FakeEarthEngine:
+    """Stand-in for the `ee` module"""
+
+    def __init__(self, fail_batches: bool = False, today: Optional[date] = None):
+        """
+        Initialize fake module
+
+        Args:
+            fail_batches: If True, reduceRegions getInfo() raises
+            today: Composites starting after this date are not yet available
+        """
+        self.requests: List[Tuple[str, int]] = []
+        self.fail_batches = fail_batches
+        self.today = today or date.today()
+        # (row, col, composite date) -> raw NDVI replacing the seasonal value
+        self.overrides: Dict[Tuple[int, int, date], int] = {}
+        fake = self
+
+        class Computed:
+            def __init__(self, method: str, points: int, compute):
+                self._method = method
+                self._points = points
+                self._compute = compute
+
+            def getInfo(self):
+                fake.requests.append((self._method, self._points))
+                if self._method == 'reduceRegions' and fake.fail_batches:
+                    raise RuntimeError("Computation timed out.")
+                return self._compute()
+
+        class Point:
+            def __init__(self, coords: List[float]):
+                self.coords = coords
+
+        class Geometry:
+            pass
+
+        Geometry.Point = Point
+
+        class Feature:
+            def __init__(self, geometry: Point, properties: Optional[Dict[str, Any]] = None):
+                self.geometry = geometry
+                self.properties = dict(properties or {})
+
+        class FeatureCollection:
+            def __init__(self, features: List[Feature]):
+                self.features = list(features)
+
+            def geometry(self):
+                return [feature.geometry for feature in self.features]
+
+        class Reducer:
+            @staticmethod
+            def mean():
+                return 'mean'
+
+            @staticmethod
+            def first():
+                return 'first'
+
+        def band_value(lat: float, lon: float, day: date) -> int:
+            row, col = modis_pixel_index(lat, lon)
+            return fake.overrides.get((row, col, day), fake_ndvi_series_raw(lat, lon, day))
+
+        class Image:
+            def __init__(self, bands: Optional[List[date]] = None):
+                # Composite dates of a toBands() stack; None for a median image
+                self.bands = bands
+
+            def reduceRegion(self, reducer, geometry, scale, bestEffort=False):
+                lon, lat = geometry.coords
+                return Computed('reduceRegion', 1, lambda: fake_ndvi_stats(lat, lon))
+
+            def reduceRegions(self, collection, reducer, scale):
+                def compute():
+                    features = []
+                    for feature in collection.features:
+                        lon, lat = feature.geometry.coords
+                        if self.bands is None:
+                            values = fake_ndvi_stats(lat, lon)
+                        else:
+                            values = {
+                                f"{day:%Y_%m_%d}_NDVI": band_value(lat, lon, day) for day in self.bands
+                            }
+                        features.append({
+                            'type': 'Feature',
+                            'geometry': {'type': 'Point', 'coordinates': [lon, lat]},
+                            'properties': {**feature.properties, **values}
+                        })
+                    return {'type': 'FeatureCollection', 'features': features}
+                return Computed('reduceRegions', len(collection.features), compute)
+
+        class ImageCollection:
+            def __init__(self, name: str):
+                self.name = name
+                self.start: Optional[date] = None
+                self.end: Optional[date] = None
+
+            def filterBounds(self, geometry):
+                return self
+
+            def filterDate(self, start, end):
+                self.start = date.fromisoformat(start)
+                self.end = date.fromisoformat(end)
+                return self
+
+            def select(self, band):
+                return self
+
+            def median(self):
+                return Image()
+
+            def toBands(self):
+                bands = []
+                day = composite_start(self.start)
+                if day < self.start:
+                    day = next_composite_start(day)
+                while day < self.end and day <= fake.today:
+                    bands.append(day)
+                    day = next_composite_start(day)
+                return Image(bands)
+
+        self.Geometry = Geometry
+        self.Feature = Feature
+        self.FeatureCollection = FeatureCollection
+        self.Reducer = Reducer
+        self.ImageCollection = ImageCollection
+
+    def Initialize(self, *args, **kwargs):
+        return None
+
+    def count(self, method: str) -> int:
+        """Number of getInfo() calls made through a method"""
+        return sum(1 for name, _ in self.requests if name == method)
@@ -0,0 +1,252 @@
+"""
+Unit Tests for the AWS client registry
+
+Tests the shared boto3 client pool including:
+- One client per (service, region), shared across services
+- botocore tuning from settings (pool size, retries, timeouts)
+- Thread-safe lazy construction
+- Socket reuse and cold start measurements
+"""
+
+import pytest
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import boto3
+
+from config.aws_clients import AWSClientRegistry, get_client, get_client_registry
+from config.settings import AWSClientConfig, get_settings
+
+
+@pytest.fixture
+def registry():
+    """Registry on a session with static test credentials"""
+    session = boto3.session.Session(
+        aws_access_key_id="testing",
+        aws_secret_access_key="testing"
+    )
+    return AWSClientRegistry(session=session)
+
+
+@pytest.fixture
+def s3_endpoint():
+    """Local keep-alive HTTP endpoint answering S3 ListObjectsV2 with an empty listing"""
+    body = (
+        b'<?xml version="1.0" encoding="UTF-8"?>'
+        b'<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+        b'<Name>bucket</Name><Prefix></Prefix><KeyCount>0</KeyCount>'
+        b'<MaxKeys>1000</MaxKeys><IsTruncated>false</IsTruncated></ListBucketResult>'
+    )
+    connections = []
+    
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        
+        def setup(self):
+            super().setup()
+            connections.append(self.client_address)
+        
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/xml")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        
+        def log_message(self, *args):
+            pass
+    
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", connections
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestClientSharing:
+    """Test one client per (service, region)"""
+    
+    def test_same_service_and_region_returns_same_client(self, registry):
+        """Test repeated lookups reuse the built client"""
+        first = registry.client('s3', 'ap-south-1')
+        
+        assert registry.client('s3', 'ap-south-1') is first
+        assert registry.stats()['clients'] == 1
+        assert registry.stats()['reuses'] == 1
+    
+    def test_region_and_service_are_part_of_the_key(self, registry):
+        """Test different regions or services get separate clients"""
+        mumbai = registry.client('s3', 'ap-south-1')
+        
+        assert registry.client('s3', 'us-east-1') is not mumbai
+        assert registry.client('sns', 'ap-south-1') is not mumbai
+        assert registry.client('s3', 'us-east-1').meta.region_name == 'us-east-1'
+    
+    def test_default_region_from_settings(self, registry):
+        """Test omitting the region uses settings.aws.region"""
+        assert registry.client('sns').meta.region_name == get_settings().aws.region
+    
+    def test_resources_are_cached(self, registry):
+        """Test resources are shared like clients"""
+        dynamodb = registry.resource('dynamodb', 'ap-south-1')
+        
+        assert registry.resource('dynamodb', 'ap-south-1') is dynamodb
+        assert registry.stats()['resources'] == 1
+    
+    def test_concurrent_first_use_builds_once(self, registry):
+        """Test racing threads all receive the single built client"""
+        results = []
+        barrier = threading.Barrier(16)
+        
+        def fetch():
+            barrier.wait()
+            results.append(registry.client('polly', 'ap-south-1'))
+        
+        threads = [threading.Thread(target=fetch) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len({id(client) for client in results}) == 1
+        assert registry.stats()['clients'] == 1
+    
+    def test_clear_rebuilds(self, registry):
+        """Test cleared clients are rebuilt on next use"""
+        first = registry.client('s3', 'ap-south-1')
+        registry.clear()
+        
+        assert registry.client('s3', 'ap-south-1') is not first
+    
+    def test_services_share_registry_clients(self, mock_dynamodb_tables):
+        """Test services constructed separately receive the same clients"""
+        from services.brain_service import BrainService
+        from services.sentinel_service import SentinelService
+        from services.voice_service import VoiceService
+        
+        sentinel_service = SentinelService(region='ap-south-1')
+        brain_service = BrainService(use_mock_gee=True, region='ap-south-1', sentinel_service=sentinel_service)
+        voice_service = VoiceService(region='ap-south-1')
+        
+        assert brain_service.sentinel_service is sentinel_service
+        assert voice_service.s3 is sentinel_service.s3_client
+        assert voice_service.bedrock is brain_service.bedrock_client
+        assert get_client('s3', 'ap-south-1') is sentinel_service.s3_client
+        assert get_client_registry().stats()['reuses'] >= 2
+    
+    @pytest.mark.parametrize("run", [1, 2])
+    def test_registry_reset_between_tests(self, run):
+        """Test each test starts with an empty shared registry"""
+        assert get_client_registry().stats()['clients'] == 0
+        
+        get_client('s3', 'ap-south-1')
+
+
+class TestClientTuning:
+    """Test botocore configuration applied to every client"""
+    
+    def test_config_from_settings(self, registry):
+        """Test pool size, retries and timeouts come from settings.aws_clients"""
+        expected = get_settings().aws_clients
+        
+        config = registry.client('bedrock-runtime', 'ap-south-1').meta.config
+        
+        assert config.max_pool_connections == expected.max_pool_connections
+        assert config.retries['mode'] == expected.retry_mode
+        assert config.retries['total_max_attempts'] == expected.max_attempts
+        assert config.connect_timeout == expected.connect_timeout
+        assert config.read_timeout == expected.read_timeout
+        assert config.tcp_keepalive == expected.tcp_keepalive
+    
+    def test_custom_config(self):
+        """Test an explicit AWSClientConfig overrides settings"""
+        registry = AWSClientRegistry(client_config=AWSClientConfig(max_pool_connections=128, retry_mode="adaptive"))
+        
+        config = registry.client('s3', 'ap-south-1').meta.config
+        
+        assert config.max_pool_connections == 128
+        assert config.retries['mode'] == "adaptive"
+    
+    def test_invalid_retry_mode_rejected(self):
+        """Test unsupported retry modes fail validation"""
+        with pytest.raises(ValueError):
+            AWSClientConfig(retry_mode="aggressive")
+
+
+class TestMeasurements:
+    """Test socket reuse and build time reporting"""
+    
+    def test_sockets_reused_across_requests(self, registry, s3_endpoint):
+        """Test sequential requests on a shared client reuse one connection"""
+        endpoint_url, connections = s3_endpoint
+        s3 = registry.client('s3', 'ap-south-1', endpoint_url=endpoint_url)
+        
+        for _ in range(10):
+            registry.client('s3', 'ap-south-1', endpoint_url=endpoint_url).list_objects_v2(Bucket='bucket')
+        
+        stats = registry.connection_stats()['s3:ap-south-1']
+        assert stats['requests'] == 10
+        assert stats['connections'] == 1
+        assert len(connections) == 1
+        assert s3 is registry.client('s3', 'ap-south-1', endpoint_url=endpoint_url)
+    
+    def test_build_times_recorded(self, registry):
+        """Test each build is timed for cold start reporting"""
+        registry.client('sns', 'ap-south-1')
+        registry.resource('dynamodb', 'ap-south-1')
+        
+        stats = registry.stats()
+        
+        assert set(stats['build_seconds']) == {'client:sns:ap-south-1', 'resource:dynamodb:ap-south-1'}
+        assert stats['total_build_seconds'] > 0
+    
+    @pytest.mark.slow
+    def test_service_construction_cold_start_benchmark(self, mock_dynamodb_tables):
+        """Compare constructing all services with per-service clients vs the registry"""
+        from services.brain_service import BrainService
+        from services.db_service import DbService
+        from services.sms_service import SMSService
+        from services.voice_service import VoiceService
+        
+        def build_services():
+            BrainService(use_mock_gee=True, region='ap-south-1')
+            DbService(region='ap-south-1')
+            SMSService(region='ap-south-1')
+            VoiceService(region='ap-south-1')
+        
+        def per_service_client(service_name, region_name=None, endpoint_url=None):
+            return boto3.client(service_name, region_name=region_name)
+        
+        def per_service_resource(service_name, region_name=None, endpoint_url=None):
+            return boto3.resource(service_name, region_name=region_name)
+        
+        rounds = 5
+        with patch('services.brain_service.get_client', per_service_client), \
+             patch('services.sentinel_service.get_client', per_service_client), \
+             patch('services.sms_service.get_client', per_service_client), \
+             patch('services.voice_service.get_client', per_service_client), \
+             patch('services.db_service.get_resource', per_service_resource):
+            start = time.perf_counter()
+            for _ in range(rounds):
+                build_services()
+            per_service = (time.perf_counter() - start) / rounds
+        
+        get_client_registry().clear()
+        start = time.perf_counter()
+        build_services()
+        registry_cold = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        for _ in range(rounds):
+            build_services()
+        registry_warm = (time.perf_counter() - start) / rounds
+        
+        assert registry_warm < per_service / 5
+        
+        print(f"\nService construction: per-service clients {per_service * 1000:.0f} ms, "
+              f"registry cold {registry_cold * 1000:.0f} ms, registry warm {registry_warm * 1000:.1f} ms")
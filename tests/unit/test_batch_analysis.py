@@ -0,0 +1,224 @@
+"""
+Unit Tests for batch Bedrock analysis
+
+Tests the daily scan batch mode including:
+- Prompt packing and output token budget
+- Tolerant parsing of complete, truncated and malformed responses
+- BrainService batches answered by a local invoke_model stub
+- Rule-based fallback for plots without a usable result
+"""
+
+import pytest
+import json
+import re
+from unittest.mock import AsyncMock, patch
+
+from services.batch_analysis import (
+    MAX_OUTPUT_TOKENS,
+    batch_max_tokens,
+    build_batch_prompt,
+    parse_batch_results
+)
+
+SONNET = 'anthropic.claude-3-sonnet-20240229-v1:0'
+
+# Mock NDVI: 0.762, 0.488, 0.586 (see test_sentry_service.TestReasoningTriageReport)
+POINTS = [(13.7, 77.0), (12.4, 77.0), (12.3, 77.0)]
+
+
+def result(plot_id, risk='medium', **kwargs):
+    return {
+        'id': plot_id,
+        'risk_classification': risk,
+        'confidence_score': 0.8,
+        'explanation': f'Plot {plot_id} assessed',
+        'recommendations': ['Monitor'],
+        **kwargs
+    }
+
+
+def results_text(*results):
+    return json.dumps({'results': list(results)})
+
+
+def prompt_ids(request_body):
+    """Plot ids listed in a batch prompt's plot table"""
+    prompt = request_body['messages'][0]['content']
+    return [int(plot_id) for plot_id in re.findall(r'^(\d+) \|', prompt, re.MULTILINE)]
+
+
+@pytest.fixture
+def stub_invoke_model(bedrock_reply):
+    """
+    Factory for local invoke_model stand-ins answering every plot id in the prompt
+
+    The factory takes an optional respond callable(ids) -> response text
+    overriding the default all-low results.
+    """
+    def make(respond=None):
+        def invoke_model(**kwargs):
+            ids = prompt_ids(json.loads(kwargs['body']))
+            return bedrock_reply(respond(ids) if respond else results_text(*(result(i, 'low') for i in ids)))
+        return invoke_model
+    return make
+
+
+@pytest.fixture
+def brain(brain):
+    """Shared BrainService in batch mode"""
+    brain.batch_analysis_enabled = True
+    return brain
+
+
+class TestBatchPrompt:
+    """Test prompt packing"""
+
+    def test_one_row_per_plot(self):
+        """Test every plot appears with its NDVI, tile, cloud cover and anomaly"""
+        prompt = build_batch_prompt([
+            {'id': 1, 'ndvi': 0.42, 'lat': 12.97, 'lon': 77.59, 'tile_id': '43PGP', 'cloud_cover': 5.0,
+             'anomaly': {'z_score': -2.5, 'classification': 'stress'}},
+            {'id': 2, 'ndvi': 0.71, 'lat': 13.0, 'lon': 77.6}
+        ], (0.2, 0.4, 0.6))
+
+        assert '1 | 0.420 | (12.9700, 77.5900) | 43PGP | 5.0 | z -2.50 (stress)' in prompt
+        assert '2 | 0.710 | (13.0000, 77.6000) | N/A | N/A | N/A' in prompt
+        assert 'NDVI < 0.2' in prompt
+
+    def test_output_budget_scales_and_caps(self):
+        """Test max_tokens grows with the batch but stays within the model limit"""
+        assert batch_max_tokens(1) < batch_max_tokens(10)
+        assert batch_max_tokens(1000) == MAX_OUTPUT_TOKENS
+
+
+class TestParseBatchResults:
+    """Test tolerant parsing"""
+
+    def test_complete_response(self):
+        """Test every valid result is mapped to its plot id"""
+        parsed = parse_batch_results(results_text(result(1, 'low'), result(2, 'HIGH')), [1, 2])
+
+        assert parsed[1]['risk_classification'] == 'low'
+        assert parsed[2]['risk_classification'] == 'high'
+
+    def test_truncated_response_keeps_complete_results(self):
+        """Test output cut off by max_tokens still yields the finished objects"""
+        text = results_text(result(1), result(2), result(3))
+        truncated = text[:text.index('"id": 3') + 20]
+
+        assert sorted(parse_batch_results(truncated, [1, 2, 3])) == [1, 2]
+
+    def test_malformed_object_skipped(self):
+        """Test one broken object does not discard the rest of the batch"""
+        text = ('{"results": [' + json.dumps(result(1)) + ', {"id": 2, "risk_classification": "low", '
+                '"confidence_score": 0.8,, "explanation": "x"}, ' + json.dumps(result(3)) + ']}')
+
+        assert sorted(parse_batch_results(text, [1, 2, 3])) == [1, 3]
+
+    def test_code_fence_and_prose(self):
+        """Test JSON wrapped in prose and a markdown fence is found"""
+        text = 'Here are the results:\n```json\n' + results_text(result(1)) + '\n```'
+
+        assert list(parse_batch_results(text, [1])) == [1]
+
+    def test_invalid_results_ignored(self):
+        """Test unknown ids, invalid risk levels and duplicates are dropped"""
+        parsed = parse_batch_results(results_text(
+            result(1, 'low'), result(1, 'high'), result(7), result(2, 'severe'), result('x')
+        ), [1, 2])
+
+        assert parsed == {1: parsed[1]}
+        assert parsed[1]['risk_classification'] == 'low'
+
+    def test_fields_normalized(self):
+        """Test confidence is clamped and missing recommendations get a default"""
+        parsed = parse_batch_results(results_text(result(1, confidence_score=3, recommendations=[])), [1])
+
+        assert parsed[1]['confidence_score'] == 1.0
+        assert parsed[1]['recommendations'] == ['Monitor plot regularly']
+
+    def test_no_json(self):
+        """Test a refusal or empty output yields no results"""
+        assert parse_batch_results("I cannot help with that.", [1]) == {}
+
+
+class TestBrainServiceBatch:
+    """Test analyze_plots_batch against a local invoke_model stub"""
+
+    @pytest.mark.asyncio
+    async def test_results_mapped_back_in_order(self, brain, stub_invoke_model):
+        """Test one call analyzes every plot and results follow input order"""
+        with patch.object(brain.bedrock_client, 'invoke_model', side_effect=stub_invoke_model()) as invoke:
+            results = await brain.analyze_plots_batch(POINTS)
+
+        assert invoke.call_count == 1
+        assert invoke.call_args.kwargs['modelId'] == SONNET
+        assert [r.gee_data.ndvi_float for r in results] == pytest.approx([0.762, 0.488, 0.586])
+        assert all(r.risk_level == 'low' and r.reasoning_tier == 'batch' for r in results)
+        assert results[1].bedrock_reasoning.explanation == 'Plot 2 assessed'
+        assert results[0].sentinel_data.tile_id == '43PGP'
+
+    @pytest.mark.asyncio
+    async def test_plots_chunked_by_batch_size(self, brain, stub_invoke_model):
+        """Test the number of Bedrock calls follows batch_analysis_size"""
+        brain.batch_analysis_size = 2
+        points = [(12.0 + index * 0.1, 77.0) for index in range(5)]
+        with patch.object(brain.bedrock_client, 'invoke_model', side_effect=stub_invoke_model()) as invoke:
+            results = await brain.analyze_plots_batch(points)
+
+        assert invoke.call_count == 3
+        assert len(results) == 5
+        assert brain.get_service_info()['batch_analysis']['parsed'] == 5
+
+    @pytest.mark.asyncio
+    async def test_partial_output_falls_back_per_plot(self, brain, stub_invoke_model):
+        """Test plots missing from a truncated response get the rule-based label"""
+        def respond(ids):
+            text = results_text(*(result(plot_id, 'critical') for plot_id in ids))
+            return text[:text.index(f'"id": {ids[-1]}')]
+
+        with patch.object(brain.bedrock_client, 'invoke_model', side_effect=stub_invoke_model(respond)):
+            results = await brain.analyze_plots_batch(POINTS)
+
+        assert [r.risk_level for r in results[:2]] == ['critical', 'critical']
+        assert results[2].risk_level == brain._fallback_risk_classification(0.586).risk_classification
+        assert brain.batch_stats['fallbacks'] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_call_falls_back(self, brain):
+        """Test a failed Bedrock call still classifies every plot"""
+        with patch.object(brain.bedrock_client, 'invoke_model', side_effect=Exception('throttled')):
+            results = await brain.analyze_plots_batch(POINTS)
+
+        assert [r.risk_level for r in results] == ['low', 'medium', 'medium']
+        assert brain.batch_stats['failed_batches'] == 1
+
+    @pytest.mark.asyncio
+    async def test_triage_rules_plots_skip_prompt(self, brain, stub_invoke_model):
+        """Test plots clear of every threshold are not sent when triage is enabled"""
+        brain.triage.enabled = True
+        with patch.object(brain.bedrock_client, 'invoke_model', side_effect=stub_invoke_model()) as invoke:
+            results = await brain.analyze_plots_batch(POINTS)
+
+        assert prompt_ids(json.loads(invoke.call_args.kwargs['body'])) == [1, 2]
+        assert results[0].reasoning_tier == 'rules'
+        assert [r.reasoning_tier for r in results[1:]] == ['batch', 'batch']
+        report = brain.get_triage_report()
+        assert report['plots'] == 3
+        assert report['tier_counts'] == {'rules': 1, 'haiku': 0, 'sonnet': 0, 'batch': 2}
+        assert report['estimated_cost_usd'] == pytest.approx(2 * brain.triage.costs_usd['batch'])
+
+    @pytest.mark.asyncio
+    async def test_missing_imagery_uses_placeholder(self, brain, stub_invoke_model):
+        """Test plots without imagery are still analyzed from NDVI"""
+        brain.sentinel_service.get_latest_image = AsyncMock(side_effect=RuntimeError('no tile'))
+        with patch.object(brain.bedrock_client, 'invoke_model', side_effect=stub_invoke_model()) as invoke:
+            results = await brain.analyze_plots_batch(POINTS[:1])
+
+        assert results[0].sentinel_data.tile_id == 'unavailable'
+        assert '| N/A | 0.0 |' in json.loads(invoke.call_args.kwargs['body'])['messages'][0]['content']
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, brain):
+        """Test no points means no calls"""
+        assert await brain.analyze_plots_batch([]) == []
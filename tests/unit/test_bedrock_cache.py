@@ -0,0 +1,244 @@
+"""
+Unit Tests for the Bedrock response cache
+
+Tests content-addressed caching including:
+- Request hashing and presigned URL normalization
+- TTL and size bounds on the memory and SQLite backends
+- BrainService analysis and guidance served from the cache
+- Coalescing of concurrent identical requests
+"""
+
+import pytest
+import asyncio
+import threading
+from datetime import datetime
+from unittest.mock import patch
+
+from services.bedrock_cache import BedrockResponseCache, create_bedrock_cache
+from services.brain_service import AnalysisResult, BedrockResponse, BrainService
+from services.ndvi_cache import MemoryNDVICacheBackend, SQLiteNDVICacheBackend
+
+SONNET = 'anthropic.claude-3-sonnet-20240229-v1:0'
+
+
+def image_request(url, text="Analyze this plot"):
+    return {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": 1000,
+        "messages": [{"role": "user", "content": [
+            {"type": "text", "text": text},
+            {"type": "image", "source": {"type": "url", "url": url}}
+        ]}]
+    }
+
+
+def presigned(signature):
+    return f"https://bucket.s3.amazonaws.com/tiles/43/P/GP/2024/1/1/0/TCI.jp2?X-Amz-Signature={signature}&X-Amz-Expires=3600"
+
+
+@pytest.fixture
+def sample_analysis(make_gee_data, make_sentinel_data):
+    """Low-risk AnalysisResult for guidance rendering"""
+    return AnalysisResult(
+        gee_data=make_gee_data(),
+        sentinel_data=make_sentinel_data(image_url=presigned('abc')),
+        bedrock_reasoning=BedrockResponse(
+            risk_classification='low',
+            confidence_score=0.85,
+            explanation='Healthy vegetation',
+            visual_observations='Green vegetation',
+            recommendations=['Maintain practices']
+        ),
+        risk_level='low',
+        confidence=0.85,
+        analysis_timestamp=datetime(2024, 1, 1)
+    )
+
+
+def multimodal_call(service, ndvi=0.45, url=None):
+    return service._bedrock_multimodal_analysis(
+        ndvi_value=ndvi,
+        image_url=url or presigned('abc'),
+        coordinates=(12.9716, 77.5946),
+        additional_context={
+            'gee_metadata': {'sensor': 'MODIS', 'cloud_cover': 10.0},
+            'sentinel_metadata': {'tile_id': '43PGP', 'quality': 'usable'}
+        }
+    )
+
+
+@pytest.fixture
+def service(brain):
+    """Shared BrainService with an in-memory Bedrock cache"""
+    brain.bedrock_cache = BedrockResponseCache(MemoryNDVICacheBackend(100))
+    return brain
+
+
+class TestCacheKey:
+    """Test request hashing"""
+
+    def test_presigned_signature_ignored(self):
+        """Test URLs differing only in signature share a key"""
+        assert BedrockResponseCache.key_for(SONNET, image_request(presigned('a'))) == \
+            BedrockResponseCache.key_for(SONNET, image_request(presigned('b')))
+
+    def test_inputs_change_key(self):
+        """Test prompt, image object and model all affect the key"""
+        base = BedrockResponseCache.key_for(SONNET, image_request(presigned('a')))
+        other_tile = presigned('a').replace('GP', 'GQ')
+
+        assert base != BedrockResponseCache.key_for(SONNET, image_request(presigned('a'), text="Other"))
+        assert base != BedrockResponseCache.key_for(SONNET, image_request(other_tile))
+        assert base != BedrockResponseCache.key_for('other-model', image_request(presigned('a')))
+
+    def test_key_independent_of_dict_order(self):
+        """Test canonical JSON makes key order irrelevant"""
+        assert BedrockResponseCache.key_for(SONNET, {'a': 1, 'b': 2}) == \
+            BedrockResponseCache.key_for(SONNET, {'b': 2, 'a': 1})
+
+
+class TestCacheBackends:
+    """Test bounds and persistence"""
+
+    def test_round_trip_and_stats(self):
+        """Test stored bodies are returned and counted"""
+        cache = BedrockResponseCache(MemoryNDVICacheBackend(10))
+        cache.set('k', {'content': [{'text': 'hi'}]})
+
+        assert cache.get('k') == {'content': [{'text': 'hi'}]}
+        assert cache.get('missing') is None
+        assert cache.stats()['hit_rate'] == 0.5
+
+    def test_sqlite_ttl(self, tmp_path):
+        """Test entries expire after the TTL"""
+        now = [1000.0]
+        cache = BedrockResponseCache(
+            SQLiteNDVICacheBackend(str(tmp_path / 'b.sqlite3'), clock=lambda: now[0], table='bedrock_cache'),
+            ttl_seconds=60
+        )
+        cache.set('k', {'v': 1})
+
+        now[0] += 59
+        assert cache.get('k') == {'v': 1}
+        now[0] += 2
+        assert cache.get('k') is None
+
+    def test_sqlite_size_bound(self, tmp_path):
+        """Test the SQLite backend keeps at most max_entries rows"""
+        backend = SQLiteNDVICacheBackend(str(tmp_path / 'b.sqlite3'), table='bedrock_cache', max_entries=3)
+        cache = BedrockResponseCache(backend)
+        for index in range(5):
+            cache.set(f'k{index}', {'v': index})
+
+        assert len(backend) == 3
+
+    def test_sqlite_shares_file_with_ndvi_cache(self, tmp_path):
+        """Test separate tables keep NDVI and Bedrock entries apart"""
+        path = str(tmp_path / 'shared.sqlite3')
+        ndvi = SQLiteNDVICacheBackend(path)
+        bedrock = SQLiteNDVICacheBackend(path, table='bedrock_cache')
+        ndvi.set('k', 'ndvi', 60)
+        bedrock.set('k', 'bedrock', 60)
+        bedrock.clear()
+
+        assert ndvi.get('k') == 'ndvi'
+        assert bedrock.get('k') is None
+
+    def test_invalid_table_rejected(self, tmp_path):
+        """Test table names are restricted to identifiers"""
+        with pytest.raises(ValueError):
+            SQLiteNDVICacheBackend(str(tmp_path / 'b.sqlite3'), table='x; DROP TABLE y')
+
+    def test_create_from_settings(self, tmp_path):
+        """Test backend selection"""
+        assert create_bedrock_cache('none') is None
+        assert isinstance(create_bedrock_cache('memory').backend, MemoryNDVICacheBackend)
+        with pytest.raises(ValueError):
+            create_bedrock_cache('memcached')
+
+
+class TestBrainServiceCaching:
+    """Test BrainService Bedrock calls go through the cache"""
+
+    @pytest.mark.asyncio
+    async def test_guidance_rerender_hits_cache(self, service, bedrock_reply, sample_analysis):
+        """Test the same analysis renders guidance with one Haiku call"""
+        with patch.object(service.bedrock_client, 'invoke_model',
+                          side_effect=lambda **kwargs: bedrock_reply('Water your crop.')) as invoke:
+            first = await service.generate_farmer_guidance(sample_analysis, 'English')
+            second = await service.generate_farmer_guidance(sample_analysis, 'English')
+            await service.generate_farmer_guidance(sample_analysis, 'Kannada')
+
+        assert first == second == 'Water your crop.'
+        assert invoke.call_count == 2
+        assert service.get_service_info()['bedrock_cache']['hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_rescan_with_new_presigned_url_hits_cache(self, service, bedrock_analysis_reply):
+        """Test identical NDVI, tile and image reuse the analysis"""
+        with patch.object(service.bedrock_client, 'invoke_model',
+                          side_effect=lambda **kwargs: bedrock_analysis_reply()) as invoke:
+            first = await multimodal_call(service, 0.45, presigned('first'))
+            second = await multimodal_call(service, 0.4501, presigned('second'))
+            await multimodal_call(service, 0.52)
+
+        assert first == second
+        assert invoke.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_not_cached(self, service, bedrock_analysis_reply):
+        """Test a failed call is retried on the next request"""
+        with patch.object(service.bedrock_client, 'invoke_model', side_effect=Exception('API Error')):
+            fallback = await multimodal_call(service)
+        with patch.object(service.bedrock_client, 'invoke_model',
+                          side_effect=lambda **kwargs: bedrock_analysis_reply()) as invoke:
+            result = await multimodal_call(service)
+
+        assert fallback.visual_observations.endswith('(fallback mode)')
+        assert result.risk_classification == 'medium'
+        assert invoke.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self, service, bedrock_analysis_reply):
+        """Test in-flight identical requests are coalesced"""
+        release = threading.Event()
+
+        def slow_invoke(**kwargs):
+            release.wait(5)
+            return bedrock_analysis_reply()
+
+        with patch.object(service.bedrock_client, 'invoke_model', side_effect=slow_invoke) as invoke:
+            tasks = [asyncio.ensure_future(multimodal_call(service)) for _ in range(5)]
+            await asyncio.sleep(0.05)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        assert invoke.call_count == 1
+        assert all(result == results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_persistent_cache_survives_restart(self, tmp_path, bedrock_analysis_reply):
+        """Test a new service with the same SQLite file skips Bedrock"""
+        def sqlite_cache():
+            return BedrockResponseCache(SQLiteNDVICacheBackend(str(tmp_path / 'b.sqlite3'), table='bedrock_cache'))
+
+        first = BrainService(use_mock_gee=True, bedrock_cache=sqlite_cache())
+        with patch.object(first.bedrock_client, 'invoke_model', side_effect=lambda **kwargs: bedrock_analysis_reply()):
+            await multimodal_call(first)
+
+        second = BrainService(use_mock_gee=True, bedrock_cache=sqlite_cache())
+        with patch.object(second.bedrock_client, 'invoke_model', side_effect=Exception('should not be called')):
+            result = await multimodal_call(second)
+
+        assert result.risk_classification == 'medium'
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_always_calls_bedrock(self, brain, bedrock_reply, sample_analysis):
+        """Test the default none backend leaves every call uncached"""
+        with patch.object(brain.bedrock_client, 'invoke_model',
+                          side_effect=lambda **kwargs: bedrock_reply('Water your crop.')) as invoke:
+            await brain.generate_farmer_guidance(sample_analysis)
+            await brain.generate_farmer_guidance(sample_analysis)
+
+        assert invoke.call_count == 2
+        assert brain.get_service_info()['bedrock_cache'] is None
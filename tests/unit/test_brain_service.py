@@ -207,6 +207,33 @@ class TestAnalyzePlot:
                     assert isinstance(result, AnalysisResult)
 
 
+    @pytest.mark.asyncio
+    async def test_analyze_plot_unusable_scene_skips_bedrock(self):
+        """Test a cloud-covered scene is analyzed from NDVI without calling Bedrock"""
+        service = BrainService(use_mock_gee=True)
+        cloudy_scene = SentinelData(
+            image_url='http://example.com/image.jpg',
+            tile_id='43PPGP',
+            acquisition_date=datetime.now(),
+            cloud_cover_percentage=82.0,
+            resolution='60m',
+            quality_assessment='unusable',
+            metadata={}
+        )
+        
+        with patch.object(service.sentinel_service, 'get_latest_image', new_callable=AsyncMock) as mock_sentinel:
+            mock_sentinel.return_value = cloudy_scene
+            with patch.object(service, '_bedrock_multimodal_analysis', new_callable=AsyncMock) as mock_bedrock:
+                with patch.object(service, '_get_image_chip', new_callable=AsyncMock) as mock_chip:
+                    result = await service.analyze_plot(12.9716, 77.5946)
+        
+        mock_bedrock.assert_not_called()
+        mock_chip.assert_not_called()
+        assert result.sentinel_data.cloud_cover_percentage == 82.0
+        assert '82% cloud covered' in result.bedrock_reasoning.explanation
+        assert service.get_service_info()['unusable_scenes_skipped'] == 1
+
+
 class TestClassifyUrgency:
     """Test urgency classification"""
     
@@ -0,0 +1,190 @@
+"""
+Unit Tests for the on-disk chip cache
+
+Tests chip caching including:
+- Content keys from tile, acquisition date and plot window
+- Byte budget with least-recently-used eviction
+- Atomic writes shared by several cache instances (worker processes)
+- SentinelService serving repeated chips without reading imagery
+"""
+
+import pytest
+import os
+import threading
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+
+from services.chip_cache import ChipCache
+from services.image_chips import ImageChip, read_chip
+from services.sentinel_service import SentinelData, SentinelService
+from tests.geotiff import write_geotiff
+
+LAT, LON = 12.9716, 77.5946
+ACQUIRED = datetime(2024, 1, 5)
+
+
+def chip(size_bytes=1000, fill='A'):
+    return ImageChip(
+        data_base64=fill * size_bytes,
+        media_type='image/jpeg',
+        width=256,
+        height=256,
+        resolution_m=10.0,
+        center=(LAT, LON),
+        size_bytes=size_bytes
+    )
+
+
+def key(lat=LAT, acquired=ACQUIRED, size_px=256):
+    return ChipCache.key_for('43PGP', acquired, lat, LON, size_px, 10.0, 'jpeg')
+
+
+def age(cache, cache_key, mtime):
+    """Backdate a stored chip's last use"""
+    os.utime(cache._path(cache_key), (mtime, mtime))
+
+
+class TestChipCacheKey:
+    """Test content keys"""
+
+    def test_same_window_same_key(self):
+        """Test sub-metre jitter in the plot centre keeps the key"""
+        assert key(LAT) == key(LAT + 1e-7)
+
+    def test_scene_and_window_change_key(self):
+        """Test a new acquisition, another plot or another chip size miss"""
+        assert key() != key(acquired=datetime(2024, 1, 10))
+        assert key() != key(lat=LAT + 0.001)
+        assert key() != key(size_px=128)
+
+
+class TestChipCacheStore:
+    """Test storage, eviction and counters"""
+
+    def test_round_trip_and_stats(self, tmp_path):
+        """Test stored chips are returned and bytes served are counted"""
+        cache = ChipCache(str(tmp_path))
+        cache.set(key(), chip(500))
+
+        assert cache.get(key()) == chip(500)
+        assert cache.get(key(lat=0.0)) is None
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['bytes_served']) == (1, 1, 500)
+        assert stats['hit_rate'] == 0.5
+
+    def test_lru_eviction_keeps_recently_used(self, tmp_path):
+        """Test the least recently used chip is evicted beyond the byte budget"""
+        cache = ChipCache(str(tmp_path), max_bytes=2 * len(chip().model_dump_json()) + 100)
+        first, second, third = key(LAT), key(LAT + 0.01), key(LAT + 0.02)
+        cache.set(first, chip())
+        cache.set(second, chip())
+        age(cache, first, 1000)
+        age(cache, second, 2000)
+
+        cache.get(first)
+        cache.set(third, chip())
+
+        assert cache.get(first) is not None
+        assert cache.get(second) is None
+        assert cache.get(third) is not None
+        assert cache.stats()['evictions'] == 1
+        assert cache.stats()['bytes_stored'] <= cache.max_bytes
+
+    def test_budget_shared_across_instances(self, tmp_path):
+        """Test eviction accounts for chips written by other processes"""
+        budget = 3 * len(chip().model_dump_json()) + 100
+        writers = [ChipCache(str(tmp_path), max_bytes=budget) for _ in range(2)]
+        for index in range(6):
+            writers[index % 2].set(key(LAT + index * 0.01), chip())
+
+        stored = sum(path.stat().st_size for path in tmp_path.glob('*/*.json'))
+        assert stored <= budget
+
+    def test_concurrent_writers_never_expose_partial_chips(self, tmp_path):
+        """Test readers see a complete chip or a miss while others rewrite it"""
+        caches = [ChipCache(str(tmp_path)) for _ in range(4)]
+        stop = threading.Event()
+
+        def write(cache, fill):
+            while not stop.is_set():
+                cache.set(key(), chip(20000, fill))
+
+        writers = [threading.Thread(target=write, args=(cache, fill)) for cache, fill in zip(caches[:2], 'AB')]
+        for writer in writers:
+            writer.start()
+        try:
+            for _ in range(300):
+                result = caches[2].get(key())
+                assert result is None or result.data_base64 in ('A' * 20000, 'B' * 20000)
+        finally:
+            stop.set()
+            for writer in writers:
+                writer.join()
+
+        assert caches[2].stats()['errors'] == 0
+        assert not list(tmp_path.glob('*/.*.tmp'))
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        """Test an unreadable file is discarded instead of failing the analysis"""
+        cache = ChipCache(str(tmp_path))
+        cache.set(key(), chip())
+        cache._path(key()).write_text('{"data_base64": ')
+
+        assert cache.get(key()) is None
+        assert not cache._path(key()).exists()
+        assert cache.stats()['errors'] == 1
+
+
+class TestSentinelServiceChipCache:
+    """Test SentinelService consults the chip cache"""
+
+    @pytest.fixture
+    def service(self, tmp_path):
+        with patch('services.sentinel_service.get_client'):
+            service = SentinelService(region='ap-south-1')
+        service.chip_cache = ChipCache(str(tmp_path / 'chips'))
+        return service
+
+    @pytest.fixture
+    def scene(self, tmp_path):
+        path = write_geotiff(str(tmp_path / 'scene.tif'), np.full((3, 2048, 2048), 90, dtype=np.uint8))
+        return SentinelData(
+            image_url=path,
+            tile_id='43PGP',
+            acquisition_date=ACQUIRED,
+            cloud_cover_percentage=5.0,
+            resolution='10m',
+            quality_assessment='usable',
+            metadata={}
+        )
+
+    @pytest.mark.asyncio
+    async def test_rescan_served_from_cache(self, service, scene):
+        """Test a repeated chip skips the imagery read"""
+        with patch('services.sentinel_service.read_chip', side_effect=read_chip) as reader:
+            first = await service.get_image_chip(scene, LAT, LON)
+            second = await service.get_image_chip(scene, LAT, LON)
+
+        assert reader.call_count == 1
+        assert first == second
+        assert service.get_chip_cache_stats()['bytes_served'] == first.size_bytes
+
+    @pytest.mark.asyncio
+    async def test_new_acquisition_reads_imagery(self, service, scene):
+        """Test a newer scene of the same tile is not served the old chip"""
+        with patch('services.sentinel_service.read_chip', side_effect=read_chip) as reader:
+            await service.get_image_chip(scene, LAT, LON)
+            await service.get_image_chip(scene.model_copy(update={'acquisition_date': datetime(2024, 1, 10)}),
+                                         LAT, LON)
+
+        assert reader.call_count == 2
+
+    def test_cache_only_built_with_chips_enabled(self):
+        """Test the default (chips disabled) creates no cache"""
+        with patch('services.sentinel_service.get_client'):
+            service = SentinelService(region='ap-south-1')
+
+        assert service.chip_cache is None
+        assert service.get_chip_cache_stats() is None
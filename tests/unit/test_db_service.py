@@ -290,6 +290,184 @@ class TestJurisdictionStats:
         assert stats.avg_ndvi > 0  # Should have calculated average
 
 
+class TestMaterializedJurisdictionStats:
+    """Test incrementally maintained per-Hobli statistics"""
+    
+    @staticmethod
+    def _plot(sample_plot_data, i, **overrides):
+        return PlotData(
+            **{**sample_plot_data, 'user_id': f"user_{i:03d}", 'plot_id': f"plot_{i:03d}", **overrides},
+            registration_date=datetime.now()
+        )
+    
+    @staticmethod
+    def _alert(sample_alert_data, hours_ago=0, **overrides):
+        return AlertData(
+            **{**sample_alert_data, 'timestamp': datetime.now() - timedelta(hours=hours_ago), **overrides}
+        )
+    
+    def test_register_plot_counts_new_plots_once(self, db_service, sample_plot_data):
+        """Test re-registering a plot does not double count it"""
+        hobli_id = sample_plot_data["hobli_id"]
+        
+        for i in range(3):
+            db_service.register_plot(self._plot(sample_plot_data, i))
+        db_service.register_plot(self._plot(sample_plot_data, 0))
+        
+        assert db_service.get_jurisdiction_stats(hobli_id).total_plots == 3
+    
+    def test_register_plot_moving_hobli_moves_count(self, db_service, sample_plot_data):
+        """Test re-registering a plot under another Hobli moves its count"""
+        db_service.register_plot(self._plot(sample_plot_data, 0))
+        db_service.register_plot(self._plot(sample_plot_data, 0, hobli_id="hobli_mysore_001"))
+        
+        assert db_service.get_jurisdiction_stats(sample_plot_data["hobli_id"]).total_plots == 0
+        assert db_service.get_jurisdiction_stats("hobli_mysore_001").total_plots == 1
+    
+    def test_bulk_register_counts_new_plots_once(self, db_service, sample_plot_data):
+        """Test bulk re-imports only count plots that did not exist yet"""
+        hobli_id = sample_plot_data["hobli_id"]
+        
+        db_service.register_plots_bulk([self._plot(sample_plot_data, i) for i in range(30)])
+        db_service.register_plots_bulk([self._plot(sample_plot_data, i) for i in range(20, 40)])
+        
+        assert db_service.get_jurisdiction_stats(hobli_id).total_plots == 40
+    
+    def test_alert_counters(self, db_service, sample_alert_data):
+        """Test create_alert and create_alerts_bulk maintain alert counters and NDVI"""
+        hobli_id = sample_alert_data["hobli_id"]
+        proof = {**sample_alert_data["gee_proof"]}
+        
+        db_service.create_alert(self._alert(sample_alert_data, 1, risk_level="high",
+                                            gee_proof={**proof, 'ndvi_value': 0.2}))
+        db_service.create_alerts_bulk([
+            self._alert(sample_alert_data, 2, risk_level="critical", gee_proof={**proof, 'ndvi_value': 0.4}),
+            self._alert(sample_alert_data, 3, risk_level="medium", gee_proof={**proof, 'ndvi_value': 0.6})
+        ])
+        
+        stats = db_service.get_jurisdiction_stats(hobli_id)
+        
+        assert stats.active_alerts == 3
+        assert stats.high_priority_alerts == 2
+        assert stats.avg_ndvi == pytest.approx(0.4)
+    
+    def test_overwritten_alert_replaces_contribution(self, db_service, sample_alert_data):
+        """Test writing the same alert key twice keeps a single contribution"""
+        alert = self._alert(sample_alert_data, 1, risk_level="high")
+        
+        db_service.create_alert(alert)
+        db_service.create_alert(alert.copy(update={'risk_level': 'low'}))
+        
+        stats = db_service.get_jurisdiction_stats(alert.hobli_id)
+        assert stats.active_alerts == 1
+        assert stats.high_priority_alerts == 0
+    
+    def test_update_alert_status_adjusts_active_alerts(self, db_service, sample_alert_data):
+        """Test resolving and reopening an alert moves the pending count"""
+        alert = self._alert(sample_alert_data, 1)
+        db_service.create_alert(alert)
+        
+        db_service.update_alert_status(alert.hobli_id, alert.timestamp, "resolved")
+        assert db_service.get_jurisdiction_stats(alert.hobli_id).active_alerts == 0
+        
+        db_service.update_alert_status(alert.hobli_id, alert.timestamp, "resolved", "Visited")
+        assert db_service.get_jurisdiction_stats(alert.hobli_id).active_alerts == 0
+        
+        db_service.update_alert_status(alert.hobli_id, alert.timestamp, "pending")
+        assert db_service.get_jurisdiction_stats(alert.hobli_id).active_alerts == 1
+    
+    def test_alerts_outside_window_excluded(self, db_service, sample_alert_data):
+        """Test alerts older than the 24-hour window do not count"""
+        db_service.create_alert(self._alert(sample_alert_data, 30))
+        db_service.create_alert(self._alert(sample_alert_data, 2))
+        
+        assert db_service.get_jurisdiction_stats(sample_alert_data["hobli_id"]).active_alerts == 1
+    
+    def test_stats_read_is_single_query(self, db_service, sample_plot_data, sample_alert_data, monkeypatch):
+        """Test reading stats no longer touches the plots or alerts tables"""
+        for i in range(5):
+            db_service.register_plot(self._plot(sample_plot_data, i))
+        db_service.create_alert(self._alert(sample_alert_data, 1))
+        
+        def fail(**kwargs):
+            raise AssertionError("stats reads must not query source tables")
+        
+        queries = []
+        original_query = db_service.jurisdiction_stats_table.query
+        
+        def recording_query(**kwargs):
+            queries.append(kwargs)
+            return original_query(**kwargs)
+        
+        monkeypatch.setattr(db_service.plots_table, 'query', fail)
+        monkeypatch.setattr(db_service.alerts_table, 'query', fail)
+        monkeypatch.setattr(db_service.jurisdiction_stats_table, 'query', recording_query)
+        
+        stats = db_service.get_jurisdiction_stats(sample_plot_data["hobli_id"])
+        
+        assert stats.total_plots == 5
+        assert stats.active_alerts == 1
+        assert len(queries) == 1
+    
+    def test_stats_failure_does_not_fail_write(self, db_service, sample_plot_data, monkeypatch):
+        """Test a failed counter update is logged and leaves the plot registered"""
+        from botocore.exceptions import ClientError
+        
+        def fail_update(**kwargs):
+            raise ClientError({'Error': {'Code': 'ResourceNotFoundException', 'Message': 'missing'}}, 'UpdateItem')
+        
+        monkeypatch.setattr(db_service.jurisdiction_stats_table, 'update_item', fail_update)
+        
+        db_service.register_plot(self._plot(sample_plot_data, 0))
+        
+        assert db_service.get_plot_by_id("user_000", "plot_000") is not None
+    
+    def test_verify_and_rebuild_repair_drift(self, db_service, sample_plot_data, sample_alert_data):
+        """Test verify reports drift and rebuild repairs it, removing stale buckets"""
+        hobli_id = sample_plot_data["hobli_id"]
+        for i in range(4):
+            db_service.register_plot(self._plot(sample_plot_data, i))
+        db_service.create_alert(self._alert(sample_alert_data, 1, hobli_id=hobli_id))
+        
+        assert db_service.verify_jurisdiction_stats(hobli_id)['in_sync']
+        
+        # Corrupt the totals and add a bucket that has no alerts behind it
+        stale_key = db_service._stats_bucket_key(datetime.now() - timedelta(hours=5))
+        db_service.jurisdiction_stats_table.put_item(
+            Item={'hobli_id': hobli_id, 'stat_key': 'TOTAL', 'total_plots': 99}
+        )
+        db_service.jurisdiction_stats_table.put_item(
+            Item={'hobli_id': hobli_id, 'stat_key': stale_key, 'pending_alerts': 7}
+        )
+        
+        report = db_service.verify_jurisdiction_stats(hobli_id)
+        assert not report['in_sync']
+        assert report['drift']['total_plots'] == {'materialized': 99, 'computed': 4}
+        assert report['drift']['active_alerts'] == {'materialized': 8, 'computed': 1}
+        
+        stats = db_service.rebuild_jurisdiction_stats(hobli_id)
+        
+        assert stats.total_plots == 4
+        assert stats.active_alerts == 1
+        assert db_service.verify_jurisdiction_stats(hobli_id)['in_sync']
+        assert 'Item' not in db_service.jurisdiction_stats_table.get_item(
+            Key={'hobli_id': hobli_id, 'stat_key': stale_key}
+        )
+    
+    def test_get_known_hobli_ids(self, db_service, sample_plot_data, sample_hobli_directory):
+        """Test Hoblis are discovered from both the directory and the plots"""
+        from services.db_service import HobliDirectory
+        
+        db_service.register_hobli(HobliDirectory(
+            **{**sample_hobli_directory, 'hobli_id': "hobli_directory_only"},
+            created_date=datetime.now(),
+            last_updated=datetime.now()
+        ))
+        db_service.register_plot(self._plot(sample_plot_data, 0, hobli_id="hobli_plots_only"))
+        
+        assert db_service.get_known_hobli_ids() == ["hobli_directory_only", "hobli_plots_only"]
+
+
 class TestDataConversion:
     """Test float/Decimal conversion for DynamoDB compatibility"""
     
@@ -651,6 +829,135 @@ class TestGSIPerformance:
         assert len(hoblis) == 5
         assert all(hobli.officer_id == officer_id for hobli in hoblis)
     
+    def test_officer_hoblis_uses_gsi_query(self, db_service, sample_hobli_directory, monkeypatch):
+        """Test officer lookups query the officer GSI instead of scanning the table"""
+        from services.db_service import HobliDirectory
+        
+        db_service.register_hobli(HobliDirectory(
+            **sample_hobli_directory,
+            created_date=datetime.now(),
+            last_updated=datetime.now()
+        ))
+        
+        def fail_scan(**kwargs):
+            raise AssertionError("get_officer_hoblis must not scan the directory table")
+        
+        queries = []
+        original_query = db_service.hobli_directory_table.query
+        
+        def recording_query(**kwargs):
+            queries.append(kwargs)
+            return original_query(**kwargs)
+        
+        monkeypatch.setattr(db_service.hobli_directory_table, 'scan', fail_scan)
+        monkeypatch.setattr(db_service.hobli_directory_table, 'query', recording_query)
+        
+        hoblis = db_service.get_officer_hoblis(sample_hobli_directory["officer_id"])
+        
+        assert len(hoblis) == 1
+        assert queries[0]['IndexName'] == 'officer_id-last_updated-index'
+    
+    def test_officer_hoblis_follows_pagination(self, db_service, sample_hobli_directory, monkeypatch):
+        """Test officer GSI queries read every page of results"""
+        from services.db_service import HobliDirectory
+        
+        officer_id = sample_hobli_directory["officer_id"]
+        for i in range(7):
+            db_service.register_hobli(HobliDirectory(
+                **{**sample_hobli_directory, 'hobli_id': f"hobli_bangalore_{i:03d}"},
+                created_date=datetime.now(),
+                last_updated=datetime.now() - timedelta(minutes=i)
+            ))
+        
+        pages = []
+        original_query = db_service.hobli_directory_table.query
+        
+        def small_page_query(**kwargs):
+            response = original_query(Limit=2, **kwargs)
+            pages.append(len(response['Items']))
+            return response
+        
+        monkeypatch.setattr(db_service.hobli_directory_table, 'query', small_page_query)
+        
+        hoblis = db_service.get_officer_hoblis(officer_id)
+        
+        assert sorted(h.hobli_id for h in hoblis) == [f"hobli_bangalore_{i:03d}" for i in range(7)]
+        assert len(pages) >= 4
+    
+    @pytest.mark.slow
+    def test_officer_lookup_scan_vs_query_benchmark(self, db_service, sample_hobli_directory):
+        """Compare read capacity and latency of scan vs GSI query on a 5k-row directory"""
+        import math
+        import time
+        
+        total_hoblis = 5000
+        officer_count = 500
+        now = datetime.now()
+        
+        with db_service.hobli_directory_table.batch_writer() as batch:
+            for i in range(total_hoblis):
+                batch.put_item(Item={
+                    **sample_hobli_directory,
+                    'hobli_id': f"hobli_{i:05d}",
+                    'hobli_name': f"Hobli {i}",
+                    'officer_id': f"officer_{i % officer_count:03d}",
+                    'created_date': now.isoformat(),
+                    'last_updated': (now - timedelta(minutes=i)).isoformat()
+                })
+        
+        table = db_service.hobli_directory_table
+        all_items = []
+        scan_params = {}
+        while True:
+            response = table.scan(**scan_params)
+            all_items.extend(response['Items'])
+            if 'LastEvaluatedKey' not in response:
+                break
+            scan_params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        
+        def estimated_rcu(items):
+            # Eventually consistent reads: 0.5 RCU per 4 KB read
+            size = sum(len(k) + len(str(v)) for item in items for k, v in item.items())
+            return math.ceil(size / 4096) * 0.5
+        
+        officer_id = "officer_042"
+        officer_items = [item for item in all_items if item['officer_id'] == officer_id]
+        
+        def scan_lookup():
+            params = {
+                'FilterExpression': 'officer_id = :officer_id',
+                'ExpressionAttributeValues': {':officer_id': officer_id}
+            }
+            items = []
+            while True:
+                response = table.scan(**params)
+                items.extend(response['Items'])
+                if 'LastEvaluatedKey' not in response:
+                    return items
+                params['ExclusiveStartKey'] = response['LastEvaluatedKey']
+        
+        def query_lookup():
+            db_service.hobli_cache.clear()
+            return db_service.get_officer_hoblis(officer_id)
+        
+        def timed(fn, runs=5):
+            start = time.perf_counter()
+            for _ in range(runs):
+                result = fn()
+            return result, (time.perf_counter() - start) / runs * 1000
+        
+        scanned, scan_ms = timed(scan_lookup)
+        queried, query_ms = timed(query_lookup)
+        
+        assert len(scanned) == len(queried) == total_hoblis // officer_count
+        scan_rcu = estimated_rcu(all_items)
+        query_rcu = estimated_rcu(officer_items)
+        assert query_rcu < scan_rcu
+        
+        print(f"\nOfficer lookup on {total_hoblis} Hoblis: "
+              f"scan {scan_rcu:.1f} RCU / {scan_ms:.1f} ms, "
+              f"GSI query {query_rcu:.1f} RCU / {query_ms:.1f} ms")
+    
     def test_gsi_limit_parameter(self, db_service, sample_plot_data):
         """Test that GSI queries respect limit parameter"""
         hobli_id = sample_plot_data["hobli_id"]
@@ -676,6 +983,711 @@ class TestGSIPerformance:
         assert len(plots) == 10
 
 
+class TestBulkWrites:
+    """Test BatchWriteItem-based bulk registration and alert creation"""
+    
+    @staticmethod
+    def _make_alerts(sample_alert_data, count):
+        base_time = datetime.now()
+        return [
+            AlertData(
+                **{**sample_alert_data, "plot_id": f"plot_{i:05d}", "hobli_id": f"hobli_{i % 7:03d}"},
+                timestamp=base_time - timedelta(seconds=i)
+            )
+            for i in range(count)
+        ]
+    
+    def test_register_plots_bulk(self, db_service, sample_plot_data):
+        """Test bulk plot registration writes every plot"""
+        plots = [
+            PlotData(**{**sample_plot_data, "user_id": f"user_{i:03d}", "plot_id": f"plot_{i:03d}"},
+                     registration_date=datetime.now())
+            for i in range(60)
+        ]
+        
+        result = db_service.register_plots_bulk(plots)
+        
+        assert result.all_succeeded
+        assert len(result.succeeded) == 60
+        assert result.request_count == 3  # 25 + 25 + 10
+        assert len(db_service.get_hobli_plots(sample_plot_data["hobli_id"], limit=100)) == 60
+        assert "user_007/plot_007" in result.succeeded
+    
+    def test_create_alerts_bulk_request_count(self, db_service, sample_alert_data):
+        """Test 1000 alerts cost 40 requests instead of 1000"""
+        alerts = self._make_alerts(sample_alert_data, 1000)
+        
+        result = db_service.create_alerts_bulk(alerts)
+        
+        assert result.all_succeeded
+        assert len(result.succeeded) == 1000
+        assert result.request_count == 40
+        assert len(db_service.get_recent_alerts("hobli_000", limit=1000)) == 143
+    
+    def test_bulk_retries_unprocessed_items(self, db_service, sample_alert_data, monkeypatch):
+        """Test UnprocessedItems are retried with backoff until written"""
+        alerts = self._make_alerts(sample_alert_data, 10)
+        real_batch_write = db_service.dynamodb.batch_write_item
+        calls = []
+        sleeps = []
+        
+        def flaky_batch_write(RequestItems):
+            requests = RequestItems[db_service.alerts_table_name]
+            calls.append(len(requests))
+            if len(calls) == 1:
+                # Accept the first 4 items and hand the rest back as unprocessed
+                real_batch_write(RequestItems={db_service.alerts_table_name: requests[:4]})
+                return {'UnprocessedItems': {db_service.alerts_table_name: requests[4:]}}
+            return real_batch_write(RequestItems=RequestItems)
+        
+        monkeypatch.setattr(db_service.dynamodb, "batch_write_item", flaky_batch_write)
+        monkeypatch.setattr("services.db_service.time.sleep", sleeps.append)
+        
+        result = db_service.create_alerts_bulk(alerts)
+        
+        assert result.all_succeeded
+        assert len(result.succeeded) == 10
+        assert calls == [10, 6]
+        assert len(sleeps) == 1
+    
+    def test_bulk_reports_items_unprocessed_after_retries(self, db_service, sample_alert_data, monkeypatch):
+        """Test items still unprocessed after max retries are reported as failed"""
+        alerts = self._make_alerts(sample_alert_data, 5)
+        sleeps = []
+        
+        def always_unprocessed(RequestItems):
+            return {'UnprocessedItems': RequestItems}
+        
+        monkeypatch.setattr(db_service.dynamodb, "batch_write_item", always_unprocessed)
+        monkeypatch.setattr("services.db_service.time.sleep", sleeps.append)
+        db_service.batch_write_max_retries = 3
+        
+        result = db_service.create_alerts_bulk(alerts)
+        
+        assert result.succeeded == []
+        assert len(result.failed) == 5
+        assert result.request_count == 4
+        # Exponential backoff: each delay (before jitter) doubles
+        assert len(sleeps) == 3
+        assert sleeps[0] < sleeps[2]
+    
+    def test_bulk_retries_throttling_errors(self, db_service, sample_alert_data, monkeypatch):
+        """Test throttling ClientErrors are retried rather than failing the batch"""
+        from botocore.exceptions import ClientError
+        
+        alerts = self._make_alerts(sample_alert_data, 3)
+        real_batch_write = db_service.dynamodb.batch_write_item
+        attempts = []
+        
+        def throttled_once(RequestItems):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ClientError(
+                    {'Error': {'Code': 'ProvisionedThroughputExceededException', 'Message': 'slow down'}},
+                    'BatchWriteItem'
+                )
+            return real_batch_write(RequestItems=RequestItems)
+        
+        monkeypatch.setattr(db_service.dynamodb, "batch_write_item", throttled_once)
+        monkeypatch.setattr("services.db_service.time.sleep", lambda seconds: None)
+        
+        result = db_service.create_alerts_bulk(alerts)
+        
+        assert result.all_succeeded
+        assert len(attempts) == 2
+    
+    def test_bulk_duplicate_keys_in_batch(self, db_service, sample_alert_data):
+        """Test duplicate primary keys keep the last item and count the superseded one"""
+        timestamp = datetime.now()
+        alerts = [
+            AlertData(**{**sample_alert_data, "message": "first"}, timestamp=timestamp),
+            AlertData(**{**sample_alert_data, "message": "second"}, timestamp=timestamp)
+        ]
+        
+        result = db_service.create_alerts_bulk(alerts)
+        
+        alert_id = f"{sample_alert_data['hobli_id']}@{timestamp.isoformat()}"
+        assert result.succeeded == [alert_id]
+        assert result.failed == {}
+        assert result.duplicates == 1
+        stored = db_service.get_recent_alerts(sample_alert_data["hobli_id"])
+        assert [a.message for a in stored] == ["second"]
+    
+    def test_bulk_duplicate_plots_across_chunks(self, db_service, sample_plot_data):
+        """Test a plot repeated in different chunks is written once and never reported failed"""
+        plots = [
+            PlotData(**{**sample_plot_data, "plot_id": f"plot_{i:03d}"}, registration_date=datetime.now())
+            for i in range(30)
+        ]
+        plots.append(PlotData(**{**sample_plot_data, "plot_id": "plot_000", "crop": "ragi"},
+                              registration_date=datetime.now()))
+        
+        result = db_service.register_plots_bulk(plots)
+        
+        assert result.all_succeeded
+        assert result.duplicates == 1
+        assert sorted(result.succeeded) == sorted(set(result.succeeded))
+        assert len(result.succeeded) == 30
+        assert result.request_count == 2
+        stored = db_service.get_hobli_plots(sample_plot_data["hobli_id"], limit=100)
+        assert len(stored) == 30
+        assert next(p for p in stored if p.plot_id == "plot_000").crop == "ragi"
+    
+    def test_bulk_empty_input(self, db_service):
+        """Test bulk writes with no items make no requests"""
+        result = db_service.create_alerts_bulk([])
+        
+        assert result.succeeded == []
+        assert result.request_count == 0
+
+
+class TestHobliDirectoryCache:
+    """Test the read-through cache in front of Hobli directory lookups"""
+    
+    @staticmethod
+    def _register(db_service, sample_hobli_directory, **overrides):
+        from services.db_service import HobliDirectory
+        
+        hobli_data = HobliDirectory(
+            **{**sample_hobli_directory, **overrides},
+            created_date=datetime.now(),
+            last_updated=datetime.now()
+        )
+        db_service.register_hobli(hobli_data)
+        return hobli_data
+    
+    @staticmethod
+    def _count_calls(monkeypatch, table, method):
+        calls = []
+        original = getattr(table, method)
+        
+        def counting(*args, **kwargs):
+            calls.append(kwargs)
+            return original(*args, **kwargs)
+        
+        monkeypatch.setattr(table, method, counting)
+        return calls
+    
+    def test_repeated_lookups_hit_cache(self, db_service, sample_hobli_directory, monkeypatch):
+        """Test repeated directory lookups only read DynamoDB once"""
+        self._register(db_service, sample_hobli_directory)
+        calls = self._count_calls(monkeypatch, db_service.hobli_directory_table, 'get_item')
+        hobli_id = sample_hobli_directory["hobli_id"]
+        
+        for _ in range(5):
+            hobli = db_service.get_hobli_directory(hobli_id)
+            assert hobli.officer_id == sample_hobli_directory["officer_id"]
+        
+        assert len(calls) == 1
+        stats = db_service.get_cache_stats()
+        assert stats['hits'] == 4
+        assert stats['misses'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_officer_by_hobli_uses_cache(self, db_service, sample_hobli_directory, monkeypatch):
+        """Test officer lookups for alerts are served from the directory cache"""
+        self._register(db_service, sample_hobli_directory)
+        calls = self._count_calls(monkeypatch, db_service.hobli_directory_table, 'get_item')
+        
+        for _ in range(10):
+            officer = await db_service.get_officer_by_hobli(sample_hobli_directory["hobli_id"])
+            assert officer['officer_id'] == sample_hobli_directory["officer_id"]
+        
+        assert len(calls) == 1
+    
+    def test_missing_hobli_is_cached(self, db_service, monkeypatch):
+        """Test 'not found' results are cached too"""
+        calls = self._count_calls(monkeypatch, db_service.hobli_directory_table, 'get_item')
+        
+        assert db_service.get_hobli_directory("nonexistent_hobli") is None
+        assert db_service.get_hobli_directory("nonexistent_hobli") is None
+        
+        assert len(calls) == 1
+    
+    def test_cached_entries_are_copies(self, db_service, sample_hobli_directory):
+        """Test callers mutating a result do not corrupt the cache"""
+        self._register(db_service, sample_hobli_directory)
+        hobli_id = sample_hobli_directory["hobli_id"]
+        
+        db_service.get_hobli_directory(hobli_id).officer_name = "Mutated"
+        
+        assert db_service.get_hobli_directory(hobli_id).officer_name == sample_hobli_directory["officer_name"]
+    
+    def test_update_officer_invalidates(self, db_service, sample_hobli_directory):
+        """Test officer reassignment is visible immediately to both lookups"""
+        self._register(db_service, sample_hobli_directory)
+        hobli_id = sample_hobli_directory["hobli_id"]
+        old_officer = sample_hobli_directory["officer_id"]
+        
+        # Warm both caches
+        db_service.get_hobli_directory(hobli_id)
+        assert len(db_service.get_officer_hoblis(old_officer)) == 1
+        assert db_service.get_officer_hoblis("officer_002") == []
+        
+        db_service.update_hobli_officer(
+            hobli_id, "officer_002", "Extension Officer Sharma",
+            "+919876543211", "sharma@agriculture.gov.in"
+        )
+        
+        assert db_service.get_hobli_directory(hobli_id).officer_id == "officer_002"
+        assert db_service.get_officer_hoblis(old_officer) == []
+        assert [h.hobli_id for h in db_service.get_officer_hoblis("officer_002")] == [hobli_id]
+    
+    def test_register_invalidates(self, db_service, sample_hobli_directory):
+        """Test registering a Hobli replaces a cached 'not found'"""
+        hobli_id = sample_hobli_directory["hobli_id"]
+        officer_id = sample_hobli_directory["officer_id"]
+        
+        assert db_service.get_hobli_directory(hobli_id) is None
+        assert db_service.get_officer_hoblis(officer_id) == []
+        
+        self._register(db_service, sample_hobli_directory)
+        
+        assert db_service.get_hobli_directory(hobli_id) is not None
+        assert len(db_service.get_officer_hoblis(officer_id)) == 1
+    
+    def test_entries_expire_after_ttl(self, db_service, sample_hobli_directory, monkeypatch):
+        """Test entries are reloaded once cache_ttl_seconds has elapsed"""
+        from services.cache import TTLCache
+        
+        now = [0.0]
+        db_service.hobli_cache = TTLCache(max_entries=16, ttl_seconds=60, clock=lambda: now[0])
+        self._register(db_service, sample_hobli_directory)
+        calls = self._count_calls(monkeypatch, db_service.hobli_directory_table, 'get_item')
+        hobli_id = sample_hobli_directory["hobli_id"]
+        
+        db_service.get_hobli_directory(hobli_id)
+        now[0] = 59.0
+        db_service.get_hobli_directory(hobli_id)
+        assert len(calls) == 1
+        
+        now[0] = 61.0
+        db_service.get_hobli_directory(hobli_id)
+        assert len(calls) == 2
+    
+    def test_cache_sized_from_settings(self, db_service):
+        """Test the cache takes its limits from PerformanceConfig"""
+        from config.settings import get_settings
+        
+        performance = get_settings().performance
+        stats = db_service.get_cache_stats()
+        
+        assert stats['ttl_seconds'] == performance.cache_ttl_seconds
+        assert stats['max_entries'] == performance.cache_max_entries
+    
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted first"""
+        from services.cache import TTLCache
+        
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        
+        assert cache.get('a') == (True, 1)
+        assert cache.get('b') == (False, None)
+        assert cache.stats()['evictions'] == 1
+
+
+class TestOfficerFanout:
+    """Test concurrent officer-level aggregations"""
+    
+    @staticmethod
+    def _seed_officer(db_service, sample_hobli_directory, sample_plot_data, hobli_count, plots_per_hobli):
+        """Register hobli_count Hoblis for one officer with plots_per_hobli plots each"""
+        from services.db_service import HobliDirectory
+        
+        for h in range(hobli_count):
+            hobli_id = f"hobli_bangalore_{h:03d}"
+            db_service.register_hobli(HobliDirectory(
+                **{**sample_hobli_directory, 'hobli_id': hobli_id},
+                created_date=datetime.now(),
+                last_updated=datetime.now() - timedelta(minutes=h)
+            ))
+            for p in range(plots_per_hobli):
+                db_service.register_plot(PlotData(
+                    **{**sample_plot_data, 'hobli_id': hobli_id,
+                       'user_id': f"user_{h:03d}", 'plot_id': f"plot_{h:03d}_{p:03d}"},
+                    registration_date=datetime.now()
+                ))
+        return sample_hobli_directory["officer_id"]
+    
+    @staticmethod
+    def _track_concurrency(monkeypatch, db_service, method, delay=0.05):
+        """Wrap a DbService method to record its calls and peak concurrency"""
+        import threading
+        import time
+        
+        original = getattr(db_service, method)
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0, 'calls': []}
+        
+        def tracked(*args, **kwargs):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+                state['calls'].append((args, kwargs))
+            try:
+                time.sleep(delay)
+                return original(*args, **kwargs)
+            finally:
+                with lock:
+                    state['active'] -= 1
+        
+        monkeypatch.setattr(db_service, method, tracked)
+        return state
+    
+    async def test_assignment_async_matches_sync(self, db_service, sample_hobli_directory, sample_plot_data):
+        """Test the concurrent assignment aggregates the same totals as the serial one"""
+        officer_id = self._seed_officer(db_service, sample_hobli_directory, sample_plot_data, 4, 3)
+        
+        expected = db_service.get_officer_assignment(officer_id)
+        assignment = await db_service.get_officer_assignment_async(officer_id)
+        
+        assert assignment.total_plots == expected.total_plots == 12
+        assert assignment.active_alerts == expected.active_alerts
+        assert sorted(assignment.hobli_ids) == sorted(expected.hobli_ids)
+    
+    async def test_assignment_async_runs_queries_concurrently(
+        self, db_service, sample_hobli_directory, sample_plot_data, monkeypatch
+    ):
+        """Test per-Hobli stats reads overlap but never exceed max_concurrency"""
+        officer_id = self._seed_officer(db_service, sample_hobli_directory, sample_plot_data, 6, 1)
+        stats_state = self._track_concurrency(monkeypatch, db_service, 'get_jurisdiction_stats')
+        
+        await db_service.get_officer_assignment_async(officer_id, max_concurrency=3)
+        
+        assert len(stats_state['calls']) == 6
+        assert 1 < stats_state['peak'] <= 3
+    
+    async def test_assignment_async_unknown_officer(self, db_service):
+        """Test an officer without Hoblis gets an empty assignment"""
+        assignment = await db_service.get_officer_assignment_async("officer_missing")
+        
+        assert assignment.hobli_ids == []
+        assert assignment.total_plots == 0
+    
+    async def test_jurisdiction_stats_async(self, db_service, sample_hobli_directory, sample_plot_data):
+        """Test async jurisdiction stats match the synchronous version"""
+        self._seed_officer(db_service, sample_hobli_directory, sample_plot_data, 1, 4)
+        
+        stats = await db_service.get_jurisdiction_stats_async("hobli_bangalore_000")
+        
+        assert stats.total_plots == db_service.get_jurisdiction_stats("hobli_bangalore_000").total_plots == 4
+    
+    async def test_officer_plots_async_returns_all(self, db_service, sample_hobli_directory, sample_plot_data):
+        """Test plots from every Hobli are merged when under the limit"""
+        officer_id = self._seed_officer(db_service, sample_hobli_directory, sample_plot_data, 5, 3)
+        
+        plots = await db_service.get_officer_plots_async(officer_id, limit=100)
+        
+        assert len(plots) == 15
+        assert len({p.plot_id for p in plots}) == 15
+    
+    async def test_officer_plots_async_honours_limit(
+        self, db_service, sample_hobli_directory, sample_plot_data, monkeypatch
+    ):
+        """Test no Hoblis are queried after the limit is met and each query is capped"""
+        officer_id = self._seed_officer(db_service, sample_hobli_directory, sample_plot_data, 6, 5)
+        plots_state = self._track_concurrency(monkeypatch, db_service, 'get_hobli_plots_page', delay=0)
+        
+        plots = await db_service.get_officer_plots_async(officer_id, limit=7, max_concurrency=1)
+        
+        assert len(plots) == 7
+        assert [kwargs['limit'] for _, kwargs in plots_state['calls']] == [7, 2]
+    
+    async def test_officer_plots_async_bounded_concurrency(
+        self, db_service, sample_hobli_directory, sample_plot_data, monkeypatch
+    ):
+        """Test Hobli queries overlap up to max_concurrency"""
+        officer_id = self._seed_officer(db_service, sample_hobli_directory, sample_plot_data, 8, 1)
+        plots_state = self._track_concurrency(monkeypatch, db_service, 'get_hobli_plots_page')
+        
+        plots = await db_service.get_officer_plots_async(officer_id, limit=100, max_concurrency=4)
+        
+        assert len(plots) == 8
+        assert 1 < plots_state['peak'] <= 4
+    
+    async def test_officer_plots_async_splits_budget(
+        self, db_service, sample_hobli_directory, sample_plot_data, monkeypatch
+    ):
+        """Test concurrent queries share the limit and a full Hobli continues from its cursor"""
+        officer_id = self._seed_officer(db_service, sample_hobli_directory, sample_plot_data, 4, 5)
+        plots_state = self._track_concurrency(monkeypatch, db_service, 'get_hobli_plots_page')
+        
+        plots = await db_service.get_officer_plots_async(officer_id, limit=12, max_concurrency=4)
+        
+        assert len(plots) == 12
+        assert len({p.plot_id for p in plots}) == 12
+        assert sum(kwargs['limit'] for _, kwargs in plots_state['calls']) == 12  # never over-fetched
+        assert [kwargs['limit'] for _, kwargs in plots_state['calls']] == [3, 3, 3, 3]
+
+
+class TestFullTableScan:
+    """Test paginated, parallel full-table scans of registered plots"""
+    
+    @staticmethod
+    def _seed_plots(db_service, count, hobli_count=10):
+        """Bulk-load synthetic plots directly into the plots table"""
+        from decimal import Decimal
+        
+        registration_date = datetime.now().isoformat()
+        with db_service.plots_table.batch_writer() as batch:
+            for i in range(count):
+                batch.put_item(Item={
+                    'user_id': f"user_{i // 10:05d}",
+                    'plot_id': f"plot_{i:06d}",
+                    'lat': Decimal(str(round(12.0 + (i % 1000) / 1000, 6))),
+                    'lon': Decimal(str(round(77.0 + (i // 1000) / 1000, 6))),
+                    'crop': "rice",
+                    'hobli_id': f"hobli_{i % hobli_count:03d}",
+                    'farmer_name': f"Farmer {i}",
+                    'phone_number': f"+91{9000000000 + i}",
+                    'registration_date': registration_date,
+                    'status': "active"
+                })
+    
+    async def test_iter_all_plots_follows_pagination(self, db_service):
+        """Test that every page is read when the table spans many scan pages"""
+        self._seed_plots(db_service, 57)
+        
+        plots = [
+            plot async for plot in db_service.iter_all_plots(total_segments=1, page_size=10)
+        ]
+        
+        assert len(plots) == 57
+        assert len({p['plot_id'] for p in plots}) == 57
+    
+    async def test_iter_all_plots_parallel_segments(self, db_service):
+        """Test that parallel scan segments together cover the whole table once"""
+        self._seed_plots(db_service, 200)
+        
+        plots = [
+            plot async for plot in db_service.iter_all_plots(total_segments=4, page_size=16)
+        ]
+        
+        assert sorted(p['plot_id'] for p in plots) == [f"plot_{i:06d}" for i in range(200)]
+    
+    async def test_iter_all_plots_respects_limit(self, db_service):
+        """Test that streaming stops once the limit is reached"""
+        self._seed_plots(db_service, 50)
+        
+        plots = [
+            plot async for plot in db_service.iter_all_plots(limit=15, total_segments=2, page_size=4)
+        ]
+        
+        assert len(plots) == 15
+    
+    async def test_iter_all_plots_scan_dict_shape(self, db_service, sample_plot_data):
+        """Test that streamed plots carry the fields used by sentry scans"""
+        db_service.register_plot(PlotData(**sample_plot_data, registration_date=datetime.now()))
+        
+        plots = [plot async for plot in db_service.iter_all_plots()]
+        
+        assert len(plots) == 1
+        plot = plots[0]
+        assert plot['plot_id'] == sample_plot_data["plot_id"]
+        assert plot['user_id'] == sample_plot_data["user_id"]
+        assert plot['latitude'] == sample_plot_data["lat"]
+        assert plot['longitude'] == sample_plot_data["lon"]
+        assert plot['hobli_id'] == sample_plot_data["hobli_id"]
+        assert plot['phone'] == sample_plot_data["phone_number"]
+        assert plot['crop_type'] == sample_plot_data["crop"]
+    
+    async def test_get_all_plots_returns_every_page(self, db_service):
+        """Test that get_all_plots is no longer truncated to the first page"""
+        self._seed_plots(db_service, 120)
+        db_service.scan_page_size = 25
+        
+        plots = await db_service.get_all_plots()
+        
+        assert len(plots) == 120
+    
+    async def test_get_all_plots_empty_table(self, db_service):
+        """Test scanning an empty plots table"""
+        plots = await db_service.get_all_plots()
+        
+        assert plots == []
+    
+    @pytest.mark.slow
+    async def test_parallel_scan_50k_plots_coverage(self, db_service):
+        """Test full coverage and report throughput for a 50k-plot parallel scan"""
+        import time
+        
+        total = 50_000
+        self._seed_plots(db_service, total, hobli_count=500)
+        
+        start = time.perf_counter()
+        seen = set()
+        first_page_latency = None
+        async for plot in db_service.iter_all_plots(total_segments=8, page_size=1000):
+            if first_page_latency is None:
+                first_page_latency = time.perf_counter() - start
+            seen.add(plot['plot_id'])
+        elapsed = time.perf_counter() - start
+        
+        assert len(seen) == total
+        print(f"\nParallel scan: {total} plots in {elapsed:.2f}s "
+              f"({total / elapsed:,.0f} plots/s, first plot after {first_page_latency:.3f}s)")
+
+
+class TestCursorPagination:
+    """Test cursor pages and lazy async iteration for Hobli plots and alerts"""
+    
+    @staticmethod
+    def _register_plots(db_service, sample_plot_data, count, hobli_id="hobli_001", prefix="plot"):
+        """Register plots with increasing registration dates"""
+        base = datetime.now() - timedelta(days=1)
+        db_service.register_plots_bulk([
+            PlotData(
+                **{**sample_plot_data, 'plot_id': f"{prefix}_{i:03d}", 'hobli_id': hobli_id},
+                registration_date=base + timedelta(minutes=i)
+            )
+            for i in range(count)
+        ])
+    
+    @staticmethod
+    def _create_alerts(db_service, sample_alert_data, count, hobli_id="hobli_001"):
+        """Create alerts one minute apart, newest last"""
+        now = datetime.now()
+        db_service.create_alerts_bulk([
+            AlertData(
+                **{**sample_alert_data, 'plot_id': f"plot_{i:03d}", 'hobli_id': hobli_id},
+                timestamp=now - timedelta(minutes=count - i)
+            )
+            for i in range(count)
+        ])
+    
+    @staticmethod
+    def _cap_query_pages(monkeypatch, table, page_cap):
+        """Make Query return at most page_cap items per call, like the 1 MB page limit"""
+        original_query = table.query
+        calls = []
+        
+        def capped_query(**kwargs):
+            calls.append(dict(kwargs))
+            return original_query(**{**kwargs, 'Limit': min(kwargs.get('Limit', page_cap), page_cap)})
+        
+        monkeypatch.setattr(table, 'query', capped_query)
+        return calls
+    
+    def test_plot_pages_cover_hobli_without_gaps(self, db_service, sample_plot_data):
+        """Test following cursors visits every plot exactly once, in order"""
+        self._register_plots(db_service, sample_plot_data, 23)
+        self._register_plots(db_service, sample_plot_data, 5, hobli_id="hobli_002", prefix="other")
+        
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            page = db_service.get_hobli_plots_page("hobli_001", limit=10, cursor=cursor)
+            seen.extend(plot.plot_id for plot in page.items)
+            pages += 1
+            cursor = page.next_cursor
+            if not cursor:
+                break
+        
+        assert pages == 3
+        assert seen == [f"plot_{i:03d}" for i in range(23)]
+    
+    def test_recent_alert_pages_newest_first(self, db_service, sample_alert_data):
+        """Test alert pages continue in descending timestamp order"""
+        self._create_alerts(db_service, sample_alert_data, 12)
+        
+        first = db_service.get_recent_alerts_page("hobli_001", limit=5)
+        second = db_service.get_recent_alerts_page("hobli_001", limit=5, cursor=first.next_cursor)
+        
+        timestamps = [a.timestamp for a in first.items + second.items]
+        assert len(timestamps) == 10
+        assert timestamps == sorted(timestamps, reverse=True)
+        assert second.next_cursor is not None
+    
+    def test_last_page_has_no_cursor(self, db_service, sample_plot_data):
+        """Test a page that exhausts the Hobli returns no cursor"""
+        self._register_plots(db_service, sample_plot_data, 4)
+        
+        page = db_service.get_hobli_plots_page("hobli_001", limit=10)
+        
+        assert len(page.items) == 4
+        assert page.next_cursor is None
+    
+    def test_page_fills_limit_across_short_query_pages(self, db_service, sample_plot_data, monkeypatch):
+        """Test a page keeps querying when DynamoDB returns short pages"""
+        self._register_plots(db_service, sample_plot_data, 20)
+        calls = self._cap_query_pages(monkeypatch, db_service.plots_table, page_cap=3)
+        
+        page = db_service.get_hobli_plots_page("hobli_001", limit=10)
+        
+        assert [p.plot_id for p in page.items] == [f"plot_{i:03d}" for i in range(10)]
+        assert [c['Limit'] for c in calls] == [10, 7, 4, 1]
+        assert page.next_cursor is not None
+    
+    def test_list_methods_no_longer_truncate_at_first_page(self, db_service, sample_plot_data,
+                                                           sample_alert_data, monkeypatch):
+        """Test get_hobli_plots/get_recent_alerts follow pagination up to their limit"""
+        self._register_plots(db_service, sample_plot_data, 25)
+        self._create_alerts(db_service, sample_alert_data, 25)
+        self._cap_query_pages(monkeypatch, db_service.plots_table, page_cap=4)
+        self._cap_query_pages(monkeypatch, db_service.alerts_table, page_cap=4)
+        
+        assert len(db_service.get_hobli_plots("hobli_001")) == 25
+        assert len(db_service.get_recent_alerts("hobli_001")) == 25
+        assert len(db_service.get_recent_alerts("hobli_001", limit=7)) == 7
+    
+    def test_cursor_is_opaque_string(self, db_service, sample_plot_data):
+        """Test cursors are URL-safe strings rather than raw keys"""
+        self._register_plots(db_service, sample_plot_data, 3)
+        
+        cursor = db_service.get_hobli_plots_page("hobli_001", limit=1).next_cursor
+        
+        assert isinstance(cursor, str)
+        assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_=")
+    
+    def test_invalid_cursor_rejected(self, db_service):
+        """Test malformed cursors raise ValueError"""
+        with pytest.raises(ValueError):
+            db_service.get_hobli_plots_page("hobli_001", cursor="not a cursor!")
+        with pytest.raises(ValueError):
+            db_service.get_recent_alerts_page("hobli_001", cursor="WzEsMiwzXQ==")
+    
+    def test_cursor_from_other_hobli_rejected(self, db_service, sample_plot_data):
+        """Test a cursor cannot be replayed against another Hobli"""
+        self._register_plots(db_service, sample_plot_data, 3)
+        cursor = db_service.get_hobli_plots_page("hobli_001", limit=1).next_cursor
+        
+        with pytest.raises(ValueError):
+            db_service.get_hobli_plots_page("hobli_002", cursor=cursor)
+    
+    async def test_iter_hobli_plots_streams_all_pages(self, db_service, sample_plot_data):
+        """Test the async iterator yields every plot across pages"""
+        self._register_plots(db_service, sample_plot_data, 17)
+        
+        plots = [plot async for plot in db_service.iter_hobli_plots("hobli_001", page_size=5)]
+        
+        assert [p.plot_id for p in plots] == [f"plot_{i:03d}" for i in range(17)]
+    
+    async def test_iter_hobli_plots_is_lazy(self, db_service, sample_plot_data, monkeypatch):
+        """Test pages are only fetched as the consumer advances"""
+        self._register_plots(db_service, sample_plot_data, 20)
+        calls = self._cap_query_pages(monkeypatch, db_service.plots_table, page_cap=100)
+        
+        async for plot in db_service.iter_hobli_plots("hobli_001", page_size=5):
+            if plot.plot_id == "plot_003":
+                break
+        
+        assert len(calls) == 1
+    
+    async def test_iter_recent_alerts_streams_all_pages(self, db_service, sample_alert_data):
+        """Test the async alert iterator yields every alert, newest first"""
+        self._create_alerts(db_service, sample_alert_data, 11)
+        
+        alerts = [alert async for alert in db_service.iter_recent_alerts("hobli_001", page_size=4)]
+        
+        assert len(alerts) == 11
+        assert [a.plot_id for a in alerts] == [f"plot_{i:03d}" for i in reversed(range(11))]
+
+
 class TestJurisdictionBasedFiltering:
     """Test jurisdiction-based data filtering and querying"""
     
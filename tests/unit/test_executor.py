@@ -0,0 +1,146 @@
+"""
+Unit Tests for the shared blocking I/O executor
+
+Tests the executor layer used by async services for boto3 calls:
+- Calls run on the shared pool, off the event loop
+- Results, exceptions and context variables propagate
+- Concurrent blocking calls overlap
+- Pool size configuration and lazy creation
+"""
+
+import pytest
+import asyncio
+import contextvars
+import threading
+import time
+
+from services import executor
+from services.executor import (
+    run_blocking,
+    get_blocking_executor,
+    configure_blocking_executor,
+    shutdown_blocking_executor
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_executor():
+    """Give every test its own executor and shut it down afterwards"""
+    shutdown_blocking_executor()
+    yield
+    shutdown_blocking_executor()
+
+
+class TestRunBlocking:
+    """Test awaiting blocking calls on the shared executor"""
+    
+    @pytest.mark.asyncio
+    async def test_runs_off_event_loop_thread(self):
+        """Test the callable runs on a blocking-io worker thread"""
+        loop_thread = threading.current_thread().name
+        
+        worker_thread = await run_blocking(lambda: threading.current_thread().name)
+        
+        assert worker_thread != loop_thread
+        assert worker_thread.startswith("blocking-io")
+    
+    @pytest.mark.asyncio
+    async def test_passes_arguments_and_returns_result(self):
+        """Test positional and keyword arguments are forwarded"""
+        def publish(phone, message, attributes=None):
+            return {'MessageId': f"{phone}:{message}:{attributes}"}
+        
+        response = await run_blocking(publish, '+91900', 'hi', attributes='sms')
+        
+        assert response == {'MessageId': '+91900:hi:sms'}
+    
+    @pytest.mark.asyncio
+    async def test_exceptions_propagate(self):
+        """Test exceptions raised by the callable reach the awaiting coroutine"""
+        def fail():
+            raise RuntimeError("throttled")
+        
+        with pytest.raises(RuntimeError, match="throttled"):
+            await run_blocking(fail)
+    
+    @pytest.mark.asyncio
+    async def test_context_variables_propagate(self):
+        """Test context variables set in the coroutine are visible in the worker"""
+        request_id = contextvars.ContextVar('request_id')
+        request_id.set('scan-42')
+        
+        assert await run_blocking(request_id.get) == 'scan-42'
+    
+    @pytest.mark.asyncio
+    async def test_blocking_calls_overlap(self):
+        """Test concurrent blocking calls run in parallel rather than serially"""
+        start = time.perf_counter()
+        
+        await asyncio.gather(*[run_blocking(time.sleep, 0.1) for _ in range(8)])
+        
+        assert time.perf_counter() - start < 0.5
+    
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self):
+        """Test the loop keeps running other coroutines during a blocking call"""
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+        
+        task = asyncio.create_task(ticker())
+        await run_blocking(time.sleep, 0.2)
+        task.cancel()
+        
+        assert ticks >= 5
+
+
+class TestExecutorConfiguration:
+    """Test executor creation and sizing"""
+    
+    def test_created_lazily_from_settings(self):
+        """Test the pool is only created on first use, sized from settings"""
+        from config.settings import get_settings
+        
+        assert executor._executor is None
+        
+        pool = get_blocking_executor()
+        
+        assert pool is get_blocking_executor()
+        assert pool._max_workers == get_settings().performance.blocking_io_pool_size
+    
+    @pytest.mark.asyncio
+    async def test_configured_pool_size_limits_parallelism(self):
+        """Test resizing the pool bounds how many calls run at once"""
+        configure_blocking_executor(2)
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+        
+        def call():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+        
+        await asyncio.gather(*[run_blocking(call) for _ in range(6)])
+        
+        assert peak == 2
+    
+    def test_invalid_pool_size_rejected(self):
+        """Test a non-positive pool size raises ValueError"""
+        with pytest.raises(ValueError):
+            configure_blocking_executor(0)
+    
+    def test_shutdown_allows_recreation(self):
+        """Test a fresh executor is created after shutdown"""
+        first = get_blocking_executor()
+        shutdown_blocking_executor()
+        
+        assert get_blocking_executor() is not first
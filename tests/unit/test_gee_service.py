@@ -307,3 +307,115 @@ class TestEdgeCases:
         
         assert isinstance(result1, QualityAssessment)
         assert isinstance(result2, QualityAssessment)
+
+
+class TestNDVIBatch:
+    """Test batched multi-point NDVI extraction against the fake ee module"""
+    
+    @staticmethod
+    def grid_points(count, spacing=0.01):
+        """Points far enough apart to land in distinct MODIS pixels"""
+        return [(12.0 + (i // 50) * spacing, 76.0 + (i % 50) * spacing) for i in range(count)]
+    
+    @pytest.mark.asyncio
+    async def test_batch_matches_single_point_results(self, fake_ee):
+        """Test batched results equal per-point results, in input order"""
+        service = GEEService(use_mock=False)
+        service.ndvi_cache = None
+        points = self.grid_points(20)
+        
+        batch = await service.get_ndvi_batch(points, year=2026)
+        single = [await service.get_ndvi_analysis(lat, lon, year=2026) for lat, lon in points]
+        
+        assert batch == single
+        assert fake_ee.count('reduceRegions') == 1
+        assert fake_ee.count('reduceRegion') == 20
+    
+    @pytest.mark.asyncio
+    async def test_one_request_per_chunk(self, fake_ee):
+        """Test points are sent in chunks of batch_chunk_size"""
+        service = GEEService(use_mock=False)
+        service.ndvi_cache = None
+        service.batch_chunk_size = 500
+        
+        results = await service.get_ndvi_batch(self.grid_points(1200), year=2026)
+        
+        assert len(results) == 1200
+        assert fake_ee.requests == [('reduceRegions', 500), ('reduceRegions', 500), ('reduceRegions', 200)]
+        assert service.get_service_info()['ee_requests'] == 3
+    
+    @pytest.mark.asyncio
+    async def test_cache_serves_repeat_batches(self, fake_ee):
+        """Test cached points are not sent again and same-pixel points are computed once"""
+        from services.ndvi_cache import NDVICache, MemoryNDVICacheBackend
+        
+        service = GEEService(use_mock=False, ndvi_cache=NDVICache(MemoryNDVICacheBackend()))
+        points = self.grid_points(10)
+        same_pixel = [(lat + 0.0001, lon + 0.0001) for lat, lon in points[:3]]
+        
+        await service.get_ndvi_analysis(*points[0], year=2026)
+        first = await service.get_ndvi_batch(points + same_pixel, year=2026)
+        again = await service.get_ndvi_batch(points, year=2026)
+        
+        assert fake_ee.requests == [('reduceRegion', 1), ('reduceRegions', 9)]
+        assert first[10:] == first[:3]
+        assert again == first[:10]
+    
+    @pytest.mark.asyncio
+    async def test_invalid_point_rejected(self, fake_ee):
+        """Test one invalid coordinate rejects the batch before any request"""
+        service = GEEService(use_mock=False)
+        
+        with pytest.raises(ValueError):
+            await service.get_ndvi_batch([(12.97, 77.59), (95.0, 77.59)])
+        
+        assert fake_ee.requests == []
+    
+    @pytest.mark.asyncio
+    async def test_mock_mode_batch(self):
+        """Test mock mode returns mock data per point"""
+        service = GEEService(use_mock=True)
+        points = [(12.9716, 77.5946), (13.0827, 80.2707)]
+        
+        results = await service.get_ndvi_batch(points)
+        
+        assert [r.ndvi_float for r in results] == [
+            service._get_mock_ndvi_data(lat, lon).ndvi_float for lat, lon in points
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, fake_ee):
+        """Test an empty batch issues no requests"""
+        service = GEEService(use_mock=False)
+        
+        assert await service.get_ndvi_batch([]) == []
+        assert fake_ee.requests == []
+    
+    @pytest.mark.asyncio
+    async def test_integration_batch_analysis_uses_one_batch(self, fake_ee):
+        """Test ServiceIntegration.batch_analyze_plots hands batched NDVI to each analysis"""
+        from unittest.mock import AsyncMock
+        from services.integration import ServiceIntegration
+        
+        brain_service = Mock()
+        brain_service.gee_service = GEEService(use_mock=False)
+        brain_service.gee_service.ndvi_cache = None
+        brain_service.analyze_plot = AsyncMock(side_effect=RuntimeError("stop after analysis"))
+        map_service = Mock()
+        map_service.validate_coordinates.return_value = Mock(is_valid=True)
+        integration = ServiceIntegration(
+            map_service=map_service,
+            brain_service=brain_service,
+            db_service=Mock(),
+            sms_service=Mock()
+        )
+        plots = [
+            {'latitude': lat, 'longitude': lon, 'user_id': 'farmer_001', 'plot_id': f'plot_{i}'}
+            for i, (lat, lon) in enumerate(self.grid_points(4))
+        ]
+        
+        await integration.batch_analyze_plots(plots)
+        
+        assert fake_ee.requests == [('reduceRegions', 4)]
+        passed = [call.kwargs['gee_data'] for call in brain_service.analyze_plot.call_args_list]
+        assert len(passed) == 4 and all(isinstance(gee_data, GEEData) for gee_data in passed)
@@ -0,0 +1,208 @@
+"""
+Unit Tests for plot-sized Sentinel-2 image chips
+
+Tests windowed chip extraction including:
+- Chip centring, size and resampling against a local GeoTIFF
+- Padding at scene edges and reflectance scaling
+- SentinelService.get_image_chip
+- Base64 chip embedded in the multimodal Bedrock request
+"""
+
+import pytest
+import base64
+import io
+import json
+import os
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+from PIL import Image
+
+from services.image_chips import read_chip
+from services.sentinel_service import SentinelData, SentinelService
+from tests.geotiff import pixel_of, write_geotiff
+
+LAT, LON = 12.9716, 77.5946
+
+
+def decode(chip):
+    return decode_source(chip.to_bedrock_source())
+
+
+def decode_source(source):
+    return np.asarray(Image.open(io.BytesIO(base64.b64decode(source['data']))))
+
+
+@pytest.fixture
+def marker_scene(tmp_path):
+    """Dark 10 m RGB scene with a bright 3x3 marker on the sample plot"""
+    data = np.full((3, 2048, 2048), 40, dtype=np.uint8)
+    row, col = pixel_of(LAT, LON)
+    data[:, row - 1:row + 2, col - 1:col + 2] = 250
+    return write_geotiff(str(tmp_path / 'marker.tif'), data)
+
+
+@pytest.fixture
+def noise_scene(tmp_path):
+    """Full-entropy 10 m RGB scene, the worst case for chip compression"""
+    data = np.random.default_rng(0).integers(0, 256, (3, 2048, 2048), dtype=np.uint8)
+    return write_geotiff(str(tmp_path / 'noise.tif'), data)
+
+
+def scene(path):
+    return SentinelData(
+        image_url=path,
+        tile_id='43PGP',
+        acquisition_date=datetime(2024, 1, 1),
+        cloud_cover_percentage=10.0,
+        resolution='10m',
+        quality_assessment='usable',
+        metadata={'size_bytes': os.path.getsize(path) if path else 0}
+    )
+
+
+class TestReadChip:
+    """Test windowed chip extraction"""
+
+    def test_chip_centred_on_plot(self, marker_scene):
+        """Test the plot pixel lands in the middle of a 256 px chip"""
+        pixels = decode(read_chip(marker_scene, LAT, LON, image_format='png'))
+
+        assert pixels.shape == (256, 256, 3)
+        rows, cols = np.nonzero(pixels[:, :, 0] > 200)
+        assert abs(rows.mean() - 128) <= 1.5 and abs(cols.mean() - 128) <= 1.5
+
+    def test_resolution_resamples_window(self, marker_scene):
+        """Test a coarser chip covers more ground in the same pixel size"""
+        chip = read_chip(marker_scene, LAT, LON, size_px=128, resolution_m=20.0, image_format='png')
+
+        assert decode(chip).shape == (128, 128, 3)
+        assert chip.resolution_m == 20.0
+
+    def test_orders_of_magnitude_fewer_bytes(self, noise_scene):
+        """Test a JPEG chip is over 100x smaller than the scene it was cut from"""
+        chip = read_chip(noise_scene, LAT, LON)
+
+        assert chip.media_type == 'image/jpeg'
+        assert chip.size_bytes * 100 < os.path.getsize(noise_scene)
+
+    def test_scene_edge_padded(self, tmp_path):
+        """Test the part of the chip beyond the scene is filled with black"""
+        row, col = pixel_of(LAT, LON)
+        path = write_geotiff(str(tmp_path / 'edge.tif'), np.full((3, row + 20, col + 20), 200, dtype=np.uint8))
+
+        pixels = decode(read_chip(path, LAT, LON, image_format='png'))
+
+        assert pixels[:100, :100].mean() > 190
+        assert pixels[160:, 160:].max() == 0
+
+    def test_reflectance_scaled_to_8_bit(self, tmp_path):
+        """Test 16-bit reflectance bands are stretched into the 8-bit range"""
+        path = write_geotiff(str(tmp_path / 'refl.tif'), np.full((3, 2048, 2048), 1500, dtype=np.uint16))
+
+        pixels = decode(read_chip(path, LAT, LON, image_format='png'))
+
+        assert abs(int(pixels[128, 128, 0]) - 127) <= 1
+
+    def test_outside_scene_rejected(self, marker_scene):
+        """Test coordinates off the scene raise ValueError"""
+        with pytest.raises(ValueError):
+            read_chip(marker_scene, 20.0, 77.0)
+
+    def test_unknown_format_rejected(self, marker_scene):
+        """Test only jpeg and png are produced"""
+        with pytest.raises(ValueError):
+            read_chip(marker_scene, LAT, LON, image_format='webp')
+
+    @pytest.mark.slow
+    def test_chip_bytes_benchmark(self, noise_scene):
+        """Report chip size and extraction time against the scene size"""
+        start = time.perf_counter()
+        chip = read_chip(noise_scene, LAT, LON)
+        elapsed = time.perf_counter() - start
+        scene_bytes = os.path.getsize(noise_scene)
+
+        print(f"\n256x256 chip: {chip.size_bytes} bytes vs scene {scene_bytes} bytes "
+              f"({scene_bytes / chip.size_bytes:.0f}x fewer), {elapsed * 1000:.1f} ms")
+
+
+class TestSentinelServiceChip:
+    """Test SentinelService chip extraction"""
+
+    @pytest.mark.asyncio
+    async def test_get_image_chip_uses_settings(self, marker_scene):
+        """Test chips follow the configured size and encoding"""
+        with patch('services.sentinel_service.get_client'):
+            service = SentinelService(region='ap-south-1')
+        service.chip_size_px = 64
+        service.chip_format = 'png'
+        service.chip_cache = None
+
+        chip = await service.get_image_chip(scene(marker_scene), LAT, LON)
+
+        assert (chip.width, chip.media_type) == (64, 'image/png')
+
+    @pytest.mark.asyncio
+    async def test_chip_cut_from_10m_true_colour(self, marker_scene):
+        """Test the chip is read from the scene's R10m TCI, not the 60 m preview URL"""
+        with patch('services.sentinel_service.get_client'):
+            service = SentinelService(region='ap-south-1')
+        service.chip_cache = None
+        requested = []
+        service._generate_presigned_url = lambda key: requested.append(key) or marker_scene
+        preview = scene(marker_scene).model_copy(update={
+            'image_url': 'https://example.com/R60m/TCI.jp2',
+            'resolution': '60m',
+            'metadata': {'s3_key': 'tiles/43/P/GQ/2024/1/1/0/R60m/TCI.jp2'}
+        })
+
+        chip = await service.get_image_chip(preview, LAT, LON)
+
+        assert requested == ['tiles/43/P/GQ/2024/1/1/0/R10m/TCI.jp2']
+        assert decode(chip)[128, 128].min() > 200  # marker pixel at full 10 m resolution
+
+    @pytest.mark.asyncio
+    async def test_scene_without_image_rejected(self):
+        """Test placeholder scenes without an image raise ValueError"""
+        with patch('services.sentinel_service.get_client'):
+            service = SentinelService(region='ap-south-1')
+
+        with pytest.raises(ValueError):
+            await service.get_image_chip(scene(''), LAT, LON)
+
+
+class TestBedrockChipRequest:
+    """Test the multimodal request embeds the chip"""
+
+    @pytest.fixture
+    def brain(self, brain, marker_scene):
+        """Shared BrainService with chips enabled over the marker scene"""
+        brain.sentinel_service.chip_enabled = True
+        brain.sentinel_service.chip_cache = None
+        brain.sentinel_service.get_latest_image = AsyncMock(return_value=scene(marker_scene))
+        return brain
+
+    @pytest.mark.asyncio
+    async def test_chip_sent_as_base64(self, brain, make_gee_data, bedrock_analysis_reply):
+        """Test Sonnet receives the chip instead of the scene URL"""
+        with patch.object(brain.bedrock_client, 'invoke_model', side_effect=lambda **kwargs: bedrock_analysis_reply()) as invoke:
+            result = await brain.analyze_plot(LAT, LON, gee_data=make_gee_data(0.41))
+
+        content = json.loads(invoke.call_args.kwargs['body'])['messages'][0]['content']
+        source = content[1]['source']
+        assert source['type'] == 'base64' and source['media_type'] == 'image/jpeg'
+        assert decode_source(source).shape == (256, 256, 3)
+        assert '256x256 px true-color RGB chip' in content[0]['text']
+        assert result.risk_level == 'medium'
+
+    @pytest.mark.asyncio
+    async def test_chip_failure_falls_back_to_url(self, brain, make_gee_data, bedrock_analysis_reply):
+        """Test a failed extraction still analyzes with the scene URL"""
+        brain.sentinel_service.get_image_chip = AsyncMock(side_effect=RuntimeError('range read failed'))
+        with patch.object(brain.bedrock_client, 'invoke_model', side_effect=lambda **kwargs: bedrock_analysis_reply()) as invoke:
+            await brain.analyze_plot(LAT, LON, gee_data=make_gee_data(0.41))
+
+        source = json.loads(invoke.call_args.kwargs['body'])['messages'][0]['content'][1]['source']
+        assert source['type'] == 'url'
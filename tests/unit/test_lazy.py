@@ -0,0 +1,258 @@
+"""
+Unit Tests for lazy service initialization
+
+Tests deferred startup including:
+- LazyService build-on-first-use proxies
+- Deferred folium/geopandas/earthengine imports in the services package
+- Construction without network calls (MapService, VoiceService)
+- Startup time benchmark per service
+"""
+
+import pytest
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import boto3
+
+from services.lazy import LazyService, is_initialized, resolve, startup_timings
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+SERVICE_TARGETS = {
+    'map': 'services.map_service:MapService',
+    'db': 'services.db_service:DbService',
+    'brain': 'services.brain_service:BrainService',
+    'voice': 'services.voice_service:VoiceService',
+    'sms': 'services.sms_service:SMSService',
+    'sentry': 'services.sentry_service:SentryService',
+    'integration': 'services.integration:ServiceIntegration'
+}
+
+
+def run_in_fresh_interpreter(code: str) -> dict:
+    """Run code in a new Python process from the repo root and parse its JSON output"""
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=300
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class Recorder:
+    """Service stand-in that counts constructions"""
+
+    built = 0
+
+    def __init__(self, **kwargs):
+        type(self).built += 1
+        self.kwargs = kwargs
+        self.value = 42
+
+    def ping(self):
+        return "pong"
+
+
+@pytest.fixture(autouse=True)
+def reset_recorder():
+    Recorder.built = 0
+
+
+class TestLazyService:
+    """Test proxy construction semantics"""
+
+    def test_not_built_until_used(self):
+        """Test creating a proxy does not construct the service"""
+        proxy = LazyService('recorder', Recorder, region='ap-south-1')
+
+        assert Recorder.built == 0
+        assert not is_initialized(proxy)
+        assert "pending" in repr(proxy)
+
+        assert proxy.ping() == "pong"
+        assert proxy.kwargs == {'region': 'ap-south-1'}
+        assert Recorder.built == 1
+        assert is_initialized(proxy)
+
+    def test_built_once(self):
+        """Test repeated access reuses the single instance"""
+        proxy = LazyService('recorder', Recorder)
+
+        proxy.ping()
+        proxy.ping()
+
+        assert Recorder.built == 1
+        assert resolve(proxy) is resolve(proxy)
+
+    def test_concurrent_first_use_builds_once(self):
+        """Test racing threads construct the service only once"""
+        proxy = LazyService('recorder', Recorder)
+        barrier = threading.Barrier(16)
+        seen = []
+
+        def use():
+            barrier.wait()
+            seen.append(resolve(proxy))
+
+        threads = [threading.Thread(target=use) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert Recorder.built == 1
+        assert len({id(instance) for instance in seen}) == 1
+
+    def test_dependencies_stay_lazy(self):
+        """Test proxies passed as arguments are not built with the dependent service"""
+        dependency = LazyService('dependency', Recorder)
+        dependent = LazyService('dependent', Recorder, dependency=dependency)
+
+        dependent.ping()
+
+        assert is_initialized(dependent)
+        assert not is_initialized(dependency)
+        assert dependent.kwargs['dependency'].value == 42
+        assert is_initialized(dependency)
+
+    def test_attribute_writes_reach_the_service(self):
+        """Test setting attributes on the proxy updates the real service"""
+        proxy = LazyService('recorder', Recorder)
+
+        proxy.value = 7
+
+        assert resolve(proxy).value == 7
+
+    def test_string_target_imported_on_first_use(self):
+        """Test "module:attribute" targets are imported when first used"""
+        proxy = LazyService('cache', 'services.cache:TTLCache', max_entries=4, ttl_seconds=60)
+
+        assert proxy.max_entries == 4
+        assert startup_timings({'cache': proxy})['cache']['initialized'] is True
+
+    def test_plain_services_pass_through(self):
+        """Test helpers accept already-built services"""
+        service = Recorder()
+
+        assert is_initialized(service)
+        assert resolve(service) is service
+        assert startup_timings([service]) == {}
+
+    def test_startup_timings(self):
+        """Test timings are reported per service"""
+        used = LazyService('used', Recorder)
+        unused = LazyService('unused', Recorder)
+        used.ping()
+
+        timings = startup_timings([used, unused])
+
+        assert timings['used']['initialized'] is True
+        assert timings['used']['construct_seconds'] > 0
+        assert timings['unused'] == {'initialized': False, 'import_seconds': 0.0, 'construct_seconds': 0.0}
+
+
+class TestDeferredWork:
+    """Test service construction avoids heavy imports and network calls"""
+
+    def test_service_modules_do_not_import_heavy_dependencies(self):
+        """Test importing every service module leaves folium, geopandas and ee unloaded"""
+        modules = sorted({target.split(':')[0] for target in SERVICE_TARGETS.values()})
+        loaded = run_in_fresh_interpreter(
+            "import importlib, json, sys\n"
+            f"for name in {modules!r}: importlib.import_module(name)\n"
+            "print(json.dumps([m for m in ('folium', 'geopandas', 'ee') if m in sys.modules]))"
+        )
+
+        assert loaded == []
+
+    def test_map_service_builds_http_client_on_first_use(self):
+        """Test MapService construction creates no HTTP client"""
+        from services.map_service import MapService
+
+        service = MapService()
+
+        assert service._http_client is None
+        assert service.http_client is service.http_client
+
+    def test_map_service_still_renders_maps(self):
+        """Test folium is imported on demand by map methods"""
+        import folium
+        from services.map_service import MapService
+
+        assert isinstance(MapService().create_folium_map(12.9716, 77.5946), folium.Map)
+
+    def test_voice_service_checks_bucket_on_first_upload(self, mock_polly_service):
+        """Test VoiceService construction makes no S3 calls and creates the bucket on first upload"""
+        import asyncio
+        from services.voice_service import VoiceService
+
+        service = VoiceService(region='ap-south-1', audio_bucket='lazy-audio-bucket')
+        s3 = boto3.client('s3', region_name='ap-south-1')
+
+        assert 'lazy-audio-bucket' not in [b['Name'] for b in s3.list_buckets()['Buckets']]
+
+        asyncio.run(service._upload_audio('input/test.wav', b'audio', 'audio/wav'))
+
+        assert 'lazy-audio-bucket' in [b['Name'] for b in s3.list_buckets()['Buckets']]
+        assert s3.get_object(Bucket='lazy-audio-bucket', Key='input/test.wav')['Body'].read() == b'audio'
+
+
+@pytest.mark.slow
+class TestStartupBenchmark:
+    """Startup time per service: import in a fresh interpreter, construction under moto"""
+
+    def test_startup_time_per_service(self, mock_dynamodb_tables):
+        """Report import and construct time per service and compare eager vs lazy startup"""
+        import_ms = {}
+        for name, target in SERVICE_TARGETS.items():
+            module_name = target.split(':')[0]
+            import_ms[name] = run_in_fresh_interpreter(
+                "import importlib, json, time\n"
+                "import config.settings\n"
+                "start = time.perf_counter()\n"
+                f"importlib.import_module({module_name!r})\n"
+                "print(json.dumps((time.perf_counter() - start) * 1000))"
+            )
+
+        services = {
+            'map': LazyService('map', SERVICE_TARGETS['map']),
+            'db': LazyService('db', SERVICE_TARGETS['db']),
+            'brain': LazyService('brain', SERVICE_TARGETS['brain'], use_mock_gee=True, region='ap-south-1'),
+            'voice': LazyService('voice', SERVICE_TARGETS['voice'], region='ap-south-1'),
+            'sms': LazyService('sms', SERVICE_TARGETS['sms'], region='ap-south-1')
+        }
+        services['sentry'] = LazyService(
+            'sentry', SERVICE_TARGETS['sentry'],
+            brain_service=services['brain'], db_service=services['db'], sms_service=services['sms']
+        )
+        services['integration'] = LazyService(
+            'integration', SERVICE_TARGETS['integration'],
+            map_service=services['map'], brain_service=services['brain'],
+            db_service=services['db'], sms_service=services['sms']
+        )
+
+        start = time.perf_counter()
+        for service in services.values():
+            resolve(service)
+        eager_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for _ in range(100):
+            LazyService('map', SERVICE_TARGETS['map'])
+        lazy_ms = (time.perf_counter() - start) * 1000 / 100 * len(services)
+
+        timings = startup_timings(services)
+        assert all(entry['initialized'] for entry in timings.values())
+        assert lazy_ms < eager_ms
+
+        print("\nService startup (import in fresh interpreter / construct):")
+        for name, entry in timings.items():
+            print(f"  {name:<12} import {import_ms[name]:7.1f} ms  construct {entry['construct_seconds'] * 1000:7.1f} ms")
+        print(f"  eager init_services {eager_ms:.1f} ms, lazy proxies {lazy_ms:.3f} ms")
@@ -0,0 +1,99 @@
+"""
+Unit Tests for Sentinel-2 tile assignment
+
+Tests MGRS tile resolution including:
+- Known Sentinel-2 tiles for plots in India and elsewhere
+- Norway and Svalbard UTM zone exceptions
+- Vectorized batches matching per-plot resolution
+- Memoization per quantized coordinate
+"""
+
+import pytest
+import time
+
+import numpy as np
+
+from services.mgrs_tiles import TileResolver, tile_ids, utm_zones
+from services.sentinel_service import SentinelService
+
+
+class TestTileIds:
+    """Test MGRS tile IDs against published Sentinel-2 tiles"""
+
+    @pytest.mark.parametrize("lat,lon,expected", [
+        (12.97, 77.59, '43PGQ'),    # Bangalore
+        (17.38, 78.48, '44QKE'),    # Hyderabad
+        (28.61, 77.21, '43RGM'),    # Delhi
+        (-33.86, 151.20, '56HLH'),  # Sydney
+        (51.50, -0.12, '30UXC'),    # London
+        (0.0, -0.1, '30NZF'),       # Equator, even zone rows start at F
+    ])
+    def test_known_tiles(self, lat, lon, expected):
+        """Test coordinates resolve to the Sentinel-2 tile covering them"""
+        assert tile_ids([lat], [lon])[0] == expected
+
+    def test_zone_exceptions(self):
+        """Test southwest Norway is zone 32 and Svalbard uses odd zones only"""
+        zones = utm_zones(np.array([60.0, 78.0, 78.0]), np.array([5.0, 8.0, 15.0]))
+
+        assert zones.tolist() == [32, 31, 33]
+
+    def test_single_digit_zone_padded(self):
+        """Test zones below 10 are padded in the ID and unpadded in the S3 prefix"""
+        tile_id = tile_ids([21.3], [-157.85])[0]  # Honolulu
+
+        assert tile_id == '04QFJ'
+        assert SentinelService._tile_prefix(None, tile_id) == 'tiles/4/Q/FJ/'
+
+    def test_outside_utm_grid_rejected(self):
+        """Test polar and invalid latitudes raise ValueError"""
+        with pytest.raises(ValueError):
+            tile_ids([91.0], [77.59])
+        with pytest.raises(ValueError):
+            tile_ids([float('nan')], [77.59])
+
+
+class TestTileResolver:
+    """Test batched, memoized resolution"""
+
+    def test_batch_matches_single_plots(self):
+        """Test one vectorized pass gives the same tiles as per-plot calls"""
+        rng = np.random.default_rng(0)
+        lat, lon = rng.uniform(8.0, 35.0, 500), rng.uniform(68.0, 97.0, 500)
+
+        batch = TileResolver().resolve_many(lat, lon)
+        single = [TileResolver().resolve(a, b) for a, b in zip(lat, lon)]
+
+        assert batch == single
+        assert len(set(batch)) > 20
+
+    def test_memoized_per_quantized_coordinate(self):
+        """Test repeated and sub-metre jittered coordinates are served from the memo"""
+        resolver = TileResolver()
+        resolver.resolve_many([12.97, 12.97, 11.0], [77.59, 77.59, 79.0])
+        resolver.resolve(12.970001, 77.590001)
+
+        assert resolver.stats() == {'hits': 1, 'misses': 2, 'entries': 2}
+
+    def test_memo_bounded(self):
+        """Test the oldest coordinates are dropped beyond max_entries"""
+        resolver = TileResolver(max_entries=10)
+        resolver.resolve_many(np.linspace(12.0, 13.0, 25), np.full(25, 77.5))
+
+        assert resolver.stats()['entries'] == 10
+
+    @pytest.mark.slow
+    def test_resolver_benchmark(self):
+        """Report tile assignment time for 100k plots, cold and memoized"""
+        rng = np.random.default_rng(0)
+        lat, lon = rng.uniform(8.0, 35.0, 100_000), rng.uniform(68.0, 97.0, 100_000)
+        resolver = TileResolver()
+
+        start = time.perf_counter()
+        resolver.resolve_many(lat, lon)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        resolver.resolve_many(lat, lon)
+        warm = time.perf_counter() - start
+
+        print(f"\n100k plots: {cold * 1000:.0f} ms cold, {warm * 1000:.0f} ms memoized")
@@ -0,0 +1,326 @@
+"""
+Unit Tests for the NDVI result cache
+
+Tests MODIS-aligned caching including:
+- 250 m sinusoidal pixel indexing
+- 16-day composite periods and release-aligned TTLs
+- Memory, SQLite and Redis backends
+- GEEService read-through caching and hit-rate metrics
+"""
+
+import pytest
+from datetime import date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from services.gee_service import GEEService, GEEData
+from services.ndvi_cache import (
+    NDVICache,
+    NDVICacheBackend,
+    MemoryNDVICacheBackend,
+    SQLiteNDVICacheBackend,
+    RedisNDVICacheBackend,
+    composite_start,
+    create_ndvi_cache,
+    latest_released_composite,
+    modis_pixel_index,
+    next_composite_start
+)
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis client calls used by the backend"""
+
+    def __init__(self):
+        self.values = {}
+        self.expiry = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value.encode('utf-8')
+        self.expiry[key] = ex
+
+    def scan_iter(self, match):
+        prefix = match.rstrip('*')
+        return iter([key for key in self.values if key.startswith(prefix)])
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
+class FailingBackend(NDVICacheBackend):
+    """Backend whose store is unreachable"""
+
+    def get(self, key):
+        raise ConnectionError("cache unavailable")
+
+    def set(self, key, value, ttl_seconds):
+        raise ConnectionError("cache unavailable")
+
+    def clear(self):
+        raise ConnectionError("cache unavailable")
+
+    def __len__(self):
+        return 0
+
+
+def fixed_clock(moment: datetime):
+    return lambda: moment
+
+
+@pytest.fixture(params=['memory', 'sqlite', 'redis'])
+def backend(request, tmp_path):
+    """Each backend implementation"""
+    if request.param == 'memory':
+        return MemoryNDVICacheBackend(max_entries=100)
+    if request.param == 'sqlite':
+        return SQLiteNDVICacheBackend(str(tmp_path / "cache" / "ndvi.sqlite3"))
+    return RedisNDVICacheBackend(client=FakeRedis())
+
+
+@pytest.fixture
+def earth_engine():
+    """GEEService dependencies wired to a fake ee module returning fixed stats"""
+    fake_ee = MagicMock()
+    region_stats = fake_ee.ImageCollection.return_value.filterBounds.return_value \
+        .filterDate.return_value.median.return_value.reduceRegion.return_value
+    region_stats.getInfo.return_value = {'NDVI': 6500, 'SummaryQA': 12}
+
+    with patch('services.gee_service._ee', fake_ee), \
+         patch.object(GEEService, '_init_earth_engine', return_value=True):
+        yield region_stats.getInfo
+
+
+class TestCompositeGrid:
+    """Test MODIS pixel and composite period helpers"""
+
+    def test_pixel_index_at_grid_center(self):
+        """Test points around (0, 0) fall on the central grid lines"""
+        assert modis_pixel_index(0.001, 0.001) == (43199, 86400)
+        assert modis_pixel_index(-0.001, -0.001) == (43200, 86399)
+
+    def test_nearby_points_share_a_pixel(self):
+        """Test points tens of metres apart map to the same 250 m pixel"""
+        assert modis_pixel_index(12.97160, 77.59460) == modis_pixel_index(12.97170, 77.59470)
+
+    def test_distant_points_differ(self):
+        """Test points ~300 m apart map to different pixels"""
+        assert modis_pixel_index(12.9716, 77.5946) != modis_pixel_index(12.9743, 77.5946)
+
+    def test_composite_start(self):
+        """Test 16-day periods start on day-of-year 1, 17, 33, ..."""
+        assert composite_start(date(2026, 1, 1)) == date(2026, 1, 1)
+        assert composite_start(date(2026, 1, 16)) == date(2026, 1, 1)
+        assert composite_start(date(2026, 1, 17)) == date(2026, 1, 17)
+        assert composite_start(date(2026, 12, 31)) == date(2026, 12, 19)
+        assert composite_start(date(2024, 12, 31)) == date(2024, 12, 18)
+
+    def test_last_period_runs_into_next_year(self):
+        """Test the year's last period ends on January 1"""
+        assert next_composite_start(date(2026, 12, 19)) == date(2027, 1, 1)
+        assert next_composite_start(date(2026, 1, 17)) == date(2026, 2, 2)
+
+    def test_latest_released_composite(self):
+        """Test a composite is released lag days after its period ends"""
+        # Period 2026-10-16..10-31 is released 2026-11-08 with a 7 day lag
+        released, next_release = latest_released_composite(datetime(2026, 11, 7, 12), 7)
+        assert released == date(2026, 9, 30)
+        assert next_release == datetime(2026, 11, 8)
+
+        released, _ = latest_released_composite(datetime(2026, 11, 8, 0, 1), 7)
+        assert released == date(2026, 10, 16)
+
+
+class TestNDVICache:
+    """Test cache keys, TTLs, backends and metrics"""
+
+    def test_key_shared_within_pixel_and_period(self):
+        """Test analyses of the same pixel in the same period share a key"""
+        cache = NDVICache(MemoryNDVICacheBackend(), clock=fixed_clock(datetime(2026, 10, 17, 9)))
+
+        key, ttl = cache.entry_for(12.97160, 77.59460, 2026)
+
+        assert cache.entry_for(12.97170, 77.59470, 2026)[0] == key
+        assert cache.entry_for(12.9743, 77.5946, 2026)[0] != key
+        assert cache.entry_for(12.97160, 77.59460, 2025)[0] != key
+
+    def test_ttl_ends_at_next_release(self):
+        """Test current-year entries expire when the next composite is published"""
+        now = datetime(2026, 10, 17, 9)
+        cache = NDVICache(MemoryNDVICacheBackend(), release_lag_days=7, clock=fixed_clock(now))
+
+        _, ttl = cache.entry_for(12.9716, 77.5946, 2026)
+
+        _, next_release = latest_released_composite(now, 7)
+        assert ttl == (next_release - now).total_seconds()
+
+    def test_key_changes_after_release(self):
+        """Test a new composite release produces a new key"""
+        before = NDVICache(MemoryNDVICacheBackend(), clock=fixed_clock(datetime(2026, 11, 7, 23)))
+        after = NDVICache(MemoryNDVICacheBackend(), clock=fixed_clock(datetime(2026, 11, 8, 1)))
+
+        assert before.entry_for(12.9716, 77.5946, 2026)[0] != after.entry_for(12.9716, 77.5946, 2026)[0]
+
+    def test_closed_year_is_final(self):
+        """Test past years use a stable key and the closed-year TTL"""
+        cache = NDVICache(
+            MemoryNDVICacheBackend(),
+            closed_year_ttl_seconds=1234,
+            clock=fixed_clock(datetime(2026, 10, 17))
+        )
+
+        key, ttl = cache.entry_for(12.9716, 77.5946, 2025)
+
+        assert key.endswith(":2025:final")
+        assert ttl == 1234
+
+    def test_year_not_final_until_last_composite_released(self):
+        """Test early January keeps the previous year's entry short-lived"""
+        cache = NDVICache(MemoryNDVICacheBackend(), release_lag_days=7, clock=fixed_clock(datetime(2027, 1, 3)))
+
+        key, ttl = cache.entry_for(12.9716, 77.5946, 2026)
+
+        assert not key.endswith(":final")
+        assert ttl == timedelta(days=5).total_seconds()
+
+    def test_backend_round_trip(self, backend):
+        """Test each backend stores and returns results"""
+        cache = NDVICache(backend)
+        result = {'ndvi_float': 0.65, 'acquisition_date': datetime(2026, 6, 15), 'metadata': {'sensor': 'MODIS'}}
+
+        assert cache.get("k") is None
+        cache.set("k", result, ttl_seconds=60)
+
+        assert cache.get("k") == {**result, 'acquisition_date': "2026-06-15T00:00:00"}
+        assert len(backend) == 1
+
+        cache.clear()
+        assert cache.get("k") is None
+
+    def test_sqlite_expiry_and_persistence(self, tmp_path):
+        """Test SQLite entries expire by wall clock and survive reopening"""
+        now = [1000.0]
+        path = str(tmp_path / "ndvi.sqlite3")
+        first = SQLiteNDVICacheBackend(path, clock=lambda: now[0])
+        first.set("fresh", "1", ttl_seconds=100)
+        first.set("stale", "2", ttl_seconds=10)
+        first.close()
+
+        reopened = SQLiteNDVICacheBackend(path, clock=lambda: now[0])
+        now[0] += 50
+
+        assert reopened.get("fresh") == "1"
+        assert reopened.get("stale") is None
+        assert reopened.purge_expired() == 0
+        now[0] += 100
+        assert reopened.purge_expired() == 1
+        assert len(reopened) == 0
+
+    def test_redis_ttl_and_prefix(self):
+        """Test Redis entries carry an expiry and a namespaced key"""
+        client = FakeRedis()
+        backend = RedisNDVICacheBackend(client=client, key_prefix="agri:ndvi:")
+
+        backend.set("k", "v", ttl_seconds=90.5)
+
+        assert client.expiry == {"agri:ndvi:k": 91}
+        assert backend.get("k") == "v"
+
+    def test_backend_failures_are_misses(self):
+        """Test an unreachable backend degrades to misses"""
+        cache = NDVICache(FailingBackend())
+
+        cache.set("k", {'ndvi_float': 0.5}, ttl_seconds=60)
+
+        assert cache.get("k") is None
+        assert cache.stats()['errors'] == 2
+        assert cache.stats()['misses'] == 1
+
+    def test_backend_must_implement_interface(self):
+        """Test a backend missing storage methods cannot be instantiated"""
+        class PartialBackend(NDVICacheBackend):
+            def get(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            PartialBackend()
+
+    def test_hit_rate(self):
+        """Test hit/miss counters and hit rate"""
+        cache = NDVICache(MemoryNDVICacheBackend())
+        cache.get("k")
+        cache.set("k", {'v': 1}, ttl_seconds=60)
+        cache.get("k")
+        cache.get("k")
+
+        stats = cache.stats()
+
+        assert stats['backend'] == "MemoryNDVICacheBackend"
+        assert (stats['hits'], stats['misses'], stats['stores']) == (2, 1, 1)
+        assert stats['hit_rate'] == pytest.approx(2 / 3)
+
+    def test_create_from_settings(self, tmp_path):
+        """Test factory builds the configured backend"""
+        assert isinstance(create_ndvi_cache().backend, MemoryNDVICacheBackend)
+        assert isinstance(create_ndvi_cache('sqlite').backend, SQLiteNDVICacheBackend)
+        assert isinstance(create_ndvi_cache('redis').backend, RedisNDVICacheBackend)
+        assert create_ndvi_cache('none') is None
+
+        with pytest.raises(ValueError):
+            create_ndvi_cache('memcached')
+
+
+class TestGEEServiceCaching:
+    """Test GEEService read-through caching"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_analysis_served_from_cache(self, earth_engine):
+        """Test re-analysing a plot or a neighbour in the same pixel skips Earth Engine"""
+        service = GEEService(use_mock=False, ndvi_cache=NDVICache(MemoryNDVICacheBackend()))
+
+        first = await service.get_ndvi_analysis(12.97160, 77.59460, year=2026)
+        again = await service.get_ndvi_analysis(12.97160, 77.59460, year=2026)
+        neighbour = await service.get_ndvi_analysis(12.97170, 77.59470, year=2026)
+
+        assert earth_engine.call_count == 1
+        assert again == neighbour == first
+        assert first.ndvi_float == 0.65
+        assert service.get_service_info()['ndvi_cache']['hits'] == 2
+
+    @pytest.mark.asyncio
+    async def test_other_pixels_and_years_miss(self, earth_engine):
+        """Test different pixels or years are computed separately"""
+        service = GEEService(use_mock=False, ndvi_cache=NDVICache(MemoryNDVICacheBackend()))
+
+        await service.get_ndvi_analysis(12.9716, 77.5946, year=2026)
+        await service.get_ndvi_analysis(12.9743, 77.5946, year=2026)
+        await service.get_ndvi_analysis(12.9716, 77.5946, year=2025)
+
+        assert earth_engine.call_count == 3
+        assert service.ndvi_cache.stats()['hit_rate'] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_sqlite_backend_shared_across_services(self, earth_engine, tmp_path):
+        """Test a new service instance reuses results persisted by another"""
+        path = str(tmp_path / "ndvi.sqlite3")
+
+        first = GEEService(use_mock=False, ndvi_cache=NDVICache(SQLiteNDVICacheBackend(path)))
+        second = GEEService(use_mock=False, ndvi_cache=NDVICache(SQLiteNDVICacheBackend(path)))
+
+        computed = await first.get_ndvi_analysis(12.9716, 77.5946, year=2026)
+        cached = await second.get_ndvi_analysis(12.9716, 77.5946, year=2026)
+
+        assert earth_engine.call_count == 1
+        assert isinstance(cached, GEEData)
+        assert cached == computed
+
+    @pytest.mark.asyncio
+    async def test_mock_mode_bypasses_cache(self):
+        """Test mock data is not written to the cache"""
+        service = GEEService(use_mock=True, ndvi_cache=NDVICache(MemoryNDVICacheBackend()))
+
+        await service.get_ndvi_analysis(12.9716, 77.5946)
+
+        assert service.ndvi_cache.stats()['stores'] == 0
@@ -0,0 +1,322 @@
+"""
+Unit Tests for the NDVI time series and anomaly engine
+
+Tests seasonal anomaly detection including:
+- Vectorized z-scores against a per-plot reference loop
+- Stress vs seasonal-low classification
+- Per-pixel series store (memory and .npz)
+- Incremental fetching of newly released composites
+- Batched series extraction through GEEService
+- BrainService anomaly context
+"""
+
+import pytest
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from services.gee_service import GEEService
+from services.ndvi_cache import latest_released_composite, modis_pixel_index
+from services.ndvi_timeseries import (
+    NDVISeriesStore,
+    NDVITimeSeriesEngine,
+    classify_anomalies,
+    composite_periods,
+    ndvi_anomalies
+)
+
+NOW = datetime(2026, 6, 15, 12, 0)
+
+
+def composite_dates(first_year: int, last_year: int) -> np.ndarray:
+    """All MOD13Q1 composite start dates for a range of years"""
+    return np.array([
+        np.datetime64(date(year, 1, 1)) + np.timedelta64(16 * period, 'D')
+        for year in range(first_year, last_year + 1)
+        for period in range(23)
+    ], dtype='datetime64[D]')
+
+
+def reference_anomalies(dates, values, climatology_years, min_years, std_floor=0.02):
+    """Straightforward per-plot, per-composite z-scores"""
+    years, periods = composite_periods(dates)
+    z = np.full(values.shape, np.nan)
+    for plot in range(values.shape[0]):
+        for t in range(len(dates)):
+            history = [
+                values[plot, s] for s in range(len(dates))
+                if periods[s] == periods[t]
+                and years[t] - climatology_years <= years[s] < years[t]
+                and not np.isnan(values[plot, s])
+            ]
+            if len(history) >= min_years and not np.isnan(values[plot, t]):
+                std = max(np.std(history, ddof=1), std_floor)
+                z[plot, t] = (values[plot, t] - np.mean(history)) / std
+    return z
+
+
+def points_in_distinct_pixels(count):
+    return [(12.0 + (i // 20) * 0.01 + 0.001, 76.0 + (i % 20) * 0.01 + 0.001) for i in range(count)]
+
+
+def fake_engine(fake_ee, clock, store=None):
+    service = GEEService(use_mock=False)
+    service.ndvi_cache = None
+    fake_ee.today = latest_released_composite(clock(), 7)[0]
+    return service, NDVITimeSeriesEngine(service, store=store if store is not None else NDVISeriesStore(), clock=clock)
+
+
+class TestAnomalyMath:
+    """Test vectorized anomaly scoring"""
+
+    def test_composite_periods(self):
+        """Test composite dates map to year and 16-day period"""
+        years, periods = composite_periods(np.array(['2024-01-01', '2024-01-17', '2024-12-18'], dtype='datetime64[D]'))
+
+        assert years.tolist() == [2024, 2024, 2024]
+        assert periods.tolist() == [0, 1, 22]
+
+    def test_matches_reference_loop(self):
+        """Test vectorized z-scores equal a per-plot loop, with gaps"""
+        rng = np.random.default_rng(7)
+        dates = composite_dates(2018, 2025)
+        values = rng.normal(0.6, 0.1, (6, len(dates)))
+        values[rng.random(values.shape) < 0.15] = np.nan
+
+        result = ndvi_anomalies(dates, values, climatology_years=5, min_years=3)
+        expected = reference_anomalies(dates, values, climatology_years=5, min_years=3)
+
+        np.testing.assert_allclose(result['z_score'], expected, rtol=1e-9, atol=1e-9)
+
+    def test_first_years_lack_history(self):
+        """Test composites without min_years of history have no z-score"""
+        dates = composite_dates(2020, 2024)
+        values = np.full((1, len(dates)), 0.5)
+
+        result = ndvi_anomalies(dates, values, climatology_years=5, min_years=3)
+
+        assert np.isnan(result['z_score'][0, :23 * 3]).all()
+        assert not np.isnan(result['z_score'][0, 23 * 3:]).any()
+        assert result['climatology_years'][0, -1] == 4
+
+    def test_seasonal_low_is_not_stress(self):
+        """Test a low value that is normal for its period is not flagged"""
+        dates = composite_dates(2019, 2025)
+        years, periods = composite_periods(dates)
+        season = 0.5 + 0.3 * np.sin(2 * np.pi * periods / 23)
+        noise = np.random.default_rng(1).normal(0, 0.005, len(dates))
+        senescent = season + noise
+        stressed = senescent.copy()
+        latest_peak = np.where((years == 2025) & (periods == 6))[0][0]
+        stressed[latest_peak] -= 0.3
+
+        result = ndvi_anomalies(dates, np.vstack([senescent, stressed]), climatology_years=5, min_years=3)
+        trough = np.where((years == 2025) & (periods == 17))[0][0]
+
+        assert senescent[trough] < 0.3
+        assert abs(result['z_score'][0, trough]) < 1.5
+        assert result['z_score'][1, latest_peak] < -1.5
+
+    def test_classification(self):
+        """Test labels for each z-score band"""
+        labels = classify_anomalies(
+            np.array([np.nan, -2.0, 2.0, 0.0, 0.0]),
+            np.array([0.5, 0.5, 0.5, 0.2, 0.6])
+        )
+
+        assert labels.tolist() == ["insufficient_history", "stress", "above_normal", "seasonal_low", "normal"]
+
+
+class TestSeriesStore:
+    """Test per-pixel series storage"""
+
+    def test_memory_store(self):
+        """Test series round-trip in memory"""
+        store = NDVISeriesStore()
+        store.save('1_2', np.array(['2024-01-01'], dtype='datetime64[D]'), np.array([0.5]))
+
+        dates, values = store.load('1_2')
+
+        assert dates.dtype == np.dtype('datetime64[D]')
+        assert values.dtype == np.float32
+        assert store.load('missing') is None
+        assert len(store) == 1
+
+    def test_npz_persists_across_instances(self, tmp_path):
+        """Test a new store reads series written by another"""
+        dates = composite_dates(2024, 2024)
+        values = np.linspace(0.2, 0.8, len(dates))
+        NDVISeriesStore(str(tmp_path)).save('10_20', dates, values)
+
+        loaded_dates, loaded_values = NDVISeriesStore(str(tmp_path)).load('10_20')
+
+        assert (tmp_path / '10_20.npz').exists()
+        np.testing.assert_array_equal(loaded_dates, dates)
+        np.testing.assert_allclose(loaded_values, values.astype(np.float32))
+
+
+class TestSeriesBatch:
+    """Test series extraction through GEEService"""
+
+    @pytest.mark.asyncio
+    async def test_one_request_per_chunk(self, fake_ee):
+        """Test a batch series is one toBands/reduceRegions call per chunk"""
+        service = GEEService(use_mock=False)
+        service.batch_chunk_size = 30
+        fake_ee.today = date(2025, 12, 31)
+        points = points_in_distinct_pixels(70)
+
+        dates, values = await service.get_ndvi_series_batch(points, date(2024, 1, 1), date(2026, 1, 1))
+
+        assert len(dates) == 46
+        assert values.shape == (70, 46)
+        assert values.dtype == np.float32
+        assert fake_ee.requests == [('reduceRegions', 30), ('reduceRegions', 30), ('reduceRegions', 10)]
+
+    @pytest.mark.asyncio
+    async def test_values_are_scaled(self, fake_ee):
+        """Test raw band values are converted to NDVI"""
+        from tests.fake_ee import fake_ndvi_series_raw
+
+        service = GEEService(use_mock=False)
+        fake_ee.today = date(2025, 12, 31)
+        lat, lon = points_in_distinct_pixels(1)[0]
+
+        dates, values = await service.get_ndvi_series_batch([(lat, lon)], date(2025, 1, 1), date(2025, 2, 1))
+
+        assert dates.tolist() == [date(2025, 1, 1), date(2025, 1, 17)]
+        assert values[0, 1] == pytest.approx(fake_ndvi_series_raw(lat, lon, date(2025, 1, 17)) * 0.0001)
+
+    @pytest.mark.asyncio
+    async def test_mock_mode(self):
+        """Test mock series cover every composite in range"""
+        service = GEEService(use_mock=True)
+
+        dates, values = await service.get_ndvi_series_batch([(12.97, 77.59), (15.0, 76.0)], date(2024, 1, 1), date(2025, 1, 1))
+
+        assert len(dates) == 23
+        assert values.shape == (2, 23)
+        assert np.all((values >= -1) & (values <= 1))
+
+
+class TestTimeSeriesEngine:
+    """Test incremental fetching and anomaly results"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_scan_fetches_nothing(self, fake_ee):
+        """Test a second scan before the next release is served from the store"""
+        _, engine = fake_engine(fake_ee, lambda: NOW)
+        points = points_in_distinct_pixels(5)
+
+        first = await engine.get_series(points)
+        requests = len(fake_ee.requests)
+        second = await engine.get_series(points)
+
+        assert len(fake_ee.requests) == requests == 1
+        np.testing.assert_array_equal(first.values, second.values)
+        assert first.dates[0] == np.datetime64('2021-01-01')
+        assert engine.stats()['stored_pixels'] == 5
+
+    @pytest.mark.asyncio
+    async def test_only_new_composites_fetched(self, fake_ee):
+        """Test a scan after the next release fetches just that composite"""
+        now = [NOW]
+        _, engine = fake_engine(fake_ee, lambda: now[0])
+        points = points_in_distinct_pixels(5)
+        first = await engine.get_series(points)
+
+        now[0] = NOW + timedelta(days=16)
+        fake_ee.today = latest_released_composite(now[0], 7)[0]
+        fetched = engine.composites_fetched
+        second = await engine.get_series(points)
+
+        assert engine.fetches == 2
+        assert engine.composites_fetched - fetched == 5
+        assert len(second.dates) == len(first.dates) + 1
+        np.testing.assert_array_equal(second.values[:, :-1], first.values)
+
+    @pytest.mark.asyncio
+    async def test_same_pixel_points_share_a_series(self, fake_ee):
+        """Test points in one MODIS pixel are fetched once"""
+        _, engine = fake_engine(fake_ee, lambda: NOW)
+        lat, lon = points_in_distinct_pixels(1)[0]
+
+        series = await engine.get_series([(lat, lon), (lat + 0.0001, lon + 0.0001)])
+
+        assert fake_ee.requests[0] == ('reduceRegions', 1)
+        np.testing.assert_array_equal(series.values[0], series.values[1])
+
+    @pytest.mark.asyncio
+    async def test_store_survives_restart(self, fake_ee, tmp_path):
+        """Test an engine with the same store directory does not refetch"""
+        points = points_in_distinct_pixels(3)
+        _, engine = fake_engine(fake_ee, lambda: NOW, NDVISeriesStore(str(tmp_path)))
+        await engine.get_series(points)
+
+        restarted = NDVITimeSeriesEngine(engine.gee_service, store=NDVISeriesStore(str(tmp_path)), clock=lambda: NOW)
+        await restarted.get_series(points)
+
+        assert restarted.fetches == 0
+
+    @pytest.mark.asyncio
+    async def test_anomalies_flag_stressed_plot(self, fake_ee):
+        """Test a sharp drop in the latest composite is classified as stress"""
+        _, engine = fake_engine(fake_ee, lambda: NOW)
+        healthy, stressed = points_in_distinct_pixels(2)
+        row, col = modis_pixel_index(*stressed)
+        fake_ee.overrides[(row, col, fake_ee.today)] = 1000
+
+        anomalies = await engine.get_anomalies([healthy, stressed])
+
+        assert [a.composite_date for a in anomalies] == [fake_ee.today, fake_ee.today]
+        assert anomalies[0].classification == "normal"
+        assert anomalies[1].classification == "stress"
+        assert anomalies[1].z_score < -1.5
+        assert anomalies[1].climatology_years == 5
+
+    @pytest.mark.asyncio
+    async def test_brain_service_adds_anomaly(self, mock_dynamodb_tables):
+        """Test analyze_plot attaches the anomaly when enabled"""
+        from unittest.mock import AsyncMock
+        from services.brain_service import BrainService
+        from services.sentinel_service import SentinelService
+
+        sentinel = AsyncMock(spec=SentinelService)
+        sentinel.get_latest_image.side_effect = RuntimeError("no imagery")
+        brain = BrainService(use_mock_gee=True, sentinel_service=sentinel)
+        brain.ndvi_timeseries.store = NDVISeriesStore()
+        brain.use_ndvi_anomaly = True
+
+        result = await brain.analyze_plot(12.9716, 77.5946)
+        anomaly = result.gee_data.metadata['ndvi_anomaly']
+
+        assert anomaly['classification'] in ("normal", "stress", "above_normal", "seasonal_low")
+        assert anomaly['climatology_years'] == 5
+        assert "Seasonal Anomaly" in brain._format_anomaly_context(anomaly)
+        assert brain._format_anomaly_context(None) == ""
+
+
+@pytest.mark.slow
+class TestAnomalyBenchmark:
+    """Vectorized scoring vs per-plot loop"""
+
+    def test_vectorized_speedup(self):
+        """Report z-score time for 200 plots x 6 years"""
+        rng = np.random.default_rng(3)
+        dates = composite_dates(2020, 2025)
+        values = rng.normal(0.6, 0.1, (200, len(dates)))
+
+        start = time.perf_counter()
+        result = ndvi_anomalies(dates, values, climatology_years=5, min_years=3)
+        vectorized_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        expected = reference_anomalies(dates, values[:20], climatology_years=5, min_years=3)
+        loop_ms = (time.perf_counter() - start) * 1000 * 10
+
+        np.testing.assert_allclose(result['z_score'][:20], expected, rtol=1e-9, atol=1e-9)
+        assert vectorized_ms < loop_ms
+
+        print(f"\nAnomaly z-scores, 200 plots x {len(dates)} composites:")
+        print(f"  vectorized {vectorized_ms:.1f} ms, per-plot loop (extrapolated) {loop_ms:.1f} ms")
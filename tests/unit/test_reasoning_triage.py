@@ -0,0 +1,198 @@
+"""
+Unit Tests for tiered reasoning triage
+
+Tests routing of plot analyses including:
+- Tier selection from NDVI threshold distance and anomaly signals
+- Cost and latency savings report
+- BrainService Sonnet / Haiku / rules paths
+- Risk thresholds read from BrainServiceConfig
+"""
+
+import pytest
+import json
+from unittest.mock import AsyncMock, patch
+
+from config.settings import BrainServiceConfig
+from services.brain_service import BrainService
+from services.reasoning_triage import ReasoningTriage
+
+SONNET = 'anthropic.claude-3-sonnet-20240229-v1:0'
+HAIKU = 'anthropic.claude-3-haiku-20240307-v1:0'
+
+
+@pytest.fixture
+def triage():
+    return ReasoningTriage(thresholds=(0.2, 0.4, 0.6), sonnet_margin=0.05, haiku_margin=0.12)
+
+
+@pytest.fixture
+def brain(brain):
+    """Shared BrainService with triage enabled"""
+    brain.triage.enabled = True
+    return brain
+
+
+class TestTriageDecision:
+    """Test tier selection"""
+
+    @pytest.mark.parametrize("ndvi, tier", [
+        (0.85, "rules"),
+        (0.05, "rules"),
+        (0.61, "sonnet"),
+        (0.37, "sonnet"),
+        (0.70, "haiku"),
+        (0.50, "haiku"),
+    ])
+    def test_threshold_distance(self, triage, ndvi, tier):
+        """Test tiers follow the distance to the nearest risk threshold"""
+        assert triage.decide(ndvi).tier == tier
+
+    def test_anomalies_escalate(self, triage):
+        """Test anomaly signals override a clear-cut NDVI"""
+        assert triage.decide(0.85, {'classification': 'stress'}).tier == "sonnet"
+        assert triage.decide(0.85, {'classification': 'above_normal'}).tier == "sonnet"
+        assert triage.decide(0.05, {'classification': 'seasonal_low'}).tier == "haiku"
+        assert triage.decide(0.85, {'classification': 'normal'}).tier == "rules"
+
+    def test_disabled_always_sonnet(self):
+        """Test disabled triage keeps the all-Sonnet behaviour"""
+        triage = ReasoningTriage(thresholds=(0.2, 0.4, 0.6), enabled=False)
+
+        assert triage.decide(0.95).tier == "sonnet"
+
+    def test_invalid_margins(self):
+        """Test the Sonnet band must sit inside the Haiku band"""
+        with pytest.raises(ValueError):
+            ReasoningTriage(thresholds=(0.2, 0.4, 0.6), sonnet_margin=0.2, haiku_margin=0.1)
+
+
+class TestTriageReport:
+    """Test savings accounting"""
+
+    def test_cost_and_latency_saved(self):
+        """Test savings against sending every plot to Sonnet"""
+        triage = ReasoningTriage(thresholds=(0.2, 0.4, 0.6), sonnet_cost_usd=0.01, haiku_cost_usd=0.001)
+        triage.record("sonnet", 4.0)
+        triage.record("haiku", 1.0)
+        triage.record("rules", 0.0)
+        triage.record("rules", 0.0)
+
+        report = triage.report()
+
+        assert report['tier_counts'] == {'rules': 2, 'haiku': 1, 'sonnet': 1, 'batch': 0}
+        assert report['sonnet_calls_avoided'] == 3
+        assert report['baseline_cost_usd'] == pytest.approx(0.04)
+        assert report['estimated_cost_usd'] == pytest.approx(0.011)
+        assert report['cost_saved_usd'] == pytest.approx(0.029)
+        assert report['latency_saved_seconds'] == pytest.approx(11.0)
+
+    def test_batch_plots_costed_separately(self):
+        """Test batch-prompt plots count as plots at the per-plot batch cost"""
+        triage = ReasoningTriage(thresholds=(0.2, 0.4, 0.6), sonnet_cost_usd=0.01, batch_cost_usd=0.002)
+        triage.record("batch", 0.5)
+        triage.record("batch", 0.5)
+        triage.record("rules", 0.0)
+
+        report = triage.report()
+
+        assert report['plots'] == 3
+        assert report['tier_counts']['batch'] == 2
+        assert report['estimated_cost_usd'] == pytest.approx(0.004)
+        assert report['cost_saved_usd'] == pytest.approx(0.026)
+        assert report['latency_saved_seconds'] == pytest.approx(11.0)
+
+    def test_report_since_snapshot(self, triage):
+        """Test a snapshot limits the report to later analyses"""
+        triage.record("sonnet", 3.0)
+        snapshot = triage.snapshot()
+        triage.record("rules", 0.0)
+
+        report = triage.report(snapshot)
+
+        assert report['plots'] == 1
+        assert report['tier_counts']['sonnet'] == 0
+        assert report['latency_saved_seconds'] == pytest.approx(3.0)
+
+
+class TestBrainServiceTriage:
+    """Test analyze_plot routing"""
+
+    @pytest.mark.asyncio
+    async def test_clear_cut_plot_skips_bedrock(self, brain, make_gee_data):
+        """Test a healthy plot far from thresholds uses the rule-based label"""
+        with patch.object(brain.bedrock_client, 'invoke_model') as invoke:
+            result = await brain.analyze_plot(12.97, 77.59, gee_data=make_gee_data(0.85))
+
+        invoke.assert_not_called()
+        assert result.reasoning_tier == "rules"
+        assert result.risk_level == brain._fallback_risk_classification(0.85).risk_classification == "low"
+        assert result.sentinel_data.tile_id == '43PGP'
+
+    @pytest.mark.asyncio
+    async def test_mid_confidence_plot_uses_haiku_text(self, brain, make_gee_data, bedrock_analysis_reply):
+        """Test a moderately close plot gets a text-only Haiku call"""
+        with patch.object(brain.bedrock_client, 'invoke_model', side_effect=lambda **kwargs: bedrock_analysis_reply()) as invoke:
+            result = await brain.analyze_plot(12.97, 77.59, gee_data=make_gee_data(0.52))
+
+        assert result.reasoning_tier == "haiku"
+        assert result.risk_level == "medium"
+        assert invoke.call_args.kwargs['modelId'] == HAIKU
+        assert isinstance(json.loads(invoke.call_args.kwargs['body'])['messages'][0]['content'], str)
+
+    @pytest.mark.asyncio
+    async def test_borderline_plot_uses_sonnet(self, brain, make_gee_data, bedrock_analysis_reply):
+        """Test a plot near a threshold gets the multimodal Sonnet call"""
+        with patch.object(brain.bedrock_client, 'invoke_model', side_effect=lambda **kwargs: bedrock_analysis_reply()) as invoke:
+            result = await brain.analyze_plot(12.97, 77.59, gee_data=make_gee_data(0.61))
+
+        assert result.reasoning_tier == "sonnet"
+        assert invoke.call_args.kwargs['modelId'] == SONNET
+        assert brain.get_triage_report()['tier_counts']['sonnet'] == 1
+
+    @pytest.mark.asyncio
+    async def test_haiku_failure_falls_back_to_rules(self, brain, make_gee_data):
+        """Test a failed Haiku call still classifies the plot"""
+        with patch.object(brain.bedrock_client, 'invoke_model', side_effect=Exception('throttled')):
+            result = await brain.analyze_plot(12.97, 77.59, gee_data=make_gee_data(0.52))
+
+        assert result.risk_level == "medium"
+
+    @pytest.mark.asyncio
+    async def test_no_imagery_not_counted(self, brain, make_gee_data):
+        """Test plots without imagery keep the NDVI-only path and are not triaged"""
+        brain.sentinel_service.get_latest_image = AsyncMock(side_effect=RuntimeError("no tile"))
+
+        result = await brain.analyze_plot(12.97, 77.59, gee_data=make_gee_data(0.85))
+
+        assert result.reasoning_tier is None
+        assert brain.get_triage_report()['plots'] == 0
+
+
+class TestConfigWiring:
+    """Test BrainServiceConfig drives BrainService"""
+
+    def test_thresholds_from_settings(self):
+        """Test risk thresholds, triage margins and outbreak size come from settings"""
+        config = BrainServiceConfig(
+            ndvi_threshold_critical=0.15, ndvi_threshold_high=0.35, ndvi_threshold_medium=0.55,
+            cluster_outbreak_min_plots=5, triage_enabled=True, triage_sonnet_margin=0.02
+        )
+        with patch('services.brain_service.get_settings') as get_settings:
+            get_settings.return_value.brain_service = config
+            get_settings.return_value.aws.region = 'ap-south-1'
+            service = BrainService(use_mock_gee=True)
+
+        assert (service.ndvi_critical_threshold, service.ndvi_high_threshold, service.ndvi_medium_threshold) == \
+            (0.15, 0.35, 0.55)
+        assert service.cluster_outbreak_min_plots == 5
+        assert service.triage.enabled is True
+        assert service.triage.thresholds == [0.15, 0.35, 0.55]
+        assert service.triage.sonnet_margin == 0.02
+
+    def test_defaults_match_previous_behaviour(self):
+        """Test default settings keep the 0.2 / 0.4 / 0.6 bands and Sonnet for every plot"""
+        service = BrainService(use_mock_gee=True)
+
+        assert (service.ndvi_critical_threshold, service.ndvi_high_threshold, service.ndvi_medium_threshold) == \
+            (0.2, 0.4, 0.6)
+        assert service.triage.decide(0.95).tier == "sonnet"
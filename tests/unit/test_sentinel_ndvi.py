@@ -0,0 +1,210 @@
+"""
+Unit Tests for local Sentinel-2 NDVI
+
+Tests 10 m plot NDVI including:
+- Vectorized band math with the processing baseline 04.00 offset
+- SCL cloud, shadow and nodata masking
+- SentinelService.get_local_ndvi against local B04/B08/SCL GeoTIFFs
+- BrainService using local NDVI as the primary source with GEE fallback
+"""
+
+import pytest
+import time
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+
+from services.sentinel_ndvi import (
+    SCL_CLOUD_HIGH,
+    SCL_NO_DATA,
+    SCL_VEGETATION,
+    boa_offset,
+    window_ndvi
+)
+from services.sentinel_service import SentinelService
+from tests.geotiff import pixel_of, write_geotiff
+
+LAT, LON = 12.9716, 77.5946
+ORIGIN = (781000.0, 1436000.0)  # puts the plot near the top-left of a small scene
+SCENE_KEY = 'tiles/43/P/GQ/2024/1/5/0/R60m/TCI.jp2'
+ACQUIRED = datetime(2024, 1, 5)
+
+
+def bands(red=500, nir=3500, scl=SCL_VEGETATION, shape=(4, 4), offset=1000):
+    return (np.full(shape, red + offset, dtype=np.uint16), np.full(shape, nir + offset, dtype=np.uint16),
+            np.full(shape, scl, dtype=np.uint8))
+
+
+@pytest.fixture
+def scene_bands(tmp_path):
+    """B04/B08 at 10 m and SCL at 20 m; the northern half of the plot window is cloud"""
+    cloud_rows = pixel_of(LAT, LON, origin=ORIGIN)[0] // 2  # in 20 m SCL rows
+    b04 = np.full((1, 128, 128), 1500, dtype=np.uint16)
+    b08 = np.full((1, 128, 128), 4500, dtype=np.uint16)
+    b04[:, :2 * cloud_rows], b08[:, :2 * cloud_rows] = 6000, 6000  # bright cloud tops, NDVI ~0
+    scl = np.full((1, 64, 64), SCL_VEGETATION, dtype=np.uint8)
+    scl[:, :cloud_rows] = SCL_CLOUD_HIGH
+    return {
+        'B04': write_geotiff(str(tmp_path / 'B04.tif'), b04, origin=ORIGIN),
+        'B08': write_geotiff(str(tmp_path / 'B08.tif'), b08, origin=ORIGIN),
+        'SCL': write_geotiff(str(tmp_path / 'SCL.tif'), scl, resolution_m=20.0, origin=ORIGIN)
+    }
+
+
+def local_sentinel_service(scene_bands):
+    """SentinelService whose latest scene resolves to the local band files"""
+    with patch('services.sentinel_service.get_client'):
+        service = SentinelService(region='ap-south-1')
+    service._lookup_tile_image = AsyncMock(return_value={
+        'image_metadata': {'s3_key': SCENE_KEY, 'acquisition_date': ACQUIRED, 'tile_id': '43PGQ'},
+        'image_url': 'https://example.com/tci',
+        's3_calls': 0
+    })
+    service._generate_presigned_url = lambda key: scene_bands[key.rsplit('/', 1)[1].split('.')[0]]
+    return service
+
+
+class TestWindowNDVI:
+    """Test vectorized band math"""
+
+    def test_ndvi_with_offset(self):
+        """Test NDVI from digital numbers with the BOA offset removed"""
+        stats = window_ndvi(*bands(), offset=1000)
+
+        assert stats['mean'] == pytest.approx(0.75)
+        assert stats['valid_fraction'] == 1.0
+
+    def test_offset_by_processing_baseline(self):
+        """Test scenes before baseline 04.00 have no offset"""
+        assert boa_offset(datetime(2021, 12, 31)) == 0
+        assert boa_offset(datetime(2022, 1, 25)) == 1000
+
+    def test_clouds_and_nodata_masked(self):
+        """Test SCL cloud and nodata pixels are excluded and cloud counted"""
+        b04, b08, scl = bands(shape=(4, 4))
+        b04[0], b08[0], scl[0] = 6000, 6000, SCL_CLOUD_HIGH
+        b04[1], b08[1], scl[1] = 0, 0, SCL_NO_DATA
+
+        stats = window_ndvi(b04, b08, scl, offset=1000)
+
+        assert stats['mean'] == pytest.approx(0.75)
+        assert stats['std'] == pytest.approx(0.0)
+        assert (stats['valid_pixels'], stats['total_pixels']) == (8, 16)
+        assert stats['cloud_fraction'] == 0.25
+
+    def test_fully_masked_window(self):
+        """Test a fully cloudy window has no NDVI"""
+        stats = window_ndvi(*bands(scl=SCL_CLOUD_HIGH))
+
+        assert stats['mean'] is None
+        assert stats['valid_fraction'] == 0.0
+
+    def test_zero_reflectance_not_divided(self):
+        """Test dark pixels at the offset floor are skipped instead of dividing by zero"""
+        stats = window_ndvi(*bands(red=0, nir=0), offset=1000)
+
+        assert stats['valid_pixels'] == 0
+
+    @pytest.mark.slow
+    def test_window_ndvi_benchmark(self):
+        """Report band math throughput on a 1000 x 1000 window"""
+        rng = np.random.default_rng(0)
+        b04 = rng.integers(1000, 4000, (1000, 1000), dtype=np.uint16)
+        b08 = rng.integers(1000, 6000, (1000, 1000), dtype=np.uint16)
+        scl = rng.choice(np.array([4, 5, 8, 9], dtype=np.uint8), (1000, 1000))
+
+        start = time.perf_counter()
+        window_ndvi(b04, b08, scl, offset=1000)
+        elapsed = time.perf_counter() - start
+
+        print(f"\nwindow_ndvi on 1M pixels: {elapsed * 1000:.1f} ms")
+
+
+class TestSentinelServiceLocalNDVI:
+    """Test NDVI from local band windows"""
+
+    @pytest.mark.asyncio
+    async def test_local_ndvi_from_bands(self, scene_bands):
+        """Test cloudy pixels are masked and the result is GEEData-compatible"""
+        service = local_sentinel_service(scene_bands)
+
+        result = await service.get_local_ndvi(LAT, LON)
+
+        assert result.ndvi_float == 0.75
+        assert result.acquisition_date == ACQUIRED
+        assert 30 <= result.cloud_cover <= 70
+        assert result.metadata['data_source'] == 'sentinel_local'
+        assert result.metadata['scene'] == 'tiles/43/P/GQ/2024/1/5/0'
+        assert result.metadata['total_pixels'] == 100
+        assert result.quality_score == pytest.approx(1 - result.cloud_cover / 100, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_too_cloudy_rejected(self, scene_bands):
+        """Test a mostly cloudy window raises instead of returning a biased NDVI"""
+        service = local_sentinel_service(scene_bands)
+        service.local_ndvi_min_valid_fraction = 0.9
+
+        with pytest.raises(ValueError):
+            await service.get_local_ndvi(LAT, LON)
+
+    @pytest.mark.asyncio
+    async def test_no_scene_rejected(self, scene_bands):
+        """Test a tile without a recent scene raises"""
+        service = local_sentinel_service(scene_bands)
+        service._lookup_tile_image = AsyncMock(return_value={'image_metadata': None, 'image_url': None, 's3_calls': 1})
+
+        with pytest.raises(ValueError):
+            await service.get_local_ndvi(LAT, LON)
+
+
+class TestBrainServiceNDVISource:
+    """Test local NDVI as the primary source"""
+
+    @pytest.fixture
+    def brain(self, brain, scene_bands):
+        """Shared BrainService reading NDVI from the local scene bands"""
+        brain.sentinel_service = local_sentinel_service(scene_bands)
+        brain.ndvi_source = 'sentinel'
+        return brain
+
+    @pytest.mark.asyncio
+    async def test_analyze_plot_uses_local_ndvi(self, brain):
+        """Test analyze_plot takes 10 m NDVI when the scene is usable"""
+        with patch.object(brain, '_bedrock_multimodal_analysis',
+                          AsyncMock(return_value=brain._fallback_risk_classification(0.75))):
+            result = await brain.analyze_plot(LAT, LON)
+
+        assert result.gee_data.ndvi_float == 0.75
+        assert result.gee_data.metadata['resolution'] == '10m'
+
+    @pytest.mark.asyncio
+    async def test_gee_fallback(self, brain):
+        """Test Earth Engine is used when the local scene is unusable"""
+        brain.sentinel_service.local_ndvi_min_valid_fraction = 1.0
+
+        result = await brain.get_ndvi(LAT, LON)
+
+        assert result.metadata['sensor'] == 'MODIS/061/MOD13Q1'
+        assert brain.get_service_info()['ndvi_source'] == {'sentinel': 0, 'gee_fallback': 1, 'primary': 'sentinel'}
+
+    @pytest.mark.asyncio
+    async def test_batch_falls_back_only_for_failed_plots(self, brain):
+        """Test one GEE batch covers only the plots without local NDVI"""
+        outside = (12.0, 77.0)
+        with patch.object(brain.gee_service, 'get_ndvi_batch',
+                          wraps=brain.gee_service.get_ndvi_batch) as gee_batch:
+            results = await brain.get_ndvi_batch([(LAT, LON), outside])
+
+        gee_batch.assert_called_once_with([outside])
+        assert [r.metadata.get('data_source') for r in results] == ['sentinel_local', 'mock']
+
+    @pytest.mark.asyncio
+    async def test_gee_default_skips_sentinel(self, brain):
+        """Test the default source never reads Sentinel-2 bands"""
+        brain.ndvi_source = 'gee'
+        brain.sentinel_service.get_local_ndvi = AsyncMock()
+
+        await brain.get_ndvi_batch([(LAT, LON)])
+
+        brain.sentinel_service.get_local_ndvi.assert_not_called()
@@ -3,6 +3,9 @@ Unit Tests for SentinelService
 
 Tests AWS Open Data Sentinel-2 integration including:
 - Tile ID conversion from coordinates
+- Cached tile acquisition index
+- Scene cloud cover from tileInfo.json and cloud-aware scene selection
+- Coalescing of concurrent lookups for the same tile
 - Image retrieval and presigned URL generation
 - Image quality assessment
 - Data availability checking
@@ -10,6 +13,8 @@ Tests AWS Open Data Sentinel-2 integration including:
 """
 
 import pytest
+import io
+import json
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 from botocore.exceptions import ClientError
@@ -18,12 +23,13 @@ from services.sentinel_service import (
     SentinelData,
     ImageQualityResult
 )
+from services.cache import TTLCache
 
 
 @pytest.fixture
 def sentinel_service():
     """Create SentinelService instance for testing"""
-    with patch('services.sentinel_service.boto3.client'):
+    with patch('services.sentinel_service.get_client'):
         service = SentinelService(region='ap-south-1')
         return service
 
@@ -34,23 +40,29 @@ def mock_s3_client():
     return Mock()
 
 
+def recent_tci_key(days_ago: int = 2, prefix: str = "tiles/43/P/GQ") -> str:
+    """Build a TCI object key for an acquisition within the default search window"""
+    date = datetime.now() - timedelta(days=days_ago)
+    return f"{prefix}/{date.year}/{date.month:02d}/{date.day:02d}/0/R60m/TCI.jp2"
+
+
 class TestSentinelServiceInitialization:
     """Test SentinelService initialization"""
     
     def test_initialization_with_default_region(self):
         """Test service initializes with default region from settings"""
-        with patch('services.sentinel_service.boto3.client') as mock_boto3:
+        with patch('services.sentinel_service.get_client') as mock_get_client:
             service = SentinelService()
             
             assert service.region == 'ap-south-1'
             assert service.sentinel_bucket == 'sentinel-s2-l2a'
             assert service.default_resolution == '60m'
             assert service.presigned_url_expiry == 3600
-            mock_boto3.assert_called_once()
+            mock_get_client.assert_called_once_with('s3', 'ap-south-1')
     
     def test_initialization_with_custom_region(self):
         """Test service initializes with custom region"""
-        with patch('services.sentinel_service.boto3.client'):
+        with patch('services.sentinel_service.get_client'):
             service = SentinelService(region='us-west-2')
             
             assert service.region == 'us-west-2'
@@ -67,7 +79,7 @@ class TestCoordinateToTileConversion:
         assert isinstance(tile_id, str)
         assert len(tile_id) >= 5  # Format: [UTM][LAT][GRID]
         assert tile_id[:2].isdigit()  # UTM zone is numeric
-        assert tile_id == "43PPGP"  # Expected tile for Bangalore
+        assert tile_id == "43PGQ"  # Expected tile for Bangalore
     
     def test_chennai_coordinates_to_tile(self, sentinel_service):
         """Test Chennai coordinates convert to correct tile"""
@@ -75,7 +87,7 @@ class TestCoordinateToTileConversion:
         tile_id = sentinel_service._lat_lon_to_sentinel_tile(13.08, 80.27)
         
         assert isinstance(tile_id, str)
-        assert tile_id == "44PPGP"  # Expected tile for Chennai region
+        assert tile_id == "44PMV"  # Expected tile for Chennai region
     
     def test_hyderabad_coordinates_to_tile(self, sentinel_service):
         """Test Hyderabad coordinates convert to correct tile"""
@@ -83,7 +95,7 @@ class TestCoordinateToTileConversion:
         tile_id = sentinel_service._lat_lon_to_sentinel_tile(17.38, 78.48)
         
         assert isinstance(tile_id, str)
-        assert tile_id == "44QPET"  # Expected tile for Hyderabad
+        assert tile_id == "44QKE"  # Expected tile for Hyderabad
     
     def test_utm_zone_calculation(self, sentinel_service):
         """Test UTM zone is calculated correctly"""
@@ -107,7 +119,7 @@ class TestImageRetrieval:
         mock_s3_client.list_objects_v2.return_value = {
             'Contents': [
                 {
-                    'Key': 'tiles/43/P/GP/2024/01/15/0/R60m/TCI.jp2',
+                    'Key': recent_tci_key(),
                     'Size': 1024000
                 }
             ]
@@ -121,7 +133,7 @@ class TestImageRetrieval:
         
         assert isinstance(result, SentinelData)
         assert result.image_url == 'https://s3.amazonaws.com/presigned-url'
-        assert result.tile_id == '43PPGP'
+        assert result.tile_id == '43PGQ'
         assert result.resolution == '60m'
         assert result.quality_assessment in ['usable', 'marginal', 'unusable']
         assert 's3_key' in result.metadata
@@ -171,7 +183,7 @@ class TestImageRetrieval:
         mock_s3_client.list_objects_v2.return_value = {
             'Contents': [
                 {
-                    'Key': 'tiles/43/P/GP/2024/01/15/0/R60m/TCI.jp2',
+                    'Key': recent_tci_key(),
                     'Size': 2048000
                 }
             ]
@@ -186,6 +198,339 @@ class TestImageRetrieval:
             await sentinel_service.get_latest_image(12.97, 77.59)
 
 
+class TestTileIndex:
+    """Test the cached per-tile acquisition index"""
+    
+    @staticmethod
+    def _month_listing(tile_prefix, days):
+        """Fake delimiter listing returning one CommonPrefix per acquisition day"""
+        def list_objects_v2(**kwargs):
+            assert kwargs['Delimiter'] == '/'
+            prefix = kwargs['Prefix']
+            year, month = (int(part) for part in prefix.rstrip('/').split('/')[-2:])
+            return {
+                'CommonPrefixes': [
+                    {'Prefix': f"{prefix}{day.day:02d}/"}
+                    for day in days
+                    if prefix.startswith(tile_prefix) and (day.year, day.month) == (year, month)
+                ]
+            }
+        return list_objects_v2
+    
+    def test_one_listing_per_tile_month(self, sentinel_service, mock_s3_client):
+        """Test a cold lookup lists each month in the window once instead of each day"""
+        sentinel_service.s3_client = mock_s3_client
+        mock_s3_client.list_objects_v2.side_effect = self._month_listing("tiles/43/P/GQ/", [])
+        
+        assert sentinel_service._find_latest_sentinel_image("43PGQ", max_days_back=30) is None
+        
+        prefixes = [c.kwargs['Prefix'] for c in mock_s3_client.list_objects_v2.call_args_list]
+        assert len(prefixes) <= 2
+        assert all(p.count('/') == 6 for p in prefixes)
+    
+    def test_latest_acquisition_selected(self, sentinel_service, mock_s3_client):
+        """Test the newest acquisition in the window is returned with a derived TCI key"""
+        sentinel_service.s3_client = mock_s3_client
+        today = datetime.now()
+        days = [today - timedelta(days=d) for d in (20, 9, 4)]
+        mock_s3_client.list_objects_v2.side_effect = self._month_listing("tiles/43/P/GQ/", days)
+        
+        result = sentinel_service._find_latest_sentinel_image("43PGQ")
+        
+        latest = days[-1]
+        assert result['acquisition_date'].date() == latest.date()
+        assert result['s3_key'] == (f"tiles/43/P/GQ/{latest.year}/{latest.month:02d}/"
+                                    f"{latest.day:02d}/0/R60m/TCI.jp2")
+    
+    def test_acquisitions_outside_window_ignored(self, sentinel_service, mock_s3_client):
+        """Test scenes older than max_days_back are not returned"""
+        sentinel_service.s3_client = mock_s3_client
+        days = [datetime.now() - timedelta(days=10)]
+        mock_s3_client.list_objects_v2.side_effect = self._month_listing("tiles/43/P/GQ/", days)
+        
+        assert sentinel_service._find_latest_sentinel_image("43PGQ", max_days_back=5) is None
+    
+    def test_index_shared_across_plots_on_tile(self, sentinel_service, mock_s3_client):
+        """Test repeated lookups for plots on the same tile reuse the index"""
+        sentinel_service.s3_client = mock_s3_client
+        days = [datetime.now() - timedelta(days=3)]
+        mock_s3_client.list_objects_v2.side_effect = self._month_listing("tiles/43/P/GQ/", days)
+        
+        first = sentinel_service._find_latest_sentinel_image("43PGQ")
+        cold_calls = mock_s3_client.list_objects_v2.call_count
+        for _ in range(50):
+            assert sentinel_service._find_latest_sentinel_image("43PGQ") == first
+        
+        assert cold_calls >= 1
+        assert mock_s3_client.list_objects_v2.call_count == cold_calls
+    
+    def test_index_expires_after_ttl(self, sentinel_service, mock_s3_client):
+        """Test the current month is re-listed once its TTL elapses"""
+        from services.cache import TTLCache
+        
+        now = [0.0]
+        sentinel_service.tile_index = TTLCache(max_entries=16, ttl_seconds=900, clock=lambda: now[0])
+        sentinel_service.s3_client = mock_s3_client
+        today = datetime.now()
+        mock_s3_client.list_objects_v2.side_effect = self._month_listing("tiles/43/P/GQ/", [])
+        
+        sentinel_service.get_tile_acquisitions("43PGQ", today.year, today.month)
+        now[0] = 901.0
+        sentinel_service.get_tile_acquisitions("43PGQ", today.year, today.month)
+        
+        assert mock_s3_client.list_objects_v2.call_count == 2
+    
+    def test_listing_follows_continuation(self, sentinel_service, mock_s3_client):
+        """Test truncated listings are followed with the continuation token"""
+        sentinel_service.s3_client = mock_s3_client
+        mock_s3_client.list_objects_v2.side_effect = [
+            {'CommonPrefixes': [{'Prefix': 'tiles/43/P/GQ/2026/03/02/'}],
+             'IsTruncated': True, 'NextContinuationToken': 'token-1'},
+            {'CommonPrefixes': [{'Prefix': 'tiles/43/P/GQ/2026/03/17/'}]}
+        ]
+        
+        acquisitions = sentinel_service.get_tile_acquisitions("43PGQ", 2026, 3)
+        
+        assert [a['acquisition_date'].day for a in acquisitions] == [2, 17]
+        assert mock_s3_client.list_objects_v2.call_args.kwargs['ContinuationToken'] == 'token-1'
+    
+    def test_listing_errors_not_cached(self, sentinel_service, mock_s3_client):
+        """Test a failed listing is retried on the next lookup"""
+        sentinel_service.s3_client = mock_s3_client
+        mock_s3_client.list_objects_v2.side_effect = ClientError(
+            {'Error': {'Code': 'SlowDown', 'Message': 'Slow Down'}},
+            'ListObjectsV2'
+        )
+        
+        assert sentinel_service._find_latest_sentinel_image("43PGQ", max_days_back=5) is None
+        assert len(sentinel_service.tile_index) == 0
+
+
+class TestSceneCloudCover:
+    """Test scene cloud cover metadata and cloud-aware scene selection"""
+    
+    @staticmethod
+    def _scenes(mock_s3_client, cloud_by_days_ago, xml_only=()):
+        """Serve one acquisition per entry with its tileInfo.json (or metadata.xml) cloud cover"""
+        keys = {days_ago: recent_tci_key(days_ago) for days_ago in cloud_by_days_ago}
+        mock_s3_client.list_objects_v2.side_effect = lambda **kwargs: {
+            'Contents': [
+                {'Key': key, 'Size': 1024}
+                for key in keys.values() if key.startswith(kwargs['Prefix'])
+            ]
+        }
+        objects = {}
+        for days_ago, cloud in cloud_by_days_ago.items():
+            scene_prefix = keys[days_ago].rsplit('/', 2)[0]
+            if days_ago in xml_only:
+                objects[f"{scene_prefix}/metadata.xml"] = (
+                    f"<n1:Level-2A_User_Product><CLOUDY_PIXEL_PERCENTAGE>{cloud}"
+                    f"</CLOUDY_PIXEL_PERCENTAGE></n1:Level-2A_User_Product>"
+                ).encode()
+            else:
+                objects[f"{scene_prefix}/tileInfo.json"] = json.dumps({'cloudyPixelPercentage': cloud}).encode()
+        
+        def get_object(Bucket, Key):
+            if Key not in objects:
+                raise ClientError({'Error': {'Code': 'NoSuchKey', 'Message': 'Not Found'}}, 'GetObject')
+            return {'Body': io.BytesIO(objects[Key])}
+        
+        mock_s3_client.get_object.side_effect = get_object
+        mock_s3_client.generate_presigned_url.return_value = 'https://s3.amazonaws.com/presigned-url'
+    
+    def test_newest_usable_scene_selected(self, sentinel_service, mock_s3_client):
+        """Test a newer cloudy scene is passed over for the newest clear one"""
+        sentinel_service.s3_client = mock_s3_client
+        self._scenes(mock_s3_client, {2: 85.0, 4: 35.0, 6: 4.2, 8: 1.0})
+        
+        result = sentinel_service._find_latest_sentinel_image("43PGQ")
+        
+        assert result['s3_key'] == recent_tci_key(6)
+        assert result['cloud_cover'] == 4.2
+    
+    def test_clearest_scene_when_none_usable(self, sentinel_service, mock_s3_client):
+        """Test the least cloudy scene is returned when every scene is over the threshold"""
+        sentinel_service.s3_client = mock_s3_client
+        self._scenes(mock_s3_client, {2: 85.0, 4: 35.0, 6: 60.0})
+        
+        result = sentinel_service._find_latest_sentinel_image("43PGQ")
+        
+        assert (result['s3_key'], result['cloud_cover']) == (recent_tci_key(4), 35.0)
+    
+    def test_metadata_read_once_per_scene(self, sentinel_service, mock_s3_client):
+        """Test cloud cover is cached per scene across lookups and plots"""
+        sentinel_service.s3_client = mock_s3_client
+        self._scenes(mock_s3_client, {2: 85.0, 4: 3.0})
+        
+        for _ in range(10):
+            sentinel_service._find_latest_sentinel_image("43PGQ")
+        
+        assert mock_s3_client.get_object.call_count == 2
+        stats = sentinel_service.get_lookup_stats()
+        assert (stats['scene_metadata_requests'], stats['scene_metadata_hits']) == (2, 18)
+    
+    def test_metadata_xml_fallback(self, sentinel_service, mock_s3_client):
+        """Test CLOUDY_PIXEL_PERCENTAGE is read from metadata.xml without tileInfo.json"""
+        sentinel_service.s3_client = mock_s3_client
+        self._scenes(mock_s3_client, {3: 12.5}, xml_only=(3,))
+        
+        result = sentinel_service._find_latest_sentinel_image("43PGQ")
+        
+        assert result['cloud_cover'] == 12.5
+    
+    def test_missing_metadata_keeps_newest_scene(self, sentinel_service, mock_s3_client):
+        """Test scenes without metadata are still used, with an estimated cloud cover"""
+        sentinel_service.s3_client = mock_s3_client
+        self._scenes(mock_s3_client, {2: 50.0})
+        mock_s3_client.get_object.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDenied', 'Message': 'Denied'}}, 'GetObject'
+        )
+        
+        result = sentinel_service._find_latest_sentinel_image("43PGQ")
+        
+        assert result['cloud_cover'] is None
+        assert len(sentinel_service.scene_cloud_cover) == 1
+    
+    def test_missing_metadata_cached_briefly(self, sentinel_service, mock_s3_client):
+        """Test failed metadata reads are counted and remembered until the short TTL expires"""
+        now = [0.0]
+        sentinel_service.s3_client = mock_s3_client
+        sentinel_service.scene_cloud_cover = TTLCache(max_entries=100, ttl_seconds=3600, clock=lambda: now[0])
+        self._scenes(mock_s3_client, {2: 50.0})
+        mock_s3_client.get_object.side_effect = ClientError(
+            {'Error': {'Code': 'NoSuchKey', 'Message': 'Not Found'}}, 'GetObject'
+        )
+        
+        for _ in range(5):
+            sentinel_service._find_latest_sentinel_image("43PGQ")
+        
+        assert mock_s3_client.get_object.call_count == 2
+        assert sentinel_service.get_lookup_stats()['scene_metadata_requests'] == 2
+        
+        now[0] = sentinel_service.scene_metadata_missing_ttl + 1
+        sentinel_service._find_latest_sentinel_image("43PGQ")
+        
+        assert mock_s3_client.get_object.call_count == 4
+    
+    @pytest.mark.asyncio
+    async def test_latest_image_reports_scene_cloud_cover(self, sentinel_service, mock_s3_client):
+        """Test quality is assessed from the scene's real cloud cover"""
+        sentinel_service.s3_client = mock_s3_client
+        self._scenes(mock_s3_client, {2: 72.0})
+        
+        result = await sentinel_service.get_latest_image(12.9716, 77.5946)
+        
+        assert result.cloud_cover_percentage == 72.0
+        assert result.quality_assessment == 'unusable'
+        assert not any('estimated' in issue for issue in result.metadata['quality_issues'])
+
+
+class TestTileLookupCoalescing:
+    """Test single-flight coalescing of concurrent tile lookups"""
+    
+    @staticmethod
+    def _listing_with_recent_scene(mock_s3_client):
+        """Serve one recent TCI object for every month listing"""
+        mock_s3_client.list_objects_v2.return_value = {
+            'Contents': [{'Key': recent_tci_key(), 'Size': 1024}]
+        }
+        mock_s3_client.generate_presigned_url.return_value = 'https://s3.amazonaws.com/presigned-url'
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_plots_on_tile_share_one_lookup(self, sentinel_service, mock_s3_client):
+        """Test concurrent callers on one tile issue the S3 work once"""
+        import asyncio
+        
+        sentinel_service.s3_client = mock_s3_client
+        self._listing_with_recent_scene(mock_s3_client)
+        
+        results = await asyncio.gather(*[
+            sentinel_service.get_latest_image(12.97 + i * 0.001, 77.59) for i in range(20)
+        ])
+        
+        assert len({r.tile_id for r in results}) == 1
+        assert mock_s3_client.generate_presigned_url.call_count == 1
+        assert results[5].metadata['coordinates'] == {'lat': 12.97 + 5 * 0.001, 'lon': 77.59}
+        
+        stats = sentinel_service.get_lookup_stats()
+        assert stats['tile_lookups'] == 1
+        assert stats['coalesced_lookups'] == 19
+        assert stats['s3_calls_saved'] == 19 * (stats['s3_list_calls'] + stats['scene_metadata_requests'])
+    
+    @pytest.mark.asyncio
+    async def test_different_tiles_not_coalesced(self, sentinel_service, mock_s3_client):
+        """Test lookups for different tiles run independently"""
+        import asyncio
+        
+        sentinel_service.s3_client = mock_s3_client
+        self._listing_with_recent_scene(mock_s3_client)
+        
+        await asyncio.gather(
+            sentinel_service.get_latest_image(12.97, 77.59),   # Karnataka tile
+            sentinel_service.get_latest_image(11.0, 79.0)      # Tamil Nadu tile
+        )
+        
+        stats = sentinel_service.get_lookup_stats()
+        assert stats['tile_lookups'] == 2
+        assert stats['coalesced_lookups'] == 0
+    
+    @pytest.mark.asyncio
+    async def test_sequential_lookups_reuse_tile_index(self, sentinel_service, mock_s3_client):
+        """Test later lookups are served from the index and counted as saved calls"""
+        sentinel_service.s3_client = mock_s3_client
+        self._listing_with_recent_scene(mock_s3_client)
+        
+        await sentinel_service.get_latest_image(12.97, 77.59)
+        list_calls = mock_s3_client.list_objects_v2.call_count
+        await sentinel_service.get_latest_image(12.98, 77.60)
+        
+        assert mock_s3_client.list_objects_v2.call_count == list_calls
+        assert sentinel_service.get_lookup_stats()['s3_calls_saved'] >= 1
+    
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter(self, sentinel_service, mock_s3_client):
+        """Test a failing shared lookup raises for all coalesced callers"""
+        import asyncio
+        
+        sentinel_service.s3_client = mock_s3_client
+        self._listing_with_recent_scene(mock_s3_client)
+        mock_s3_client.generate_presigned_url.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDenied', 'Message': 'Access Denied'}},
+            'GeneratePresignedUrl'
+        )
+        
+        results = await asyncio.gather(
+            *[sentinel_service.get_latest_image(12.97, 77.59) for _ in range(3)],
+            return_exceptions=True
+        )
+        
+        assert all(isinstance(r, ClientError) for r in results)
+        assert mock_s3_client.generate_presigned_url.call_count == 1
+        assert len(sentinel_service.tile_lookups) == 0
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_lookup(self):
+        """Test cancelling one waiter leaves the shared call running for the rest"""
+        import asyncio
+        from services.cache import SingleFlight
+        
+        flight = SingleFlight()
+        release = asyncio.Event()
+        
+        async def lookup():
+            await release.wait()
+            return 'image'
+        
+        first = asyncio.ensure_future(flight.do('tile', lookup))
+        second = asyncio.ensure_future(flight.do('tile', lookup))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        
+        assert await second == 'image'
+        assert flight.stats() == {'in_flight': 0, 'calls': 1, 'coalesced': 1}
+
+
 class TestPresignedURLGeneration:
     """Test presigned URL generation"""
     
@@ -385,10 +730,10 @@ class TestTileInfo:
         assert 'bucket' in info
         assert 'resolution' in info
         
-        assert info['tile_id'] == '43PPGP'
+        assert info['tile_id'] == '43PGQ'
         assert info['utm_zone'] == '43'
         assert info['latitude_band'] == 'P'
-        assert info['grid_square'] == 'PGP'
+        assert info['grid_square'] == 'GQ'
         assert info['coordinates'] == {'lat': 12.97, 'lon': 77.59}
         assert info['bucket'] == 'sentinel-s2-l2a'
         assert info['resolution'] == '60m'
@@ -432,7 +777,7 @@ class TestIntegration:
         mock_s3_client.list_objects_v2.return_value = {
             'Contents': [
                 {
-                    'Key': 'tiles/43/P/GP/2024/01/15/0/R60m/TCI.jp2',
+                    'Key': recent_tci_key(),
                     'Size': 3072000
                 }
             ]
@@ -444,7 +789,7 @@ class TestIntegration:
         
         # Verify complete result
         assert result.image_url.startswith('https://')
-        assert result.tile_id == '43PPGP'
+        assert result.tile_id == '43PGQ'
         assert result.quality_assessment in ['usable', 'marginal', 'unusable']
         assert result.metadata['s3_bucket'] == 'sentinel-s2-l2a'
         assert result.metadata['coordinates']['lat'] == 12.97
@@ -6,15 +6,27 @@ Tests proactive monitoring, urgency classification, and notification triggering.
 
 import pytest
 import asyncio
+import io
+import json
+import re
+import threading
+import time
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime
 from typing import Dict, Any
 
-from services.sentry_service import SentryService, ScanResult
-from services.brain_service import AnalysisResult, BedrockResponse
+from services.sentry_service import (
+    SentryService,
+    ScanResult,
+    ScanProgress,
+    ScanResultSink,
+    JsonlScanSink,
+    CallbackScanSink
+)
+from services.brain_service import AnalysisResult, BedrockResponse, BrainService
 from services.gee_service import GEEData
 from services.sentinel_service import SentinelData
-from services.db_service import DbService
+from services.db_service import DbService, AlertData, BulkWriteResult
 from services.sms_service import SMSService
 
 
@@ -26,12 +38,22 @@ def mock_brain_service():
     return service
 
 
+def stream_plots(plots):
+    """Build a side effect that streams plots like DbService.iter_all_plots"""
+    async def _iter_all_plots(*args, **kwargs):
+        for plot in plots:
+            yield plot
+    return _iter_all_plots
+
+
 @pytest.fixture
 def mock_db_service():
     """Mock DbService for testing"""
     service = Mock()
     service.get_all_plots = AsyncMock()
+    service.iter_all_plots = Mock(side_effect=stream_plots([]))
     service.create_alert = AsyncMock()
+    service.create_alerts_bulk = Mock(return_value=BulkWriteResult())
     service.get_officer_by_hobli = AsyncMock()
     return service
 
@@ -258,10 +280,7 @@ class TestAlertCreation:
         sample_plot_data,
         sample_analysis_result
     ):
-        """Test successful alert creation"""
-        # Setup mock
-        mock_db_service.create_alert.return_value = 'alert_123'
-        
+        """Test alert creation outside a scan is written immediately in bulk"""
         # Execute
         alert_id = await sentry_service._create_alert(
             plot_data=sample_plot_data,
@@ -270,17 +289,19 @@ class TestAlertCreation:
         )
         
         # Verify
-        assert alert_id == 'alert_123'
-        mock_db_service.create_alert.assert_called_once()
+        mock_db_service.create_alerts_bulk.assert_called_once()
+        alerts = mock_db_service.create_alerts_bulk.call_args[0][0]
+        assert len(alerts) == 1
         
-        # Check call arguments
-        call_args = mock_db_service.create_alert.call_args[1]
-        assert call_args['plot_id'] == 'plot_001'
-        assert call_args['user_id'] == 'farmer_001'
-        assert call_args['risk_level'] == 'high'
-        assert call_args['ndvi'] == 0.25
-        assert call_args['metadata']['urgency'] == 'high'
-        assert call_args['metadata']['sentry_scan'] is True
+        alert = alerts[0]
+        assert isinstance(alert, AlertData)
+        assert alert_id == f"hobli_001@{alert.timestamp.isoformat()}"
+        assert alert.plot_id == 'plot_001'
+        assert alert.user_id == 'farmer_001'
+        assert alert.risk_level == 'high'
+        assert alert.gee_proof['ndvi_value'] == 0.25
+        assert alert.gee_proof['urgency'] == 'high'
+        assert alert.gee_proof['sentry_scan'] is True
     
     @pytest.mark.asyncio
     async def test_create_alert_handles_failure(
@@ -292,7 +313,7 @@ class TestAlertCreation:
     ):
         """Test alert creation handles database failures"""
         # Setup mock to raise exception
-        mock_db_service.create_alert.side_effect = Exception('DB error')
+        mock_db_service.create_alerts_bulk.side_effect = Exception('DB error')
         
         # Execute
         alert_id = await sentry_service._create_alert(
@@ -301,8 +322,120 @@ class TestAlertCreation:
             urgency='high'
         )
         
-        # Verify fallback alert ID is generated
-        assert alert_id.startswith('alert-plot_001-')
+        # Verify the alert ID is still generated and the failure is recorded
+        assert alert_id.startswith('hobli_001@')
+        assert sentry_service.metrics['alert_write_failures'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_create_alert_reports_unprocessed_items(
+        self,
+        sentry_service,
+        mock_db_service,
+        sample_plot_data,
+        sample_analysis_result
+    ):
+        """Test per-item failures from the bulk write are counted"""
+        mock_db_service.create_alerts_bulk.return_value = BulkWriteResult(
+            failed={'hobli_001@2024-01-01T00:00:00': 'Unprocessed after 5 retries'}
+        )
+        
+        await sentry_service._create_alert(
+            plot_data=sample_plot_data,
+            analysis=sample_analysis_result,
+            urgency='high'
+        )
+        
+        assert sentry_service.metrics['alert_write_failures'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_scan_batches_alert_writes(
+        self,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result
+    ):
+        """Test a full scan writes alerts in batches of batch_write_size"""
+        plots = [{**sample_plot_data, 'plot_id': f'plot_{i:03d}'} for i in range(60)]
+        mock_db_service.iter_all_plots.side_effect = stream_plots(plots)
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        
+        result = await sentry_service.scan_all_registered_plots()
+        
+        assert result['alerts_triggered'] == 60
+        batch_sizes = [len(c[0][0]) for c in mock_db_service.create_alerts_bulk.call_args_list]
+        assert batch_sizes == [25, 25, 10]
+        mock_db_service.create_alert.assert_not_called()
+        assert result['alerts_written'] == 0  # the mock reports no succeeded ids
+        assert result['alert_write_failures'] == []
+    
+    @pytest.mark.asyncio
+    async def test_scan_reports_alert_write_failures(
+        self,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result
+    ):
+        """Test alerts the bulk write could not persist are listed in the scan summary"""
+        plots = [{**sample_plot_data, 'plot_id': f'plot_{i:03d}'} for i in range(3)]
+        mock_db_service.iter_all_plots.side_effect = stream_plots(plots)
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        
+        def write(alerts):
+            ids = [f"{a.hobli_id}@{a.timestamp.isoformat()}" for a in alerts]
+            return BulkWriteResult(succeeded=ids[1:], failed={ids[0]: 'Unprocessed after 5 retries'})
+        mock_db_service.create_alerts_bulk.side_effect = write
+        
+        result = await sentry_service.scan_all_registered_plots()
+        
+        assert result['alerts_written'] == 2
+        assert len(result['alert_write_failures']) == 1
+        failure = result['alert_write_failures'][0]
+        assert failure['plot_id'] in {'plot_000', 'plot_001', 'plot_002'}
+        assert failure['error'] == 'Unprocessed after 5 retries'
+        assert sentry_service.metrics['alert_write_failures'] == 1
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_scans_buffer_alerts_separately(
+        self,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result
+    ):
+        """Test each scan writes and reports only its own alerts"""
+        scans = {
+            prefix: [{**sample_plot_data, 'plot_id': f'{prefix}_{i:03d}'} for i in range(10)]
+            for prefix in ('a', 'b')
+        }
+        mock_db_service.iter_all_plots.side_effect = [
+            stream_plots(scans['a'])(), stream_plots(scans['b'])()
+        ]
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        
+        def write(alerts):
+            ids = {f"{a.hobli_id}@{a.timestamp.isoformat()}": a.plot_id for a in alerts}
+            return BulkWriteResult(
+                succeeded=[i for i, plot_id in ids.items() if plot_id.startswith('a_')],
+                failed={i: 'DB error' for i, plot_id in ids.items() if plot_id.startswith('b_')}
+            )
+        mock_db_service.create_alerts_bulk.side_effect = write
+        
+        result_a, result_b = await asyncio.gather(
+            sentry_service.scan_all_registered_plots(),
+            sentry_service.scan_all_registered_plots()
+        )
+        
+        for call in mock_db_service.create_alerts_bulk.call_args_list:
+            assert len({alert.plot_id[0] for alert in call[0][0]}) == 1
+        assert result_a['alerts_written'] == 10
+        assert result_a['alert_write_failures'] == []
+        assert result_b['alerts_written'] == 0
+        assert {f['plot_id'] for f in result_b['alert_write_failures']} <= set(p['plot_id'] for p in scans['b'])
 
 
 class TestSMSNotifications:
@@ -408,7 +541,7 @@ class TestDailyScanSimulation:
         """Test successful scan of all registered plots"""
         # Setup mocks
         plots = [sample_plot_data, {**sample_plot_data, 'plot_id': 'plot_002'}]
-        mock_db_service.get_all_plots.return_value = plots
+        mock_db_service.iter_all_plots.side_effect = stream_plots(plots)
         mock_brain_service.analyze_plot.return_value = sample_analysis_result
         
         # Execute
@@ -420,7 +553,7 @@ class TestDailyScanSimulation:
         assert result['scanned'] == 2
         assert result['alerts_triggered'] == 2  # Both high urgency
         assert 'duration_seconds' in result
-        assert 'results' in result
+        assert 'results' not in result  # Results are streamed, not accumulated
     
     @pytest.mark.asyncio
     async def test_scan_all_plots_with_limit(
@@ -434,14 +567,14 @@ class TestDailyScanSimulation:
         """Test scan respects max_plots limit"""
         # Setup mocks
         plots = [sample_plot_data]
-        mock_db_service.get_all_plots.return_value = plots
+        mock_db_service.iter_all_plots.side_effect = stream_plots(plots)
         mock_brain_service.analyze_plot.return_value = sample_analysis_result
         
         # Execute with limit
         result = await sentry_service.scan_all_registered_plots(max_plots=1)
         
         # Verify
-        mock_db_service.get_all_plots.assert_called_once_with(limit=1)
+        mock_db_service.iter_all_plots.assert_called_once_with(limit=1)
         assert result['total_plots'] == 1
     
     @pytest.mark.asyncio
@@ -452,7 +585,7 @@ class TestDailyScanSimulation:
     ):
         """Test scan handles no registered plots"""
         # Setup mock
-        mock_db_service.get_all_plots.return_value = []
+        mock_db_service.iter_all_plots.side_effect = stream_plots([])
         
         # Execute
         result = await sentry_service.scan_all_registered_plots()
@@ -471,7 +604,7 @@ class TestDailyScanSimulation:
     ):
         """Test scan handles database failures"""
         # Setup mock to raise exception
-        mock_db_service.get_all_plots.side_effect = Exception('DB error')
+        mock_db_service.iter_all_plots.side_effect = Exception('DB error')
         
         # Execute
         result = await sentry_service.scan_all_registered_plots()
@@ -481,6 +614,650 @@ class TestDailyScanSimulation:
         assert 'error' in result
 
 
+class TestStreamingScanPipeline:
+    """Test the bounded producer/consumer scan pipeline"""
+    
+    def test_sink_must_implement_write(self):
+        """Test ScanResultSink is abstract"""
+        with pytest.raises(TypeError):
+            ScanResultSink()
+    
+    @pytest.mark.asyncio
+    async def test_callback_sink_receives_every_result(
+        self,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result
+    ):
+        """Test results are streamed to a callback sink"""
+        plots = [{**sample_plot_data, 'plot_id': f'plot_{i:03d}'} for i in range(12)]
+        mock_db_service.iter_all_plots.side_effect = stream_plots(plots)
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        
+        received = []
+        result = await sentry_service.scan_all_registered_plots(
+            sink=CallbackScanSink(received.append)
+        )
+        
+        assert result['scanned'] == 12
+        assert sorted(r.plot_id for r in received) == [p['plot_id'] for p in plots]
+        assert all(isinstance(r, ScanResult) for r in received)
+    
+    @pytest.mark.asyncio
+    async def test_async_callback_sink(
+        self,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result
+    ):
+        """Test coroutine callbacks are awaited by the sink"""
+        mock_db_service.iter_all_plots.side_effect = stream_plots([sample_plot_data])
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        
+        received = []
+        
+        async def collect(scan_result):
+            received.append(scan_result.plot_id)
+        
+        await sentry_service.scan_all_registered_plots(sink=CallbackScanSink(collect))
+        
+        assert received == ['plot_001']
+    
+    @pytest.mark.asyncio
+    async def test_jsonl_sink_writes_one_line_per_plot(
+        self,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result,
+        tmp_path
+    ):
+        """Test results are streamed to a JSONL file"""
+        import json
+        
+        plots = [{**sample_plot_data, 'plot_id': f'plot_{i:03d}'} for i in range(5)]
+        mock_db_service.iter_all_plots.side_effect = stream_plots(plots)
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        
+        output_path = tmp_path / "scans" / "results.jsonl"
+        await sentry_service.scan_all_registered_plots(sink=JsonlScanSink(output_path))
+        
+        lines = output_path.read_text(encoding='utf-8').splitlines()
+        assert len(lines) == 5
+        assert {json.loads(line)['plot_id'] for line in lines} == {p['plot_id'] for p in plots}
+    
+    @pytest.mark.asyncio
+    async def test_running_aggregates_and_failures(
+        self,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result
+    ):
+        """Test summary is built from running aggregates including failures"""
+        plots = [{**sample_plot_data, 'plot_id': f'plot_{i:03d}'} for i in range(4)]
+        mock_db_service.iter_all_plots.side_effect = stream_plots(plots)
+        mock_brain_service.analyze_plot.side_effect = [
+            sample_analysis_result,
+            Exception('Analysis failed'),
+            sample_analysis_result,
+            sample_analysis_result
+        ]
+        sentry_service.max_concurrent_scans = 1
+        
+        result = await sentry_service.scan_all_registered_plots()
+        
+        assert result['total_plots'] == 4
+        assert result['scanned'] == 3
+        assert result['scan_failures'] == 1
+        assert result['alerts_triggered'] == 3
+        assert result['risk_level_counts'] == {'high': 3, 'unknown': 1}
+    
+    @pytest.mark.asyncio
+    async def test_progress_callback_reports_live_counters(
+        self,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result
+    ):
+        """Test progress callback sees counters increase as plots complete"""
+        plots = [{**sample_plot_data, 'plot_id': f'plot_{i:03d}'} for i in range(6)]
+        mock_db_service.iter_all_plots.side_effect = stream_plots(plots)
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        
+        completed_counts = []
+        await sentry_service.scan_all_registered_plots(
+            progress_callback=lambda progress: completed_counts.append(progress.completed)
+        )
+        
+        assert completed_counts == [1, 2, 3, 4, 5, 6]
+        assert sentry_service.scan_progress.completed == 6
+        assert sentry_service.get_metrics()['scan_progress']['scanned'] == 6
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("workers", [5, 1])
+    async def test_producer_is_bounded_by_queue(
+        self,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result,
+        workers
+    ):
+        """Test the plot source is never read far ahead of the workers (queue follows the worker count)"""
+        pulled = 0
+        max_ahead = 0
+        completed = 0
+        
+        async def plot_source(*args, **kwargs):
+            nonlocal pulled, max_ahead
+            for i in range(200):
+                pulled += 1
+                max_ahead = max(max_ahead, pulled - completed)
+                yield {**sample_plot_data, 'plot_id': f'plot_{i:03d}'}
+        
+        async def slow_analysis(*args, **kwargs):
+            await asyncio.sleep(0)
+            return sample_analysis_result
+        
+        def on_progress(progress):
+            nonlocal completed
+            completed = progress.completed
+        
+        mock_db_service.iter_all_plots.side_effect = plot_source
+        mock_brain_service.analyze_plot.side_effect = slow_analysis
+        sentry_service.tile_group_window = 10
+        sentry_service.max_concurrent_scans = workers
+        
+        result = await sentry_service.scan_all_registered_plots(progress_callback=on_progress)
+        
+        assert result['scanned'] == 200
+        # Tile grouping window + queue capacity + one plot held by each worker + the one being enqueued
+        queue_size = sentry_service.max_concurrent_scans * sentry_service.scan_queue_per_worker
+        assert max_ahead <= (sentry_service.tile_group_window + queue_size
+                             + sentry_service.max_concurrent_scans + 1)
+    
+    @pytest.mark.asyncio
+    async def test_sink_failure_fails_scan(
+        self,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result
+    ):
+        """Test a failing sink stops the pipeline instead of hanging it"""
+        plots = [{**sample_plot_data, 'plot_id': f'plot_{i:03d}'} for i in range(100)]
+        mock_db_service.iter_all_plots.side_effect = stream_plots(plots)
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        
+        def broken_sink(scan_result):
+            raise IOError('disk full')
+        
+        result = await asyncio.wait_for(
+            sentry_service.scan_all_registered_plots(sink=CallbackScanSink(broken_sink)),
+            timeout=10
+        )
+        
+        assert result['status'] == 'failed'
+        assert 'disk full' in result['error']
+
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_100k_plot_scan_has_flat_memory(
+        self,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_analysis_result,
+        caplog
+    ):
+        """Test a 100k-plot scan keeps peak memory independent of plot count"""
+        import logging
+        import tracemalloc
+        
+        caplog.set_level(logging.WARNING, logger='services.sentry_service')
+        sample_analysis_result.risk_level = 'low'
+        sample_analysis_result.gee_data.ndvi_float = 0.7
+        sample_analysis_result.bedrock_reasoning.explanation = 'Healthy vegetation'
+        
+        async def plot_source(*args, **kwargs):
+            for i in range(100_000):
+                yield {'plot_id': f'plot_{i:06d}', 'user_id': 'farmer', 'latitude': 12.97, 'longitude': 77.59}
+        
+        async def analyze(*args, **kwargs):
+            return sample_analysis_result
+        
+        mock_db_service.iter_all_plots.side_effect = plot_source
+        mock_brain_service.analyze_plot = analyze
+        sentry_service.max_concurrent_scans = 20
+        
+        tracemalloc.start()
+        try:
+            result = await sentry_service.scan_all_registered_plots(
+                sink=CallbackScanSink(lambda scan_result: None)
+            )
+            _, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        
+        assert result['scanned'] == 100_000
+        # Holding every ScanResult would need well over 100 MB
+        assert peak_bytes < 10 * 1024 * 1024
+        print(f"\nStreaming scan: 100000 plots in {result['duration_seconds']:.1f}s, "
+              f"peak traced memory {peak_bytes / 1024 / 1024:.2f} MB")
+
+
+class TestTileGrouping:
+    """Test tile-ordered dispatch and S3 savings reporting"""
+    
+    def test_group_by_tile_keeps_first_seen_tile_order(self, sentry_service, sample_plot_data):
+        """Test plots on the same tile become adjacent"""
+        bangalore = {'latitude': 12.97, 'longitude': 77.59}
+        chennai = {'latitude': 11.0, 'longitude': 79.0}
+        plots = [
+            {**sample_plot_data, **(bangalore if i % 2 == 0 else chennai), 'plot_id': f'plot_{i}'}
+            for i in range(6)
+        ]
+        
+        grouped = sentry_service._group_by_tile(plots)
+        
+        assert [p['plot_id'] for p in grouped] == [
+            'plot_0', 'plot_2', 'plot_4', 'plot_1', 'plot_3', 'plot_5'
+        ]
+    
+    def test_group_by_tile_keeps_plots_with_invalid_coordinates(self, sentry_service, sample_plot_data):
+        """Test plots outside the UTM grid are kept, after the valid tiles"""
+        plots = [
+            {**sample_plot_data, 'plot_id': 'bad', 'latitude': 91.0, 'longitude': 77.59},
+            {**sample_plot_data, 'plot_id': 'bangalore', 'latitude': 12.97, 'longitude': 77.59},
+            {**sample_plot_data, 'plot_id': 'chennai', 'latitude': 11.0, 'longitude': 79.0}
+        ]
+        
+        grouped = sentry_service._group_by_tile(plots)
+        
+        assert [p['plot_id'] for p in grouped] == ['bangalore', 'chennai', 'bad']
+    
+    @pytest.mark.asyncio
+    async def test_scan_dispatches_plots_grouped_by_tile(
+        self,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result
+    ):
+        """Test plots reach analysis grouped by tile within each window"""
+        plots = [
+            {**sample_plot_data, 'plot_id': f'plot_{i}',
+             'latitude': 12.97 if i % 2 == 0 else 11.0,
+             'longitude': 77.59 if i % 2 == 0 else 79.0}
+            for i in range(8)
+        ]
+        mock_db_service.iter_all_plots.side_effect = stream_plots(plots)
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        sentry_service.max_concurrent_scans = 1
+        sentry_service.tile_group_window = 4
+        
+        await sentry_service.scan_all_registered_plots()
+        
+        latitudes = [c.kwargs['lat'] for c in mock_brain_service.analyze_plot.call_args_list]
+        assert latitudes == [12.97, 12.97, 11.0, 11.0, 12.97, 12.97, 11.0, 11.0]
+    
+    @pytest.mark.asyncio
+    async def test_scan_reports_s3_calls_saved(
+        self,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result
+    ):
+        """Test the summary reports the per-run change in Sentinel lookup savings"""
+        mock_db_service.iter_all_plots.side_effect = stream_plots([sample_plot_data])
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        mock_brain_service.sentinel_service.get_lookup_stats = Mock(side_effect=[
+            {'coalesced_lookups': 4, 's3_calls_saved': 10},
+            {'coalesced_lookups': 9, 's3_calls_saved': 25}
+        ])
+        
+        result = await sentry_service.scan_all_registered_plots()
+        
+        assert result['coalesced_tile_lookups'] == 5
+        assert result['s3_calls_saved'] == 15
+    
+    @pytest.mark.asyncio
+    async def test_scan_without_lookup_stats_reports_zero(
+        self,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result
+    ):
+        """Test scans still summarize when the brain service exposes no Sentinel stats"""
+        mock_db_service.iter_all_plots.side_effect = stream_plots([sample_plot_data])
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        
+        result = await sentry_service.scan_all_registered_plots()
+        
+        assert result['s3_calls_saved'] == 0
+
+
+class TestBatchedNDVI:
+    """Test per-window batched NDVI prefetch during full scans"""
+    
+    @staticmethod
+    def spread_plots(sample_plot_data, count):
+        return [
+            {**sample_plot_data, 'plot_id': f'plot_{i}',
+             'latitude': 12.0 + i * 0.01, 'longitude': 77.0 + i * 0.01}
+            for i in range(count)
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_scan_fetches_ndvi_once_per_window(
+        self,
+        fake_ee,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result
+    ):
+        """Test each window issues one reduceRegions call and plots reuse its results"""
+        from services.gee_service import GEEService
+        from tests.fake_ee import fake_ndvi_stats
+        
+        mock_brain_service.gee_service = GEEService(use_mock=False)
+        mock_brain_service.gee_service.ndvi_cache = None
+        mock_db_service.iter_all_plots.side_effect = stream_plots(self.spread_plots(sample_plot_data, 12))
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        sentry_service.tile_group_window = 5
+        
+        result = await sentry_service.scan_all_registered_plots()
+        
+        assert fake_ee.requests == [('reduceRegions', 5), ('reduceRegions', 5), ('reduceRegions', 2)]
+        assert result['ndvi_prefetched'] == 12
+        for call in mock_brain_service.analyze_plot.call_args_list:
+            expected = fake_ndvi_stats(call.kwargs['lat'], call.kwargs['lon'])['NDVI'] * 0.0001
+            assert call.kwargs['gee_data'].ndvi_float == round(expected, 3)
+    
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back_to_per_plot_lookups(
+        self,
+        fake_ee,
+        sentry_service,
+        mock_db_service,
+        mock_brain_service,
+        sample_plot_data,
+        sample_analysis_result
+    ):
+        """Test a failed batch leaves NDVI to each plot's own analysis"""
+        from services.gee_service import GEEService
+        
+        fake_ee.fail_batches = True
+        mock_brain_service.gee_service = GEEService(use_mock=False)
+        mock_db_service.iter_all_plots.side_effect = stream_plots(self.spread_plots(sample_plot_data, 3))
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        
+        result = await sentry_service.scan_all_registered_plots()
+        
+        assert result['scanned'] == 3
+        assert result['ndvi_prefetched'] == 0
+        assert all('gee_data' not in call.kwargs for call in mock_brain_service.analyze_plot.call_args_list)
+
+
+def build_latency_brain_service(latency: float) -> BrainService:
+    """
+    BrainService with mock GEE and boto3 stubs that block for `latency` seconds per call
+    
+    Peak overlapping invoke_model calls are recorded in brain_service.bedrock_client.in_flight.
+    """
+    with patch('services.brain_service.get_client'), patch('services.sentinel_service.get_client'):
+        brain_service = BrainService(use_mock_gee=True)
+    brain_service.bedrock_cache = None  # every plot must reach the blocking Bedrock stub
+    
+    bedrock_reply = json.dumps({'content': [{'text': json.dumps({
+        'risk_classification': 'low',
+        'confidence_score': 0.9,
+        'explanation': 'Healthy canopy',
+        'visual_observations': 'Uniform green cover',
+        'recommendations': ['Continue routine monitoring']
+    })}]}).encode()
+    
+    in_flight = {'active': 0, 'peak': 0}
+    lock = threading.Lock()
+    
+    def invoke_model(**kwargs):
+        with lock:
+            in_flight['active'] += 1
+            in_flight['peak'] = max(in_flight['peak'], in_flight['active'])
+        try:
+            time.sleep(latency)
+        finally:
+            with lock:
+                in_flight['active'] -= 1
+        return {'body': io.BytesIO(bedrock_reply)}
+    
+    def list_objects_v2(**kwargs):
+        time.sleep(latency)
+        today = datetime.now()
+        return {'Contents': [{
+            'Key': f"tiles/43/P/GQ/{today.year}/{today.month:02d}/{today.day:02d}/0/R60m/TCI.jp2",
+            'Size': 1024
+        }]}
+    
+    brain_service.bedrock_client = Mock()
+    brain_service.bedrock_client.invoke_model.side_effect = invoke_model
+    brain_service.bedrock_client.in_flight = in_flight
+    brain_service.sentinel_service.s3_client = Mock()
+    brain_service.sentinel_service.s3_client.list_objects_v2.side_effect = list_objects_v2
+    brain_service.sentinel_service.s3_client.generate_presigned_url.return_value = 'https://example.com/tci'
+    return brain_service
+
+
+class TestScanConcurrency:
+    """Test that concurrent scans overlap their blocking AWS calls"""
+    
+    async def _scan_duration(self, mock_db_service, mock_sms_service, sample_plot_data,
+                             plot_count, max_concurrent_scans, latency):
+        """
+        Scan plot_count plots with real BrainService/SentinelService
+        
+        Returns:
+            Seconds taken and peak overlapping Bedrock calls
+        """
+        brain_service = build_latency_brain_service(latency)
+        sentry_service = SentryService(
+            brain_service=brain_service,
+            db_service=mock_db_service,
+            sms_service=mock_sms_service
+        )
+        sentry_service.max_concurrent_scans = max_concurrent_scans
+        mock_db_service.iter_all_plots.side_effect = stream_plots([
+            {**sample_plot_data, 'plot_id': f'plot_{i:03d}'} for i in range(plot_count)
+        ])
+        
+        start = time.perf_counter()
+        result = await sentry_service.scan_all_registered_plots()
+        elapsed = time.perf_counter() - start
+        
+        assert result['scanned'] == plot_count
+        assert result['alerts_triggered'] == 0
+        return elapsed, brain_service.bedrock_client.in_flight['peak']
+    
+    @pytest.mark.asyncio
+    async def test_bedrock_calls_overlap_across_workers(self, mock_db_service, mock_sms_service, sample_plot_data):
+        """Test blocking Bedrock calls from five workers overlap without exceeding five"""
+        _, peak = await self._scan_duration(
+            mock_db_service, mock_sms_service, sample_plot_data,
+            plot_count=20, max_concurrent_scans=5, latency=0.05
+        )
+        
+        assert 1 < peak <= 5
+    
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_scan_throughput_scales_with_workers_benchmark(
+        self, mock_db_service, mock_sms_service, sample_plot_data
+    ):
+        """Report scan throughput for increasing max_concurrent_scans"""
+        plot_count = 60
+        throughput = {}
+        for workers in (1, 2, 5, 10):
+            elapsed, peak = await self._scan_duration(
+                mock_db_service, mock_sms_service, sample_plot_data,
+                plot_count=plot_count, max_concurrent_scans=workers, latency=0.02
+            )
+            throughput[workers] = plot_count / elapsed
+            assert peak <= workers
+            assert workers == 1 or peak > 1
+        
+        print("\nScan throughput (20 ms blocking Bedrock call per plot): " + ", ".join(
+            f"{workers} workers {rate:.0f} plots/s" for workers, rate in throughput.items()
+        ))
+
+
+class TestReasoningTriageReport:
+    """Test the per-scan reasoning triage report"""
+    
+    @pytest.mark.asyncio
+    async def test_scan_reports_savings(self, mock_db_service, mock_sms_service, sample_plot_data):
+        """Test clear-cut plots skip Sonnet and the summary reports the savings"""
+        brain_service = build_latency_brain_service(0.0)
+        brain_service.triage.enabled = True
+        sentry_service = SentryService(
+            brain_service=brain_service,
+            db_service=mock_db_service,
+            sms_service=mock_sms_service
+        )
+        # Mock NDVI: 0.762 (clear), 0.488 (mid-band), 0.586 (near 0.6)
+        coordinates = [(13.7, 77.0), (12.4, 77.0), (12.3, 77.0)]
+        mock_db_service.iter_all_plots.side_effect = stream_plots([
+            {**sample_plot_data, 'plot_id': f'plot_{i}', 'latitude': lat, 'longitude': lon}
+            for i, (lat, lon) in enumerate(coordinates)
+        ])
+        
+        result = await sentry_service.scan_all_registered_plots()
+        triage = result['reasoning_triage']
+        
+        assert triage['tier_counts'] == {'rules': 1, 'haiku': 1, 'sonnet': 1, 'batch': 0}
+        assert triage['sonnet_calls_avoided'] == 2
+        assert triage['cost_saved_usd'] > 0
+        assert brain_service.bedrock_client.invoke_model.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_mock_brain_service_has_no_report(self, sentry_service, mock_brain_service,
+                                                    mock_db_service, sample_plot_data, sample_analysis_result):
+        """Test scans with a brain service lacking triage report None"""
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        mock_db_service.iter_all_plots.side_effect = stream_plots([sample_plot_data])
+        
+        result = await sentry_service.scan_all_registered_plots()
+        
+        assert result['reasoning_triage'] is None
+
+
+class TestChipCacheReport:
+    """Test the per-scan chip cache report"""
+    
+    @pytest.mark.asyncio
+    async def test_scan_reports_hit_rate_and_bytes(self, sentry_service, mock_brain_service,
+                                                   mock_db_service, sample_plot_data, sample_analysis_result):
+        """Test the summary reports chip cache activity during the scan only"""
+        counters = {'hits': 10, 'misses': 4, 'evictions': 0, 'bytes_served': 50000, 'bytes_stored': 90000}
+        
+        async def analyze_plot(**kwargs):
+            counters['hits'] += 3
+            counters['misses'] += 1
+            counters['bytes_served'] += 3000
+            return sample_analysis_result
+        
+        mock_brain_service.analyze_plot.side_effect = analyze_plot
+        mock_brain_service.sentinel_service.get_chip_cache_stats = Mock(side_effect=lambda: dict(counters))
+        mock_db_service.iter_all_plots.side_effect = stream_plots([sample_plot_data])
+        
+        result = await sentry_service.scan_all_registered_plots()
+        
+        assert result['chip_cache'] == {
+            'hits': 3, 'misses': 1, 'evictions': 0, 'bytes_served': 3000,
+            'hit_rate': 0.75, 'bytes_stored': 90000
+        }
+    
+    @pytest.mark.asyncio
+    async def test_no_report_without_chip_cache(self, sentry_service, mock_brain_service,
+                                                mock_db_service, sample_plot_data, sample_analysis_result):
+        """Test scans without a chip cache report None"""
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        mock_db_service.iter_all_plots.side_effect = stream_plots([sample_plot_data])
+        
+        result = await sentry_service.scan_all_registered_plots()
+        
+        assert result['chip_cache'] is None
+
+
+class TestBatchAnalysisScan:
+    """Test daily scans in batch analysis mode"""
+    
+    @pytest.mark.asyncio
+    async def test_window_analyzed_with_one_call(self, mock_db_service, mock_sms_service, sample_plot_data):
+        """Test a window of plots is analyzed by one batch prompt instead of one call per plot"""
+        brain_service = build_latency_brain_service(0.0)
+        brain_service.batch_analysis_enabled = True
+        
+        def invoke_model(**kwargs):
+            prompt = json.loads(kwargs['body'])['messages'][0]['content']
+            ids = [int(plot_id) for plot_id in re.findall(r'^(\d+) \|', prompt, re.MULTILINE)]
+            text = json.dumps({'results': [
+                {'id': plot_id, 'risk_classification': 'low', 'confidence_score': 0.9,
+                 'explanation': 'Healthy canopy', 'recommendations': ['Continue routine monitoring']}
+                for plot_id in ids
+            ]})
+            return {'body': io.BytesIO(json.dumps({'content': [{'text': text}]}).encode())}
+        
+        brain_service.bedrock_client.invoke_model.side_effect = invoke_model
+        sentry_service = SentryService(
+            brain_service=brain_service,
+            db_service=mock_db_service,
+            sms_service=mock_sms_service
+        )
+        mock_db_service.iter_all_plots.side_effect = stream_plots([
+            {**sample_plot_data, 'plot_id': f'plot_{i:03d}'} for i in range(6)
+        ])
+        
+        result = await sentry_service.scan_all_registered_plots()
+        
+        assert result['scanned'] == 6
+        assert result['batch_analyzed'] == 6
+        assert result['risk_level_counts'] == {'low': 6}
+        assert brain_service.bedrock_client.invoke_model.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back_to_per_plot(self, sentry_service, mock_brain_service,
+                                                        mock_db_service, sample_plot_data, sample_analysis_result):
+        """Test a failed batch still scans every plot with analyze_plot"""
+        mock_brain_service.batch_analysis_enabled = True
+        mock_brain_service.analyze_plots_batch = AsyncMock(side_effect=RuntimeError('Bedrock down'))
+        mock_brain_service.analyze_plot.return_value = sample_analysis_result
+        mock_db_service.iter_all_plots.side_effect = stream_plots([sample_plot_data])
+        
+        result = await sentry_service.scan_all_registered_plots()
+        
+        assert result['scanned'] == 1
+        assert result['batch_analyzed'] == 0
+        mock_brain_service.analyze_plot.assert_called_once()
+
+
 class TestDeepLinkGeneration:
     """Test deep link URL generation"""
     
@@ -0,0 +1,270 @@
+"""
+Unit Tests for DynamoDB item serialization
+
+Tests the fast conversion layer including:
+- Iterative float/Decimal conversion
+- PlotData/AlertData item round trips
+- Parity with the previous recursive, validating conversion path
+- Conversion microbenchmark
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from services import serialization
+from services.db_service import PlotData, AlertData
+
+
+def legacy_floats_to_decimal(obj):
+    """Recursive converter previously used by DbService"""
+    if isinstance(obj, float):
+        return Decimal(str(obj))
+    elif isinstance(obj, dict):
+        return {k: legacy_floats_to_decimal(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [legacy_floats_to_decimal(item) for item in obj]
+    return obj
+
+
+def legacy_decimal_to_float(obj):
+    """Recursive converter previously used by DbService"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    elif isinstance(obj, dict):
+        return {k: legacy_decimal_to_float(v) for k, v in obj.items()}
+    elif isinstance(obj, list):
+        return [legacy_decimal_to_float(item) for item in obj]
+    return obj
+
+
+def legacy_alert_to_item(alert):
+    """Previous serialization path"""
+    item = {
+        'hobli_id': alert.hobli_id,
+        'timestamp': alert.timestamp.isoformat(),
+        'plot_id': alert.plot_id,
+        'user_id': alert.user_id,
+        'risk_level': alert.risk_level,
+        'message': alert.message,
+        'gee_proof': legacy_floats_to_decimal(alert.gee_proof),
+        'bedrock_reasoning': alert.bedrock_reasoning,
+        'resolution_status': alert.resolution_status,
+        'sms_sent': alert.sms_sent
+    }
+    if alert.officer_response:
+        item['officer_response'] = alert.officer_response
+    return item
+
+
+def legacy_plot_from_item(item):
+    """Previous deserialization path for plots"""
+    item = legacy_decimal_to_float(item)
+    return PlotData(
+        user_id=item['user_id'],
+        plot_id=item['plot_id'],
+        lat=item['lat'],
+        lon=item['lon'],
+        crop=item['crop'],
+        hobli_id=item['hobli_id'],
+        farmer_name=item['farmer_name'],
+        phone_number=item['phone_number'],
+        registration_date=datetime.fromisoformat(item['registration_date']),
+        last_analysis=datetime.fromisoformat(item['last_analysis']) if item.get('last_analysis') else None,
+        status=item.get('status', 'active')
+    )
+
+
+def legacy_alert_from_item(item):
+    """Previous deserialization path: full conversion walk plus model validation"""
+    item = legacy_decimal_to_float(item)
+    return AlertData(
+        hobli_id=item['hobli_id'],
+        timestamp=datetime.fromisoformat(item['timestamp']),
+        plot_id=item['plot_id'],
+        user_id=item['user_id'],
+        risk_level=item['risk_level'],
+        message=item['message'],
+        gee_proof=item['gee_proof'],
+        bedrock_reasoning=item['bedrock_reasoning'],
+        officer_response=item.get('officer_response'),
+        resolution_status=item.get('resolution_status', 'pending'),
+        sms_sent=item.get('sms_sent', False)
+    )
+
+
+@pytest.fixture
+def nested_alert(sample_alert_data):
+    """Alert with a nested gee_proof like the ones written by sentry scans"""
+    return AlertData(
+        **{
+            **sample_alert_data,
+            'gee_proof': {
+                'ndvi_value': 0.35,
+                'confidence': 0.82,
+                'ndvi_history': [0.61, 0.55, 0.48, 0.41, 0.35],
+                'quality': {'cloud_cover': 12.5, 'pixels': 144, 'bands': {'B04': 0.071, 'B08': 0.152}},
+                'sentry_scan': True
+            }
+        },
+        timestamp=datetime(2026, 10, 17, 9, 30, 15, 123456)
+    )
+
+
+class TestValueConversion:
+    """Test iterative float/Decimal conversion"""
+
+    def test_matches_recursive_converters(self, nested_alert):
+        """Test output is identical to the previous recursive converters"""
+        value = {'proof': nested_alert.gee_proof, 'list': [1.5, [2.25, {'x': 0.1}], 'a', 3]}
+
+        as_decimal = serialization.floats_to_decimal(value)
+
+        assert as_decimal == legacy_floats_to_decimal(value)
+        assert serialization.decimals_to_float(as_decimal) == legacy_decimal_to_float(as_decimal) == value
+
+    def test_scalars(self):
+        """Test scalar inputs are converted or passed through"""
+        assert serialization.floats_to_decimal(0.1) == Decimal("0.1")
+        assert serialization.floats_to_decimal(3) == 3
+        assert serialization.floats_to_decimal(True) is True
+        assert serialization.decimals_to_float(Decimal("2.5")) == 2.5
+        assert serialization.decimals_to_float("text") == "text"
+
+    def test_input_not_mutated(self):
+        """Test containers are copied rather than converted in place"""
+        value = {'a': [0.5, {'b': 0.25}]}
+
+        serialization.floats_to_decimal(value)
+
+        assert value == {'a': [0.5, {'b': 0.25}]}
+        assert isinstance(value['a'][1]['b'], float)
+
+    def test_deep_nesting_does_not_recurse(self):
+        """Test nesting deeper than the recursion limit converts fine"""
+        import sys
+
+        value = current = {}
+        for _ in range(sys.getrecursionlimit() + 100):
+            current['child'] = {'v': 0.5}
+            current = current['child']
+
+        converted = serialization.floats_to_decimal(value)
+
+        node = converted
+        while 'child' in node:
+            node = node['child']
+        assert node['v'] == Decimal("0.5")
+
+
+class TestModelRoundTrip:
+    """Test schema-aware PlotData/AlertData converters"""
+
+    def test_plot_round_trip(self, sample_plot_data):
+        """Test a plot survives item round trip unchanged"""
+        plot = PlotData(
+            **sample_plot_data,
+            registration_date=datetime(2026, 1, 5, 10, 0),
+            last_analysis=datetime(2026, 10, 1, 6, 30)
+        )
+
+        item = serialization.plot_to_item(plot)
+        restored = serialization.plot_from_item(item, PlotData)
+
+        assert isinstance(item['lat'], Decimal)
+        assert restored == plot
+
+    def test_plot_optional_fields_default(self, sample_plot_data):
+        """Test missing optional attributes take model defaults"""
+        plot = PlotData(**sample_plot_data, registration_date=datetime(2026, 1, 5))
+        item = serialization.plot_to_item(plot)
+        del item['status']
+
+        restored = serialization.plot_from_item(item, PlotData)
+
+        assert restored.last_analysis is None
+        assert restored.status == "active"
+
+    def test_alert_round_trip(self, nested_alert):
+        """Test an alert with nested gee_proof survives item round trip unchanged"""
+        item = serialization.alert_to_item(nested_alert)
+        restored = serialization.alert_from_item(item, AlertData)
+
+        assert isinstance(item['gee_proof']['quality']['bands']['B04'], Decimal)
+        assert restored == nested_alert
+        assert isinstance(restored.gee_proof['ndvi_history'][0], float)
+
+    def test_alert_matches_legacy_path(self, nested_alert):
+        """Test fast deserialization builds the same model as validation did"""
+        item = serialization.alert_to_item(nested_alert.copy(update={'officer_response': "Visited"}))
+
+        assert serialization.alert_from_item(item, AlertData) == legacy_alert_from_item(item)
+
+
+@pytest.mark.slow
+class TestSerializationBenchmark:
+    """Microbenchmark of the conversion layer against the previous functions"""
+
+    def test_alert_page_conversion_benchmark(self, nested_alert):
+        """Compare serializing and deserializing a page of 1000 nested alerts"""
+        import timeit
+
+        alerts = [
+            nested_alert.copy(update={'timestamp': nested_alert.timestamp - timedelta(minutes=i)})
+            for i in range(1000)
+        ]
+        items = [serialization.alert_to_item(alert) for alert in alerts]
+
+        def legacy_serialize():
+            return [legacy_alert_to_item(alert) for alert in alerts]
+
+        def fast_serialize():
+            return [serialization.alert_to_item(alert) for alert in alerts]
+
+        def legacy_deserialize():
+            return [legacy_alert_from_item(item) for item in items]
+
+        def fast_deserialize():
+            return [serialization.alert_from_item(item, AlertData) for item in items]
+
+        runs = 5
+        timings = {
+            name: min(timeit.repeat(fn, number=1, repeat=runs)) * 1000
+            for name, fn in [
+                ('legacy_serialize', legacy_serialize),
+                ('fast_serialize', fast_serialize),
+                ('legacy_deserialize', legacy_deserialize),
+                ('fast_deserialize', fast_deserialize)
+            ]
+        }
+
+        assert fast_deserialize() == legacy_deserialize()
+        assert timings['fast_deserialize'] < timings['legacy_deserialize']
+        assert timings['fast_serialize'] < timings['legacy_serialize'] * 1.5
+
+        print(f"\n1000 alerts - serialize: legacy {timings['legacy_serialize']:.1f} ms, "
+              f"fast {timings['fast_serialize']:.1f} ms; "
+              f"deserialize: legacy {timings['legacy_deserialize']:.1f} ms, "
+              f"fast {timings['fast_deserialize']:.1f} ms")
+
+    def test_plot_page_deserialization_benchmark(self, sample_plot_data):
+        """Compare deserializing a page of 1000 plots"""
+        import timeit
+
+        items = [
+            serialization.plot_to_item(PlotData(
+                **{**sample_plot_data, 'plot_id': f"plot_{i:04d}"},
+                registration_date=datetime(2026, 1, 1) + timedelta(minutes=i),
+                last_analysis=datetime(2026, 10, 1)
+            ))
+            for i in range(1000)
+        ]
+
+        legacy = min(timeit.repeat(lambda: [legacy_plot_from_item(i) for i in items], number=1, repeat=5))
+        fast = min(timeit.repeat(lambda: [serialization.plot_from_item(i, PlotData) for i in items],
+                                 number=1, repeat=5))
+
+        assert [serialization.plot_from_item(i, PlotData) for i in items] == [legacy_plot_from_item(i) for i in items]
+        assert fast < legacy
+
+        print(f"\n1000 plots - deserialize: legacy {legacy * 1000:.1f} ms, fast {fast * 1000:.1f} ms")
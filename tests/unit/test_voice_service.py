@@ -15,7 +15,7 @@ import json
 @pytest.fixture
 def voice_service():
     """Create VoiceService instance with mocked AWS clients"""
-    with patch('services.voice_service.boto3.client'):
+    with patch('services.voice_service.get_client'):
         service = VoiceService(region='ap-south-2')
         return service
 
@@ -81,7 +81,7 @@ class TestVoiceServiceInitialization:
     
     def test_initialization_with_defaults(self):
         """Test service initializes with default settings"""
-        with patch('services.voice_service.boto3.client'):
+        with patch('services.voice_service.get_client'):
             service = VoiceService()
             
             assert service.region is not None
@@ -91,14 +91,14 @@ class TestVoiceServiceInitialization:
     
     def test_initialization_with_custom_region(self):
         """Test service initializes with custom region"""
-        with patch('services.voice_service.boto3.client'):
+        with patch('services.voice_service.get_client'):
             service = VoiceService(region='us-east-1')
             
             assert service.region == 'us-east-1'
     
     def test_initialization_with_custom_bucket(self):
         """Test service initializes with custom bucket"""
-        with patch('services.voice_service.boto3.client'):
+        with patch('services.voice_service.get_client'):
             service = VoiceService(audio_bucket='my-audio-bucket')
             
             assert service.audio_bucket == 'my-audio-bucket'